@@ -0,0 +1,275 @@
+# Read-only JSON API over the latest snapshots and the opportunity store, for tools that
+# poll for new opportunities (bid tracker, spreadsheet sync). It never scrapes: data is
+# whatever the scheduler / dashboard last saved. Responses carry strong ETags, honour
+# If-None-Match with 304, and are gzipped for clients that accept it.
+#
+#   python api_server.py                          # http://127.0.0.1:8502
+#   python api_server.py --host 0.0.0.0 --port 9000
+#
+#   GET /sources                        every source with its snapshot version, time and row count
+#   GET /sources/<source>               that source's latest tables
+#   GET /sources/<source>?since=T       only its rows first seen at or after T
+#   GET /opportunities?since=T          rows first seen at or after T, across sources (default: last 24 h)
+#
+# T is epoch seconds or an ISO 8601 time (2025-01-31 or 2025-01-31T08:00:00).
+import argparse
+import collections
+import datetime
+import gzip
+import hashlib
+import json
+import logging
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import snapshots
+import sources
+import store
+
+# Smaller bodies are not worth compressing
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+
+log = logging.getLogger('api_server')
+
+# Encoded snapshot bodies per source, rebuilt only when the snapshot file changes
+_bodies = {}  # source -> entry from snapshot_entry()
+# Compressed bodies by ETag (a content hash), so a popular snapshot is gzipped once
+GZIP_CACHE_SIZE = 32
+_gzipped = collections.OrderedDict()
+_lock = threading.Lock()
+
+
+class BadRequest(Exception):
+    pass
+
+
+def parse_since(value):
+    try:
+        since = float(value)
+    except ValueError:
+        pass
+    else:
+        if not math.isfinite(since):
+            raise BadRequest(f'since must be a finite time, not {value!r}')
+        return since
+    try:
+        moment = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        raise BadRequest(f'since must be epoch seconds or an ISO 8601 time, not {value!r}') from None
+    return moment.timestamp()
+
+
+def encode(payload):
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'), default=str, allow_nan=False).encode('utf-8')
+
+
+def etag_for(body):
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def table_payload(table_name, df):
+    df = snapshots.export_frame(df)
+    return {
+        'name': table_name,
+        'columns': [str(column) for column in df.columns],
+        'rows': json.loads(df.to_json(orient='values', date_format='iso')),
+    }
+
+
+# Latest snapshot of `source` encoded for the API (dict with taken_at, version, rows, etag, body),
+# or None before its first scrape. The body holds only the data, so an unchanged re-scrape keeps its ETag.
+def snapshot_entry(source):
+    modified = snapshots.modified_at(source)
+    if modified is None:
+        return None
+    with _lock:
+        entry = _bodies.get(source)
+    if entry and entry['modified'] == modified:
+        return entry
+    snapshot = snapshots.load(source)
+    if snapshot is None:
+        return None
+    body = encode({
+        'source': source,
+        'name': sources.NAMES[source],
+        'version': snapshot['version'],
+        'tables': [table_payload(table_name, df) for table_name, df in snapshot['tables']],
+    })
+    entry = {
+        'modified': modified,
+        'taken_at': snapshot['taken_at'],
+        'version': snapshot['version'],
+        'rows': sum(len(df) for _, df in snapshot['tables']),
+        'etag': etag_for(body),
+        'body': body,
+    }
+    with _lock:
+        _bodies[source] = entry
+    return entry
+
+
+def gzipped(etag, body):
+    with _lock:
+        if etag in _gzipped:
+            _gzipped.move_to_end(etag)
+            return _gzipped[etag]
+    compressed = gzip.compress(body, GZIP_LEVEL)
+    with _lock:
+        _gzipped[etag] = compressed
+        while len(_gzipped) > GZIP_CACHE_SIZE:
+            _gzipped.popitem(last=False)
+    return compressed
+
+
+def sources_payload():
+    listing = []
+    for source, name in sources.SOURCES:
+        entry = snapshot_entry(source)
+        listing.append({
+            'source': source,
+            'name': name,
+            'url': f'/sources/{source}',
+            'version': entry['version'] if entry else None,
+            'taken_at': entry['taken_at'] if entry else None,
+            'rows': entry['rows'] if entry else 0,
+        })
+    return {'sources': listing}
+
+
+def new_rows_payload(since, source=None):
+    rows = store.new_since(since, source)
+    return {
+        'since': since,
+        'source': source,
+        'rows': [
+            {'source': row.source, 'table': row.table_name, 'key': row.row_key, 'first_seen': row.first_seen,
+             'last_seen': row.last_seen, 'data': row.data}
+            for row in rows.itertuples(index=False)
+        ],
+    }
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = 'HiraniScraperAPI/1.0'
+    # Keep-alive for pollers; every response sets Content-Length
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.respond(send_body=True)
+
+    def do_HEAD(self):
+        self.respond(send_body=False)
+
+    def respond(self, send_body):
+        try:
+            status, body, etag, headers = self.route()
+        except BadRequest as e:
+            status, body, etag, headers = 400, encode({'error': str(e)}), None, {}
+        except Exception:
+            log.exception('%s failed', self.path)
+            status, body, etag, headers = 500, encode({'error': 'internal error'}), None, {}
+
+        compress = status == 200 and len(body) >= GZIP_MIN_BYTES and self.accepts_gzip()
+        if etag and compress:
+            etag = etag[:-1] + '-gzip"'  # A different encoding is a different representation
+        if etag and status == 200 and self.matches(etag):
+            status, body = 304, b''
+        elif compress:
+            body = gzipped(etag, body) if etag else gzip.compress(body, GZIP_LEVEL)
+
+        self.send_response(status)
+        if status != 304:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            if compress:
+                self.send_header('Content-Encoding', 'gzip')
+        if etag:
+            self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if send_body and status != 304:
+            self.wfile.write(body)
+
+    # (status, body, etag, extra headers) for the request path
+    def route(self):
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split('/') if part]
+
+        if parts in ([], ['sources']):
+            body = encode(sources_payload())
+            return 200, body, etag_for(body), {}
+
+        if parts == ['opportunities']:
+            since = parse_since(query['since']) if 'since' in query else time.time() - 24 * 60 * 60
+            source = query.get('source')
+            if source is not None and source not in sources.NAMES:
+                return self.not_found(f'unknown source: {source}')
+            body = encode(new_rows_payload(since, source))
+            return 200, body, etag_for(body), {}
+
+        if len(parts) == 2 and parts[0] == 'sources':
+            source = parts[1]
+            if source not in sources.NAMES:
+                return self.not_found(f'unknown source: {source}')
+            if 'since' in query:
+                body = encode(new_rows_payload(parse_since(query['since']), source))
+                return 200, body, etag_for(body), {}
+            entry = snapshot_entry(source)
+            if entry is None:
+                return self.not_found(f'{source} has not been scraped yet')
+            return 200, entry['body'], entry['etag'], {'X-Snapshot-Taken-At': f"{entry['taken_at']:.3f}"}
+
+        return self.not_found(f'no such endpoint: {url.path}')
+
+    def not_found(self, message):
+        return 404, encode({'error': message}), None, {}
+
+    def accepts_gzip(self):
+        accepted = self.headers.get('Accept-Encoding', '')
+        for coding in accepted.split(','):
+            name, _, params = coding.strip().partition(';')
+            if name.strip().lower() in ('gzip', '*'):
+                return params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+        return False
+
+    # If-None-Match uses weak comparison (RFC 9110 13.1.2): W/"x" matches "x"
+    def matches(self, etag):
+        header = self.headers.get('If-None-Match')
+        if not header:
+            return False
+        if header.strip() == '*':
+            return True
+        candidates = [candidate.strip().removeprefix('W/') for candidate in header.split(',')]
+        return etag in candidates
+
+    def log_message(self, format, *args):
+        log.info('%s %s', self.address_string(), format % args)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Serve cached scrape results as JSON.')
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--port', type=int, default=8502)
+    args = arg_parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(levelname)s %(message)s')
+    server = ThreadingHTTPServer((args.host, args.port), Handler)
+    log.info('serving on http://%s:%d', args.host, args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+# Side-by-side parse timing: the original full-document html.parser against
+# every installed backend with SoupStrainer/CSS subtree parsing.
+#
+#   python benchmarks/compare_parsers.py                    # fetch each source live (through the caches)
+#   python benchmarks/compare_parsers.py --html page3=ads.html --html page7=passport.html
+import argparse
+import os
+import sys
+import time
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Compare every row: the DOT pages' date windows would otherwise drop old rows
+os.environ.setdefault('SCRAPER_PAGE3_WINDOW_DAYS', '0')
+os.environ.setdefault('SCRAPER_PAGE4_WINDOW_DAYS', '0')
+
+import fetcher  # noqa: E402
+import parsing  # noqa: E402
+import scraperapi  # noqa: E402
+import sources  # noqa: E402
+
+# (backend, strain, label); the first entry is the baseline every other row is compared with
+CONFIGS = [('html.parser', False, 'html.parser, whole document (current)')] + [
+    (backend, True, f'{backend}, strained') for backend in parsing.BACKENDS
+]
+
+
+def load_html(module, path=None):
+    if path:
+        with open(path, 'rb') as f:
+            return f.read()
+    if getattr(module, 'USES_SCRAPERAPI', False):
+        return scraperapi.fetch(module.URL)
+    response = fetcher.get(module.URL)
+    response.raise_for_status()
+    return response.content
+
+
+# Best-of-`repeat` wall time for one parse, plus the tables it produced
+def time_parse(module, html_content, repeat):
+    # Bypass the content-hash memo, or every run after the first would be a lookup
+    parse = getattr(module.parse_tables, '__wrapped__', module.parse_tables)
+    best = float('inf')
+    tables = []
+    for _ in range(repeat):
+        parsing.clear_memo()  # PASSPort's parse_tables goes through the memoized parse_page
+        start = time.perf_counter()
+        tables = parse(html_content)
+        best = min(best, time.perf_counter() - start)
+    return best, tables
+
+
+def same_tables(left, right):
+    return len(left) == len(right) and all(
+        left_name == right_name and left_df.reset_index(drop=True).equals(right_df.reset_index(drop=True))
+        for (left_name, left_df), (right_name, right_df) in zip(left, right)
+    )
+
+
+def compare(module_name, html_content, repeat):
+    module = sources.load(module_name)
+    rows = []
+    baseline_seconds = baseline_tables = None
+    for backend, strain, label in CONFIGS:
+        if not parsing.available(backend):
+            continue
+        with parsing.use_backend(backend, strain):
+            seconds, tables = time_parse(module, html_content, repeat)
+        if baseline_seconds is None:
+            baseline_seconds, baseline_tables = seconds, tables
+        rows.append({
+            'Source': module_name,
+            'Parser': label,
+            'Best (ms)': round(seconds * 1000, 2),
+            'Speed-up': f'{baseline_seconds / seconds:.1f}x',
+            'Rows': sum(len(df) for _, df in tables),
+            'Same output': same_tables(tables, baseline_tables),
+        })
+    return rows
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--html', action='append', default=[], metavar='PAGE=PATH',
+                            help='parse a saved page instead of fetching it, e.g. page3=ads.html')
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    saved = dict(item.split('=', 1) for item in args.html)
+    module_names = list(saved) if saved else list(sources.NAMES)
+
+    rows = []
+    for module_name in module_names:
+        module = sources.load(module_name)
+        rows.extend(compare(module_name, load_html(module, saved.get(module_name)), args.repeat))
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
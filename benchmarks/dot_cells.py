@@ -0,0 +1,102 @@
+# The DOT sources' per-row cell extraction: the original string slicing (page3) and
+# serialize-and-reparse (page4) against the single-pass cell_description() readers, on the
+# recorded fixtures scaled like parse_suite. Also counts the descriptions that differ: the
+# single pass returns plain text, where the original kept entities (&amp;) and inline tags
+# (<b>) of the serialized cell, as in one of the page3 fixture's ads.
+#
+#   python benchmarks/dot_cells.py
+#   python benchmarks/dot_cells.py --scale 1 --scale 1000 --backend lxml
+import argparse
+import os
+import sys
+import time
+import pandas as pd
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parsing  # noqa: E402
+import sources  # noqa: E402
+from parse_suite import SCALES, fixture_path, scale  # noqa: E402
+
+
+# page3 before the single-pass reader: slice the serialized cell
+def legacy_detail_ad(info_td):
+    description_html = str(info_td)
+    description_start = description_html.find('&nbsp;') + 6
+    description_end = description_html.find('<ul>')
+    if description_end == -1:
+        description_end = description_html.find('</td>')
+    description = description_html[description_start:description_end].strip()
+    return description.replace('lass="bcbanregion2">', '').replace('\n', '').strip()
+
+
+# page4 before the single-pass reader: slice the serialized cell and parse it again
+def legacy_designation(info_td):
+    description_html = str(info_td)
+    description_start = description_html.find('<br>') + 4
+    description_end = description_html.find('</td>')
+    description = description_html[description_start:description_end].strip()
+    soup_desc = BeautifulSoup(description, 'html.parser')
+    for strong_tag in soup_desc.find_all('strong'):
+        strong_tag.decompose()
+    description = soup_desc.get_text(strip=True)
+    return description.replace('class="bcbanregion2">', '').strip()
+
+
+LEGACY = {'page3': legacy_detail_ad, 'page4': legacy_designation}
+
+
+# Every listing cell of the page, parsed once up front so only extraction is timed
+def info_cells(module, html_content):
+    soup = parsing.make_soup(html_content, module.TABLE_STRAINER, module.TABLE_CSS)
+    return soup.find_all('td', class_='bcbanregion2')
+
+
+def best_time(extract, cells, repeat):
+    best = float('inf')
+    descriptions = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        descriptions = [extract(cell) for cell in cells]
+        best = min(best, time.perf_counter() - start)
+    return best, descriptions
+
+
+def run(scales, repeat):
+    rows = []
+    for module_name, legacy in LEGACY.items():
+        module = sources.load(module_name)
+        with open(fixture_path(module_name), 'rb') as f:
+            recorded = f.read()
+        for factor in scales:
+            cells = info_cells(module, scale(recorded, factor))
+            legacy_seconds, legacy_descriptions = best_time(legacy, cells, repeat)
+            seconds, descriptions = best_time(module.cell_description, cells, repeat)
+            rows.append({
+                'Source': module_name,
+                'Scale': f'{factor}x',
+                'Cells': len(cells),
+                'Original (ms)': round(legacy_seconds * 1000, 2),
+                'Single pass (ms)': round(seconds * 1000, 2),
+                'Speed-up': f'{legacy_seconds / seconds:.1f}x' if seconds else '-',
+                'Changed': sum(new != old for new, old in zip(descriptions, legacy_descriptions)),
+            })
+    return pd.DataFrame(rows)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='DOT cell extraction: original against single pass.')
+    arg_parser.add_argument('--scale', type=int, action='append', help='row multiplier (repeatable; default 1, 10, 100)')
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    arg_parser.add_argument('--backend', choices=parsing.BACKENDS, default=parsing.BACKEND)
+    args = arg_parser.parse_args()
+
+    with parsing.use_backend(args.backend, parsing.STRAIN):
+        results = run(args.scale or SCALES, args.repeat)
+    print(f'Parser backend: {args.backend}')
+    print(results.to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+# Cold-start timing: how long a fresh interpreter takes to import each part of the app,
+# and to run the homepage script once, i.e. what a restarted container pays before first paint.
+#
+#   python benchmarks/import_time.py               # 5 fresh interpreters per measurement
+#   python benchmarks/import_time.py --repeat 10
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import pandas as pd
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+import sources  # noqa: E402
+
+# Each snippet runs in a new interpreter and prints the seconds spent between its `start` and the end
+TIMER = 'import time\n{setup}\nstart = time.perf_counter()\n{code}\nprint(time.perf_counter() - start)\n'
+
+MEASUREMENTS = [
+    ('streamlit', '', 'import streamlit'),
+    ('source registry', 'import streamlit', 'import sources'),
+    ('main_dashboard (import)', 'import streamlit', 'import main_dashboard'),
+] + [
+    (f'{module_name} (import)', 'import streamlit', f'import sources; sources.load({module_name!r})')
+    for module_name in sources.NAMES
+] + [
+    # The whole homepage script under the test runner, as a cold start would run it
+    ('homepage (first run)', 'from streamlit.testing.v1 import AppTest',
+     f'AppTest.from_file({os.path.join(REPO, "main_dashboard.py")!r}, default_timeout=120).run()'),
+]
+
+
+def time_once(setup, code):
+    script = TIMER.format(setup=setup, code=code)
+    result = subprocess.run([sys.executable, '-c', script], cwd=REPO, capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Cold-start import and first-run timing.')
+    arg_parser.add_argument('--repeat', type=int, default=5, help='fresh interpreters per measurement')
+    args = arg_parser.parse_args()
+
+    rows = []
+    for label, setup, code in MEASUREMENTS:
+        seconds = [time_once(setup, code) for _ in range(args.repeat)]
+        rows.append({
+            'What': label,
+            'Median (ms)': round(statistics.median(seconds) * 1000, 1),
+            'Best (ms)': round(min(seconds) * 1000, 1),
+        })
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+# Offline parser benchmarks: every source's parse_tables against its recorded page in
+# benchmarks/fixtures/, scaled synthetically to 1x, 10x and 100x the rows. Reports the best
+# parse time, throughput and peak traced memory; nothing touches the network unless --record.
+#
+#   python benchmarks/parse_suite.py                          # all sources, default backend
+#   python benchmarks/parse_suite.py page3 page7 --scale 1 --scale 1000
+#   python benchmarks/parse_suite.py --json now.json --baseline before.json   # flag regressions
+#   python benchmarks/parse_suite.py --record                 # re-record fixtures from the live sites
+import argparse
+import copy
+import os
+import sys
+import time
+import tracemalloc
+import pandas as pd
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Time every fixture row: the DOT pages' date windows would otherwise drop old fixture rows
+os.environ.setdefault('SCRAPER_PAGE3_WINDOW_DAYS', '0')
+os.environ.setdefault('SCRAPER_PAGE4_WINDOW_DAYS', '0')
+
+import fetcher  # noqa: E402
+import parsing  # noqa: E402
+import scraperapi  # noqa: E402
+import sources  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+SCALES = [1, 10, 100]
+
+# Leading <td> rows of each table that are titles/headers rather than data (OGS has no <th>)
+HEADER_ROWS = {'page2': 2}
+
+# A parse this much slower than the baseline file counts as a regression
+REGRESSION_TOLERANCE = 1.25
+
+
+def fixture_path(module_name):
+    return os.path.join(FIXTURE_DIR, f'{module_name}.html')
+
+
+def record(module_name):
+    module = sources.load(module_name)
+    if getattr(module, 'USES_SCRAPERAPI', False):
+        html_content = scraperapi.fetch(module.URL).encode()
+    else:
+        response = fetcher.get(module.URL)
+        response.raise_for_status()
+        html_content = response.content
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    with open(fixture_path(module_name), 'wb') as f:
+        f.write(html_content)
+
+
+# The fixture with every data row repeated `factor` times in place. Data rows are <tr>s holding
+# <td>s and no nested table; repeated grid rows get fresh data-ids so nothing de-duplicates them.
+def scale(html_content, factor, header_rows=0):
+    if factor == 1:
+        return html_content
+    soup = BeautifulSoup(html_content, 'html.parser')
+    for table in soup.find_all('table'):
+        rows = [tr for tr in table.find_all('tr')
+                if tr.find_parent('table') is table and tr.find('td', recursive=False) and not tr.find('table')]
+        rows = rows[header_rows:]
+        if not rows:
+            continue
+        tail = rows[-1]
+        for copy_number in range(1, factor):
+            for row in rows:
+                duplicate = copy.copy(row)
+                if duplicate.has_attr('data-id'):
+                    duplicate['data-id'] = f"{row['data-id']}-{copy_number}"
+                tail.insert_after(duplicate)
+                tail = duplicate
+    return str(soup).encode()
+
+
+# Best-of-`repeat` time for one parse (memo bypassed), then one traced run for peak memory
+def measure(module, html_content, repeat):
+    # Sources whose parse_tables wraps a memoized per-page parser (PASSPort) need the memo cleared too
+    parse = getattr(module.parse_tables, '__wrapped__', module.parse_tables)
+    best = float('inf')
+    tables = []
+    for _ in range(repeat):
+        parsing.clear_memo()
+        start = time.perf_counter()
+        tables = parse(html_content)
+        best = min(best, time.perf_counter() - start)
+    parsing.clear_memo()
+    tracemalloc.start()
+    try:
+        parse(html_content)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak, sum(len(df) for _, df in tables)
+
+
+def run(module_names, scales, repeat):
+    rows = []
+    for module_name in module_names:
+        module = sources.load(module_name)
+        with open(fixture_path(module_name), 'rb') as f:
+            recorded = f.read()
+        for factor in scales:
+            html_content = scale(recorded, factor, HEADER_ROWS.get(module_name, 0))
+            seconds, peak, row_count = measure(module, html_content, repeat)
+            rows.append({
+                'Source': module_name,
+                'Scale': f'{factor}x',
+                'HTML (KB)': round(len(html_content) / 1024, 1),
+                'Rows': row_count,
+                'Best (ms)': round(seconds * 1000, 2),
+                'Rows/s': round(row_count / seconds) if seconds else 0,
+                'Peak (MB)': round(peak / 2 ** 20, 2),
+            })
+    return pd.DataFrame(rows)
+
+
+# Rows whose parse got slower than the baseline run by more than REGRESSION_TOLERANCE
+def regressions(results, baseline_path):
+    baseline = pd.read_json(baseline_path)
+    merged = results.merge(baseline, on=['Source', 'Scale'], suffixes=('', ' (baseline)'))
+    merged['Change'] = merged['Best (ms)'] / merged['Best (ms) (baseline)']
+    return merged[merged['Change'] > REGRESSION_TOLERANCE]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Offline parser benchmarks on recorded fixtures.')
+    sources.add_argument(arg_parser)
+    arg_parser.add_argument('--scale', type=int, action='append', help='row multiplier (repeatable; default 1, 10, 100)')
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    arg_parser.add_argument('--backend', choices=parsing.BACKENDS, default=parsing.BACKEND)
+    arg_parser.add_argument('--json', metavar='PATH', help='also write the results as JSON')
+    arg_parser.add_argument('--baseline', metavar='PATH', help='JSON from an earlier run; exit 1 on slower parses')
+    arg_parser.add_argument('--record', action='store_true', help='fetch the live pages into fixtures/ first (needs network)')
+    args = arg_parser.parse_args()
+    module_names = sources.selected(arg_parser, args.sources)
+
+    if args.record:
+        for module_name in module_names:
+            record(module_name)
+
+    with parsing.use_backend(args.backend, parsing.STRAIN):
+        results = run(module_names, args.scale or SCALES, args.repeat)
+    print(f'Parser backend: {args.backend}')
+    print(results.to_string(index=False))
+
+    if args.json:
+        results.to_json(args.json, orient='records', indent=2)
+    if args.baseline:
+        slower = regressions(results, args.baseline)
+        if not slower.empty:
+            print(f'\nSlower than {args.baseline} by more than {REGRESSION_TOLERANCE:.2f}x:')
+            print(slower[['Source', 'Scale', 'Best (ms) (baseline)', 'Best (ms)', 'Change']].to_string(index=False))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
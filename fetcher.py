@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+import httpx
+
+import metrics
+import ratelimit
+
+# Connect/read timeouts in seconds; ScraperAPI render=true calls routinely take 10-60 s
+CONNECT_TIMEOUT = float(os.environ.get('SCRAPER_CONNECT_TIMEOUT', '10'))
+READ_TIMEOUT = float(os.environ.get('SCRAPER_READ_TIMEOUT', '30'))
+RENDER_READ_TIMEOUT = float(os.environ.get('SCRAPER_RENDER_READ_TIMEOUT', '90'))
+
+DEFAULT_TIMEOUT = httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT)
+RENDER_TIMEOUT = httpx.Timeout(RENDER_READ_TIMEOUT, connect=CONNECT_TIMEOUT)
+
+# Retry policy: jittered exponential backoff on throttling, server errors and dropped connections
+MAX_RETRIES = int(os.environ.get('SCRAPER_MAX_RETRIES', '3'))
+BACKOFF_BASE = float(os.environ.get('SCRAPER_BACKOFF_BASE', '1.0'))
+BACKOFF_MAX = float(os.environ.get('SCRAPER_BACKOFF_MAX', '30'))
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Keep-alive pool size per host
+POOL_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=60.0)
+
+
+# INFO logging for the command-line tools. httpx logs every request URL at INFO, and
+# ScraperAPI URLs carry the API key, so httpx itself only logs warnings.
+def configure_logging():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(levelname)s %(message)s')
+    logging.getLogger('httpx').setLevel(logging.WARNING)
+
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2]); fall back to HTTP/1.1 without it
+def http2_enabled():
+    if os.environ.get('SCRAPER_HTTP2', '1') != '1':
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+# One pooled keep-alive client per host, shared by every page module and session
+def get_client(url):
+    host = urlsplit(url).netloc
+    with _clients_lock:
+        client = _clients.get(host)
+        if client is None:
+            client = httpx.Client(timeout=DEFAULT_TIMEOUT, limits=POOL_LIMITS,
+                                  http2=http2_enabled(), follow_redirects=True)
+            _clients[host] = client
+    return client
+
+
+# Seconds to wait before retry number `attempt` (0-based): full jitter, honouring Retry-After
+def backoff_delay(attempt, response=None):
+    if response is not None:
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return min(float(retry_after), BACKOFF_MAX)
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def _should_retry(response, attempt, retries):
+    return response.status_code in RETRY_STATUSES and attempt < retries
+
+
+# Where a request goes, for the fetch metrics; never the URL itself (ScraperAPI URLs carry the key)
+def upstream(url):
+    host = urlsplit(url).hostname or ''
+    return 'scraperapi' if host.endswith('scraperapi.com') else host
+
+
+def _record_response(record, response):
+    record['bytes'] = len(response.content)
+    record['status'] = response.status_code
+
+
+# Blocking GET through the host's pooled client, retrying transient failures.
+# Returns the final response; callers decide how to treat its status code.
+def get(url, headers=None, timeout=None, retries=None):
+    with metrics.stage('fetch', upstream=upstream(url)) as record:
+        response = _get(url, headers, timeout, retries)
+        _record_response(record, response)
+        return response
+
+
+def _get(url, headers, timeout, retries):
+    retries = MAX_RETRIES if retries is None else retries
+    client = get_client(url)
+    kwargs = {'headers': headers}
+    if timeout is not None:
+        kwargs['timeout'] = timeout
+
+    for attempt in range(retries + 1):
+        try:
+            # Every attempt waits its turn under the host's (or API key's) limits; backoff happens outside them
+            with ratelimit.permit(url) as permit:
+                response = client.get(url, **kwargs)
+                permit['status'] = response.status_code
+        except httpx.TransportError:
+            if attempt == retries:
+                raise
+            time.sleep(backoff_delay(attempt))
+            continue
+        if not _should_retry(response, attempt, retries):
+            return response
+        time.sleep(backoff_delay(attempt, response))
+
+
+# Async counterpart of get() on a caller-supplied AsyncClient
+async def aget(client, url, headers=None, timeout=None, retries=None):
+    with metrics.stage('fetch', upstream=upstream(url)) as record:
+        response = await _aget(client, url, headers, timeout, retries)
+        _record_response(record, response)
+        return response
+
+
+async def _aget(client, url, headers, timeout, retries):
+    retries = MAX_RETRIES if retries is None else retries
+    kwargs = {'headers': headers}
+    if timeout is not None:
+        kwargs['timeout'] = timeout
+
+    for attempt in range(retries + 1):
+        try:
+            async with ratelimit.apermit(url) as permit:
+                response = await client.get(url, **kwargs)
+                permit['status'] = response.status_code
+        except httpx.TransportError:
+            if attempt == retries:
+                raise
+            await asyncio.sleep(backoff_delay(attempt))
+            continue
+        if not _should_retry(response, attempt, retries):
+            return response
+        await asyncio.sleep(backoff_delay(attempt, response))
+
+
+# Pooled AsyncClient for one concurrent sweep (async clients are bound to their event loop)
+def async_client(timeout=RENDER_TIMEOUT):
+    return httpx.AsyncClient(timeout=timeout, limits=POOL_LIMITS,
+                             http2=http2_enabled(), follow_redirects=True)
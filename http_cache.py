@@ -0,0 +1,103 @@
+import hashlib
+import os
+import pickle
+
+import fetcher
+import metrics
+import parsing
+import records
+
+# Persistent conditional-GET cache for the direct-fetch state sites (OGS, DOT).
+# Each entry keeps the response body, its ETag/Last-Modified validators and the
+# already-parsed result, so a 304 skips BeautifulSoup entirely.
+CACHE_DIR = os.path.join(os.environ.get('SCRAPER_CACHE_DIR', '.cache'), 'http')
+
+
+# Entries are keyed on URL, parser and table schema (and the parser's variant, e.g. its date
+# window), so a different parser never reuses a stale result
+def _entry_path(url, parser):
+    key = f'{url}|{parser.__module__}.{parser.__qualname__}|schema={records.SCHEMA}'
+    variant = getattr(parser, 'variant', None)
+    if variant:
+        key += f'|{variant()}'
+    return os.path.join(CACHE_DIR, hashlib.sha256(key.encode()).hexdigest() + '.pickle')
+
+
+def load_entry(url, parser):
+    try:
+        with open(_entry_path(url, parser), 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def save_entry(url, parser, entry):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _entry_path(url, parser)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)  # Atomic, so concurrent readers never see a partial file
+
+
+# Request headers that let the server answer 304 Not Modified
+def conditional_headers(entry):
+    headers = {}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+# Turn a (possibly 304) response into a parsed result, refreshing the entry on a 200
+def resolve(url, parser, response, entry):
+    hit = response.status_code == 304 and entry is not None
+    metrics.cache_result('http', hit)
+    if hit:
+        return entry['parsed']
+    response.raise_for_status()
+
+    parsed = parser(response.content)
+    _remember(url, parser, response, parsed)
+    return parsed
+
+
+def _remember(url, parser, response, parsed):
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        save_entry(url, parser, {
+            'etag': etag,
+            'last_modified': last_modified,
+            'body': response.content,
+            'parsed': parsed,
+        })
+
+
+# Blocking conditional GET + parse; raises httpx.HTTPError like fetcher.get callers expect
+def get_parsed(url, parser, timeout=None):
+    entry = load_entry(url, parser)
+    response = fetcher.get(url, headers=conditional_headers(entry), timeout=timeout)
+    return resolve(url, parser, response, entry)
+
+
+# Streaming get_parsed for multi-table pages: yields each (name, df) as `iter_parser` builds it
+# (see parsing.stream); a 304 yields the cached tables. `parser` is the page's memoized
+# parse_tables, which keys the cache entry exactly as get_parsed does.
+def iter_parsed(url, parser, iter_parser, timeout=None):
+    entry = load_entry(url, parser)
+    response = fetcher.get(url, headers=conditional_headers(entry), timeout=timeout)
+    hit = response.status_code == 304 and entry is not None
+    metrics.cache_result('http', hit)
+    if hit:
+        yield from entry['parsed']
+        return
+    response.raise_for_status()
+
+    parsed = []
+    for table in parsing.stream(parser, iter_parser, response.content):
+        parsed.append(table)
+        yield table
+    _remember(url, parser, response, parsed)
@@ -1,134 +1,223 @@
-import streamlit as st
 import base64
+import functools
+import hashlib
+from pathlib import Path
+import streamlit as st
+
+import sources
 # Set the page layout to wide
 st.set_page_config(layout="wide")
 
+# Icons and the homepage stylesheet live in static/ (served by Streamlit, see .streamlit/config.toml)
+STATIC_DIR = Path(__file__).parent / 'static'
+
+# Homepage boxes, column by column: (title, button label, page, icon)
+SOURCE_BOXES = [
+    [("NYS General Services", "NYS General Services", 'page2', 'icons/general_services.png'),
+     ("PASSPort Opportunities", "PASSPort Opportunities", 'page7', 'icons/passport_opportunities.png')],
+    [("NYS DOT Designation", "NYS DOT Designation", 'page4', 'icons/nys_dot.png'),
+     ("NYS DOT Detailed Ads", "NYS DOT Detailed Ads", 'page3', 'icons/nys_dot.png')],
+    [("Port Authority Prof. Services", "Port Authority Professional Services", 'page6', 'icons/port_authority.png'),
+     ("Port Authority Construction", "Port Authority Construction", 'page5', 'icons/port_authority.png')],
+]
+
 # Function for navigation
 def navigate_to(page_name):
     st.session_state['page'] = page_name
 
-# Function to load images from file
+# Function to load images from file (encoded once per process)
+@functools.lru_cache(maxsize=None)
 def load_image_as_base64(image_path):
     with open(image_path, "rb") as img_file:
         return base64.b64encode(img_file.read()).decode()
 
+# URL of a file in static/, fingerprinted with its content hash so browsers cache it until it changes.
+# Without static serving the image is inlined instead, still encoded only once per process.
+@functools.lru_cache(maxsize=None)
+def static_url(name):
+    path = STATIC_DIR / name
+    if not st.get_option('server.enableStaticServing'):
+        return f"data:image/png;base64,{load_image_as_base64(path)}"
+    digest = hashlib.sha1(path.read_bytes()).hexdigest()[:10]
+    return f"app/static/{name}?v={digest}"
+
+# Homepage stylesheet, read once per process
+@functools.lru_cache(maxsize=None)
+def dashboard_css():
+    return (STATIC_DIR / 'dashboard.css').read_text()
+
 # Main dashboard homepage
 def show_homepage():
     st.markdown("<h1 style='text-align: center; color: blue;'>Hirani Scraper</h1>", unsafe_allow_html=True)
     st.markdown("### Choose what to scrape:")
 
-    # Load the icons
-    general_services_image = "iVBORw0KGgoAAAANSUhEUgAAAG0AAABCCAYAAABdAli1AAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJbWFnZVJlYWR5ccllPAAAAyJpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDUuMC1jMDYwIDYxLjEzNDc3NywgMjAxMC8wMi8xMi0xNzozMjowMCAgICAgICAgIj4gPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4gPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIiB4bWxuczp4bXBNTT0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL21tLyIgeG1sbnM6c3RSZWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZVJlZiMiIHhtcDpDcmVhdG9yVG9vbD0iQWRvYmUgUGhvdG9zaG9wIENTNSBNYWNpbnRvc2giIHhtcE1NOkluc3RhbmNlSUQ9InhtcC5paWQ6QTA1Nzc1NjVGNjM2MTFFMzk5NkFGRERGMEYyODU3RTciIHhtcE1NOkRvY3VtZW50SUQ9InhtcC5kaWQ6QTA1Nzc1NjZGNjM2MTFFMzk5NkFGRERGMEYyODU3RTciPiA8eG1wTU06RGVyaXZlZEZyb20gc3RSZWY6aW5zdGFuY2VJRD0ieG1wLmlpZDpBMDU3NzU2M0Y2MzYxMUUzOTk2QUZEREYwRjI4NTdFNyIgc3RSZWY6ZG9jdW1lbnRJRD0ieG1wLmRpZDpBMDU3NzU2NEY2MzYxMUUzOTk2QUZEREYwRjI4NTdFNyIvPiA8L3JkZjpEZXNjcmlwdGlvbj4gPC9yZGY6UkRGPiA8L3g6eG1wbWV0YT4gPD94cGFja2V0IGVuZD0iciI/PhMlZyIAAA02SURBVHja7F1djNxWFb7XyRMvYyQUUbHJeBuoeJtpkUAg0Dj9gYS22dmgIkVUXW+aFvoD8Sr8CRDrVAVFRTSzgBRImuysCEUqauNt0lDSVplFQgiBqPcNNSTrSaMk5CXeF56oL+fYx7t3bzy/2Z3Mz17Ja8/19b32+XzOPX/Xy1mflI//wjMF547QeIExzpjGmODwR+PReY57zqM9j85zFuJvHrfldIx1msbnzn81a3brs/JeB+sTh/6ZB7BK8CQFBAVAW4TfXhpwuOfpwPlwnQ4/dTjOQ10GgLsbgPO68Zk39jJgd/38H0UWijKAkxGMLwJEzoVn86Vb4tiXLwYAMwtD5nfrc/csaHe98HcLAJuORFvIZmBvn7fvCW6131Aggwp2Yfdw0K3PrvUiYJ88+LcyD8NpoC1SeeK9/Z+yzk/cszpEFsJD4IDj8uuctgpl6/N/1TWNuaEQBQ3nIiHG//XdT5dXdZBQFPBV/vfXtnrroK0OG7igWRQEE4shY+Z73//MqhNWE2IWONjvZir0jPaYfe4vFjDANGh1oPSBZvfDz3psQEvvcJoQqIpHc9iFH39uVQD77+832rArwobzofOh3f/zpHOoheK85tM5H+oqdbqzYLPVa6gvi8bxoM6hOh3bpLXvC9CGJv/swDy2DzhtEYBbzTkMCVmg4zwQMg+ESxSafbTH82UibKFOX0h8NMhz1M4nULDgC5CBbQTGKBM4pjQGjmv1Bafd8aOKrjFeBm1uBNVwmMfs9yc/v1aqeJY4xWmy/TxxaFKQSysEWvJCOPgiEGBJMeklKEp1lb5Q+Tf94JwtQuGHTIzwEBQPwUbfd75QXuNhJ4nIzRQbuMOUNuQeVzqfIxFoKteZyp4p1/Ump2363jtgh4mxEJUO0OZCzqyrzxU6ZeyWUgidOocBKEm7SOTBVoG6RYmzzJS+8vRiZNvltK4D7SPfecsCMTgGYFV5yKxrB++tdPgWCqSgNCpj0rFPIi8BYEQSkSpoOUU0zjergHSteNTwocMQ56+sEMLq4NBz0rHT4rV+DVFXlLhuURbD7XJZV4J2/WcP+HBTs8BpCNwYiEq7Q0Mj8aboONNE+23AIZy2Sg0QMorYTStuz4NGwBXBLjtAwOkdHNpROKLlQqJuvsZcqfa9qADew4rI/rM6gGbTW1Xq1Lhoo5EhfLJFRSTiMAkAWfVP5q2AjPORWxGNXQsaF6IoGAfRImaA6zoaIgHiukDcWYW4jRQRLIYEgisZzjI4KmhuO/eodSdozADgWAcct56kJMhj2ZKIqypGdENlhDhOvt6VQKtKik9bnNaVDuOP2m+ajPNzgrO5/7z4JZOtl+4Wj3d8648GqPp5Eb1RfB2hbgZt6Jk3dOCuKMAZCwCBgek1E48wb6ENlZc9GtI52ZPhJt5/UlLytAUkXl0lOqCTfWZIffhSW3kcFMOJdlxKnNVQj9cmNip6WspdJx6Hnj5two24goPywXk15KwMxwHTePlqaXuwRqCVJGWhCoQxJIItyPYYAeQqrie5zCReegL8XJ2hxxMQoK1Q7L4Kge5JY82hb7MtTht65OU8QGxhihmMVEjyBAWPcwYxfS16CzQ+D+c9qKtUZ75Srtfn8Ndfx1xFE8Th5Adx+kDkZ7zyywc7oTE69DajAZzFtx6IU5LcUVhmiYCeAtg8cVJiPI/B9X4SK0vxtMie/mlU/eu4rkrSWIsSxzXPaZt3/c4BYCxomY2AIZAAmHnYB7DpBFwAf6Kbw7zCaE7iHNpEHGTADyNKP+TxTIXgw0EmpARROJ6qHn7Y7iSHk7iblrQ8S+GSYRJx0yqnEEeUJRUeDWVd5TT0mFDbG1Ifo2RaCIWjDWWsqF1Lc9rm0RM2GLmTSGYRPZQog/3kXn5ld83I8ZZH/2CIUFgAHBBA5ITgOR7PTyyEfjAuJng8Z3HB5+A3qr2VhV/vrHRaLBPxbTKEswqXHaBotezcnUtEGxnLtgRaRjG21bLYwD1mKK6uqTTAGotHIfQoa5eJ8cuvPlpuhhCXTjyCbO8AeKUIOC5A/PEKj8HRE+AuvjTacZBqFFviDFksJQTUa3kwCFQZDEOx95CbZTGs2oeqWMxI4tdpT3sU8R/gtNLQrhPs8mvNAUfgBXQjJdbFhSZ/1QNiS2kHzRjVuVqgsZUe/YSD0uazjMJ17XlEQDEoA2ZV4LgM7K0+Nn1Kqtis0S7NeZ1rwZeIPsha8/aMAmC5LdAuvf6YD8DlkeMit9JgFlmUFUmpkBWZVFeWomAsAazMkXIpK8CN1ArGNvQ9AnAB+QGNAQVNfuNxzkNxWiSClhQlxU8Tv2Q6LHG1DHzK/CqHdZy0nJWmHMaRei9EdvPIb/ODhhh5O6YUcYihm0NsZVTabqDsyMDbNcYKFLssVUw2BG3LQzMmFywn4jlO71NsAkU1V4mJRB5nyx56phjgpuTKuqkv4sAJWcymjBVIL8l4PZFa17jOPli2waY6FLfk85dOPTZwnJZikOuJ71H2OXay1ATN2DGNadjvoh0MwB24dHrMYeulK0oqaMb2aUvgJMtZBgCbunTGsvucc4qKbeQl3gjF41+rLKUaUH8WmQdyCkJiaDdjfuTrjFlZAZrxwDGdadxNHMKwn6u+OW72MWB5sq3S3EuJLxHPFxp0teSJV6IHWIbJc4JjvdvEbY3TCzRZa6wlRcS4/5jBo5xDUYB9VQgx2s+AUXFZbX9gpo7txerYZ1YNzdFv8p4atfMjN5Zx30s2LjIXgmeAweZDwczq2T1BP6NFYk8Ot9yNigVpamZiVFOczKJrZK47oIZiyNhWXwKsS9xiXGp7UyxNubebuDgpG4fvPVqJxCHaz1zMAnBW9a3+BqzWXILLkFgcXXbb7MNK41gEs45rrFHRJRAxZudjPigAJqqA2Tb/7b1F/+3HBwUwT7GTkIMwlnUDiOQ2CLPUmh8Liv1WD8xmCxrz52grLxnXAJzvv7O3MmCejqCOFwM9/ufq+AkbeT0wWi2LzgKlMaxK0QbYEZx484fJTZWWyu00yWU6W7kSJvF6LNYAtZWC97WNtohjN5J7Km9sOypix0dkTMf5UMupBXFdnG2QpAcs1VFqQdQeTwhKK2DJnjqO65fPJX3XyTeRzsfj4QFUz1Hagg/nSheOjrTlmaC3P0jCJfTbZcvhllyTXRUVBaSQYiZYbQIXqPn+qD1OAWH2IcchUZDxOKUERMoJBkEjikVH8SenooURcRJCFCKNTou4hkdpBJRgEKcVUAO6IhLIcV/UtyBuX+6RQAY1NvoQGdaK5GyUtlCgtAUgjBjb+sTsBADXTrA1MmRxDiOwDMXInm9DNNYq7SokujK/Bhv9ypP2LbDubSvZPSfzAJwJsB6Ct+QQAIfJR8ULR0b8FrgsiVbvUwxi2Y5rRgHJqca0dB5BGpPAbRW0RBFZntN6dT6qHh/1Fo6NloAFRzG6DnyXg33TigMR9gBLX9q0mGaHsfScfkuxqfw682KuhTXdrfkee60MP37SADG7AE8ze/Fosdjq9URIXQK00qAtU7KKE6+/X0dRySd2Vq06RQrU0jb7xyQD4MSde922VeFNE3/SN+0/6/TCs2r9AhroLIuo0ABwbRmyG5hwoJNJAM5cB61DBbRfFz/5B8A5AFzLEXbAO78BddNQrHNapwqQ2gbg5uEAv4pwA4Dz7nyiefB4KCJzB4Dz10HrlDY5vSsAmuNijikWi0rUJp0WQI/Y7eqh7V0PWl+u2jP2vGaAKb5AXhdcKGKD8V2pd83Hvnmm8gEa65x9+NrUjmCd0zpc/OO7fBB2sf0mcBGIOAfGd3nrk7N6nTkt2IBemx7IpO5L0Ag4d+H4qAHAHQDQUFyO4cJ7AG6F92fLU6f1zU+fdjQhRnBO03ogTXAgFjUP7zlpwJOWQEyOxA5pNh9ybi38Zqe35alTMO/xSRE7pKeg3rnyqy/XFI+bvn22CDIXNzOMndcV6NPTYIsd3pp39fm1/fjaQK1EH97rFuGBEbwsPjkQfVxEixox+MlnLh1+yBp65g0jjBc85kUcedCjxZLxMdZlkugGS/5jBkUntDhaMXHlJ2ZpHbTVBU7naB5wPglPX8UvtQIIkwAcfrU14PghteXVqYyAozBUdDwLxxXYXPiJn86YlkNNANzo1Z9uc9dBW4OCdhwQOUccx4jj8LiKWWnw2wcUPKgLJODwGjNezsxHQonjMAMb+nKuH7zPXet73ziooAkMeVCMjz61O6MxXgIRuSKgOvTsGSNkIg+o5AGbcihENonsgRY3FzLgOCbc6y/c3zH7biBBAzvOZHHQFxdMlgGE8sKRnRHRjW+cKgInmWCz5YF/ELCsBhUhwgTIahqvAnAOXONee/GLt8WeG0jQ0M8oIntHBNF/gBLCAjsOlQ8TAMF/NoTuLIafydBCUQ015gNwFQDOu1La4d7u+x/IOc2wXg3oQzNs6TMZnD7rFJsDLmwVOPaqhx/uOu/IoHIaaIkCE3GqMCd5wHEecBeAJLyLR4pdH2T8vwADANA824ekci98AAAAAElFTkSuQmCC"
-    nys_dot_detailed_ads_image = "iVBORw0KGgoAAAANSUhEUgAAAMsAAABNCAYAAAAIEpD2AAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAAEnQAABJ0Ad5mH3gAAAAhdEVYdENyZWF0aW9uIFRpbWUAMjAyNDowNjoyNCAyMDowODozNgWTeQAAABfDSURBVHhe7Z0PTFRXvse/76nppOAyXanMxlpnF7qwwQgNvqKZjWAwS800lj72YVqanUVfIEqDUXYl0gYiWTG4q41E2mhW6DSyBlKelixxaSAyZCcrBl7BOFnYwsu4ynam4nYo0HcbcN87Z+4ZuPfMvzswiGvPJ5lwDjP33znnd87v/Lnn+y8x//Gr/4NAIAjLv7K/AoEgDMJYBAKNCGMRCDQijEUg0IgwFoFAI8JYBAKNCGMRCDQi5lkETxh6FPxnHk6aEpAQs1r+18M5THom0HmlDfs+8cj/WwQhjMWA4qIs7N0cj5RnY/HUqtXQrWFfMSRpDt9MTWDw1m2c+rgPNhf7QiBYIbJKStCWEw8di6u4O4jY8g4WiZwQxmLGQGs6klksLA8ljNhtyD/XDyf717eK/EKM/7sRcaxCmRx34PDhq2iVo98SUtH47sso2MCK6qwE23+dhrlNji4/RvyuoRB7nmVRDvfAVSTWOVgscqLXZ1mlQ/KOXNirM8ktfwtZHztvKJQ4fQxpm79txCJBr6jT1+hgWM/Cj4QkbPouCzKcN69ic9lV1Pf2o866eEOhRGQs7mE7jtRdRGxBA8zv9sA67IHEvvMRl5qNZouexQSCR8lT0K1iQS8S7vzZAafLgcpznbiwxG5CRMbi+bwHFwboFT2w/cmO0qoGbL3kxKT8NWM10ky5sLCYQPCkEFGfZeT6CWS8zyIKLMcOoeHFWBajzKGvpQ45vK+auBUNb2YgL1GPON3CSIX0tQd9NwdQeb4fQ/J/GZnEB80mPij5rceJyqpuSK/moOSl55C8VjnS4cGNG39EOWlmA/WX0nZmo2JnMjI36hdGSCjEp3b/1Qnr77tRY+dHSXahuykTmTFyTJpyor7Rjcw30pD1rOxqTN514PjoOpzZGcbhIjWbmbgCNhKsPVGOshfUPn2paxdO/5Sc16CTa0bS/3M7x1D326u4MEZ/mISjv8jBoRfjF1w9cqxz7Dbq3wteYxpN2ah9hZz3eYWLyEaGbD03UNmiTq+skv34XbYBcfQeyPn7PmnD/tEk9b0RJh+40NnegX3XfBdORduFPOSGdCiClImAGFBcQvI53YBNxK2bby1myb1/cQ9XP+lG6fy1ZYrfKceZLQG79V6W2l+hRMVYsCUPt99JVfVV+JvLLdqPxp+wjAiC5BpGZW2bIvPV90BH33Q+IwuAdHcQheUd6GRxlbGFRMLQtY9hahplcQr//MSoZ/1HBMc+9yDxe2Hczhli6EXNqCfBhnffhmWD/G+K0+HEM6lGxLG4itkJWC+NIeU1YrTBLkGMuPJtcm5V2dGjrKIQVRn6wKNCjMnP+rDv7a759CqrLkdt6sIRk64JUm6JgbK4mjmMdLcg4zw1t2x0f2hCZqiLEYKWHyUZpJIqCfG8jMmxfuw71jl/73y68kw6urDheB+LLY7odPBvfYYRrmJOWL9gOkbLfjTvDm0oFJ0hBdUkoYIRylAouo3paHxHeXw8ksMaCkWHtN25aNzCogHxNxRqZNNfeOCcZdFgTM1wLeYCxmCGQlkTD0tRmIKz1ohDReksImOpsKA2jKFQ4l7IRO2B4MMxcUENhbIayaTlOuoNezB8n++98szB8wULBsOQiY6D4Q2FEke8lEbFYNLNW06MPJhjMX8kaZqFFk+URsMccE2xoI81a9iDmHAxx6DIuDk4b/Yg/9gJxB7rwIXP1Ikcl5qOhhBejXTfiQvnm7GZDjIQt83GJVDcFpKI84Xejs4x+v0c3GOjuHC5jbhD5LplzaQZH+f6Wnpk7U5l4SDMTKD1Er32ReRfHsbQ8G3UnCDxQnLO66QWVkJbkwLyf/phLlhgSHp8Svp/JD02H+9CuytAhs9Ow3atg9w7feZBDHHlMuH7yShgYdrK/zJD6RITd8p7bODzJ79kQhkLB2JybBCVxxsC5hV060ia0cAgSstPk2ftgm3G+808tDXxpkFBeBfMYtmGrLUs4kXCSK9cVui9t97ly8o2nN4ph61Nzcg4cBsjcpRB3FyrfP2lumCUqA0dj3zFJeTaGOyhfy0p6ubZOYhXfkMLMQmTjDjy9g30qQ6NR3ouC/oxgZbSZhzpdhJf2wNbdyfMpGlVH69HmslXNXlQecxKfnMeicdacOTKsDxx6iL9lKYPYOU6OAnrvsdCgZjDEHE79rXTaxOf/UobTFULbsBicd9sw+aTPbCS9HA6+vDGb0e5fhfJ8JazMDcNknunz9yByk+5ZnzN6vlh6oLdm9Tu8KfdyPEe6zv/iPr8MfHI2sHCHNJYH0zESOod5HrevBrC0EP2pRcdDM+z4JJJxZ5EpZHL955xTi4r9N73lXejU/Xosdi2I7gnEm2iZix+/INmM/GDjeo21f3gHlcY7Bh+wIIMgyFMDa/E1QPbXXVtaViv7Gm5YKOZHQDXDGfga55igUB4MHgp8HmWgmdG2U8i3JLwDQvOoyqggO1vM9609UePlzeoC5zrb4MsxLj1Oe6oav9YGL7PghzfSFNcXk3Bw184WiXI8AKSVUVlGoN27t5JC1b/Z3UexK1/DlksvNxEzViSv8N5yF95cIH8SVZOUhESMvIw3fq26sN3zHQ6dYaHY5hr1eL08SxEIIZXe6wEY00V6uterkBVSjiv/jFletbfoLwkI0HlxgBpZsUzez+7kMVG+HzonmaBlSQjBs+woIwEVy8LKrD9nbPWp0l/kwWXmygZSyoMXCZJX3PO6zLSyruAPmiH8UQeyl6MVw8ZU+hatzADDoIVZGaa638wJiSur/noiI6xbOGbUNL8T3AdAsakw459566G/Bz4KGAyBaWAb9UYRw9mqzuMUy5YL7PrNNnRPh6gM/2EMdKrTttAn8pP2I8fJ2JiVdMW88TrQozQLS9RMRaLWd2ppP7myIBsLO6v1QUyjtTwrb2OkJ/2IH2MYKTwxjJLnZStyNqgbk2Gei+i9Aq7zrUe3PA8acbixuTXLMjQE5eLT1/+4x1sWWkGZvAlC8roYAgw8JD1XS6vv5aCDstHmyUbi3FPIWpVs/eE8VHUM3/zw3tcwd+YjMYMFlahR8HebBRHuvrQQFqPjWqjcH5OO83Ex+KeTve0hgH8xfIP9ndFceLGF2qXNCElHWUB09SA4tdNCDrwuCgeLj4dXPxcXSzSTer5I4A8y4/UeUhn9IMPy0eXiIzlKV0qchPlcFrGVpw5Vgr7m/yk2rR3KYTvAZxXxjCknLRbRYzirRI0vpbk7ZilZaTiaEkhBi6WojHfhNqDJvl3AYnHyyfNOJpBc1+PrJxstFVmcjPHvlZtGhI3WZj8Uj4acoykFTQg97U8WIxR7ODfm1b70jHxyDUbkLY7H/aa3CgXyuDU994j7YuCGCOqqgtxxvvcJM22b0XVL/Zj7MP9OPNaNk4fCj4pGTn9cH7FgozkJDOyElNRW70fbXtCVVbEoxhTTxwmvJiDgbeIQZMyZ0zNROPpHG5JzTRu9C5tVj4SIjIW4/Y8tJ2UR1XsFbkoflHPGcocRq53IP86i1JcXaj544R6qJMUpILX98LuPU8eqkhGJrO+hW5t6No/ITEdVRX7yT2UoqOEJKRB3apITgfKva2aQ54fUBJjgIUY5u1WknGvpyKZGxXCeiM63tzKuZQa6XDDqRrijUWWZT/sRSlISyEFdDlXltK5Elb54HonzjrUrYtunRHF3ucmaXY4F0dfMiCB1RPP6BPkwCLZ9MO9qGITgxSbi5sp35iOjpN5KEslFdQruQuTpwGwWm/Apprcpq99kAqRlLnb1btQsFFduU06bqBcWdaWmaj0WbxIHnS2WJHxPjdvQOh8vwWVf/Jfzh8I9xfcTHgkeJyoOdM1PzdgO9sJKzcHo+LhNNzKzFlDW6tkeTI1YvrRMhz8CZd3eDYWua+/ilrvbLoH9cc/Rv2wluUdc3C5VO1QxOg2JKFEMTHY2jWKkWDLfxSTpwFx9cH8Xh/6NHRZvWvDjvdx80DLSwhjGUFL9yj67nowKdFFhOzfCiRJgvuuE61XOmD6WQPy29QrQRfw4MK7Ddh61o72Yfl8SiQ6TOiQl1UkngzVrHrQ3kEyY8r/+KHeLpir+AWFoygtt+JIrwtuxUi29/c37Sh95ywS3+vHkM9g6HKW1m7vgkfgG3iUo98z34QZsmSF9NMJTCrTalbCyKd9qLsiRydJh3SehxI8/DIhch6X8vnI8ZP8bwZG0HlXguRrybzXGEL9NRYnz11ZdRYmOnN/l7iHyvuhq7yn6CpvusSmji2ElHE9IL/1nZPcG42r6UM9XT3hSxe6gpmuvL6kyLMB4llYHRh6oLg/Al2pvJC2IRjoQk7xRe8qjRHuHN5Vx+N09cVFbFAsolyA5pki7SSuMlwij/mGFfzK3wlYC86jlMUEgkdJ9NwwgeAJRxiLQKARYSwCgUaEsQgEGhHGIhBo5DE3Fm74dnYuyNJ0gWD5ecyHjgWCxwfhhgkEGhHGIhBoRBiLQKARYSwCgUYCd/Dzf46JvRvCbtIWGLpX02mYFy+DIXjSoHIcPzUubLI4M476og9QyaL/LARuWdY/tUhDoURzLynB4qFaKeULu7o0l6Mjn30VReiLfOOX2TUuV2C8OsDLe1SOQ7k5SMxTK/Ye/VIIbCxTc5rePQmMBNdfWVCwgjwarRTDOoUhrFqNOH2Al/emvlEvtZfCve7weBLRPIvf5svjg4g9LPytx5NMdDSp9wjTtDF3hPCbiT/JZUJ08AUCjUS9ZSk4XIr3XtLP64xQncnzyED1dqYtInlg+6QT5kvs9WODEWWvmrB3iwHJ31VocYTUbVmKloiatN15OPNKItKoDohKw8SDQccIrB/1oNV36JZd6D6Uicy15DGovMWvnch8cxssqYpN/Oixf3ej8/d/CHpNStpuM2p3JSHdoNZOCfXM2tJ2GNKObRFqpeiRtceEo9uNSH9ev3A/BPo27J2xYZy/1MG0YmQKKg6hUbUBuT/ScA/iq+yqdKNQqYs33u7y35XFkIqqN/8NBT9KgNGnv0Mh+RtcRycTbe9nI3ed/PvJ+8OoK7VDesuMigxFvtC3SW8Poa6payE/IyTqxuLXLM/Oed+9VuEZxb7iFrgtP8fvXt4QVopCejCKmuMtqleGF68l4kOPsncsqN0SZqvY2XGcKvwANTRsLsS4xbebDSnY0mroQoyEuG91IedX/HviSaitMaMsJcx1Z1y4cO4ijgywOEFb2n6JMd0zSAxxX5R5l4wryEGZnfbusZDfLhfWqhMVOPoCd20eX/lQpRtBoVfjw/iTfPzekgKjwlD9mYNzoAev1CnTlH+bdhoj4zokc3vGzUPKXiUpe2Ffbw7A8rthfGZSZqZxk/xJ3rgurKFQdOuSUBVyiyREoCUiY7TkoyqcoVBm/hfDLKgmtKFQErZko61EuVcMMdDqV8MbCiXGgOKDhUH2/GIESduhSLRSNiQgJZyhUNbEIvenefNpeOeeZ+F9/SDQd/01kWFGW1hDoayGMYOk6YEkFg9EbHBDoeiTULzI7Z8eQZ9lDm5HP9MfIU25g7hF1+3emuGC3Qk3TfCZCdh6feKuJ2Cq6/HTEdG9kIJaFg6GNi0RmV8St09Z1qnqWM28uGwnTt2km1wQ987eF1Kem27YIB9HNVscGFFt8cwZ6c5cHFK2DIT548uaUdk7oR4lCiBUpCZQ2rbjZ5FopVxzwEZVDKhb53DgVFMLTPQ3x1pQc5PbkUe3Aa+yLZ2s75/HhtdPoJLbdsnbmnivcUJ2wcKiR+3ezUhWGsq8Hg0pC+/zGjwkTXdk4UyoSmTWg066iQrNy0vDfmJTxucjUGlQsPzGQlyog8c7mf7III4cJ4WKNeW43kbclGaYis7DfM4n7goMDdjxxkfEkLwxxipSYwTREaFEpiWyFZwSBlx/6capeXHZftT85iISi04jhxdxUULcibryq+w4qtlyFRnnSObI38pQIzXLwQK6X5cclKEuge94lxP1586j8lNuo7kfpgYXGwqVtpoZxBvHm2F+5zQyjl9FzbVRua80NopTv+mBjTtdRHIgmtjqt6PoUJeV6dGQ8HWqwTOozstVBmS9FqxTNo32Mw2k4iLH0Lxsb0PNLW6XGr0exSwYCctuLJOueyEFf6imYsC9anunyaMqIW5PCHchMi2Rfji5QmA07cdAtW+3yyUwMIBb91nYiw6bvk8z1l87xT12G1YW9mHt4PRrYvTYFkS+L1zaaoYYqi3gfscOuLjWKVI5kLDsIZ15pSv+0AVbE5c5rk50/o/a09j0XLAWV8KXin4exU9lgZSDMB50QB6BGxYaOhrV3VCOiWY2C8w+Ex+Sppn9Zjn4tY2TJF9FOoWpbLfLpkNewylLDTmkFATFvlqMZ9bRJ/HXTvF8FUC67dYk1xfQIW4jCy4XVJ+xphTjH3IaNs0V2LvEuiMspAJR9TUlibTR/vAaPLqn+e1El58VNZbcAyXoLkpF5rOKYVtGOLHVpeJsb8a+9nG5z8RD5Q6I4dRWl+D24ci3c/VTFAtIsJUOAVrE5YR0rgdqclGQopBb97FmBTRsPJ6AI1VBNXgeIStnLFvycHpnvKI5lIVIjzDNkJprpCCzb5aLzksfIPFws1eGwjbO7X7oZTWM23NwcW9kLYwhRksjH2wN3VpwYmnLiBGNlnRV51pykb5KE9NuudyvaSvVqEL6E4H6aME0eB4lK2cs24mvyoJe6D7FJ0knn2mGnGq6z/VZlgkqxnr5KsyHTyP+9YsoveaEWzV6shqZGVtZWAtGGDkPQZaVHvHbSlT/nQCd5S1x3HC6hMm7LBh1UpGmcrOmYfuohVRUTLvlSieGOZcy6oxz6gM6UomwoBJeg+dRKsv5WDlj4a9Mmvzldo9VED/96G7+ii6vRPS+fs5MQwqzcmRkYMuzLOyFtJhO2jfx4A+kYChJSNwMfnN9i/k5dSUy48GNWywcEaSZjFgrJfQgSiD8W+MIaefUB+hIVxHXkhtykfsDtYt45x4vzrr8rJyxcIpgiHkOh45lMy2OdJypTsIm9lX0SUdbRS6qikhn/mIJOt7KRvF2ql9C9WJMKElSZ1bQWozcczG5Z4t3IIBqvphhP5iiLuwPJ9DXIgdb6dyNHJTRJ6H2dJ48AkeX/bxV4icM5f6LY1Gzzdq0UrjVwMQ1zHxlL6rY/ViKCvFymJXKF/jNww3PoSHVgAJLIewVmeq0CEi/n9p02i4LOorSkUVuI21nLjqq05HGj5hdedT+4Uoai3WY069fjYQXTUyLw4zi1FhueE+H9B/TgsWii2BeS2RHMtJ99rCW6sCbcOYw1S+hejHZ2MO1DEP/3cPCPKRPQ+65oboU017NF5KpXM3sHhxYeMkpgHZK3MZUeQSuvhC1O7hVCFNOnG1afA0aXiulCx9/xk3+rkvCUXY/DbuNSOAGXuKe34zGfMUMusPDzYfFw0KMsdFsJBXPNpwOMTcm40Fly221TMWaWGTtNqOjnuTHga3IYuu+ZOYw0mvDkUBDZlrRxePVA5kRS4KvnLHAjv104jFEMy55plUzyHGkVtz7Eossgnktkb84MaypYpqDe6AH++cXHEYGXWx5sE5Z2CPQTqFrw97jJTQiQ4tWyqn3/CceVcxOw63MhLWk1fixYlC/d4C4l5yXMI9Gt84rU+E/0+6PvDYsP4AGUESsikXmzvSQwkqBiMhY7ngUI0ZsZS6P6yv1b778KnjBoMO3Oef60KkciaLnpRocl5qxtdiKmgEP+44klGNB52RJWiJUNKeYirGS1u0+uTafSXSV611yD01WJKoW7XHMjMPq1X5RFBZyHWlqAp3XOpBT3hFg0jCcdsoEbN2dMBWpF1FSIklbL1q0UmhaVF3105WR76ML5vKzyPloFE5mMNJ9J+o/Ui5jGUVpXTdax7hn8Wrm2FBJ19lOSfhS+d3X/nMpzk/asJmuZrg5Dienv+PNj7FhnDp7Hpv98kOtZyNNTeMOC89zZQCtSj0b0g+0dfwRv2ZRrYhN9iJBw+pZwZPLCrphAsE/F8JYBAKNCGMRCDQijEUg0IgwFoFAI8JYIoEfAqWS5ywoePIRQ8cCgUZEyyIQaEQYi0CgEWEsAoFGhLEIBBoRxiIQaEQYi0CgEWEsAoFGhLEIBJoA/h8EvVc5a2MX5gAAAABJRU5ErkJggg=="
-    nys_dot_designation_image = "iVBORw0KGgoAAAANSUhEUgAAAMsAAABNCAYAAAAIEpD2AAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAAEnQAABJ0Ad5mH3gAAAAhdEVYdENyZWF0aW9uIFRpbWUAMjAyNDowNjoyNCAyMDowODozNgWTeQAAABfDSURBVHhe7Z0PTFRXvse/76nppOAyXanMxlpnF7qwwQgNvqKZjWAwS800lj72YVqanUVfIEqDUXYl0gYiWTG4q41E2mhW6DSyBlKelixxaSAyZCcrBl7BOFnYwsu4ynam4nYo0HcbcN87Z+4ZuPfMvzswiGvPJ5lwDjP33znnd87v/Lnn+y8x//Gr/4NAIAjLv7K/AoEgDMJYBAKNCGMRCDQijEUg0IgwFoFAI8JYBAKNCGMRCDQi5lkETxh6FPxnHk6aEpAQs1r+18M5THom0HmlDfs+8cj/WwQhjMWA4qIs7N0cj5RnY/HUqtXQrWFfMSRpDt9MTWDw1m2c+rgPNhf7QiBYIbJKStCWEw8di6u4O4jY8g4WiZwQxmLGQGs6klksLA8ljNhtyD/XDyf717eK/EKM/7sRcaxCmRx34PDhq2iVo98SUtH47sso2MCK6qwE23+dhrlNji4/RvyuoRB7nmVRDvfAVSTWOVgscqLXZ1mlQ/KOXNirM8ktfwtZHztvKJQ4fQxpm79txCJBr6jT1+hgWM/Cj4QkbPouCzKcN69ic9lV1Pf2o866eEOhRGQs7mE7jtRdRGxBA8zv9sA67IHEvvMRl5qNZouexQSCR8lT0K1iQS8S7vzZAafLgcpznbiwxG5CRMbi+bwHFwboFT2w/cmO0qoGbL3kxKT8NWM10ky5sLCYQPCkEFGfZeT6CWS8zyIKLMcOoeHFWBajzKGvpQ45vK+auBUNb2YgL1GPON3CSIX0tQd9NwdQeb4fQ/J/GZnEB80mPij5rceJyqpuSK/moOSl55C8VjnS4cGNG39EOWlmA/WX0nZmo2JnMjI36hdGSCjEp3b/1Qnr77tRY+dHSXahuykTmTFyTJpyor7Rjcw30pD1rOxqTN514PjoOpzZGcbhIjWbmbgCNhKsPVGOshfUPn2paxdO/5Sc16CTa0bS/3M7x1D326u4MEZ/mISjv8jBoRfjF1w9cqxz7Dbq3wteYxpN2ah9hZz3eYWLyEaGbD03UNmiTq+skv34XbYBcfQeyPn7PmnD/tEk9b0RJh+40NnegX3XfBdORduFPOSGdCiClImAGFBcQvI53YBNxK2bby1myb1/cQ9XP+lG6fy1ZYrfKceZLQG79V6W2l+hRMVYsCUPt99JVfVV+JvLLdqPxp+wjAiC5BpGZW2bIvPV90BH33Q+IwuAdHcQheUd6GRxlbGFRMLQtY9hahplcQr//MSoZ/1HBMc+9yDxe2Hczhli6EXNqCfBhnffhmWD/G+K0+HEM6lGxLG4itkJWC+NIeU1YrTBLkGMuPJtcm5V2dGjrKIQVRn6wKNCjMnP+rDv7a759CqrLkdt6sIRk64JUm6JgbK4mjmMdLcg4zw1t2x0f2hCZqiLEYKWHyUZpJIqCfG8jMmxfuw71jl/73y68kw6urDheB+LLY7odPBvfYYRrmJOWL9gOkbLfjTvDm0oFJ0hBdUkoYIRylAouo3paHxHeXw8ksMaCkWHtN25aNzCogHxNxRqZNNfeOCcZdFgTM1wLeYCxmCGQlkTD0tRmIKz1ohDReksImOpsKA2jKFQ4l7IRO2B4MMxcUENhbIayaTlOuoNezB8n++98szB8wULBsOQiY6D4Q2FEke8lEbFYNLNW06MPJhjMX8kaZqFFk+URsMccE2xoI81a9iDmHAxx6DIuDk4b/Yg/9gJxB7rwIXP1Ikcl5qOhhBejXTfiQvnm7GZDjIQt83GJVDcFpKI84Xejs4x+v0c3GOjuHC5jbhD5LplzaQZH+f6Wnpk7U5l4SDMTKD1Er32ReRfHsbQ8G3UnCDxQnLO66QWVkJbkwLyf/phLlhgSHp8Svp/JD02H+9CuytAhs9Ow3atg9w7feZBDHHlMuH7yShgYdrK/zJD6RITd8p7bODzJ79kQhkLB2JybBCVxxsC5hV060ia0cAgSstPk2ftgm3G+808tDXxpkFBeBfMYtmGrLUs4kXCSK9cVui9t97ly8o2nN4ph61Nzcg4cBsjcpRB3FyrfP2lumCUqA0dj3zFJeTaGOyhfy0p6ubZOYhXfkMLMQmTjDjy9g30qQ6NR3ouC/oxgZbSZhzpdhJf2wNbdyfMpGlVH69HmslXNXlQecxKfnMeicdacOTKsDxx6iL9lKYPYOU6OAnrvsdCgZjDEHE79rXTaxOf/UobTFULbsBicd9sw+aTPbCS9HA6+vDGb0e5fhfJ8JazMDcNknunz9yByk+5ZnzN6vlh6oLdm9Tu8KfdyPEe6zv/iPr8MfHI2sHCHNJYH0zESOod5HrevBrC0EP2pRcdDM+z4JJJxZ5EpZHL955xTi4r9N73lXejU/Xosdi2I7gnEm2iZix+/INmM/GDjeo21f3gHlcY7Bh+wIIMgyFMDa/E1QPbXXVtaViv7Gm5YKOZHQDXDGfga55igUB4MHgp8HmWgmdG2U8i3JLwDQvOoyqggO1vM9609UePlzeoC5zrb4MsxLj1Oe6oav9YGL7PghzfSFNcXk3Bw184WiXI8AKSVUVlGoN27t5JC1b/Z3UexK1/DlksvNxEzViSv8N5yF95cIH8SVZOUhESMvIw3fq26sN3zHQ6dYaHY5hr1eL08SxEIIZXe6wEY00V6uterkBVSjiv/jFletbfoLwkI0HlxgBpZsUzez+7kMVG+HzonmaBlSQjBs+woIwEVy8LKrD9nbPWp0l/kwWXmygZSyoMXCZJX3PO6zLSyruAPmiH8UQeyl6MVw8ZU+hatzADDoIVZGaa638wJiSur/noiI6xbOGbUNL8T3AdAsakw459566G/Bz4KGAyBaWAb9UYRw9mqzuMUy5YL7PrNNnRPh6gM/2EMdKrTttAn8pP2I8fJ2JiVdMW88TrQozQLS9RMRaLWd2ppP7myIBsLO6v1QUyjtTwrb2OkJ/2IH2MYKTwxjJLnZStyNqgbk2Gei+i9Aq7zrUe3PA8acbixuTXLMjQE5eLT1/+4x1sWWkGZvAlC8roYAgw8JD1XS6vv5aCDstHmyUbi3FPIWpVs/eE8VHUM3/zw3tcwd+YjMYMFlahR8HebBRHuvrQQFqPjWqjcH5OO83Ex+KeTve0hgH8xfIP9ndFceLGF2qXNCElHWUB09SA4tdNCDrwuCgeLj4dXPxcXSzSTer5I4A8y4/UeUhn9IMPy0eXiIzlKV0qchPlcFrGVpw5Vgr7m/yk2rR3KYTvAZxXxjCknLRbRYzirRI0vpbk7ZilZaTiaEkhBi6WojHfhNqDJvl3AYnHyyfNOJpBc1+PrJxstFVmcjPHvlZtGhI3WZj8Uj4acoykFTQg97U8WIxR7ODfm1b70jHxyDUbkLY7H/aa3CgXyuDU994j7YuCGCOqqgtxxvvcJM22b0XVL/Zj7MP9OPNaNk4fCj4pGTn9cH7FgozkJDOyElNRW70fbXtCVVbEoxhTTxwmvJiDgbeIQZMyZ0zNROPpHG5JzTRu9C5tVj4SIjIW4/Y8tJ2UR1XsFbkoflHPGcocRq53IP86i1JcXaj544R6qJMUpILX98LuPU8eqkhGJrO+hW5t6No/ITEdVRX7yT2UoqOEJKRB3apITgfKva2aQ54fUBJjgIUY5u1WknGvpyKZGxXCeiM63tzKuZQa6XDDqRrijUWWZT/sRSlISyEFdDlXltK5Elb54HonzjrUrYtunRHF3ucmaXY4F0dfMiCB1RPP6BPkwCLZ9MO9qGITgxSbi5sp35iOjpN5KEslFdQruQuTpwGwWm/Apprcpq99kAqRlLnb1btQsFFduU06bqBcWdaWmaj0WbxIHnS2WJHxPjdvQOh8vwWVf/Jfzh8I9xfcTHgkeJyoOdM1PzdgO9sJKzcHo+LhNNzKzFlDW6tkeTI1YvrRMhz8CZd3eDYWua+/ilrvbLoH9cc/Rv2wluUdc3C5VO1QxOg2JKFEMTHY2jWKkWDLfxSTpwFx9cH8Xh/6NHRZvWvDjvdx80DLSwhjGUFL9yj67nowKdFFhOzfCiRJgvuuE61XOmD6WQPy29QrQRfw4MK7Ddh61o72Yfl8SiQ6TOiQl1UkngzVrHrQ3kEyY8r/+KHeLpir+AWFoygtt+JIrwtuxUi29/c37Sh95ywS3+vHkM9g6HKW1m7vgkfgG3iUo98z34QZsmSF9NMJTCrTalbCyKd9qLsiRydJh3SehxI8/DIhch6X8vnI8ZP8bwZG0HlXguRrybzXGEL9NRYnz11ZdRYmOnN/l7iHyvuhq7yn6CpvusSmji2ElHE9IL/1nZPcG42r6UM9XT3hSxe6gpmuvL6kyLMB4llYHRh6oLg/Al2pvJC2IRjoQk7xRe8qjRHuHN5Vx+N09cVFbFAsolyA5pki7SSuMlwij/mGFfzK3wlYC86jlMUEgkdJ9NwwgeAJRxiLQKARYSwCgUaEsQgEGhHGIhBo5DE3Fm74dnYuyNJ0gWD5ecyHjgWCxwfhhgkEGhHGIhBoRBiLQKARYSwCgUYCd/Dzf46JvRvCbtIWGLpX02mYFy+DIXjSoHIcPzUubLI4M476og9QyaL/LARuWdY/tUhDoURzLynB4qFaKeULu7o0l6Mjn30VReiLfOOX2TUuV2C8OsDLe1SOQ7k5SMxTK/Ye/VIIbCxTc5rePQmMBNdfWVCwgjwarRTDOoUhrFqNOH2Al/emvlEvtZfCve7weBLRPIvf5svjg4g9LPytx5NMdDSp9wjTtDF3hPCbiT/JZUJ08AUCjUS9ZSk4XIr3XtLP64xQncnzyED1dqYtInlg+6QT5kvs9WODEWWvmrB3iwHJ31VocYTUbVmKloiatN15OPNKItKoDohKw8SDQccIrB/1oNV36JZd6D6Uicy15DGovMWvnch8cxssqYpN/Oixf3ej8/d/CHpNStpuM2p3JSHdoNZOCfXM2tJ2GNKObRFqpeiRtceEo9uNSH9ev3A/BPo27J2xYZy/1MG0YmQKKg6hUbUBuT/ScA/iq+yqdKNQqYs33u7y35XFkIqqN/8NBT9KgNGnv0Mh+RtcRycTbe9nI3ed/PvJ+8OoK7VDesuMigxFvtC3SW8Poa6payE/IyTqxuLXLM/Oed+9VuEZxb7iFrgtP8fvXt4QVopCejCKmuMtqleGF68l4kOPsncsqN0SZqvY2XGcKvwANTRsLsS4xbebDSnY0mroQoyEuG91IedX/HviSaitMaMsJcx1Z1y4cO4ijgywOEFb2n6JMd0zSAxxX5R5l4wryEGZnfbusZDfLhfWqhMVOPoCd20eX/lQpRtBoVfjw/iTfPzekgKjwlD9mYNzoAev1CnTlH+bdhoj4zokc3vGzUPKXiUpe2Ffbw7A8rthfGZSZqZxk/xJ3rgurKFQdOuSUBVyiyREoCUiY7TkoyqcoVBm/hfDLKgmtKFQErZko61EuVcMMdDqV8MbCiXGgOKDhUH2/GIESduhSLRSNiQgJZyhUNbEIvenefNpeOeeZ+F9/SDQd/01kWFGW1hDoayGMYOk6YEkFg9EbHBDoeiTULzI7Z8eQZ9lDm5HP9MfIU25g7hF1+3emuGC3Qk3TfCZCdh6feKuJ2Cq6/HTEdG9kIJaFg6GNi0RmV8St09Z1qnqWM28uGwnTt2km1wQ987eF1Kem27YIB9HNVscGFFt8cwZ6c5cHFK2DIT548uaUdk7oR4lCiBUpCZQ2rbjZ5FopVxzwEZVDKhb53DgVFMLTPQ3x1pQc5PbkUe3Aa+yLZ2s75/HhtdPoJLbdsnbmnivcUJ2wcKiR+3ezUhWGsq8Hg0pC+/zGjwkTXdk4UyoSmTWg066iQrNy0vDfmJTxucjUGlQsPzGQlyog8c7mf7III4cJ4WKNeW43kbclGaYis7DfM4n7goMDdjxxkfEkLwxxipSYwTREaFEpiWyFZwSBlx/6capeXHZftT85iISi04jhxdxUULcibryq+w4qtlyFRnnSObI38pQIzXLwQK6X5cclKEuge94lxP1586j8lNuo7kfpgYXGwqVtpoZxBvHm2F+5zQyjl9FzbVRua80NopTv+mBjTtdRHIgmtjqt6PoUJeV6dGQ8HWqwTOozstVBmS9FqxTNo32Mw2k4iLH0Lxsb0PNLW6XGr0exSwYCctuLJOueyEFf6imYsC9anunyaMqIW5PCHchMi2Rfji5QmA07cdAtW+3yyUwMIBb91nYiw6bvk8z1l87xT12G1YW9mHt4PRrYvTYFkS+L1zaaoYYqi3gfscOuLjWKVI5kLDsIZ15pSv+0AVbE5c5rk50/o/a09j0XLAWV8KXin4exU9lgZSDMB50QB6BGxYaOhrV3VCOiWY2C8w+Ex+Sppn9Zjn4tY2TJF9FOoWpbLfLpkNewylLDTmkFATFvlqMZ9bRJ/HXTvF8FUC67dYk1xfQIW4jCy4XVJ+xphTjH3IaNs0V2LvEuiMspAJR9TUlibTR/vAaPLqn+e1El58VNZbcAyXoLkpF5rOKYVtGOLHVpeJsb8a+9nG5z8RD5Q6I4dRWl+D24ci3c/VTFAtIsJUOAVrE5YR0rgdqclGQopBb97FmBTRsPJ6AI1VBNXgeIStnLFvycHpnvKI5lIVIjzDNkJprpCCzb5aLzksfIPFws1eGwjbO7X7oZTWM23NwcW9kLYwhRksjH2wN3VpwYmnLiBGNlnRV51pykb5KE9NuudyvaSvVqEL6E4H6aME0eB4lK2cs24mvyoJe6D7FJ0knn2mGnGq6z/VZlgkqxnr5KsyHTyP+9YsoveaEWzV6shqZGVtZWAtGGDkPQZaVHvHbSlT/nQCd5S1x3HC6hMm7LBh1UpGmcrOmYfuohVRUTLvlSieGOZcy6oxz6gM6UomwoBJeg+dRKsv5WDlj4a9Mmvzldo9VED/96G7+ii6vRPS+fs5MQwqzcmRkYMuzLOyFtJhO2jfx4A+kYChJSNwMfnN9i/k5dSUy48GNWywcEaSZjFgrJfQgSiD8W+MIaefUB+hIVxHXkhtykfsDtYt45x4vzrr8rJyxcIpgiHkOh45lMy2OdJypTsIm9lX0SUdbRS6qikhn/mIJOt7KRvF2ql9C9WJMKElSZ1bQWozcczG5Z4t3IIBqvphhP5iiLuwPJ9DXIgdb6dyNHJTRJ6H2dJ48AkeX/bxV4icM5f6LY1Gzzdq0UrjVwMQ1zHxlL6rY/ViKCvFymJXKF/jNww3PoSHVgAJLIewVmeq0CEi/n9p02i4LOorSkUVuI21nLjqq05HGj5hdedT+4Uoai3WY069fjYQXTUyLw4zi1FhueE+H9B/TgsWii2BeS2RHMtJ99rCW6sCbcOYw1S+hejHZ2MO1DEP/3cPCPKRPQ+65oboU017NF5KpXM3sHhxYeMkpgHZK3MZUeQSuvhC1O7hVCFNOnG1afA0aXiulCx9/xk3+rkvCUXY/DbuNSOAGXuKe34zGfMUMusPDzYfFw0KMsdFsJBXPNpwOMTcm40Fly221TMWaWGTtNqOjnuTHga3IYuu+ZOYw0mvDkUBDZlrRxePVA5kRS4KvnLHAjv104jFEMy55plUzyHGkVtz7Eossgnktkb84MaypYpqDe6AH++cXHEYGXWx5sE5Z2CPQTqFrw97jJTQiQ4tWyqn3/CceVcxOw63MhLWk1fixYlC/d4C4l5yXMI9Gt84rU+E/0+6PvDYsP4AGUESsikXmzvSQwkqBiMhY7ngUI0ZsZS6P6yv1b778KnjBoMO3Oef60KkciaLnpRocl5qxtdiKmgEP+44klGNB52RJWiJUNKeYirGS1u0+uTafSXSV611yD01WJKoW7XHMjMPq1X5RFBZyHWlqAp3XOpBT3hFg0jCcdsoEbN2dMBWpF1FSIklbL1q0UmhaVF3105WR76ML5vKzyPloFE5mMNJ9J+o/Ui5jGUVpXTdax7hn8Wrm2FBJ19lOSfhS+d3X/nMpzk/asJmuZrg5Dienv+PNj7FhnDp7Hpv98kOtZyNNTeMOC89zZQCtSj0b0g+0dfwRv2ZRrYhN9iJBw+pZwZPLCrphAsE/F8JYBAKNCGMRCDQijEUg0IgwFoFAI8JYIoEfAqWS5ywoePIRQ8cCgUZEyyIQaEQYi0CgEWEsAoFGhLEIBBoRxiIQaEQYi0CgEWEsAoFGhLEIBJoA/h8EvVc5a2MX5gAAAABJRU5ErkJggg=="
-    port_authority_construction_image = "iVBORw0KGgoAAAANSUhEUgAAAI4AAABGCAYAAAAaRqzRAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAAEnQAABJ0Ad5mH3gAAAnISURBVHhe7ZwHsFXFGceZiePElkRjLDFmLBmjUWNJMho1ig1QFLEhY2/EChFLRLGbOKiEaELsMiD4ikBQisBTeALSHuWBgNKkNynSHk3F9fzP2e/cb/fsuedwcs814vef+Q3c/Xb33Xfv/275du9r1OhP3ZUg7DDOQkFIwlkoCEk4CwUhCWehICThLBSEJJyFgpCEs1AQknAWWgybtEx9UL/CSe/aBerJHlPVzy9+K9Jun+aVqlOvaerjBesU18bNX6qaCUvV+fe9b9T/3c0DnD+DqJ28XHWumq6OufZtv/7FHYc767no+Opk42fV1h8ZZbKj7P+RHJ/nY91aGq9TLM5CizTasu0rwwjHXveOWrxyk47G67neH4dtzmk/VJcm67Q73lV3/nOcfpSsXjWfhj8H4EVSqpFgkZtxxkxf6XU+xQejCUYP0rqGbX79w67oq9Zu3KZLA02Zs0Z1qZ7hj1CbthTaQM9UTPPb2cbpPnhu+LNe6DdTlwYa6z0PMU7pyc04mCp4DCMG11FX91NvDJmrHwW69z8TjDYHXFSt5i3bqKOBMNXZxmncbojRjk95q9ZtNWKgath8HVVq7pINkbjgpnG7Dt4rVkbj7HZOT/XhR5/pSKB9L6hUsxev14+U2rDpC6Mv4u6udbpGoEsfqo0Y565/1fnmAa0e+cAY3bDesfsU42SjLMYppn4jF/r18aaRlq3eHOkPXPf3UbpGoJs6jVbntq/Rj5J19l1DI31y43y6VIyTlsZtv0XjYP2y+7m9/PrYhXFht2T3CZNxwQhpjfPHWwdF+gNinGyUxTjVw+eH0wfA7smuf/1TH+rageZ4I1DLB4erHzV7Ux3tbaUx3XHNX77Rbxe3xrnqiZG6JBAtpm1kqspGWYxjL47jeHXAbN2iuNas3xrmZewR50xtHIC8D9cJN/YPY4SMONko++I4iQdenuTnd+KELfUhl/cJ6xczzqGt+qjNWwt9TZy5OowRYpxs5GacM9oODqemw1v3ddaJ46fNK/2p5tFu9d6TCnIy7f9dp066ZWCk7t7nV4Q/B/zkvAojjpGJx/dq+qYR/801hbirf8FNblOVsHNTFuM0ubsmHDkITCO8DpJ5PI6RgMfBX1+cGMZbdBjmlyFvw9sVA0nEI6/qZ5T94pLoeRmP45iCx/7QZqB6y1vsr1y7xXvRClr0WYN6pf+syO+FBT7vz+a+FyaqE28yd5BXPj4yjN/eZaxf1uGlSUa7Yti/I/rj/QPkzngdjLh2nWKUxThLHOdPrw2cbdT5fZsBOhLosodrjTj4fEPhSILa4w1LK7xBl3Ss1Y8CnWxt07GL48IbRrE0xxVIXja9pyZsgyOQNELmnNoMHLNYlyo/840y9JtWOL6pfH+efhQIry/1D94etUhHlML5oD3FJ5HbGoe4liXtlq/ZrP8XiJ+OpzHOam83RSLjLPC25Wl1vLerwgjAZRtnzya9dCQQGeeWZ8fokoLwBmObP2LKCl1SEOWNbOPw03d71EKmG224cabPW+uX4UwvrbB5wFqOJ1WpH8DfE8geVdOQu3FmzF/rPzkIB5z8Md9tZTUOB9MO162dg2Gek8U4Pzy7p/GJx5uI3BJvh+saXDAGyrlxVngfHN4GbxjX8/rU32UcDhb8XK0fGxGpAzDCcj3yer06+NLexu/y8Gv1zrZJ5GocrEO4fnlZb9XmmTH6kVINW770d0Wo+20ZJ0kwjv0GvPzOrEi/YPLsNbpGIJTFGefHzSr80Yrrz96ohlipjAOwBuTCTQWS6+wuLbkaBzkX0qCxi/0yHDFwxz/4SjAV4IiBy/Vi8HblNI5t6n9UzYj0C4aMNxOOONBNu8ZBphzrK/RTSuMAvPa2sF50XaRLS26L49PvHOw/QRKSazS383s3mOfxAmM3woUbgry/X3s7BS5XUjGLcWBAvrt4qudHOhIIxtm/RbV+FIgWrJyfXVhlnMTTFY40xpk69/Nw5AWlNg52UEtXmRsU+ybljpLbiPPu2CX+E0wj2nLy23+4uHVjp9HeExyimt37nqq3pgHXi5XXGgfl9vEFzt8wEmEERbZ69DTzqgjWc2gXN1XZowA/1C21cQA+ICRM+a46O0Iuxjnuhv7+EyThFJyyswS/k4OdEdphXZNGMxdGP/EgT+Mc2LLauDNUTEPrlob9xRkHi1R+qxG3HSn2nTBOHlNVxXtmDgFDvV3n6ifN02tKUuFfGCNOeIGRp7D7A3kaB+AoBFc74s7SMD09W2lOoXHGAX95fryOBEIyEOXf2xEH20waWZBpddXBFpePQLg+yuP4tgOmqPtfCrLF2HH89vrodQwb3qdr8Yf5ntehBSmHx7ETtOMAORdaF+FMLS4Xgiwu9XXKbdE6/GfRWRmunVCZ6/Xbw5seebv9WlRF6thgjUj1T719x/M2NnJWJWQilxEHZ0L8E4H1gV0HuREe558IgGnBboN6vA7fiQBkaylmT0GAjzauOMXAQd60Z8eFArkYx77Nt3BFQ8QIdZ+s0lHlJwWRid32xXZdovxdDK+/S+Me/raVhF3Wrme9YdTBXWWuO7qMM+J8fYPnxGMwJVfb58YbccEkl6nKNg6ErCrmZqoz4ZPVOlLImOKN5sICmurz/Ap2I/wyF2Eb5+uvVXiKDsQ4paNsxoFwIf0HZ/Tw67iMA3h+A2dCGKmwqNy+3XOBVtwuwjYOhFGMFq5inNKR+1Rlb12xPUWdcTMKU9XNT48O2+J4n1+V6DtigZq1qJA/ed1x1EDw6xv8yigdSnLjUO6IwLqMC1coeFwwyd04yEPgK7xcf+sxNdY4ACOMSzAQfZ3GBTfOE92n6P8FwmjEp0Ixzv9GWYyDs6hRU82UPJJhJCyO7T7wlyJsIfFl1+Pw85gLvbXNRQ+Yp/N8KrONc8SV/9WRQGKc4uS+xqHMJy4WTZpVWNdw2SMOsb6hcBrebdAcZx0OH3EuuD84xLO//Uki4yCpiGuq9tka7tfwvgWTshkH2N8RJ7lGHIDvT5Hi7sBw7BGHyttZqX2IjOO61gpJHqc4ZTUOwDGAfU+Y76o4/PoFvqznqsPhUxGmKR6z1zy0q3IZ5yHrDyoJUXJZ4+BuL53j0JUJzq9a9w3jwPU9cUDnVICPIHHc03VCWB+ZaDuO50Jx3IxDGf4CBpXBMPLdqnTkYhxh50eMI2RCjCNkIjfjUKf4u3muuPDdRowjZEKMI2RCjCNkQowjZEKMI2RCjCNkQowjZEKMI2Qid+MIOz9iHCETJTUOpijh+0FJjSMIEZyFgpCEs1AQknAWCkISzkJBSMJZKAhJOAsFIQlnoSAk4SwUhCSchYKQhLNQEJJwFgpCUbqrbwCHV+uNKcN6NgAAAABJRU5ErkJggg=="
-    port_authority_professional_services_image = "iVBORw0KGgoAAAANSUhEUgAAAI4AAABGCAYAAAAaRqzRAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAAEnQAABJ0Ad5mH3gAAAnISURBVHhe7ZwHsFXFGceZiePElkRjLDFmLBmjUWNJMho1ig1QFLEhY2/EChFLRLGbOKiEaELsMiD4ikBQisBTeALSHuWBgNKkNynSHk3F9fzP2e/cb/fsuedwcs814vef+Q3c/Xb33Xfv/275du9r1OhP3ZUg7DDOQkFIwlkoCEk4CwUhCWehICThLBSEJJyFgpCEs1AQknAWWgybtEx9UL/CSe/aBerJHlPVzy9+K9Jun+aVqlOvaerjBesU18bNX6qaCUvV+fe9b9T/3c0DnD+DqJ28XHWumq6OufZtv/7FHYc767no+Opk42fV1h8ZZbKj7P+RHJ/nY91aGq9TLM5CizTasu0rwwjHXveOWrxyk47G67neH4dtzmk/VJcm67Q73lV3/nOcfpSsXjWfhj8H4EVSqpFgkZtxxkxf6XU+xQejCUYP0rqGbX79w67oq9Zu3KZLA02Zs0Z1qZ7hj1CbthTaQM9UTPPb2cbpPnhu+LNe6DdTlwYa6z0PMU7pyc04mCp4DCMG11FX91NvDJmrHwW69z8TjDYHXFSt5i3bqKOBMNXZxmncbojRjk95q9ZtNWKgath8HVVq7pINkbjgpnG7Dt4rVkbj7HZOT/XhR5/pSKB9L6hUsxev14+U2rDpC6Mv4u6udbpGoEsfqo0Y565/1fnmAa0e+cAY3bDesfsU42SjLMYppn4jF/r18aaRlq3eHOkPXPf3UbpGoJs6jVbntq/Rj5J19l1DI31y43y6VIyTlsZtv0XjYP2y+7m9/PrYhXFht2T3CZNxwQhpjfPHWwdF+gNinGyUxTjVw+eH0wfA7smuf/1TH+rageZ4I1DLB4erHzV7Ux3tbaUx3XHNX77Rbxe3xrnqiZG6JBAtpm1kqspGWYxjL47jeHXAbN2iuNas3xrmZewR50xtHIC8D9cJN/YPY4SMONko++I4iQdenuTnd+KELfUhl/cJ6xczzqGt+qjNWwt9TZy5OowRYpxs5GacM9oODqemw1v3ddaJ46fNK/2p5tFu9d6TCnIy7f9dp066ZWCk7t7nV4Q/B/zkvAojjpGJx/dq+qYR/801hbirf8FNblOVsHNTFuM0ubsmHDkITCO8DpJ5PI6RgMfBX1+cGMZbdBjmlyFvw9sVA0nEI6/qZ5T94pLoeRmP45iCx/7QZqB6y1vsr1y7xXvRClr0WYN6pf+syO+FBT7vz+a+FyaqE28yd5BXPj4yjN/eZaxf1uGlSUa7Yti/I/rj/QPkzngdjLh2nWKUxThLHOdPrw2cbdT5fZsBOhLosodrjTj4fEPhSILa4w1LK7xBl3Ss1Y8CnWxt07GL48IbRrE0xxVIXja9pyZsgyOQNELmnNoMHLNYlyo/840y9JtWOL6pfH+efhQIry/1D94etUhHlML5oD3FJ5HbGoe4liXtlq/ZrP8XiJ+OpzHOam83RSLjLPC25Wl1vLerwgjAZRtnzya9dCQQGeeWZ8fokoLwBmObP2LKCl1SEOWNbOPw03d71EKmG224cabPW+uX4UwvrbB5wFqOJ1WpH8DfE8geVdOQu3FmzF/rPzkIB5z8Md9tZTUOB9MO162dg2Gek8U4Pzy7p/GJx5uI3BJvh+saXDAGyrlxVngfHN4GbxjX8/rU32UcDhb8XK0fGxGpAzDCcj3yer06+NLexu/y8Gv1zrZJ5GocrEO4fnlZb9XmmTH6kVINW770d0Wo+20ZJ0kwjv0GvPzOrEi/YPLsNbpGIJTFGefHzSr80Yrrz96ohlipjAOwBuTCTQWS6+wuLbkaBzkX0qCxi/0yHDFwxz/4SjAV4IiBy/Vi8HblNI5t6n9UzYj0C4aMNxOOONBNu8ZBphzrK/RTSuMAvPa2sF50XaRLS26L49PvHOw/QRKSazS383s3mOfxAmM3woUbgry/X3s7BS5XUjGLcWBAvrt4qudHOhIIxtm/RbV+FIgWrJyfXVhlnMTTFY40xpk69/Nw5AWlNg52UEtXmRsU+ybljpLbiPPu2CX+E0wj2nLy23+4uHVjp9HeExyimt37nqq3pgHXi5XXGgfl9vEFzt8wEmEERbZ69DTzqgjWc2gXN1XZowA/1C21cQA+ICRM+a46O0Iuxjnuhv7+EyThFJyyswS/k4OdEdphXZNGMxdGP/EgT+Mc2LLauDNUTEPrlob9xRkHi1R+qxG3HSn2nTBOHlNVxXtmDgFDvV3n6ifN02tKUuFfGCNOeIGRp7D7A3kaB+AoBFc74s7SMD09W2lOoXHGAX95fryOBEIyEOXf2xEH20waWZBpddXBFpePQLg+yuP4tgOmqPtfCrLF2HH89vrodQwb3qdr8Yf5ntehBSmHx7ETtOMAORdaF+FMLS4Xgiwu9XXKbdE6/GfRWRmunVCZ6/Xbw5seebv9WlRF6thgjUj1T719x/M2NnJWJWQilxEHZ0L8E4H1gV0HuREe558IgGnBboN6vA7fiQBkaylmT0GAjzauOMXAQd60Z8eFArkYx77Nt3BFQ8QIdZ+s0lHlJwWRid32xXZdovxdDK+/S+Me/raVhF3Wrme9YdTBXWWuO7qMM+J8fYPnxGMwJVfb58YbccEkl6nKNg6ErCrmZqoz4ZPVOlLImOKN5sICmurz/Ap2I/wyF2Eb5+uvVXiKDsQ4paNsxoFwIf0HZ/Tw67iMA3h+A2dCGKmwqNy+3XOBVtwuwjYOhFGMFq5inNKR+1Rlb12xPUWdcTMKU9XNT48O2+J4n1+V6DtigZq1qJA/ed1x1EDw6xv8yigdSnLjUO6IwLqMC1coeFwwyd04yEPgK7xcf+sxNdY4ACOMSzAQfZ3GBTfOE92n6P8FwmjEp0Ixzv9GWYyDs6hRU82UPJJhJCyO7T7wlyJsIfFl1+Pw85gLvbXNRQ+Yp/N8KrONc8SV/9WRQGKc4uS+xqHMJy4WTZpVWNdw2SMOsb6hcBrebdAcZx0OH3EuuD84xLO//Uki4yCpiGuq9tka7tfwvgWTshkH2N8RJ7lGHIDvT5Hi7sBw7BGHyttZqX2IjOO61gpJHqc4ZTUOwDGAfU+Y76o4/PoFvqznqsPhUxGmKR6z1zy0q3IZ5yHrDyoJUXJZ4+BuL53j0JUJzq9a9w3jwPU9cUDnVICPIHHc03VCWB+ZaDuO50Jx3IxDGf4CBpXBMPLdqnTkYhxh50eMI2RCjCNkIjfjUKf4u3muuPDdRowjZEKMI2RCjCNkQowjZEKMI2RCjCNkQowjZEKMI2Qid+MIOz9iHCETJTUOpijh+0FJjSMIEZyFgpCEs1AQknAWCkISzkJBSMJZKAhJOAsFIQlnoSAk4SwUhCSchYKQhLNQEJJwFgpCUbqrbwCHV+uNKcN6NgAAAABJRU5ErkJggg=="
-    passport_opportunities_image = "iVBORw0KGgoAAAANSUhEUgAAAyAAAADWCAIAAACmMXGmAAD//0lEQVR42uxdB4AURdbu3JNndjbnJcMSlxxEghFBRdQTxXTmcOKdnjmn88z5jPffnaeggDmgIChKlBwkh2XZHGdnJ3Worr+qemZZPMLsTM8G3YcSd3uqXle9+uqF79GaplEdWyD6DwtFt/dImseDhKbJeGj6WKOC4a874i87yBSOOin0H43UrCVwlOjxDEO3/AC6w2rkSOW0FFr/G0ipAIQk1R+Qa+r9FVXemgZ/fWMA/b7RF2psCvmCiiyrGloH8PB3sgzDcYzDKrrsJqtVSHKY3Q5zRqo9Jcma7LK47GaLReB5pCQ6oiT6Vx/dkQUeqS80CfRbTYOSrPr8Un1DoNbjr6hpqq7z1XkCXp+kK0qSgQa0lkpG8+c5xmoWHDaT1SKkuCxupyXJaU51WzNSbUlOi9nEiwKHlIk/jT6KWjqOomCLibXXaofH+sMxxtNxtNclXdKphe74AAthmEZvYOe+Gl5g23ssBIWgXzSK5RmB50w8KwgsQzO8wJjQycgzosC3/HpVt6+6jtFJAClyKHQ4QQNEyEdRwaZtZSzL0okZpKqCnExnVppLVbFakCo6C8DSwjqiODJiALSq2qYde6t37K8uKW/YXVy3r7TB2xSUFQApjWZYgWd4tC44DJUYiiXfjZAWQL8AipJVVZE1iKAHTSE05XZZ0lyWnMykHrlJ/Xpm9ClISU+xpyVbde2oLY7o9t8AxxWg/4J2B4NvHlCDGHpWN27bU7V1T+W+g3VlCF3V+n1BCdL4ByewJg7tHiQUS9Ma1KeKEawKkJJVVdVkFaJHIbWbzXyqy9Ijz909Jzk/09W3Z2rPvBQETFmODWuJmDL0NNiRFBUeF9QYFk+0PUdCsBUNw9cDtCDRO8BrusUJABms/Y6jvS7pkk4tnQNgrd1Ucs1DH9utIvM/7oS2HkxkAOhYEARa5HkLAlkcazVxSU6rzcxlpTlSk+1JTlNmir0g2y2IXPP3AoCPio4JKdAiQCfchl/Krrp3PtJzglTnC8izpg25/ZoJnQ5gEY8SHmuDJ7h6y8EtOyrXby/bV1rX6JVUTWNZRsSAG6MpfIgi7IBUCvVJY8USLyzATtgIgtAfBxHeglABQFFURcH/ZrWKqU5zboazqDDnpKF5wwqzEVIjLwjBlQ5/8kW0hGT91kM/rC3evL30YEVjdYMvJGtILQLHku3CUhGkgfAHg7VCU+Gdhc//ZhgCmfDXICyqAk1RALoDIGCKnuN0WnrmJA/qkz6gV/qowQWpCI8SF6lK8EHHWVY6wEJLAE3BJ6kY1bTxCDDSpbDKGRark6VYiK4AFM+id/W/CwrC9rWwXdIlvyHpHABrzbri8257DyGY9h7LYcF6I+Ef8j8aox4KohkaXVShiCCXWUhJsmWl2vKzksYOyR87NJeLOLfQSYnAFkWOAXRydxCfFprDE68t+ce8NS6HORHPRwAhKElFfbLnvzCLEVigQQadqx1j7v8rxOmAT0eOC4PAQxWeOZ9u/G7tvsoaryypNMsgXMVzDIILvzqSMGhg0HczOhxnwg/UMPiIRGD1v28Zj0Ufg9aUClQFQTaAD2WHlS/IcA3ulz1r2uAeBan6lwGVRHHZjgK2AHFbsWw4WF5X5//w6y0/bSzeW1Lr8QYZ4p/ieVZgMZpuDps3T5xEjRmqpSqwY4+sCwRN0DcdGbPGWsIRRU0BEACkVIrj6Yxk+5hBeeed3r+of3b4aUT072DZdvUbEYDFcdSB0qbVO6pppn2wHxtJZ0DvgMbQiuI59FKQcmiTyIkcY7fySTbBZuHNIlIhFwmDQ6gRZyOlXw466nbtki7pkNI5ANbaDSUz75iD7qx0x/B4QB1gEVuO7T92LuCBMZHrHzoANHTThjQAQME3bzXZaRk1KG/CiG6jB+cW5LoZcgKjkwI9InLEtI/orx+djyFJvmj2nN2l9RYTH+czj6U0WdVMHPP8nVNPHtVdVWGH9WCht0deJzoNGVkBqzcc/M8na3/acFCBmkkQBAS5CC5mSYTFwDUJ8QfTxPsFGYQhNKhoVCgkISR6xpjel507dEDfdIfdjFcODRmq3U68FpgHj5RlaAR5DpZ75n6+8d2vNgZCilngeAGd4FiB6GtwWIohiWVGvBuI9xvSjx6RRHsOe7aCCvZs9chxX3P+8NPH905OsiH1oL/HPkW2PcEBuYBhrL1xT+3G3fUIkbfLMMLKI1qAmv574mclaFdPckU/OIblecZu5jJTTSl2E0JdDosg8LSOCwHUfa9dUKtLuiQq6RwA62cdYDnMLNtB7u2tEOIL0UKS4g3I6LDslZty/ukDThvbq3/PdF7gAI6WteclG5D3j87CtVsO3fDwx7KiiWJCABb+LACCIeXmi0ffcvlJHTlgCoDGkcyeXfur/vvpxjlfbQ5KakqSiePRUUMbAxSiF02TFFDnDYose/LwgqtnDDtpeDeGY1UIaHzOtcPKAZFTlqYhSzEHSus+Wrjlk+927C2rS3GiA5nDqLMN3y42YhCiW02jXwr41YnD82edWzRhZA+XA4FRDdCAbb/MIh1gaRCs3FKzr7JJ5NgOckv89TgBjlZjdxtNAVVTFWwXLCKX4hKzU60ZySaXHRkGDsFZFUFcjFq7pEu65ATSBbASLpBc89GtGxklZO19AUkFMDfDOWFowZXnDe9ekNK+eQ/6AcCy9P99tPaZt38QTTzHcfE/9uifpWkBv3TS8O5P3THF7bJoCGN1yIswWnKqqv3ro7UffbNl18E6i1WwiIIGAI78tbm/kQSiNZpmZVn1BkKpTsvMKUOunDEsBWcdtc/KgQRj8QQorFi3/5n/+2nLrgqW5xxWQQ8AkiAp3WZuDlz8qpHAKUuhzdXUJJlN3OjBudf9YdTIwXn6eNorLwsSrxG6X/24oaqiISjwHRRgkUQx4pvEtTgkPohxoSbJGsLLVhOfnCT0zLblZ9jRl5B0wg6U6NYlv1U5ShE1bOc87NaNvwtgtaVAknsFNCgpOK85w229/qIxl88YRuFDQEMXR3SOtvEU0c2V4eiGxuDdz3619OcDVnMCAZaGPXmq22F68d5zhg/MQVdhtsMYaYhz6iiWZFztKa598IVvft5ZwdGUSeR5ju0IrjY93S8gyaoCu2Un/fH84TPPGkQzjKLCNkjmOyJHChf9sXX1vjc/WDNv0TZfSDaLnMjQGo4WtrOiIL7MwJCsoouM0yZeOX34TReP5gVWz9yiaSayv9oozEXKR2C9V1q6odIXkHmc09f+aylKgSR1UsM+XVXDxaFUTrJlYJ+UdJeIIBZQIUPqorsihl0SjZANSLNH+LbDlS16FJ8+DJ3IPY0m25lAKrwUAa1CHNNmWUL200GSl48rXQCrTUUjd23dBQIglEMKOgZGDsj56x/HjxySh130ANustnSS6ABr7eaDs5/8ytskiTjFNVFKBhCfcsGgcsussXqUsN33iH5xp0gSOsewAIAvl25/5LWlDb6gw2piCd+AhusEO8TCg7ovFOkwpDT55fNOKXzkltNSkm0AaJgWASdmJUqhgCTp4zQdCqfOLVu976FXF+8va3DZzRzPUnpKIuwANCTobenDgFCSgC8YGto3565rTh49NB/tLhWgGwxJsMOKaiOgQ9OwtMr/46ZKRaNIhLC9VRS1YFSNqzNIsQGhKiFoXuuZ7Sjqk2wz8SpJ5WKYdkrd75JOJSRkAQ9VB6rrA2RboMOHQtdsRcaV1Lg+mBTwaAD9GzJylKrSCqbIQ/tWz3LW0N2ysJtzZP/UsIu8w0sXwGo3AXoNogpqm4JOq+nRm085f8pgXCUGaIPygaMSkoFLv/HBquf+/ZPVbCLlYIn6cD2U0+gNThjR/bUHzjVbxPam3YjQFFG4WtAXCP3j3VVvfbwObV2rRUSDZdkOF9DBTlB8rcNhmqoa7+Th3R699Yxe3VM1nIME2YSBY0jqBTlSgbb4p91/eeoLb0BOdllwJUAHU1FkwOTGrIG6xpDLZnro5lPPP3Mg1hKpTaTbEGChsWwv9qzdXouuLh1vQbVyJui0UzS/pGanWU4enOaymwAu+uzUc+qSthBs6HHhDvhuXeXuEq+JsFrqIAlhdpZkkx6un9DvQDD8l1hYUlaswpGFKf27uzRAd4o0wC6A1W7SnJuFmVR9kkXg7r9+0h+mDaEIa2KbmX9kGoMB5fanv/x62S53kpWmE2ktSQW+Pyg5LOYFL12cl+1ud9adSBU9Tj95+LXF//5kvcUiWEw8Sbii2j7j6oSiFxrqjjc0vMYmf7/uGfdfP3HMsG4EPTCJWDmEahVw2PXCLFq284FXF9U2Sm6HSIgs6HZJtI9q2PrbZdhGf9DGc4/OPuOc0woxiyneX5Buu2FrG3bVbdztMYlsQrdXm0wFKw4ZLikIUpOFsf3TUt0Wre3JvbqkswnAGAk2BZTFa8o9QQUBLBqvpRZdPf7nd0ceDpgJD5mgcYNT89PtgFC7dXzpAlgdRKAvIHMsc82M4TdcPMpkEhDSZ6mEh1xwXgVL7z5QNfMvHwQU2SKKiQVYYUCjVdR6//nI+VMn99O0cDptW8IYPfChb2M0GI5jIID3v7RozlebrRbeJPAdIeMqGsEOUE3zB0JWQXzpvrMnju6BSbKgxlDGJOM3c3eht4SJyGnqvU82PPuvn4KyYjELnWgzIqUgLQksN/uSMVddOILFNZhtcYfRGySoqrZ8c9W+siaTyHV6gEUEJ7lrQFagxcSNKnR3y3YBgDRKM2xXPlaXHF2I/5uqqPF/ubpc4HGucavqJLCtU1VkdiYVZaS4xDCfTYeXLoDVIUQjnVRCMvD7Qued0v+xv5xut5pUBTKJza7WAKARvPjPJ+tvf/rL3HQXrZfXJ3zlwspq7/RJha8+ch6OOIC2pnQnvkOSXEJRPEf7fNLf3/nhvc832G1mnmcwk3gH81odSzCPGo2xlD8gIQ2++eD0iWN6AlxIgX/Ev1lwTgStkc4zuDD/jfdWPvbm93a7yWzikcHrRJuRdCWiJUkNSvKV5wy9+/pJnMC2ATM+wGgDhoLg259L65tkk8DBzpGbewLRSCUhuivJCp7lxKLM7jkODLHwcqQSmAnYJZ1WCMCC63fW/7yj2m4VITlmol8nyMrJQEt3iBOGpltMIiaZ7AyLrAtgdRTB7W5pqMigut5366yx9900GSeQ4HMhUd4dXA3GoOezV9zx4dK1+9OSreTjEt4xDeJSOEVk6fULZrM8m3gc+T8D0MJUsQhcAlV78u2l73y0wWYRRZ7tHJmTv54Prpvz+CW3w/z6Q+cNHZANFABZyNLxbhZ0hpJgJMJq3KKfdl378McWgbNYRI3qqIlXx1MSlmBI8vrBwzdOvHbmaBygSHCAGpASwjqP9O3qMhVAnmd/O9wGUA8X4oJNgWOmjM1JcZoUlQSM6d/OLLvEKEHXPo6BC1eVldYELCa+teYD4OQ/0C3LOnZgBsPh2E6ngAJdAKujCAxn10BJVkMh5ZnbzpoxZSCpDsOX3kQYLFIcx4SC6qiZryHrbxI52CYFTjjVHeDU449evHjE4HxM6U63ac8cfPUGhCSTYz74fOM9L39rEXnRLNCEQbHtxmHolDQIvd7QkH5Zz991Vl6OW1FVzgAPFq774TnmQGnD1ffNP1TV6LCImCSp4zR4il7I9kKG2RdSOJr+1xPnjxiSr+GO2wmcjR4WKavxL1xZKpoIvOpsajuh4BZYIZCZajllWIZJZFVNY9qrH1CXdGBB5xiA2gdLi1VF4/lWmyaAe7/DQT1cw/qlKrBj9Rs93qy7AFaHEtIVGAaDst0qPnXbGZPG9EILC52d8R+WLUXPrSEtYJmvlu686YlPk1xWrq1cEpDEBT0+6arzht1/86ltmdEfnjuOe0GOYzdvL7v0rnmyCuxmgeqwvPLRCQSYi7vJHxo3qNs/Hplus4qApB7HnBOjZ6kxNF1V47vz2a+Wbyh22ESK5Tr7DkQWrykQ6p6V/NYj5+XnuhPaUUAHWLuLPd9tqHDaxM7m9Yt2khoEkgp75tjGDkhnWJ3iv9MB8C5JiGiRrg8sTdc0BD9bflDk2RjOcUUF6Go3ZmBar1ynShzPncIQdQGsDieQEDk2+ULpSfZn7jhrzNB8hN2N5abCTEoUzbDoc7hbHv386+U7nHZLm1FDaCQSGZLkPnkpHz53sWgWAMFYbSOQUIpyNNfkk2beNmfXwVqX3YSTuDsCh1McglvC0AzSbVm1908zRz94y2kQg67Y2Qh0cBAMKve98M1Hi35xJ1lowpXe2TECIO2pvb7Q2CH5T/11Sla6M3GEt4RllFqxpXrL3nqHTfhtAixIeuxomKNoUA/X0MIUiJ2Cv825dklrBUba3aIL/MadNev31Jt5QvbSSlEUIHDspOEZGW4LIOWFncJYdwGsjiiEcE1raAwW9cl6+4kZKUk2Y+kM0BmDA2QsX1vnu/iOuaWVXovI0W2rW0VV0U3mhbunjR/RrS0BFsDoikGb/tl//vjavNVOu8gxiWKub3tB60SSVZ9P+vD5i0cV5auAeAdjUi4BB/T8hZv+8uRXLoc53OO68x+bkMRTAdAam6Rrzx9x300T0YWGTkw2lg6wvl5VWlYTsJoT1eKz3UVn9FNUjaHg1LE5KS6zCjpHFX2XJFpgBGPxNP3d2tKSqoBJ4GK486kKsFj5qSMzzWax3cl9opcugNVBBYfRNFBd63/oxlOuv2Q0oac2jJNJr93jeWb5+gO3PPqpCqFA2hi35QQRyAtJ2uxLRt946Zi2bKkHSdhrzeZDt/3tizpfACFL5rcFsHAyli84ZmDu/z35B4SKcIpba4o0tTAlIOYclyRl6nX/2VdW67abNYKu2r0TjmFqgjAQlHmOmfPsJQP6ZCRoAZIWINS8JQcCEhCF37jtQjr0BeU+ua6JQzNwXgPaZ13lhL97gRGyEqCAr1Ye8gRUIaYsA0VWU1wigu+dqw1mF8DquIKTsSSZZ9jP/3FFfk6SqqpGlfgRQkqWobVn//XTW/PX2kw8zsZq29nhvtd++aRh+c/cPjU52doGTiwMUinIsZw/IN/6xGdLVu9Pcpphp6IbOPEcSd2fgrvEqH+9bPy1l4xSNUzHEf3r1Xsy0rhykH71Pyue/veyZJcVe3h0fP9bAVg45Z2hq+p9p47o8e+nL6IS0zeb1KxocxfvR5ut82evnUBI7Qpmgzz7pNxUl0UljbB+E8ulS2IXqHcho5mq+uB3a8vRZZ6Pyd6GJLVXrm384Ky2DHfEL10Aq+OK/mo8jf6zTu736kPTyaFgjBMLaIBj2bIK75//9sXWPVUWq9D2ngmowUBIctlNz989bUxRQRs0ftadgjzHf/T1lpuf+CwtxcZzXAfkao9LwqWoIBACbpfl+bvOGjU4H6gqE/XG0QEWx9HFJbWX3DnP0xQ0i3y4vLSTp6m11BJFgoIa1Gpqff94YPo5p/WPsybgqIJeRUWd/8sVh0wCH2f2GmHH1WICuDQZicEqPIrgbkpQVkFumvn0UTmgc7kauiQxQkKEGkvTOw40rN5RxzF0bId4IKSM7JM6qLe7c7UN6AJYHVowu5qqotX54j1nTxzVQyO37DgPAFLWARia+37Fntuf+VrWNJHn2j63BqDDDagBSZ19yZhbLjsJaAlv/KzTUkCNnnL1OzsP1iQnWcniMnLiYX74yEEY+f/X0tJXgl+o0cAFI0kIG7zy9Il9nr5zGofwc9TeGRhuDUa/9O/lr8xdZbMIxlawRqslGGmjEfkyw6EwJAUlPr9c2D3lgxcuMZkEwwtaaXKurNhWbeb5OFnJ9PuVirveRjVC/ctIEhj2IzGEQ7i5y1vzL0YuPU1PeAfogyYPS89KtXcuZ0OXJEL0HCyowlXbavaWezmeYVtvckllvTplTFZ2mh1t0k4EAroAVkcXTQN+v3TeaQMfu/U0nucAiBeI4BoqGrIa89K7P7383xVOh4lh2qEDLW5aTFEeb/CU0T1effBcQRSoBCdi6X2B1m4qufD2OU6bGc/Z0M7WkNRS4UbwkEKwWJaAAlRZARo4/DVoADzLmEy8Ged+kfOOsDVG72GKfjDozsdTzPxXLu7TPT166KDntpeVN/zp8S93FFdbzQbXvsEwvsSFHJoKg5KCdKUAnHVO2hkQbgiG4jjWZOJEAf1KopvEecsaSqhAABYm10Fv6JGbTr3grMG6Eyv+D9AiPczRxWXNtuqt+xsIiW1czwSkObzNxAo8E43NpsPtrqGiAkWFSMOKrJHMKMhzDKbUJQWm6LAy1nMMAPo4amB354h+qZrRHsEu6XSCe6vTdCCofL+hqsYTEvhYzhq0qCRF+8PEfIcd3YLiJlBuQ/mdAiw8Z9I9CxMpRjcK/E34SxmagoStGOejMPi6T+t9whPEgY5OFn9QSnVbX7576tCBeTq3ezxCsryphsbgDQ9+vGZbabLT0i5F1aTRNfSHVKuZm/fCrB55yYnLdCdNcXADD/SKbn/y80+W7nTZTZA09jCCExEvIhrXDSArgP5T0SJw2iyZqfasZGtedjKaIEs+BSFKjzdUWtVYXFpfWukNaUDkWFFgBJbHHUZoBi9LdD8zJM2OoL2KWu9154965M+nqxphLY8i6Zi4NOi5X2567B/fcRzHx2QQ/0dDeHug8aAnowWMVBSSEarRLCY+N92ZmWLPSrG7XWZeYDHTBIShkLLnYH1ZVWNZTZMvEEIQS0Q6wlCL9Fg0yAhAvVcUTfv80vD+Oc/ffVZGmhPhrfgfDyNeOoRdFv9chiuncGl6XM9UVWASuAlD0pKdZuVERpvEc/WWUEAFNCBVk6GQHJRhnTdUURtq8EsAYCTNcjTJDWP0oGn8Sw+9PlkGKU5x4tB0m4XHVvO3EVbukhgFbX2qsi70w4YqSVGQSWm1PYGYBAvtyotP7Y4XKd0FsIwdYgIAFjI96N5sMwk2syCrWnQvHBNUqUBDB0NQBhL6NggQyEJXbMJLiy/YiWBCx0SjmuYLyH+cPuzeGybHDwjCZXQbD158xwcWMyfwPC7kb3vuZT1biIKHyhvfeHj6jDMGJg5gAXLWoCPu4KGGS+/6sN4bMGGHGXpncbdNI51kFHR6SYpZ4HvkJo0b0m3qxD69uqUcHwdUlHu+X3dg9aaD67eX13h8yO4IPK5eZhHuNGKRY+1SFLJoiqIte/f6jDQHbp9zoqRjzGDE0l5vcPZjny5bX2xYFJUUN2oUppAAEPbKSRkzOGf04IKRQ3LsNtNxvg9hgtUbS778fufa7WXVDU00oEwWwajFijEQKSdUVFVVtHuvnXTZjGHxe4ipZoBFU5qqfb2ypMGPGUni1KIiqy67MHVcHocbKp9gp9B6Pyhy9WOOjAnq/xgMqaXVgf0VjdX1kqppHFIp+s+Iswtg5Ix7M4wZkNor14GMa6dnTuuSOIT4pOH2/Z61O2rR8d3aQ5JsUgpZ11SX+ZzxeYD4FzrRgvqdAixAUU3e4LXnD7ti+nCPNxSN7UOrRFK0gKTICvB4A6VV3j0H64pL6w6UNXj9kknkBJHHTi3j82mwNPqlPrnJ7z59UYrbGicQwT1uGfql/1v+2Nvf52e7KMLq3n6OfFhe450xkTR+JilmiegUC8gcWZr5+Jtt97/8LaYS5uOlZojgQ5wc0+gLDe2bdcV5w04b21s0NT8Z/irXShcSFzy84DbvrPjvx+sXrd4TCioWK6+Haw1C6njl1DYEbr983Owrx0dT1QUATm/fsqNs5m0fIMNmMgmGcF+RJaz5/ZLdar7i3KJZ5wx1J1kieoTN95vmj9EDhXSL5KwDh+q/Xb5r/rdbi8vqHTaLDrEMycrSiS0aGwOjB+W/8dh5Dpsp/swhgrop9CYbm+RvVh9CEIaLu4QQYdPsFMvpo7Jj2P16jJqJUD4yYdSFvfL7yny/7Kuv80osWnmcAR0mcT8BCjuxCrs5RvdPQ2/XUI7kLulkoiF8pMKftlbvKWk04xaErVtipG8s9AfVwgL7+CGZmCAbtmlftTjldwqwkI2q9fjuv3bStReNivkhPr+EkNaWXVWfLv3l+9X7FEVLcpkwxkpAPg0yWLKkzHvpksH9suMEWPq5dcEt767bUZ7itLZv4T2aiz8ouSzm1QtuQqPCpE0J6IcLiNMOyOqTb37/3y83WS08x8YLsKBe6k9R1Z7AqP45L997dnaWC2dzYl6EE0exND3fiMZgNxiUv12++425q3cW1yQ5TeHUMCPeC3qG1ycN6ZX+/vOX4M7WJ4IOGqBYjp77+abZf/8iO8NB4pYGHLoIRPn8crrLevvVJ08/rT9FAl6QsMxDdKc9xuOhjgxw1hCll+Bt2VnxxOtLflx3wO22iRy2tPEbBEhC1UEZABXMf3HWwL6Z8WfR4maXGoKqVGVdYOm6CtWIVlchSe2Tax83ONOQzHFdtwwELMM1+qQNu2v3lfpEgYlfn3qXz5CiZrnNpwzPYsPh8S75PQo5qGAoBBavK6/1hEwCaXfbKoBFOGy9fnn8wLSBvZIUBTtEO1GM8HcKsJA0eAK3XXnSzZeOhRCc0H+jEShNrnxEXbg58eGTR5KV9dvKXnt/1YpNBx12E8cwkETdDMTZ6DQvKfc8d+dZl583PDaA1TLxtrKqccLlb4tmTuDamWNTb/xc2xj89MVLhg3OTxB3DnrDDEeXVTX++fEvtu6rsphxsXD8I8eeRV8wN83xf3/7Q/e8ZKDhVHKGjsqxEqmkIzXMZFXX1jbd8fTCxWv3pTosyIpAPS09pgWPz+BIsp6k4IrC526bctbkfideOdiZSd/4wEdf/LgzPdWpTzL+hRwKKWaReer2qZPH9oQkrRASHw/2Vh77PqqvWFIEgL+MYjT01jyNgRf+s3zOV5sEnB/GcDEt4GbaXj0Aob/M4tKGO64cf+/Np8RfB94MsPYealy5rRpXU8RnuHAVVUgdXZg2oGeSIQArQieLXwOyVwgBL15TXloTNGE2VDouLzJ+X5qiQoSAp4zOdTn4timrBxEDxxB3vEYdpUlUi2qTw/48XdrRh/8bFr3dVnVd4MtV5RwupyA9KlsJsDQA/ZJ81ujsvHSbCujORcb3+wVY9R7/7VeOJwArKrxCeGgiWzZSG6OXkIfT3Snqmbd+eHPBzyaRD/cVMVINsKrOd9qonv/39wtj40Rs2bLgzTmr//bO95hAsr3zT/Xlh2DKxVOGPP6XMxLU+FlP3F61/sBfnvqqKaiYBANoKQiDBmCh9sCNp50/ZSDAkS5CudB6S61vQeyk0eC19y/4dtUel9PM4QqvVmfu6CtDI3lFQMZlHAiIpCZZ/njesEunD2eZEyTvYLVo2sgLX/VJslkUDYlUQkwYEbj2/BH33DAZEGhDSAP0fztBRFhrsRgITaymI6o5n2144u0fGJYWOD6GNwnDglefrADCjsaiJ48vyn/1oenxc47iuAbBjhv21mzZ7eG4eAGWXj9x7kn5qUlmo7gPmnWr80AGJfXzn0p8QU0UmThtFyQ1jyFZmTYmJyvVnGiuhvDNF21ASMAV+onWkXMY2UEYMdvh9B1aNwkw8qJhF8BKjADSEOKXA3U/baqyWUWMrVppH9ELQhsUfde0cdkpTjPpI9qZyPi6AFa0AOv4oh/h6Dd3/v3rOQs3pbhtbJSujGifD31ByW0zr5qHQ2kxdLtsblmAVvmVd364YtNBu83U7gBLF39A6Z2fNO/5S3DjZyOyjP9He/jtvPvJhiffWooL5lk6fuSAg5shpW9eyisPnp2bmRT/KtKLDxoa/Nc99PGGnRU2s8hFlxPTTEGJBAA1KAFFViwWITc9qU9+yuii3JOGdsvOdEKonRC7oicUH6qffOWbDrsVfbohykfgwOMNLnzjqr690lSSaB+P6N390EiffWvZy3NXpibZsNE+4UYLZ8zpc8QANBBUkZaQPUl1W4r6Zo4cmDeoT+bgvhnEdxjvlHUuMSBrK7dWFlf4SXVk7IgFQlLpArWZk3uYTKyxpSAt7117Shq/31RhFllC3B+XbdCIvTqlKLtXnt1wD1aLe67GULpqGf2yhu48qqoFQpqigpCshhTsANErxXH1N83wLG02ccgEmERG5BmBY/A6J+Xg+uFNE36Ldszy0SIUG4b4KY90CPz67/U/QOLLYw+7hvQVRn4PSVo5TR/1mdSJBgkghbS7ZF3Z3vImmykWwhfcXFUBdhN75phcu5mDUd++m3GN/pntxZHcBbAMAlgR/uvyysZrH1iwvbjG5TDj0mejksYgVBQgScqqOTe6k20xhNIg4SpA94nS8obL7ppXVe8zIQPTMQCWLKvI6r183zmjBuclAmChPYYe+8I/f3x93hqnw2JIFRppZidNGtn9ydumoJUZ/7AJR4PGMuzqTYduf+qL+saAxSxGY5J0b0wgJDd6Q2hq+emuYYNzJg3vNqQwK91tt9pEinCSkEaCJwZYS5bvverB+ckupCVjli5atDzHrJt/M8OxqhpvD2A9woiWcZNPunD2+9uLq1NxvvyJpoYACvkCtNIa/VIopORnJQ3tlzm4T+boovzeBcl2m5kKU5FjZqg4p6zfZIIhZdnGqsr6YGzcP4enjC7xCjCJ7EWn5GNqEWMd45Ejk9awR3bRuoqq+qCJ4+JMJSV1OfK4ASmDe6UaWx0MI/FNNhzJhKoKPD7V4w3VNklNfiUog5CkEnozCHB+HS5wibCzYujEMxBtBWT8zGYeHSkOq+B2mFIdomjC3bg1oAEaskbQt8QmgHDE8awxNPgIaBKS2SPWNGyRMcJSmK2G1MhrPr/ikxUphIlU0B8VlXY5hJxUS8tjApAQMOZTiRqEfrhkfyAIRDGW9YQWDwLKuanW00dmxxYaxHcTcl1ol8BiF8AyBmCFXdIQ59N88+POu5//RpE10cwb9VZJe2bQ0Bj69JXLigZkx5AMHskLob/6fsedzy7kWHTexWJE0TDCFywj0p+bnxkMqbdcPObmy8cC4rc3NosRjTMYku95ZuGnP+xIcRmT16+PecYphQ/+6VRB4CkqXn4yigqnvaMfcz/b8PAb35tNrN5guTmMFs6sR/YOl75h26EATZKxyyoz1T715H4TR3XvnpuckWLjBY4Ks3ri76HpqPyp6MvemrvmyXe+T3JajALfvqCckWT94b3rSblevEsGRhoJItC2Yu2Ba+5fAFnGZuE10MyPpWdY4fUZCQRSKgAhdHIoarLdOqww86wJfYb1z81OdwoCp7sLAD41cA9GKn7mjrAmYUOjtGR9pS8k8zFw/0RE55IIhNSsVNPUMbmAlPwaeAE57JAAkOXgroPe1dtrSfkAHQ8fG05MDshFPd2jB6TFb1+b0QBRLMAIGFPGaxW1wb3lTQ2ekF/CjiuyM8geYvH3kFgh+ZbmUdE6Jx7UKW3J6sDbjWUoi4VLRmAixZKbaTdh2h0cvgYkP49tw+ChXnzAUaCsOljXiJuRx/wohJGSnUJWikXfGS1LdBGIRFZFrz4ISaC4vKm8Loj2aQBbEtwHQiVeR2RbBhW4Rw1IbWkwVXSI0LApKJfXBIF2vDOIgGD8kPW7ajE/Q0xnN8nE0FKdQs8cOwT0iZ3wRwxAEzg2O81i5jmtlcn1RkkXwDIGYOmCDl00QklSH3550cdLt1vNgmHMqPg1QWRKHp992qzpQ2PwYOk85sGg/PCriz9Zst1i4rENbX2ut0rK5CgNYtpHZM+MSNPBbPUBeVi/7OfumZaZ5lAg4Aw1amgJodd9w4Ofrt0eJlaN/5noXaNj79yJ/R6dfapoFiBJjYlz0MQ9g72M6PdX3zN/2Yb9DptJp7PFznhyIOigCr8ECB1WsUeuu6gwa8LwHmOG5R8xPD2djQQ7oh8VUtSDL3373pcbXXbDAJY/KKc6zD/OvVEvCIpT93q5CSRUI2j1vfKv5S/PXYUsKKuDmHCoFBI+cez0RQowm7iMJFv/3ulnT+w7flh3Tmhe85qq6SzBuC7JaExPHaz0Ld9UqUL8QmPeJTCcHiAP7eke2T8dbfxWvdBWfBAxEMGA/MOGihpPCPO6xnEikepgtSDDGhuvhC4tTtNwvySkSISVa+uD+8qbDlYFfCEVoR+WcLgi5MmwLZl0j3KhiOTRRh6s6enw2LhidgmInWFmgemZ6+yV43DZRJ6nEYxj8KMZ2Cas9PphzNJwwfcHK+pDFoGJRXtkck1+ecyAtNEDUhVCRUY3J6vhHzgSXtso7Tnk3V3WpEgqLvbEqJXmyPfqFQAIP40qTO5XkNRyDCRGD7cf8CzfXE1F4cVCr03AkZIYb+P6bUnDTtzWARWEEJGRzEgynzIi02YVKbJx2l66AJaRAKt5wAt/2HHHcws5jjW2j1uDN3DrrHGzrxgXWzI4Gtjeg7WzH/v8QIXHQihJYhgDAlhotyTZTA3+oEZomuOlUAy3mpIQmHj+rmljhxUAoBoVn2qeeEW199r75u88WOe0mw1xvOEjJCCNK8p/+s6pyS6LQqjS40wwgmFHo4ZOtxXrimfd+YHTIRKGAoQeNFnWAiEJHSJJTnP3vOTBvdJHD8kbN7QbH0EMcZa/6ZlqNz3y2aKVOx1Ws1EAC6Ec9ELXfHCz1WYyhCc9PFpSGbq/pO7Wxz/ffajOQlr60BQGVUEJU52bTXx+pnP0oLwRg3OH9MrMyHBEppngjkx6xI2COw54Vu+o5RhSqhDri9F5gJqC0uSirD75joRW5NGk/nTtjpodBxpxi6I4GEKRjtFbyHJbzhqXE5u+NVI9qpeNQAZyNER3ipr60O5D3v2l3qCiiQIn8PiIN7CaSKeSDoZUs4ktSLf2zXdmuC24dSumySU++8S3r9ZZZOcs2qcCBE1i8/rgiTQFpNNHZvbMSVII7QgdiQxyuKUCtXVf3ZY9DT4JmM0cfzT0A3C0nB7TP6VXnqvlltHIG9mwq2bzXo8otkOPtShF7yjQPds6bmAGw7bFizuqdAGshACsPfurr7p/gccni4KRPAj13sB1M0bcfcOkmAHWt8t23f38QlxcFmuD55CsZCZbzz6p39zvtjb5QiK6nsf9UghbPab5/ssV466fOQb9wdiAOZrp/pLaK+6eV93gt1lMRgEsdIRkp9hfvv/sfj0zFAX7ZgxIMCJeLI7DTalPvfKtg5Ueu1Vs9AV9ATnJZumV7x4zJP/kkd175eM4oJ6Lq7ZYwPF8vp5lf9PDnyxatddpFY3qcAIg8NQH//3khRNG9zAwwQ7ouSUMfP6dZW8tWGsycYGQ0tgkiRzTv2fG8P7ZQ/tlDy7MKMhKZnmGCqdi4OBRou+xEVZPbf2OOnQImUQ2HlIzEghGK02dNjYrO82aaMoD3J26uH7NL3VoJcdjbNFawgAr2XLWmBgBFvZ3ksRWlsPLsq4xtONgw6HKAO6wiT0ihE6C1ou4DRPs8CQU+AhmyQA4zHxhN1dhgQvBTYDdnTRxkyVWaBoGJOWD74pJFkeMAAutGVlWzhqLqzjVyJ4j6Ap7edftqt20rwGBDp7ljhWEQDYZDWVSUUZOmu1XhatAAyu31Owp9ZpEA8qxEyRIA+gcGdDdObxvMoCGNjFtjXQBLIMBlt4rV1HUi/4yd8f+WquFN/DhnqbgBaf0//udZ5Ekk1ZYFk1n2lTVx//xw38+W+ciid6x7Q2vPzhxeI/HZ5969QMf7y6usVkNwCu4CRFDN3j8p47s8cqD03G2qaEvBR8b+6pm3fFBQFKtMRWzHGXMJFoXDEo3zRx96x/HA4DMPWDjc0O3DF+gF/TW3NU3/+3znHTHgO7p504uHD4oJy/b7bKLum+JkEkdsQbiD2EgzVxz34If1x2wWQWjnIhIUU0+6dTR3f/xyAx92MZUSOkMKQy9eUf5zNvmovt6n/zkk4oKJo7t2b97WmqKTX/LJIcJ6F9sXFHv8YQ0U8e5Kj9urNpf0aQfQnEALA1hdzTsaWNy3S4xwd43rKWSat+PGypxAk37ASwYpl2gsRcNwl/2e7bsrw+GQIRuXlex8aVhLTYghuPIjCO0lZFkHtLTnZ1uI8EqwvPFMAmiddCPj/Ia35eryq0mJrbIMuYWVJBq6GljkL0waSS6iTuBsowkg3W7anYebBIYmuWO13lEVQG65p0yNDM92dISYKHpKxL4bl15lSdoEmIMg7SBYA+cRo8gIU4VAKYdmsFh6QJYxgMsmqCZq+6Zt3JTCcIfBj680R+aMq73y/ef09pTihC+0YfKPJff/eGhKo/DZqZIUVlrJqZ3g6XqGv33Xj3puotH3fXU158u/cViMSbPTHcIsRQ976VL+vVIN+oY1gUtoV92V17y17kK0MwGASyNKESSFEUGbz4yfdKYXrghD4g8mQw95ino76uy2rt4+Z6Jo7rlZrtb/BOORWqRpifGGnqkmWvvXbBsY7HNIhroRFRUVZLkP186/oZZY9AfcQahEbXTerEe0sj8bzYP6ZPVu2da8z/peRs6MUWccdvWCoG9MBAE360prQvIIs+REznWp0EoK6rTwp85OseMuzAl3INVUeP7bkMFBeMDWBAXUWalthpgNecJEQ89XVEXXL+jtrwhIHIczvjW8Y2xJM7HGgn24GCXq0ry+QZ1dwzvl4ZepoIug9gURl9F17rpI4C1dU/t6h11FgRfYnoDpPOHmuQQzxiVbeJx8z9SAoJLJRDoP1QdNOM7GmFvPPZqQgDLamHPGJFjtfAaPGxkEOCt90rfri6TACRRkA5Rh36U8QMEx+lJRZlZqdYugHXcIXZOgHXrY58uXLHXYTMUYPkCZ47r88oD56qknWr0K0Y/sBev2H3lPfNTXRaWpN22ymmKL3Qk4bCxKfT1G3/s2yt9zuebHn/9OxHtYMOoKLRD5Z63H5lx7ukDFMJDbtTLRpPdvrdy1u0fhFRgMQhgNY+6riGQk+p4+7EZSCcU9lxAPbUcHo1LOkoBpLKNp4/e1jBxEgZYGw7YLIZ5sCgCRoMhGSHx26486YoZw9HHqCohcouPlJlEUzXM2kSsfLgorL1v1CR2CRu80sLVZUCDfExpNIfnCKEkqTlplonDM3k6sSTWze6TJUYArEBIyU2znjm6dUnuUEdX6I1qcOuBxg27aiUZWsxMNCQjCRI94uYPyf3znaMKU0QTp6r4rxNR+a+/guVbKnYeaEJ4Ojb0Qi6ram6aZdLQTJ5nSKwPJ+ovXV+x+5DXbtEbjJ5gKWGIZhemjc1lOOYIgEVTFTXBL1eVCALPxZ9+mzBBANEisqePyLHZwwCxC2AdY4idCmBFEgnp2Y99/s2K3QYDrKbg1Il9X7zn7NbmYBGfOv3kP5a++P7KXJztS7fWe6BXvAeDis3Cr5l/Mzp9124uueGRTxSNEuJuZEtFgGlZVcPlU4c+ffdUkjBjJMDadaD60js+8PrR+I0EWDi4SVMeb7BvftofZww9Y3wfhx2/caCzlEfPi/erx+rFPmFJVDziqIq67oGPv/95r91qJAktIAWEwaDMscyss4dec+HwVLetea4x7z/Y3O1EC3sL6XaiEzxisoBCG6Ki1v/l6lITz8eTKq5rR5KVPrmOsQMztAQ3Tg4DrGrfko0GACxfQOmbZ58wNKtVL5gkAmKqhc176jfurkW/E1iOtMRspxMyMiqgAVnWumfZRvdPsZh4RaFo47vOYkGPXbSmtLwqIIgx1lJjQy0r/XIdYwZmIG1qAKJ9t6u4YdnWKjOLi8chfeKdIslqhts8ZUwOuTAeAbD2l3u/WVNht/DNLUw6mkDiNXfbhKljc/UK0C6AdewhdiqA1ZwacvV9C5ZvKLYbGiL0NAVnnjb48b+e3mqARSDFpMveKKvx2a1R0Vf+SnDlCcOU1zReeEr/lx+cjv4mGJAuuHXO/lJcwAVbG3A82vP1vA27Wfh53s0U7o9mWJQQzbekrOGqe+eXVHnsVmOqCHXBmwdgupxgSEHbOj/Ldeb43heePigj3dGSCZ1QpLXO+9CS8aUN6sObFXXjIx8vWYkBllFJ7tTh1jS4xC8kg4Is1/ihBWeO7zWob7bZfDhJEeMwECYDi+bDf0WK02ZaOr6Q9iDUrpLG79eV222x7LXDEySNhQDQhvRyD+mVpEI6PrR2YkGDLS5v+mlztd6oKebn4MS7gDy8T/LwfmnRG1hAmvZIEti4u27bQQ/PMhwpEzSM2jxWIdsc51/JKkh3mScNz7SJnIq77RiW10e4b3CVjKpqX64oaWxSOS4GFp0Wa6aPe0hPN1Ahy1E1DdLidRWSAjC8oqOi9gopard066Rh2b86a2gabthRu2ZHnd0qGNSS3nhBFlmW1fx066kjsiN8Ne2zfLoAlvEAC91ZFVm96LY5O/bXWC2igQ+vb/TNnjXuz1eOx1ks1In7OTR3XUC7au3m0gv+/F5SkoWLySDgnG5NK6ts/M/fLjhrUiHQIMvQ9zy78MNFW1zoMI61LfHhoep8mBSsbQi9++SFE8f0aK4ujl8wD1a97/qHPt2ws9zlMBJgUWEnFq1X/4UkNRCURZHp3y1j3LD8MUV53XKTkx1mk1n4lTKP6OSgs1x1AHyANHPHk1998v02p81sIMDCFJBoyrgDC7Y3IRUEAzLQQF6G+8xxvccW5eVnuVNTrS6bqSUIPUJLTHg1t1fLi1ZMlvArrtxStXlvg8MWl7sUaQCnktD0+MFpeZl2SNo4Jm7YJLeB2ryndsOeemQl4gJYGmzyKxOGpvUrcEdvYJGqvD7px81VZTUhs4DDgqyOrjrAKa43W0JG0B8CyS7hrLG5FpFRVJq0RDNgTeoceOhpDb7QolVlkqbhNxBTn01VBSzLjBuU0i0T83o0+eUfNlXWeCRRoHGriBPFmXXSbARQ+uQ7xw5MbwZYzStk8c9lB8r9FjNHd1QPFgBo/MqQvu5hvVNjaCtnoHQBrIQArD0Ha6+6Z77HJxlI04CGWdfou/eaydfNHKmS0tsTmu7mGApH039/felbC9a6nDHyG5FmLApPUwteuax3t1QVAo5mP1+0/Za/f+p2Wpm4AVZztziPN3DZtKKHbz3dUA8W5W0KzX78ix/WH0gxiGj0yLHrj4QA4mJCRVX9AcUXlK0i37tbWv8ead1yk3oXpPQsSE12mm0WsTkvB2EzTdM5RLHxauN07KMpin7m7R9e/3ANbvRkKJDB5IZoimGQRLKloOYLqk0BiWHonFRnYY+0IX0ze+a5czOT0tPsbodZiOydMKc20PSuvGy7q+kEM8X3mYWrDmKUYIqlF3Wz4EIoTTObmElFmSlJZgg0A1Hvrz9L7yilaqu3Vu4t8/Px8WBpAPpleeqonJx0S3TNnvHul2Rt8dqy0uqg1cwykIHEe9UR0FVkjGHeV39I6ZFtn1CUwXE0UPH44j+XmkmGS6t832+sIG3NYnkBBGChNcNOKkpPdVmQgVm3o3bLPo+Jx9zteqHS8d+HPhJZUkYUpg7q6W4GWDB8V9fmLTnoCwLcAKqVZNdtJhBgOqGJRek9cl1tlL56DOkCWAnhwfp62Y67nl3IGko0igFWg++1+6dPndy3VQBLb/B8ye1z1m8rtcacWwNhvTc4pFfGP5+8IMmJC3fRKVJb2zRm1usmgRfQ7jUoPaQpEBrcM+OD5y5meNaoV0Nst/rAi99++O2WZJctQV2pwhiClK7hyy6Fy7yDIUUFKrJtdquQlmTNSXPm57r698joVZCSn+l2uX4VQW5fa4DH/a/56x55/Tu3yzAm919rSQfSutkhacKE50mRZcBA3LEEYbuMFHuv/JQBPdJyMl3dct3o58MK0jAjc/tq6fhCQKA2f+lBnwREPq6YHsKVkqomO4SJQzPR+sEgJGHYUsUdWqDPryzdUFnvlQUhrqRylUDDaaOzU9zmKF6WfreiV2yp3r7fYzJxTDN9QEc7wMkNAWhAAXBwd3dR7yT0Z2QMubhBfyR5FweXV2+rRjsj5t4y6IKXZBMmFGW77EJNfWDhmnJ0WeWRUqNzgOK7D6ACsjJhcHqfAldzJEE/ShB6m7t4H9rEGP+1sl1bmwkm0JG1GSdnp7isXQDrREPsPACLpF/QvqD80IuLPl+2w24WGKMq7DQNUNDjCS5848p+vTOiBViRBs879lZfee98n18SRTaG6jC9UY/XL19xztD7bpiEW6GGy7Xoc27415a9VbjBn0F7Dd08zCL/yt1TRw/rBkiCpQEHPT7Q4Svvrnj5vVUuB8Y0bdPlWl9aNLZKuFeaiglVcSMwlqMdFnNKkjk7zdm3R9q4wXkD+2aKIicI4aAooViEGhljxNl1uIu9Md3yjqonml61oXjmX+dgGNqGoTgc/EI3b4gOZqQkDahIA7gYz8TzbqdYkOPuk59a2DNt5CB0YNsFnot07kVfpfc3pCmmo+RjobGEZIAOIVwKH5cbiDRvUUBemu2kwak8x2lxtwo4qkQSCTR0YO4paVjxSy36K56PFWBhHgVME2C38GeMzrGSQNLx5gg0HAak6c176zbtqmc4BocA4pwpvutox/5c2JJGJYalonuJ0M+jClP6dXOhTR3/nS3Sikdbv7Nuy/5GPlaiVwTKFQCyU23jh6SZBG7RmpLiCr8FnURR0xToVZMhVUX4OCvVpvclZCIRzHpf4JMfSnBhE8u2qpK9LQVpAK3CS07N53muna+sXQArfoB1+OwjLdK+Wbrzrhe+UWjNRFpcGjJaUq2toG287qM/CQKP7k9sFDlYpHgL26t/L1j793/+YDKJbEz8onpLcwvPPvGXM08f37uZdw496o33Vt3/2nf5WU6jLtcIiQRCyjXnj7jj2gkQbxMDAnp61Oazxb889Np3QNNiZrGP8dOJz6YlKSg6KRGQUIAqKxBDCk1zWUzdst1jivJPGpZfkJXkdttslnDaFr5PAkKAqEV6ESfMrqFxNnoCo2a+LggM6WDddqKRVDaG1FJEJo7BqKICWQYKAl0KEAW2Z27qyIE5Q/pm9euZkpOZ5LCJYUgabs1LZhF2I7U1xoo0kqPLqv0LVx0SCA1jPAYAI3IA+3dzjuiXgi4aWnxM/ceSiJ9bk0Ng0drKak/QLHIxZ2/jjtnEXORn2CcWZdDM0cmWDttMzDgDN+6u37THg0AV5hFlThzGOvbHh2PQaB0BSLhAINW82XUaD5Ym7RwZkmqEr4qt1io5NHEmAPp5yuicjGQzgPEm4kO9fZ6i/bS5+lBlE7prxWajsGHRYGE35+jCtJJK38I1ZSYep91GH1gnAAugfXfBxAKn3dRs7fXsl92HPMs2VllMmN0tcTe9OEWSgNPCzZhcoMVax22UdAEsAwBWONVJ0ziWra333/jQgrXbK5JIFotRBznEBFTB3nkpX79zlYaNUlRGQd8S3qbgPc8tXLR6n90sMjFdDHEz5hBAn/7KfVMLcpNVBO/IY9Ds1mwsuej29x12M7orGDJVtCD9AXlE/5xn756akWpv/qx4BJk/ZLe37Ki49cnPq+r9ZrH9CYiJ6SfZDpDWAPZvBSQFIUszLxRkO/t2Tx9amDlqSF5BpsvptOjfQS7NDG72kkiAhX4+7cq3D1R6cNPGDhCJ07cn4c3H6zAoyf6QDFU6K91e1Dd7UL/0gT0z+vVMz0wLtxpEOtKb1RhVIdGKoUYoWnbsb1i+tVokRJHxeLBUnIQFR/ZL7dctiUzL+ONMt/64/SXL7D7YsHRDtdnExtWdmvg/gKoN7uMa2jsZp40dTQMtbCZzoMz7/YZKBKw43NsYsnG4Tkk7dEomiVEmgUcGzyQy+EIFaUABWdF8ASUkARlgDxnHsbr3M4ZDBRPZHub6yqVIEls8IU29ibIvSEK0HjlmDyK5r2mjClP7dnN/taqkuj7Ic63rJaADLKhRl5yez/N88/GonybrfqnZuL/eamrT21erhKQLqz0yrZNHZAPYzhCwC2AZBrAYCidlPvv2shf+uyI52cozBtbw4g8pr/JefObg5+6bBgnAivK5SHs791XOfuKLkkqP1SzGZjfRImnyS+dO7Pvon083iyLEZMrhhx+qaLjyznmHappiY384ymdBTEqZ7LA8f8/UkYPyVZIBEKdgaiKOrqr13fb3L9b/Um41lAorToGkNSuJMeAfCsB8UbIKkFHMSnP0yEse3Cdz3NCC4QOymhOc42zqfBzRw763P/nl+19tzs2ww/bxBB1FwmUEZN3j/DaoIRsakmR0hXZY+W55yeOG5I8ckFvYMy05GTNsEe8XKZJoqzxcLRLlQeB99bbqbfsbTCKPrvjxrF4F4M4AEwan52c6QHS54q0dM60nNjAIEsFPlhd7faooxNXbB53M6HTGlY+D0gqy7OoxroK6zWQpKCvgi59KPAHVImC+qxicIhoVzsnDrb5VVZa1ZIfYK8eR5jZZTJj/nWdZqCNvDYRCsMEXqqgJHqhokhRgNgl6eC+WdHKCZtBDTh+ZnZ+BZgqIczl2oXGdeHDJxopAEHcjjRFgATQMasKwTIFjv11ThobZ2kMTKVNB9odlZp2WT9MsjChZJ9Beur6suMJvEo3ssWusYIqQoDy8V/LwwhQA27nM8XcKsNCi8Xj8t7USYGnNVEYtfMEaydDUiUU+WrjlzhcWWniOFwnrskEnE4kxUaUVja/ef86FZw1uzYDR7mLe/2zjE28u4TiO52N0OyuKguzvfTdOvnjaEECq+8IeLIqWFfWBl76d983WJIc5frIGrFqI3TnolnnLpWP/dOlYQxo/hy//ED73zx/f/mit1cyzXAc1EKTBIE3Cgpoiq6oK0Y3UYTf1zU8eU1Rw2thePbulCKQIkeBsvHn1ZWZI1pHe7/nz77Zd89AnmWl2vaS7Y5YKkdYCQEUniqIpiqpACp3Q6cm2UYPyZpxWOKQwmyP8typ2Z4W73SY0MUuvvULKYmlq0c9lh2oCJp6Lk1ZBVYBJYE4ZkZXsNBsLsMJ5V8T6syR6tHxT+faSJmS7aD0ZOubmiTgHSEty8BOLspw24ViXAUhiicge/bS5clcxbhsMYzIe+m5BkI6mNEmFVhNTWJDUO89uFrGLhbSfOHxFI2mreiUKVd8UXLm1rqwugMvr8KqHra1OJR+NAKKWbOdPH5VjEhmC6WO/UxMSMt/yLZXY487GCLAQYLWI7KSizJ2lnt0Hm7AXtfUAS1YUh0U4f1JBS/cVuQJqX648VOslDaCOoxmyvJg49luLjNPWtNyNVHP7gsqpwzJ75DjU6EI9iZPfL8Cq9/j/GjXA0nVEk+7u5HfhNnDNrQIqq7z//XzjW/NWCyb0g6OMdV7hnAaFUuH8Vy8t7JEeJcCCpN18ICTf8fQXC3/c43KKaNCxKTAoyyk2yzuPzejVI00ln64/RXcaL1i45eFXl9AMJMWE8R7GhHAUNniDYwbnvvXIDJtNiN9fg1MeGQoNbuWG4psf+VTVoCh2XBc3paP2FrPGAcSgFJBUjqaH98++4rxho4bkp6fYSAYLoQ9jjKEq1lsqHSxvuOyODyvqvHbSybtjZrJCcu1oucUQFpcl4A+GkPJ6F6RMm9jnzAl9+nRLI6Xp4QytxNWlER8Jhe77CgRfryj1BGSeibHVSbMghO2yi1PHZrMcG73TOtrRYjAEEKBC6GTD7vrNe+tNuPCeDXc7jvXDSPoOzhsb1S8ZEJLQYwAsnHq1p8S7fGstRsIMy8ATJ5X+SsI9vLHXG0qKlp9mO2lgqtkikBIRAm6bmQAP34fD+e0M7tCnrdlevfNgEwYzHBNL3xec6QUQui/qkzSkVzKxM/GQwcJt++vX7WzAubsMjC3aoMjA7RIG5LtW/VKD2ybSrWbTQgbeH1QKMqynj8o+Ij7I0N5AaOGaCklWjx/GhaTQgY3DfwtblCm0avQkHqApAE4bk52abIkylyZx8jsFWGj/NTQG77zq5BsvGR3N1zcjGhoe8cIB0CprvN+v3jvvm20bd1Y6rDw6uY0vv4LQ0xQc0jvrnb+d77KbIRUVwNIPyz0Hambd8UGjX7KadeLdWHa/1y+NGZjzn6cvgnqe6OHp49DbL7srb33i87Jar9lkTIdgEkSXeZZd8OIlvbu3ggn6mA+MaEOW1D/8+b1dJbU2s5EM+4kWwhoFcexFgx6/DFRQ1CfzrIn9zp1cmJXhREZEo1rH7H8s0asBFAU88vKi97/e7HJaTtAStiOJ3o4cI05V9YdUr08qyHT9Ycqg6ZP79eyO+0C3vBsYLmEeI4Zu9IUW/lwuy4CLu4VUSFHzUiynjsz+VbsSA3RFBszROIto0+6GnYc8uOSx9Yfx/woCWMgGTBiUmZtpVXEh7FFWj87F2uCVfthY0dAk80KMTe1guOs5LgDKSLGcNiJLFDiVNIM84XZAe4ljWXT8rdxWvbukkedjvHySXkZako2bWJThcppUZBJjek80KRpdu716W7HXRJLgYkPniqqmJVlsJnZXaaOJhCxa+yA0I59f7ZdvP3lo5mHTq2F/Y3l107c/VwDteIE3iN1v6K2TOcS2AzRSs4JxUizgRFU0k4k796Qcp10EMMYhGCW/V4AFQIMveN91k6+5cOT/tNw4zrdBZKMDfrnBG6yu85eUN2zfX7N2a8mu4jpFBQ4b5m/R4m4a8yuBhKHB6w9dcU7RfTedgsNw0R14OqT4csn2qx/8JCvNdmIG36N+OnEoIXh3/fkj77phEmaQPzJihN5OXYP/rme+/nF9sc1qTIdgnTW+vKrxP3+7cMrEfoC4sOLRqRbhcUEKefy1JW9/vDbZaSXl/R2dFjwyAXJV1/CFFJM+KKAxIKOtO6RP9p8uHTN5bC+K5K4ZReCAPuPbZbvuen4hsqSCwMKOGiU8qmA1kNa2ELM6ybKi9sxNnj658I8XDLdYREAaRCbkcyNEkZV1/u/WVqAzIn4OvGBI7VdgHzswM874YPP614WhwrQCjU2hNTtqS6r8HMNwPA4NxuVyI6gNwX+XTThrbA7Hs8dqsqtfETdsr9m8z8NzmK6djqmSBUA9SAesJvb0kVlJDlP0SFRfBciU+v3yV6vLAhKIrXcxMlUKTu+CI/olD+jpVhC8iEl5kIaKov20oaK42mcShZiz4FQVuG18SNGaQkDgYvGD6W2ORvZLHdrH3TJ6gAZUVu3bvLeB+P+O/lRIWIF8IcXrUzFij6Inz1EHgDPJaDrZIeDE09ZsWI14sGxmflRhCi/GmshmnPxOARbaDzJQMlOdWamOYFCNCrEwkBT1YPepLyA1+WV0+UOnGsszIovTGBD0YNF6NPrERps3JCkWgX/qr2eeMrYX0DBrZXSKwz9mP/LZgiXbMtOcMawzTfedAFDbGPz0pVnDBuX9CmDp1HPox6v/XfHK+6ssZp70toj3sk1cVrCspumSMwc9f+/ZKjHI8b94PcGovMIz6Yq3WZ41iRzdYXs9HE85GHDS5AoekBSeZc84qdcNF43u3T1Vz3DFbyeOxjsa4UOqbwjc8ezXy9but1tECpfCte89MCZF6WFETZMUNSSpA3tlPHD9KSOG4IIvDQKyho2lqscpBOh+sftQ48pt1SwdI1Hk4fFDiADWuIFp/bolxVfWAMNsBXptCs2glYPM1/6ypt1lTcEg4ASaJCHFexbpBA1BSR3WJ7moT4oS4U9q+VSNvBSOZarq/V+vKkd3RY6J8aN1h6Wi4nzwkwel5mXYSNA4Wp3DMO7Eq33L3ro122rNZtL5sJXD0EFeKKRmJIunjszGVHaw1bPR8/2bguqin8sbfZKg1xnE9BaQCdDZjtnWZ3GFA6oIYPnlCYPTC7sf0eaItF/AW+eYOiY6RaZ1xebKXSVePIuYbmbEKahmuc0Th2ehZ7T+QqSRwlBInG7tfDP8nQIsnB0MMacluv20Ig+VvCxc38ugaxeOjh3xvYbmXR0eqgZ8fmn8sO7P3jU1yW5WAOBO5IPWXynL0qGgPPyCV9ECNZliISbQ+0IEgorTyq+Z9yf0JlRSlcG0+ALdLbRqY/HNj34GNI3lsH2JntTu6J9LJCgpAsuuXXALslmG1BLCCFHZE68teWnOypx0B/E2dhrfjC6RlkJhRcmK6mkKOcziQzefetG0wRQh0cb/Fmv+AyT5DxzN/fTzgZsf/xT9UWC52BwM7S7NukIqafIG0I64/sJRf7xguBvzO0ftt45Wb/pNW9u4s27b3kaWj5EoslnQSRmStQsm5CU5zWi0sZW5kYpLTCkgAyDLMCiD2obggQp/VX0QaJh/HKEr3PGEMqChHvoYRcHgYuapBThUR9xXvwL6uklBx97Xqw+VVAUcFh7GajdxwhPEJTdDeycP6pmEKfNAK8LZ4Sw0vNRpTdU+WFosqVBsvROLcAJrZCeCM0dn56RZ1daHpUi0gaqtD3y1spTG5IlszOURGGARIuVo1aozh0XCODBCczBlVHZexhFtjvTdxDDUUV1KGgz3+2JY+uuVJZX1ksBxVKweLEkGfXIdYwel4XgNbDVEgeFDMBEHcuvkdwqwqCMPqtZLnM70Vgi2syHt7mvGX3H+cABIBd+JdKCnJiD8t/jHXVc+uCDNbY/tkqhvvaoa7/SJA1595Nz/pYcg91HsE27w+C++fe7BikbRhGwDG0+eJxVuCA9pSNd5A+/9/cLxI3sYUkLVPNqDZQ2X3vFBZa3PaTcZ3pewLYUAUbyMG/0hNQTuum7SdX8YgTCuSoxsbHxCpJBDf4X0jQ9+/O2q3W5MxNUpAVYLRSEEoQVktcknTR7R7bE/n5GXnWRsDw2dKBIoGrq+H6zyx1yx2yyYTQqCgd1cPMdqpAw2ekvNhGeNPV+qBkJB1S9BX0AOhEAIV+DTmHuSWDCcjGyQKcO5OwF5QHfnuEGZRyXebHZfVdcFP11xyIJL/WP3+ON+eYqa4hSnjMlBylY1fJpGr/EW+FpjaHb5poptxR57rAQuaO5evzy0p3vUwLQYSEd1gHWwsumb1WVWs2BcAfqJh00RqIpMLiAgHkcscNk4mD4+LzvVGv0WIUATo6tgSP5qVWkwhHMQY9sBAEN1bVBP3IlIpTqh87yF/H4BVscX/GoQlldAmtvy/lMzszJdaBecENjpdcvoF4aj73v+m7lfb3LZTTgUFmMKp1ZS3vjKfefMnHZ0eohmsvibHvp40ep9DjN2lcVP1kCR46qhwX/V9OH3/+kUI89CUoT+3ifrH3vze0FkBa5NWd0TIbrnPiAjgZefPeTO6yeaRV6FIKbbYws90fTu/ZVn3/BfmmdsIo+xHL6/dlakpbtFVRXUewKjB+e//uD0VNwGRKUp2pDENdIUiQoG1GWbKqrQ9T2+Xn5U+JoEVFXvjN3qiwDQicp1zjqS60sT4mOSe0wZu+ZxPADiDAqkhanjclKTzEctjydmSeNodtn68j0VPrMYOzWx7p8ISuqYAWkDuifp5Qux1XkQcAOLS5u+WVtus7SipcwRU4MUMtR2M3PhpO4ggq6ifxBhQqa27W34cWuV05pwlj6de0/VKAnBUgAEgbPwrMnMmDjOjHup4VUzqGey3dKKuAcJkWsMy1bW+r/bUAG1VvNvRcam6YXkowek9cpxaDBOqpN2li6A1XGFuPZhvcd/48xRd183GdlaOuyiPe53kZ7DLEPLIfmCP8/dd6hGJCmTMaTe635vdJtZ8MIlA/pmHhXlEBCIvWX/WrD24de/czutejMKQzTgC4QKu6W9/8xMs0UAERsapwAN3eA5f0B69NUl8xZvddpFluYS2uAv0aI7/BjS0DqoKOee3P/h2ac6SI+LeDRGYkb0a++ufPztJSkum+6SibJfbAeUsFuUhMzqvcHRA3Ofuf2svNwkSMj0jaEQo2CdV1q6odIXkLnYUqaPFNy6knAXaDHQb2rEj9Iy14ymdWNvbG0H1A9FiAyO2jPXftKQdILfjjJ5krJJN3hD36wpUxWN42M35ugTJQWaePrCyQVI0/F0qgGkpLG+UVq4qpS0baZjYTsl7OeSop0/KTfJbmlukBztGEg59vItlVv3NzgSQIMcvnVHwoEyWlgqtJi4VJeYnWpx2wWTGWeEY7cmhzvgkF2i0yi26h1hME+aVdfE3KwaANw9zCLyE4ekp6dYNKh1VotDpAtgdVxBa9wflCwm/od/X+dwmBW03KOgJGqOD/748/7ZT36O1nzM5eKQ0EMM75f9zuMzbHYzdWw3EnpHFZXeky9/02LhsWfYoOwWWVJYjn7ujrMnj+1hVI29njOBBultCl1z70frdpY6bRbI4EBJp3ZkAcL6rQKtotZ3/in9X7rvbNHExxNaJUYfagr1wCuL53y10WYTeZrFcaVOvgX1JJX6xsCgHhlP3jFlQO8MEhyJ90zTozw6UaQKKAxHO2fiWgwTx1dB7L/hJw1LdzvNx6mkQxeZ9Ttqt+1v4FiGjYPGQiOVbsN7uUf0T4vfu41ptGSweH15TV3IJHB0TAZML0oY2S95UK+U1u47cpmBn/5YUtcomRPQhQYfCpiLFaqYLY5Oc4qFBa78TCvL6i8K6uTGGKFGSQJ0TB1QP/9Ss6OkER0CMTerlqCWZhMmFGVaCVFtp7Y3XQCrIwq5cOA3U1Htvevqk/9y1ckaqcKPJphB0k1w4PrVd1e8Mnc1wmcxLnTiqG3yy1eeW3TPjZMo7XjBSf3KdcZV7+wtrU9CUMygG5iqglBIufbCkbdffTJOYjWocyfxQuNOZHv21Vx+z/zKel+SE0dRE1Ol0EZCGtzifCygwepa322Xjbvj+olUJM0ilgfi7tI4D9rT6H/klSWfLdvutIkMw1GJKudoO0XpvmGPN1jUO+P1R2dkpDpweSxNxZzorROtsRTcsd/z8446hiUl6p0asEctgLDeoNUyvG/ygG5JeoDsqBYHKbjRp3y/qdLTGGJ5zFUey+dpJNcNAlWGU8ZmZSa3Ik/omI8kK2LZxqoD5XrgMkanSUhR89OspwzPbu2m079+zuID6IIkxOHYO5q2iM0E+AdAINgu9M529CtI4nmWWHjca1ufLBOrC7BZkNUPSGD5poqyuqDAxdqsGkJZBXmplvGD0kWRM5Zft+2lC2B1RAGECrfJF8xKtn/wwsVZGc4oNywkncXQ7bm2IXDHU1+u2HzQZo6Rm0rD8UGFo+jHZp9+9qn9cQzg2PuFEO7SD7246I15q3Kzko3SA24yHZRHDMh+/q6z01LsmkGdpXAiJ1n1PEf/tGbfrU99WecJuJ0WEjrp3AtMRw+yrKIF9NifTjv/zEEUXk4gtvgncYbSHM34fKE/Pfrpt6v2pafY9IKJtqvySJiWgAaq6/yzpgx+9t6z0XLQVBDuDNR60dtLMxCu21GzZV+DgI6veHPcO41gR7uEib9PG5aNUOqxua80pN29ZY0rttbSpIC+ta1pmh+kr3CnXThzVI7JZIC/nOT8gFXbanaVeNGhHjN3i6KqLqswdXQOJ7CE7jTab0T7yR9U5i4uFoUY+U6PPq9wehx20CJD2i3TOqow3eUQIMn6ogwm3cVX8EZv6LuNVU1NEu4wHdMNgzDjU/3ynCMHJJM327l3URfA6lii+64gpEOygn69//pJs84dii4fTHQuZ3J9hDzN/Lyp5LanvqhrDFlMQmyxLwRuAiG1INP18gPn9C5IVVV4HN3rFFOLftx15X3zERJiDWp0TXoEqS6L+Pxd00YNzTs+yGvN1AhtJx4zLiBat6nkkTeWbttTYbea+cj1sZM6afRMI/SbQEhJdZmfvG3K+BHdNZKXF1sbXZpk2XE0V+8J3PrYZ0t+3pfktIgmHnsTOy2CaM7HUlSAsONTt0/5w9QhhII8RvohQjQFVED9tLnygN4K13hGvI4lZBP9P3vfASBFebc/fbbv9Q5Hkd47ggICoiD23v4pphg1iSW26JdYE6MSE/MZYzTGxPLZkthRFCnSD4929DuO631v97ZOff/v+87uciBydzNzd3tkfiYECbc789bn154HLRBBVDiWunhukdvFy3HR5ZOsNCQWKKsbdjdV1HTA9QNInRE+VUEqUjFFGT3Yc+a4HGCgD/HYsykQ8KmlB1t3HA5wvH5sLMtYO3J6QabHrqigJwCLrG8JfbSlzs5TJnLO4dI4EkK9mCANL3CfNSnXxlOYPiPOyGCq+BISja1pCn+1s0mSAeod0jUxsqLAp54xOmscYuFSBnr/sgWwUsuwK4WWGLwgb1w+5Zc/WcgwFGaB6taWR306pEor5LOvbvjj65vhkUcROnPhcGGEIsKli8c98tPFHMsp6qkAlsYaX1vffv0979S3+t0OHncqGRd+RsmHcEz4yZWz7vj+PAKY7M/AgcYtj1QoJNz3+5WffnWIZSkkdoRroU3phewX08qMOoLRwfnpr/7u6qKCNHjk0WSPtd40w81fCsRYsiQ//bev3ly5OxwTUbEdNbCjNFocC949do597n8unj21WDd1CwZYiD1o1dZ6f1jguQHfmtr1K6O9SaLOG4paPCOvKMeN6Vu/dYWRBGgPogZ+UVZ5AxwW0O2UZSSMd9b4TKTmq5qTioVeyY7ytp0H2xhM/61v52v77uyJOUMKvIrSM4C161Dr9oNtNpY1kZYA0/qocO8Py3fNn5JL0Yhjtpf8RnQFEGD3YX/JoVZUlaJXJ0cjSl0wOXdQrsdcgfN+MQtgpZDFxdQI4G8Pz5ky9IWHL3a57BDRU93mRdFajtsDsdsefn/T7pp0j113MkeSZOiQPXDzwusunKKFRU6xMXEbuRqLqfc//fF/Vh/IyrDjkJYZuoTwXPZH504p/svDlzgdvLlbLh7KQuJZpCTKz/5z8z8/2B6Mim47x2g1BMbpF/vD4tVYQK1tDPzwihmP37lUY7nRGTMgNGpoxD4K//XLTYdXvPzV3iPNHreNY2kA4vHL/n5pHS+matwTHaHYjHFFz9y/PC9H55mOCrAA8EEAsalGRann07/+CnNeQNePQqVXw9NktJdOfjrHxaNJcLgm+EVJvdvBIcJ0vQMEAZYkqx4Xe87U3HSXTdHTYXny19lV3rbjsI+hGVKvYDNyjRUwfUzWuGHpParCgpt1w66Gg0eDnI0xsTVCkZHw9qBcx9xJuQ6ekhVSZ91bdwYQi25v3NN8oCZgZzSyHj2fAy8djqXOnVGQ6bVbAKtPHvG/A2CpGrwiQEdH1Ouyv7Xi2hHDslHtLdEDBgFNrLfsYMM1d7wBaBJegLpRDvTsPXbuzw9dMnlsYXcWOnx+iqJfemvrUy+vs+PCL+PCsQRmmA5HBPgi//rTDUMHZ5pC6X7CiJEqpufBS+urkooX3ty2vqTS4eQcGv29cQ2RfjGtGEtWooL8n2evnzCqACJ1IzRWSTFjeFvW1LU/+bf173+5D86xx83BgaMYfQps/W94lORoVPr59XN/+p25+sQKtWxLXUv44611Wmivv1+rdw2hK0lVVHXa6IwJZ2TAPYQFgE9ewKhx3MMh2bCzYU9lIE5DYABgiaJSlOc4e1KejUMEDabcwRhg+XYcbNOI8fRGX5Ce4MQzvNPHZPcQYBGfbamtbY2iHkaT1o5GsuOxM+fNLnI5GFlFNYK9l7eGN1dMUFZvb2hq195C56kpinKam18+p5BmKFP4U/rXLICVEoaqrgBWko4I0IV59oGLz507QhM57mmmHA7XK++W3L1i5eCCNH2xKy38EYqKk0fmvfXMdfATuwOwAEAAq2RX9c9/+2F7ENd+mRLBQqkItb458NIjl1+4eJyCs/Lm6xHhXzXiomhU/Neqsmdf3djYFnQ6eJ5jOlOiD5jarDheR0LdC2ee8eJjlxFatxeW0dA3RKQWywIK3IYxUV69ofyfH5SWlNVAROGw8/GP7c1DvDdMwVsvGom5nPxbv79+WHEWbp/tWexS42g4eDSweme9F+XHT0+AlUyhSrKqymDOxKzRQ9I1jRSNSe7bARYqcnhnzdFQVOZYmjRQ/qMoqNZtysiMySMyZIDCV8bHWmMpKD3csvOgn+do3dUNCGApyqgiz+zxOd0hLE0cOwREQh9vrAlGZEpvb+UJnwtwF7oog/NnFRZmOxUFzVKv0gSTiF5OXLmtWpJINMN6vwwCrIIsx5JZhagreiCmD04YFgtgpYIhEKEQwahQlO158CeLFp81QgNdPf0cfPqRl97yzx2H6rPSnPpKlnCHleLviP7k2jPv/uECGaOr7nwQnKlWX+Su3324ZXe102YzxY/HJdtqU2vogvljXnjkMgVVa/fW9ZUkTYW/h6//8rsln204XFnfDoEKBx3buCrtAAtowQNLVpTHfrrksvMnwNMfnoNGNhFuwETN3Qwbp+H+8Mt9f3lra0VVK7ztbCzDcqwJusF9aBplA8SNNU3B71889Xf3LJORVAcSpOr+S+DIMbFpT9OuckwUObAp1b59rFRUyS8BwsFScybmFOd74GKABxc6H759uPDggGBIfOvLKo7DMq4GhgcuZjjU8ybnD8p1yriiyARAAlC/S+nB1p2H2uECJgmd5ZcKlgooyrSfNTnPzjNdBrFAIufgCwirSmolSdXNWXjcx6J5AuGYMnVU+oyxuRLuDerti5PsLPVjYE6iMXncUO/s8blmMUv3r1kAqz8t6RHC37QFIlNGFTx827mTxxVozCw9Wl1Jged2X2TmNc/B7c1yOos1Mb5SfB2xd1ZcN2vK4G6yEuOmPPTgT7/81UvvbHM4OFMmCw0RQQiizLP05rdu4bCIbC8tgqQ8maZgDX/T0NTx3uqy977YV1HTBh/E6eTgAyQJVwdENEuV5WBUmjN58O/vW56Z7lBRIYYBgkfMQkRoriWmeodD5msPf7Ru/9qtlSVl1cGo4rIxnI0jtVFK+TFCCwxxx5ExSZZEZcPrN+dkuWUZ0WJ1P/6rXZOfbKipb4vYkVpUf7+V+cOEgiKihM6lohzH5BGZOek26BSianNVK8H81miDNjjlNf41O5scPGNEDADxC0iK00YvmVXgdLBw6igzqv+w1CMo2de8tzLA4hShToClIICVn2U/e1K+0053DbCw6gZDkTVNoTU7GkjCqEC49plopkQlzcmed2YRPIZlFd0DvXpxalWYOw+1biprQVI/egEWQAkEae6EnDFD07vv2KeyWQCrPy3RxyS2+aMLZwx/4u7ziwsz9MWukgTu/1q5646nPsnyOhCFiE41KBAVJJYit//rZyxLy/hpuq7BwtsDHk4r1x245+mVFE2xZnhjmsGj3O+PvPrktWdNH6JndHr6dfhXKlG7XVXXvmbz4S+3Vm7aXRWKSOlulDekEgGtXn4WowZUFcJThmGeuGPJ+fNHy6psVh84PMoRebyqahMdighbSqvf/nTXpp01bf4QdGRdTo6A6wCPUYoPVFKW6t7vzb/lxjmyIuObu7tAACMM8NYXR2IxgDSFUhlR9tA0JxD+KggqzZDTRqaPHZrB0JSEGY3pbmToNIC1tay57Eg7RJ9GHkYBhCzJuZn2ZbOLFNyiYDyChVUNUeJ74+6mw7UhI/VDKIIlKnmZtvlT8hw2tmuAFT+0iQNV/i17W2i98jLHPwMqBKAAMWNs5pghXgkiOIA0BXp1+2GARXy5vf5wXchl19lCixMIqKv3ormDcrOcPZUbSk2zAFZfW+dWcEVRQ1HBwbKXnTfhru/OdbvtKDmhi6AkKbp826Pvf7rhgMdh0w2w4Ic1t4aWnj3ihUev0PHDjU0d1937VktbmONMa+PH+nGR71ww9aHbz+2D1pLOoSz4X60nLBoV95Q3fLjqwOqS8ua2MCBJjqXhO1LHippSEUWoeGX4g9GLzxnzxC+W8VzXjnXPRikZwMCVy6IoH6hoKdlT/eGaA3srmuAtCAEH/FKaopLDlIJRLcw/ByJRcfTQnDeevhriAAV0qz1Na0SFbxOLSf+3ugrlYsykiuy/AUnQXMHfIGoiAHK8timjsopy7GhTaDyVFNXNowoOy6qtNfWtMRQANmBw6UZFeWyxd86EXE07qzu+XxefiahtIHAD63Y0VDaGEZO7bgoJGYhAyU23zZuU53J0C2Dh4Kn69YG2PZV+Vq+8TGdTZCDJyuAcx1mTczmWwnuzu9Ok25DAIUm+vboyHFFQjZ2ulwBYz1FSiesWFdttrApMZurqF7MAVl9bnEVaUQRRkRTl7KlD7vrOvAlj8uH/JQOF1ruiVFQ1QjY0+q+9581mX9SGwY1eT0Jtag0+ecfSCxePFSW5pz+e7rLf/Mh/1m+vcjoYE4nRI2HxjMHprz91rdtjVMa4+6ZgEkICixQlW+9jgvz1ntqV6w9s3V1d3xqE8wi9N4ZF8r4sHW9BOzbuKUD0oIlaOjn2nT+iIu4eMfR09ytwsgPeyDRz7NVLy+o+WX9gz8HGitpWf1DEY0gxLFZJ0STPSPMJD42YLCvQ/f/N7UuXLxrTTbUTfCsQLEvWt4Y/2VjDocS4WVrnfWvqsVUL8L8gRWCUXiIz0/jxQ9OH5bsgiMadNz0rUicR7FY+2lzTEZE5Y1FtoICIKC+YnDNicLpZkWycHlQlSV1d2tDQFu+A0/l4MoBgNBsCrCndAlhaFTf0STbuaapqjjCMCUsHXipwmhZNyyvIdiHCsN6XxNRq7CJR6f++OIo6aPW+BBwuQVKcPHn1omEmiaL1v1kAq0+sU9gK/jYiSPDEyctwXn/hlO9fPt2B6Z10q8F3HqhP1x285+lPSKyLrjtOAH8QPuDw/Ay7k0cdOz00G89WNwZ8/jA6L8ybLxkJP9Mr7r1gwezhMnag+0BLN9k6h4cF/ZoM1UCrrfPvPFi/v7y5pKz2cHVrKCLCeaQZygGdOApVh+Duqv4nLMVKa2pNU+Dvj125fOGYU5Py6x8o7bs6rWFtyYtRsWRv/bbdNV/vr6uq87X4ovAYpRjSxjIo/odHiUw8Z/9GtqDbE45K158/8YFbFzGI4qtrjIW1w1Fqft/R9k27mm02BpE89eM76DUVa5hq8khwz4uyCi9Kl40ZUeQaXZxh4xmAGge/lYvhFAaXQSAUW7m5TpBVg2UDml96ybzirDTTSJK0UsFwVFy1tT4QloyQxCrYc85J624ECw8O6AjL63Y0tAVEljWBOxC6f0XZjiUzC1Wcw+1t9y5ZGVLbHPxkc70DS2XrBlgQpQ3KcZx/5iDdCqqpZhbAMtPi/I5JV1Bb3lrTN9bijcbkQCg6NC/9wkXjLlw4esKofFSFjE4Ko1Fc+L3Q/37ypXX/eG+Hw84Y6hTD3ULRiIxwTA+3CsA16RzP8ih6ZSbTtyzLcPRuvnrWHd87W1EAJqgy67O7/3b4QMFYGKUGE0/Q1h6uqGrdsa9h39Hm/YeaKurbI+EYxTAOB2tjWVSUk/wIkoxnleKf2BeYAp9WoK4p8P1LZ/7mrvMU3FXU63VsaBnhOrYEs48/EGnzR7bvrd2+q3ZfZQsEfG2+MLwD7HYOEbtSNHQLvvHk3U9DmfHMKohFhQkj8565/6LCPE+3AFaiJWJzWdPeowG7YR6jJFQ1Xlp0IuTVWDY6h6qOvQS6CKAzhUJ4KuAZMi/TNqzAk5fp8LpY+Bck1FlCEbqcQHgINLRGVn9dD/EHa+wAlxQFIsFrFw3lutGj103D9UOgPSh9tqU2JhnSWoYvKMlKXrdThHhwiJb26JrShqiACiV1H5jxSUVyAtLCaQXDCz29Eag+6ehp63/HobbtB1t5RDFK6JtkuN2CEXHKGVmzxmf2fp1tH5kFsPQY3jnfPKfwTaaqcFUrFKXiFhfoRkCYokooGwjhRl6W+6IFoy87f/ywQVmE1k+rImZDg2TEWn6wtsF/++Mflh1ucjp5I43iKNujmnADmwseMMCSpo8b9Pv7L8g1T/i5hyNzbFSSqUDc0p9E1KClNXS4uu1IVeu+8uZdh5tqGn2CoOAWS5JhUX0O4uVE4QJCa4Hqgzp5LSsdDAuDcz2r//ljFS1S0OuJgySMxAxJlKYHrv2BqvqDsfrGjvLq1u1ldXsON9Y1dwRCMazjAQeFYTiSxX9f6yRAmLZPJhvV2EalNI9txT0XYOWcrhlBEhcMrjFqizE0Y3DJw8FRSKyORxgFltop1QncxwvmVEKJ3/1AUysg0VZlgIOlM9y27DQ+N8uR7eU1MWY1MYG6cS78iqONoa92NBKk0S45QZCcdvaqRcUqMI0JQ+Mwa26LfLSpDiIcI0QJAPNg5abb5k/tVpE7gefkSH3Hxj3NcAZoWv86x7FyVZYROL5q0VCKJlWlLwjpkgBrzdd1RxvCDGKz0en6wu3WEZYWTs8dPTjtdAlg/RcDrER3DHbpej6duPwZHPu9FiZQUABHxTQkmFuF5DjKbuPzM50zxg1aOHv49AlFvA310cCdCOAGIHUqYp5g0K+DR8Onaw/c94dPZVllcYrKrIFKEQOyGhVlp5N95p7lZ80Y2ge9hN20eKgGTyP5DenZ2obA3kON+yub91c0V9S0tfgi0FWFCw7OEEOTqG4LhzyPvWYvhLQ0gAURaiQmb3vrtox0BwT9fZBgPe4ZErSKiOLhG6s+FIpBPFqyp+7AkaaaJn9DSxDiLSRjQMEdxLAUotkHvTY+ScM8RpIsE/d8b973rpjenRiAxk6i4Bojv+EaI0LTYgME3MEoBWY4GEYRWuIv/pyIUR0OKcT5uFTOYWMcHOOw0y4bm+bhvU44zky84h9uOBm5aZrzp+9BkiI5+yrbt+3zwUk0yMEWi0lFuY7zZg0ycftr8mJH60OrSuocNkMcTooKJFEpzEY0DY7u0DSgCQK7Ktq+3u9jtAos3QT3WgQoKk4dnjFrfA6OOPZFHRPQIvqy+tGmmvagaKSJAW43QZKWzi4qzHZaAKsPH7F3ABaqNIfOoqyIkp7JhNciqkYgAQl9RApeV7SNZXieZqEX6LE7nRBUuYsL04ryvdnprtFDsrxpDu0HJXQ0qLht1sQEOQnP5d/9dc2L736d7uWpAa7Ce1LDnQGoz+vWa2f9/LtnqYmbo9/tWFgrTnSOfktSWm/dcQ5pVW374aq2qrr2Hfvrdh9sbGoPC7LMUhR0dnHZdzyZbHqYNlkB2OoLv/uH62dMGtT3AOuko0TgbYD/cyxi6vdHDh1tPVjVumNv3eGjrVWNHaGIQNHADg9vDjrmyNPvpYfEMBSVYX3voqn33XJOd2Q8NQ4Cf4fw6bZa0QyiSEGUCzJtM8fmSJLRozkOjKh4TTpmy0AAy8bRDNY8wpHXZCIRU/piCnBKyxoazs4mJhnsLm/ffrCVoRmG0X8uwdmBqHt8sXfupFwTyfA0DqeyI21f7Wr2OA3pT0C/WlSV4hznnAl5Np46NUpI7vdte5vLjgTsNv30ENqnoRY8UVk6e1BBjkMGJvRXdsfMWv9wrDCFLLlsTmGGh08Z99mo/fcCLLgcoY944dkjZ04YHIpJPZpPgCMQTjuvBURZHp78tNfLuxyIH4mH/8oydlR9c+xpVRVgqXWCwpTH5i4fOERNraEfPfjO7ormdK+dRBpOKZFLNdG0MIy/IzJv2tA/P3SZAzXSp64UqJpI0BCaE6/FtxLHZzQqNbQG9xyoLy2r3bir+uDRNgiJ3U5U843gQ6+11rW0BX97x/nXXTSlXxKsJx8onMNSsZo0IlpkjkEtQZA6QuLhyqYvNlds2119sKotJsher51n416y6dEsFD0igD8oXDh/9NP3LmNQQUnXKB5Oa11z6MsdDagyz/ABFRWl8cXps8bn9MZog0TUJF7arZGZaW+BB5JK/DVThlWJ0yiopQfa9xxph4vciJQxTnOLs8flTB5psiYpnMGNexp3VbR7HYYAlqICWVJGDfbMGpvTpY6FQmhZPXXNjobaphDPc4YAFkDkok4HvWz2IJeD6TOAomkY1DSG1uxsNEKUip9f9jrZ82cPstno3q8R7SP77wVYiNxFVn992+LLz5tg+jMnqb6Tf5IsSemNvg50QJRWXnfXm3CIWIaGXqgpCvMpZQATOkFownHMu89cO2JYjgxUOoV6/E80LWaTfD5tAcTbHjrp9TW1BDfvrPrPF/t27K+LxCQXYsBHYSwzJEBONJ8//JOrZ9/9w/l9UwDbs7HSEu2UVimkpZaOXTeBjuiBI00frzn0/pq9wYhot7M8BKOkCbxBxz0GEiyH7nj0zPFFzz96udPJE93IVcCnPFjt31LWQhkjitTUI6OifPb4nFFDTKMhOG6Q8W8675kTygrNXRRKvEgRbCtrOVDbAfEqYwDX4yJoadHU3BGD08yVc4DD/smmuvrWiN1miIUf6QipxKTh3mmjuxZ7xr1Q8I3kVVtrO8IKx5F6ZULjLG7Q/RhW6J43KZegvk0WslcMjt6e8vavD7bSBijgMMWoXJzjmDe1gKZSjSbPwOD8NwMsWVYe/PHCa5ZPRn1ViRqFrp8Hl4oCrcIBpfuwj9ZpW8YD7H0ToY3zHJK/ff7LFf/cMLQwIzXyZuYbwPJBKiAaGgLP/eqSK5ZOVFSJIk2rNDjuptEIRnHkCWeJkjQCJr2L1o1IoerapK+2Z3/9H17buHZbpd1OcywSRDM9QhPoCN+wfOqvf2aIrDXuKmiREHx4UBpPdJI+FyikpqOje3ySIUBsnUfp4JHmF98q+WJreUyS7FycaM3EgYIfFQjGhg/KfO3JK7Mz3d2aclXdfqhtT3mAZY3WGCEaAkm55Ozi7HS7uUGafjGQIMHasqeloinIGuN5gl5BTJSXzS4oRCkwc0L08cZKoP7f51USUFnakH4qBFjwkJo1Lnt0cRpWpe9qcADR6o9+vKUOLl4jEo2oMQKVUBDTR2eMHZYBv7lvVo5W5CfL6uZ9zRU1QdRBayiCpYwegoJ/iHbwNAlgWQBLA1gGiCtP2vTcZ/gbJVawp3/ud1480tie7rL1QEFtQBmISwgh4eeLzhn7/EOXIrX1nlEensqUThNHHb/FO4LRSETISHdynDnN4Z3XjJagoZEsCykI4hMvrH3l/R0OB8uzjOkthv5g5NJzxj5133IjUBEVYQPcFcgQne8ESZIbWkK5GQ7WRqsIwOm/q07YU5q7oqgYaaEvBp+sOfDQn1d3hAXcqwUSzYYmGPy0jpBQnJ/26pNX5ed0zdSAAISgbtzTWNUQRnwcBi5oDWDBobtm8RCeY5Ve09zsM9MqoBVR3VjWWNkY5hlDtaEQvQiyeuHswrwsh1kRLI2jIRiW3llTiRpOaEOliRBgwfc7e1Jucb4HwPk75WdpybXqptCnW2odds6IpqJWO8ix9LxJOYU5TnxO9sUtoODRi0akdbsaG30xFrfs6Hl+RCaHKMSmjcoaPzxNPY3uMAtgIYAF1AHJHKti3wW6hVU1vgXf/avHhcrbjR0RqWtx2Q6SjAqSnaG3vn0bw9E6IjHJzJ1m2o9/89xvaQlVNfiqGzr2Hm7cXlYLL7/Hbl8ycUyB6Qx4yY+DhwxD0jGIsf6y7o1PSm12njWVSIxASDFy8byxTz2wvDsEBMlIVTLfjH/kuB+LRMWqOv/hIy37K1uP1LZ8vbf+0Z8tWbpgNLwL47E/k0xNMGIQhMayQ65cu//Wx953Onh8qpuGRFEldVgoyHa//tQ1BXneU083pkchglF53dcNrf4Ya0wbKs5kbaOvXlisGibGSwXTWhcFUd1sBsCSFCTLfcHsQZleTjG8uJIhUujHHG0IfLG90YhITvwJJQX6YEtm5GV67V1m4bXi+j2J4nqDAEuS5XQ3f86UPJeLI/oKYMkEwWIer7WlDRFBZihGn4Oh4L576CbNnZgzJN91GrgWSbMAFgJY3blvUtAArhqBAOv51zb/7u/rMjw2QJhclZKCBl+5zR/5x+NXLDjzDAUH4k84SzrXmiR/k6w3V/Hfpjv3reHFEI6IPl9k/5GWQ1Uth462llf7mlo7IjER0cCic5f65Y8XfP/yGb23VLQ+IJZhmtuC9z65ctOuGoeTM1d1xQ8B1oIxK+6/EJyMyQ0kqsQIQisUw5GqTk+gKGo0KsExqahqK91bd7CqraYxUN/s9wWiigoYiozEpBsunPLE3cuQK08ZuTJOPVCoHp4i6PtXrHzlvdL8LDcO4poXwQoLRdne15++qiC3C4CF6FEo0NohrP26PhhTGZYyMl9Y0UgenOs4f3bR6dGmrgEsyaQIFoQvLEsum12Y5uKNO8QgkYlmSbJkX/Pu8nY7xxq82EWIcpzc0jOLIOhX1S5y5Br/1lc7m8qOBjwOQ9hOllEEa2ihc+74PJpD3Yt9cwdggAUqajs27WlRVQpV/+py71H3pSI7bdw5U3KzM2wyMEmOPgXMAlgDGGBp5xf85//94s1te+ucDq7fxUb64q0RTWXk2qWTH7/zfMTT+o00YZxyCXWbk2pc6F077I47xGJRqbE1WNscqKr17T3csvNgXXV9IBRDpB1wkbE8xUGwQ2m8kaC9IzJv8tD/fehSl5PFgty9Msj4bVBF3Yer9973zCoWfr3htv/OFghGrjh3wm9/sVTDDRigJwJ68HtxZRhNHzdMgiC3+IKt/khVnb90X+3ug001TYFAICIiUlCKZiieQz2zFB6RiCDmZ3lwcs3be3X0yRL4A+VNV93+ugKAzWao+eu4KQAgGBSGFHhfW3FtTqarS4AFL5SqptD6XY0qQP3qRuLHGpP11JEZM8fmnh5SIZ1ThFWNYdpADRbAAItnqGVzijwuuAeNzndcPRMrbn2xra66KWJjGaMAS5IHZzsXziiQZaJLvk0tO/ne+mpfQOJthmq/4EUGl+KUERmTR2WomIGxb+4AFVdT7DzUsuNwO4slhvTVTmFxNjXXy8+fluuy86fH4tfMAlgDGGBpg1N+tPU7978F3W6e4/r7cfrCVACiEWFkcfYbT1/tdPEy1oHpLJKNCV8RNRg84mjy2DmnKGokJtbVB/Ycbjx4tLWmwV9R1Vrd3BGLyYAADo5hWBrrJ8YLerRfAV4cMVFSZeWd398wYUy+rMhUl03YukxDPNDPr6rxwTltCwpJSgJTzBeM/PDS6fffvBDgM0xV49VUJ5QwBYOxZl/oaI1/35HG/RWtR+t89c0d/mAM/nWOoVgOwirE95b8mSRdlCTJcE/d94MFN146DR4svQr3kcJdR/SWh9/fvLs6w2M3SzgJ12DFRg/JfuWJKzPTHV1QGSkEyYB9Ff5tB9pQC5WxSjB4MwbDwsJp+SOLTxMm62SR++Y9TRVNKIKlO6oJBwQCLIeNWja70A49ScJokAOLbqBItqAoH2+qCUVkpJNoZPoIIipI00ZkTBmVLSuAJLqAOSQ+yt74vFJWcXG9ke5FxDhEnD0xZ2ihp/fcv2+aCn1bGXy1u6miLmgzkGBVcIX7sDz33Ik5HEedHotfMwtgDVSApTWpwAPrX5/u+Z9nV/G8If3BAWQKnjjoMP3+ngsWzBouAZkkjuvA0VQjaNxmpMhKQ3NHZX373oON+ypaqurb65o7IBgVcQ4LwgWexyp41LF+/M4cColPQy2MDS3BH14+45E7lihaP30vNIomAVYoFLv6jjcqG/wOm5mg2ReI3HbNmXfedDY82VVFxQS5GoAD9U0d1Q1++J/dBxr3ljfVtwSCISEmwMdBwgA8i8aKIqnk0XdS8AQPk1A4Nn180R/vvyg7ywmnqRfXJEnKkvLQs6teW7k70+swKx+JudaiZ08b8vyvLrE5aOKUNX7auVGyv7nsiN/GswYFfXCXnHTBmUUF2fYUpnjryRslaBq2ljUfrOmAMILWRTSKrihAiJLicdBLZxfZbIxZAIthyCZf5Itt9QoBGGMUGzgMg6YvP8vVnQ5QeK+FIsLbXxxlWcTvYeR9IPS0sdSiGQVZafY+Df9AX1dUviiBp0XMZkQkW1EkhZg41Dt9rKZCONAu4283C2ANYIAFvZ5IRHjoT1988OVeh4P/LwFYmNJdicXkH14x864fzANYWI08PoIFr9tP1h9cv6W8uiFQ3xpq8QVjgoxUSFkaetEM0rs7VrZz6nMBkzGiTaJIcMmAT1+8aXBhmoQvQNNPAq2oDs5jNCJdfedrFTU+h50356PxEm/xhf5w97LLlk2SVTRscL3s3Ff/+cbDh6rbjtb6mn3RSExUgcqySFEPiS8jEgys59S97QHQQQkUWb37+2d/94oZiFUD6dz1SsYCvo4iqb99fvUr75empzlMSREiHiyS9HVEL5w3+sn7lrJd8Y6rQFEVYt2OhqNNEYMl0nCsJBmwNLlszqA0N0ucFkzWcaJRoJYeattVEWApSh/A0lwmSQReF3verEKnjZaNAywVjTFNkQeq2rfuNcRhprWDQJQDfbprFw+BDpvaDagNV0tNc/DTLfU8a0gkB5ooyulu7oI5RQzTtT6PiQbdTJ9fXLmtFi1dnR2EyFDzrApmj8seVZwOf386VblYAGugAixcYEgerGj66WMfVDf6HQ5bbxUVp56hVq+oOGVk/jO/XJ6f4/lmLyFcMz977P3XPijNSHOwLMMxSIT0hL/RzS4trduIwjzyvkDkwvmj//SrS+CfywmMZaLh70K9hE2tHTfe/RaEhjaeNeNzUbYOLvFWX+SD526YPK4IkQEAAuKn194vvW/FpxCQup08ilFRx2kVq9qLd/vAw5EG1IWXleZ4c8W1gwvT4a1D688LndJIMhoRf/G7j1duOJiR5jQFYOFUCwjH5B9cNu3umxYQWI/7FH8fECASlT8rqQ8EBd6AB09oRIuinOGxnT+zgDfWjZg6ltQiLDviL9nfwuglogQJpu9MLw8BFkQkwPDW0+rDgKRs3td6uKaDZfQDLNwOgpbNsDznubOKurxNtBsXzvHuQ76tB1rsPEtShl5HFOTBue6FM/JU0KckQfA1a5tDn2yut9mw9pJeg3cxRVLnTMktzHGlGgey0SGyANYABVioqJYi3/xw16N/+YKmKJahdJO8DTjTbiO3nV1xz/K504ecEBXX5LE+WFV22xMfZac5NA024/OLeqElSVWIB29eeM2FkzVeLtOPApVQaZLeuqvm1of+g5gPGRNqsDAHPhJ7FgR1+7u3ut12WUFBP7hkyg42/uzxDxragk47ZwpcREhOVRtagzcsm/zU/YgPggCqKYrmJxic0dpG//V3/V9TW9jp5E1BJOgWl+CoE/f+YP6Nl0zr0pmG39kWED7ZXAsBKypKM/bVgiAPynWeMzUXCcqcFhGs5Cgdqe3YsLuJ1BslwncU2vJZHgyweEY1zKUJPRkKJenktaUNre0izaESOp0fBTQZH+GcaQWjiz1dylBpXTgQj6/f2VBeE+QQuDO096IxaeLwjBljs3vD6zuFQS/1QKV/TWmjx8Ub4QaFF7Gdp5bMKPS6bHArWQCrbx/RAlgnMwBISZIf+P2n767ak5HuRFGCAfcO+t8dwOmLRqVbr5398++ehbHOceofSH/UF5lx3XN2G8uZgVGS3xuOCeku2xN3Lp0/a7iaoE9TzajHQm+hoAIslQBPvrj+7+9tc/CcKQtek3EMRYT8LPe6124mcPiNxjvLF4je+/Qn67ZVupy8KeI82nfBnRUIxX5/7/LLz5sAcBGriee+1v4FXd5/r9x96+Pv52V7zCIaRcW2Ucntsj1z77Izpw2BkPTU40+Sam1j5JOSegf0bwzgKwVLnQiSMnawd9a4HII4rbYynJqGtvDqbQ0Q6DOsrvWMGUMEUfE46aVn4hosVR8hwDFDxCI00dAaWVvaCEeeQR6qboClyhIKh11w1uBML98dkRyAz6hPt9Q0tERpRF+hf3fAb48IysIpecOLvJK2rw0NTA8MDtiWsuYdB30eF2cEYMGLLM3NXThnEJxUFQx4+rfjhsgCWAMUYMFhqapru+Hutxt9Qa/TtC6qAWGIw50iff7ovCnFf374EoeDVzpVlWpdNHB8Lv7xP/ZUNma4HVqqy3gpEOooJIhgSMjNcPz5V5dMHFsow/MNExZ0lh3UYaq2BFHajtpSWvmLp1b6AhG73bTADPyloTV49bkTnnnwIhnrPNHx9kryL69v+v1rm5w2lu6ys7ybL4Jq4oAgKA4b88htS5adM4bQMqoJ3i3dU5H4AJUiaSEmLfvx3482+KHXaxbRKFBBOBobOyz3mV8uLy7MwEX6p45gkfsrfWt3NrohPDWSH1RVfEEr00ZmjR+aAYiBdxydcpSIjrC0ckuNIKg6ARZud5UUxcZTy84scvOsQhiN16soFYVyl9sP+FCXCw1oXS0KcMHDZRAT5IIsx6IZ+TTVNf+bRq8jCsonm2s6ojLE5vq0Y7XtAF9ElOTL5xeneWxKn5SIx5VDcffxys1VNc0xh53Vj68A4g8rzHKcO7NQxujqNFr7FsAamAALX1HkqnUHbrzvnfw8D22eVMiAMK0mIxITWZJ85483jh6e3VkZF/+/KH/6/OtbHnx21ZCidFSE1I2Drzvfq2Kw0u6P5Gd5Xnz40vGj8wkc+YiTjOtFWDixpjIMc6S67WePfbCvssnrsqOzxqwIlqrWNPr/8uvLLj9/giQBTHalEZGTX++p+dFD/5ZEFfrwwAwdAC3CBF8nFhUZhr31mlk/umYWvMNQZX1Su1AfXw5OFjG4vvmXK1a+9uGuzDQ76gA1idVUUZRwVLx88fiHblvM29gudQLgd27c1bS7vN2gB6+gvg2VIamzJuUMyXNJKsGcTl48gZbgx5tq2gICy+kPJ0uSwjDkstlFaS4OASzDvoAoq2tLm2ubQjaWQR2g+oJryMNSVZmcOSZj7LB0CQCmS4CF3BuyrSO6qqReklTdXHfaQQcvMpYkrjl3GElTGgd6b98EWNkGLX54WLy5ujIWU1B+XK/SHMBke2OGuM+cmN/HKc4+MAtgDWCAdfeTn/zj/a8H5aURphQZDRzTZHMgpKpr9D/3IBJ+7twXDTBBEc2QO/bWX3vX6xRD2TjWlCCH9r24RQj4g7HsNOdPr59z2blj7A4bAg+4L0+voRO+uTV4y8Pvb91TnZPuhBNsFo8UKlmLiRQCo9ePHp4rywALhMcBFrwfLv/562UVjYjijzJHQ5fAYAUOeDQmxmLytcsm3/PDs9O8TvznKMKlb6CQbA9JxWLSc69ueuHdbbyN4bT+K5M6FbUz4eFbFl++dGJ32t3hV3+8saqhNWa3s4YYsHCFnJ1nFk7Lz0pznAYyzycYqdUb1SK2JN0fAleOJCsXzC7MNUOLkARqS0D4eEs93MtoEekLImFwLElyuos7Z0pBmoeV4SHQ1VLUFJZqGkNrdjYiplPdxfX4IogJSrabvXjBYMy9ZX5r80m+F2dssTyo/PrnlYhukNJJM4EyAgoRlaSZY7Imjci0AFZ/PKIFsI43rcYI/mbWlf/rD0Wd6HDX1XaEXhuoai93xWrEd1pqB4fTzfs+0NQaWj5v1POPXIZiI4kYFtacIaBPFQzHfvboB19ur8iCV7upwslAQRrNwZgIFDB74uCbr5k1d/rQxKgSMoGPH9zzr4JjB268IRETpuO/gL3AhCe+c3/NI/+7tnR/XbqHRyReJo0Soh6gUK3VWZMHP/frS92uY0TJSSqgp19c86c3t2TAUaIMltseP0o4dCaJMiIoH1Nw0xUzzpl9hsPOaWOBgBZm2kdg7/h3VTQpPjxKKl47yRbwAxVNf3hlw+ot5TzP8hyEWyYV2OHMZkxS8jKdr/z2qkEFp2oXjxO0wgejwJurKgVJxbSrBgYKQQc1I41fMCXX4+ROJ6JFInFeHazxb9jRxGE6NX1SeaiQPCotmZE/rMBjGGDBg4jeeah5U1mrx1j1ocbhNGmod9qYrO4I+CQKGMD+I/6t+1tovZ2VhMY0QaB+6tHFngVTCnuJO+Yk3wvwAcuCQEh8Z81RzMCo89jQPkqUpbkTcsYMSZdxC+HAuYq7NgtgDTCApV3SDEmW7Ky+4s430j1OdCXqC3VgQik4voIgikhIleqNg53UuNBp0sEjsgRzdXkFQeJYdvObP+Z5LokbsAY2VhukiNfeK330hS/hZWyucLKKk27wA2VVDUVEF88uOnPEBfNGjB2Rn5Vu5zj22F9EIOo4EtQTHiIYFvYfanrrs93rtlUGwlGX00ZpVKfmjZKkKEJMvuu7Z//ompkKQSSnWQMKcE4qq9vO/d5LdjeHRgmFicwBd7geC74KxA9ENCpBMD9meM4lC8eed9Yor9dut/WAgSIcEVt9oZXrDr72fmldW8jjwuX/cMmapVqGObv8HZHLFo9/+r7lSG9E/dZhiANTmohEpbfWVNIE7o4z8CBwgARZGVzgPHtCHs+eVkzWRBxggUhEevPLo5izQ+d1jDv1xGkjs2aMy9INsBIUCehQ+tfaKojYeFYvvwb26eDmsnP0khkF6bgEqsuNE68jBGD7/pa9RwIMa5QeAnovc8fnTByRqQJgSrdN1++NPUOISmsag59trbfbGZ2QWTsfFSIiSQun5g8v8sgquoRMFInvd7MA1gADWMkW30f+9/NX3ivNTHfqPo5V7D7Ak31Qbvq4M7JDMcmMNrKTPDE8VcMxuexQvYiqKIxK1h/3Cqra1h76+2NXLpw74hs5HeSkVtX6fvb4BwePtjrsXG9E6gDeQjFRDkUEeOLkZ3vmTBx81rTinCy3123L8Djh6WOHyJKm4C0sy6oowAGXwlGppS3U3hEtr2xbu71ix4HGmCA5HSyPkZm5hLEQKURj4pC8tD8+cPHIYdnqN5rIMSEY+f/ufntNyWGkvoepr7pMc/RslPAGkyQJwixJVvOz3VNHF0wbW3jG0OyMNHuWF0JSDg6UjaNx8Rbqp4vE5JggBoIxXyBSXuVbX1JZVlHf3B6xcazDFk/4mhmSRIBZaQ1E3n36hllTB5+6G0urQYELuaEl9NHmWpsNYiJDJO4KMmLcUO/0MdkmDnuKGG6aA9C/+XB9dZNG+U3oGS6UDhOVDBd76YLBug/s5Pl5uNq/dkcjj3o7dH6UilN0sZg88Yz0meOyZaBSRNcnqMa/JQnKxt2N1c0RHP0xQA+hoFLUJWcWDslz9ymFOyZz3l/Zvmlvs90IVx/ONkZFCWLEMUPTZRmY51qmhFkAayABrKTMrSwpV9/+xt7KZpdDP9M3ulIIwh+I/OG+5ZecO75Xn7wjFL39sY827qpy2Xjj5anHBgSo/o7I1Usn//bO87/BhgVQLgKQf3596zOvbXDaWMY8vobjxxHdzgBvJREjA/gnTgfvdXLpHofLwXpddggd4MyJshoKiSFBjEbFFl84GBYEReFZFiEwXNWMrukTlHoMjQ5a1gpQomHxe5fNuO/HC/CVcOL5pRGqrfrq4E0Pvuv1OlgsGGduSZ9Wu4byImikVElUYpIsSsDB0Wkee2Y6hEyM183DcaJoUpEV6JR3RIRYRPSHYv5gLCqgbj67jeFwDxr8FJQ3BObkmrW0NbS29vD4M3I+fOF7BO55PEUkQKMFQSxiR9q37EMXjMHBQkzWCpg1Pnv06aJC2NkSQXdQVtH+1c4mt5Mn9fbkIJksSYUAK82tRxMG/wCabghnP9mMiu4ZFL7qcfBFC+EQuO4ersHLFwx22jkIsMhu5PW1eB5c4V9+3dQeirG0focTV7irigouPLMgO8PRZyvnWBZlX/PuI+2GABaOAgqSPGqQZ+7EPA1gEQZIK1LNLIA1kACWgnsuWJosLav70UP/EkSVN9CVA7DGgijJW16/JT3DoeANSsePIdMMDSzcQyR49h8bn3tzi93G6nfZvvkKQI1EhDOKc95ccY3TySfLt/HboUADQzJHa3w33vNme1DgbUwf7Fz4pYoEd5UqwbNPRkkyFUfyKYyfMFsZovBhWcybrvV/9sLiUzEQQXVFgpTmdvzt0cvHjMiRZByY+cYegg/QEYze9vB7X+2sgn8ZteX1MmmtFjGSVcSYJUkY+GG2eewZ419Q8g8OEMFxGPL1WhcHYm8n4TGoNLeG/vzgJZedP6HLmzspGblxT8PB6qDNwB7UDJ5FNEnOn5JXlOPqTpppIBomZY2u3FgvA7WzUniPDK9necKw9JnjclQELYgeoWwZlUWi6OyBo4HNZS2MXvZ2iM/g+sVigtL00ekzxuZ0M3yVHIpmX2RNaUNMUJFKjv4IlirIwM5Ry2YP8jqZ7lSAmWLJKODGPU0HqwPG178kK247c/6MIoeTkVABplmVlf1vFsAaUAALEQyhsuiX39r6u3+st3PGojIAtPkjM8YWvP2nG4GmaNwLKXwFF/pAR3FjSeWtj3+A2tE5A7JVJ3y4osqyzHHMCiz83DnCjEvJSVxPSj363OqX3i3JzHSSgDCrNe/bH+nE4mgywfmO+W/IRKUYOke0GqXeeBqELknMKOGL/PCKGQ/cukjBLAmI4fAbe0hrSv3oi72/fPZTVSU5zsxSuW99QsxMQWk627gVUAXx4ToWZEOVbr3LQaLgfoVAKDZ2aO6rT16ZnubsFsBCFwyxanNdXXuEZw0DLFnhOXrJzIJ0d7fqeAaioWNAAZvKmg/XBJAwtq5tCA9AOFZOjj4X1TzxCNZ0gx4jyduEMpUU0dwWW7ezMRxVWE7nylIgulJIUZGdPLtsToHLwYNu0+BpLkR5bcfmPS3w8WkDEuGaoEWO13buzEKO7TumniTAWltaf6QhZBxgocCkrA4vcs8cm2PjaEXjGk00A+GStbjqOhmvysAdTbjRJMGN16caQd03C2ANJIAFb02KJn3+yD1Pf7K+pNLh5BkDtzO80Gqa/L/52ZIfXD2r9zTYFbz0WRQjiV1z5+tH6nwOnqNMmkeA1eOiMflHV86866Z5Cu5L63xeacozLS0di773kqSqNhvXSxGjVDOAxWxDEcFpYz976absLNcpOnS0UQpHhV+uWPnx+oNup51AveunGVfAyQ0ldkUZXr6/vvXcK5ZOVIBMdVU/jWluCehqf7Kpxh8RjUsFSDLq879gziCIOdSUvCeMm4LCyWRNU+SrXU2SDIG1nlpDXHWkiCoYmuecOzGXZWgZfmxXAwY0SKSSDEMGgsKanY0tfsGuyb3r4n3DShLIWZkxJhNVDgHAdDt6hKNuxJ7Dvq8P+FAIjdTfp6EBrOI89/zJOSgY3lcpwqSDsbqkrqolYjPsYEDkragqHNLCbOfkkZm56TyBuVdAvFMSgSztzNaahBA616rAsF+G+5Gp1OR3sADWgAJYeFF9vafmjic+bmsPs3auS1K7k5pWdyLKihCT3n7musljCzsTdZprSQ8DPvmdT3z8/pdlXrfDNPlfPHPhiDhtTP6K+y7My3GfEADAixtxNP/pnxsffeGLgmwvXELaMPbO66aEafMLr+3mtvBvfr7k+1fOlDFJDvmtAAvxdVAUs3Nv3U3/8y94amvKz/39Hr1umrBPMBS96Jxxj9++xGbnVKB0WZOjEUX6grFVJXWiqJ8okkjsDkGQh+Q5F04vPP14gJKGbn+SUCR1c1lTeW2I4UhGB+eaxu5BoMt4zGDv7LHZ8GKVE0wzJ8QwkpVSKkrnocxgNCp/UdrQ2BK18wja6C531CIuQwtccyfkMiyFZSS69UE4uQynGEXy9h/tsNsYFGDXO98asciEod4ZY3L6EpcnAdbn2+rqWiOcYYCFK1gRBBYEYOep4jxnUbYzzc05bYkWABKFrCgQX0V4BaDqi5ikRqNSVrpdxQR+KbhxLIA1kACWShI0IF98e8tTL69HxUyMTv0s6DCQAJXdjB2W88rvrspIc/Y2t6EWI3l/1b6fPvF+VrrLRHyDyBpE2WVnn777grNmDP1mKE4hFHia+tqjP3jg3Z0H67weB/wZupcK3lPD4mmvYHT6uKKXHrvc47ZLOOz+7WcQOt7gCoD3xMPPfvHSf7bmpLsJU7QJU9hQYENVhYiYn+1++bdXDinKkHF6t+uUEyZorW0Orfm6gSANdX1qqaWYKE0sTp85PkfF/sFpCWxxJFtlSarZF/tiez0EKDplc7QAkqpKEhg3xDNjTBbDMCrQeG2PBaQ0ChKc+wYUqkgAgQ5hw57mel/MziBxGn1kAAi0EUCQVI+dWTIr3+PiVaUHWuZoW8KtJitf7mioa47YeJYkddaFahwo8JeZKIrmlYFZhCXdGP9EinDN9rrK5rDxCFb8YwFCz3BwZIBUDTiWcthYt52N02iQCIcBXP0Gr+uoKMNZCEclr4O5aH6xdoGn4HllAayBBLDgUAQjwh2PffD51oosLwIK+oqRAUD1xcGgcOOFU//n1oUk8hJ6K4KlmQaw2v3hudc9D8GN1g5mSjkUwGxekZh0yzVI+Jk4XviZiDcCw29nNpRU/uKpj/0hwYGIPE9PgKXFruB9E4nIeRmup++9YMakQRpBDnXKMoVkZ1AoFF3+k38ebWjPTHPiVszT8cbXhgkXP7V3RP/0wEUXLx6nKIh3l+zebQl/+ECVHxVK0/p5jIiE6FNMkOdPyh0xOE1CPOCpeE8YNxDXUCLggG3a3bivKmDnUV021fPaGdzAoUoqKUtyUZZt3ND0rDQbDy9k9DnkcV+J+a4CYbG8tqOiLhiKKRxLoqpyHV8aj4eho1NQ1MXTc4fmezFvUw/iYArqIgLBiLRqa31HTOYZ/QzyGvs/BJfzJmUPynXJ3Y6iGbckwNqwu/5QVchmM+cs1fgLKRKAOD7G3UEK0Rmg4LMdUeuR+DYMi8q4QZ750/IV0BcMqzrMAlgDDGAdKG+6+s43REV12DgD/b0otsySxG9+vmTZwrHQZTBNIeVbTcWFzNS1t7++YXdVjteJ6r7NIP/Usjzwmpw7qfgvj1zictq+GY1TcE6QIsDf393+mxfX2nmWM1yYmZqmwU0ZdTGSj9626PLzJyqowr673i3AOsprNpff/PB7JEU6HCypGshhpKqhEcFtjE1t0esvmPgUYhZF5PwaOW23PoFQS/e37a0I0CxlpCkWXySKICqXzCvOSrOfxilCotPFDN2h/6ytEhQFla/pWl/o0kIrG7Wgwp/3OthBuY68TDvD0Cy6I1D0SpYRcm3wRY42hiIxhaHhXCHZSn3zpbF6QhQeFeQJw9PmTsxXMJlHj5jHcXEC0eKLfLSljqZIxsB1piioDgxeiQum5Wd4bSjq01cAK+mMbdvXvKey3c4ZoGnQZ5pWDwCBqHjW+JwJI9IlfMSl4MaxANaAAVha5dDbH++45dGPBhd4SN1kMnGlZGF4UcazD1wybHBG37y+ppjx8ttb717xaXFhGnJezag31wBWNCaxNPXuH24YOTz7mwALL3GVJin4pj97/IMP1uzPznARWl/R6RKeSQRlCAivWvyh26+fe/ePFiCfUFG7HyfUVI2gW/3CG1uefuUrnmd46PKbpPSXIhYP8qmqvyM6aWT+Xx+7LCfTLQOtuqNbq4FEzD3qxl2N1Q1hlqMNAVCASbAAuO7cISzLKji/ffqM9UleF3k7LEkeqkI8nxwP8ZBO6jfMp4/QFbzBEI+YrMBPQbVVyGtDElUy4sdHYICjaIalNPcBdJ9NofN34aCZAtSYAAoz7Yum5yIPDfFe9ewEUbAAwNH64Kfb6lw2+Fz6Vw5QgSwpWem2BVPy7Q5GNSzO2LNvx5fRwer29TubHTa2j08IHNpCKyAcFc/HJKsy6AsKex1mAayBAbBUFFpAEaCb7n/3s42HcrNdeGB0PjTKqUWlSxeNe+TnixmGxQxNvf4KCnZ6du6vu/L2N1iWsXM0wCDR6Mgk7sv65uCfH7zoctQIdvJGd610xu8PX33nm/srm7PTHYQBkJpqpmByHjikLb7Q0rNGPv/QpXCQZQnFJnv0ilqnqijKT/1t7Uv//trrQKI0pnGfpoChKARWKBoxOPOpX1wwfnSeLKvdj2rgbjg6FBbW7Ghs84ss2x2igFM8DcRqitNGX7Wo+DTlZzjOEi0viKFj0+7mQ7VBDnfz0bq6+eKGdNYxKYmKYXJCjgpPC165KIRroNsaE1+h3KACMt3c2ZNzM7w2FdOK9vSj4OcwDNhzuH1DWbPHqT8FgUcQiJIytNA5d0IeQ/dp82kygtXqD7+3tobnMUVEH+I7rboO1ZUCefmZg7MzbApIRXRFWABrAAEseMuFI9Kcq54TgWrnWf1MRaoqoSIs5eHbFl9+3kQsq9cX/ocWwWprD//41/8u3VuX4XWoZgAs7Y3gadrsC583e/iLv7kS9ZqcrGMZExeg/q+yAw0//82HlfW+NI+jDwifets0iIlbx0EgFJ05tuDPv74sO8ulYl6pnjqXWtk1nClJkO/63Ufvrd6bme6iaMqkkrl+HiUChy3bg9Gh+enP3H/hhNH5CpDJbrEpxQ3CWJoAbYHYl183hmMqB9eTkTgEiiXLg/Oc580sPP043L/NUDaWJuCLb9zdUNMc4zkaL2C9pxCu7frmHBynAKpPKS9OuYRSypIse+zcOdPyMr36M7naO67bUX+gKuRyGBINgwe4rBATz/BOG53dxytHS/XCGSNl5Y0vjsoywbLdrF00x3CrgSrJwGajls0u9Di4PiNZ7alZAGsAASz6w9V7b3n8gyyvHXtmOqMvuKhWzM1wvfzYFUMGZ/Zp2QfcFgpY8dK659/ZlubmKcpMAeaYKFGA3PbOLTYbp7HSn7DjQYLfnKaoXfvrHvzDF3srGrXHILQ04kBDEPGbBZMDwWn1h4XZ4wY9cffS4qIMVZX1OZWae0pgpvJoVLzpl++uLz2a4bVjEUljknv9OVBxXnsVkTII6V773x65fNLYAhnlflCep/vRCJkALImyPBt2N8uY9Zc2MCbwkTpC4vTRmTPG5vQeF12qmdZMx9BEMCR+tq2+IyIxNGOqGrs5BuKCrUCUFY6llswozM10wIuDoHSyLmksox+sr27pkOy8obtMkhW482ePzxk5yNvH8RuQiETCGVu1tfZIY9Bl5/qS+AbEm8el/HTH4hkFqIuxLwNoPTELYA0MgKWNwy+e+Oi9L/d53RBg6Y8nqKrSERYXzRz2wqOXq5g+u88AlpYl/HzDoXtWrJRkpPNjrvBza3v45UeuWHz2iJOiRu1Q0CIZEGMdqfL9/IkPdh1syPI6tKINAiO+PhkJk8YTV2tTELXKhC8QWTRz+JN3L8vJduMWbv1gUXPcNT3jppaOX/3x8083HXa7eA43TA+kATo2UPE8ciAYTXc7nvnl8vkzhslAwQPUsz42FXNK7zviLznQCo8j5OUYuNzgRHWEBXhznzHI3WtUdClnWhugipg/qea2yMqtdbKiIkJwI3GsXjANk4uSCo+L+VNyh+S7VTXB/aArKAY3j6Io/7e6SpGRXpCRZ5MkBW7HBVPyC7Kdfcz+34naEJRXB1Ztb9TSnX02dyBBsnpGoWfexFxUN2pFsPQ/ogWw8CBoxUM1TQGHnTPyUXDG29rDj/zs3O9cOl1KiNr2JcCqrfP//Dcf7a1sctoNVSF88738HZFrz5/0+C+WItZy4uQdYfF2cVSVQdXU++/4zYdbyqrTXHZ43mk6NgMmiIW3LjxoJAW+ePj8M0c9c/9yt8eOwZUJJx0W21EYigkFY8+/ufWv72ylGdrp4LT060DJF+LuehyGUJRAWBw/JPvBWxbOnjpEg1w6Fh8mZSW27mvZdzRg44xGXRQF3hPS8jlF+VnO/5oAFjI8I+jcYRmioqZjw+4mBQJ6CFhxZWb/9p4kGUoVoMgCcDnoWWOziwtc2DczdAHB1RIICu+uPcoxFLrLDKwdWVIcdvq8GUVuF9tfFUgkAYJh+bNttYGIxNEIH/eN+gMu9gCiKE86I33q6Gw1VQuwCAtgpT7AiusDkuTazeW3//ZDCIhY1lBbrCzLkai89pUfFOSnJatC+2aBoiYakpRU+Ym/rH31o51OO2vihKqol1AYXpT55orrXIgA8OScjYk4FjpDIaRq90d+/8qGf39eFpNkj5OHoEE3v3PfmkYzqIbCIkNTVywZ98DNC232k+dGdRsm9lNZ3AH99ic7f/PCukA4hkcJuYxm6R314hjhSAnEiRFRikaEZfNG/88ti/JzPQo8n3vSXHncZwJFlYk1OxuqmyKIENxInTK6JlWGIpbNHZTmZnuZii61LA5iACZaI4nq+tC2Ay3BsMLi3he9PKDmGK6hVlWFFGQ5N902Z3xOVroNMZkS+hsaksd4dUPws5J6G4v1WA1sIEGUs9Nty2cXqaQOVi9zTEXqW+Teo75t+9rgSc7QfVRCAGcHzQYB5ozPOmOQV+7bDsoemQWwUh1gKVo7jApWvPzVX9/ZBkGJToFn7H/Bj2oPIAL3D1/4LkH0ddUH6qxGfir58Zp99674lKJJzhhYPGGg4ISyNPmHuy+YN3v4KWrLQLLSCHeMw99+8Pn+Z17deLSu1engOVSxiUFnSqUrNEuUaiMlHEmC3vDQovSfXD37yvMnkDTVHR29Hg4pmjEKk0PC79xYUvnUy+v3HG7iWIq3sXRicFIumpUkhUTbHISjMRoAuM0fuHkxh6RkATAQtYWXbzgqryqph4NvMMetpTkyXPz5swt5nk7ZNEevmhKv5iFa2qNf7Wr2dcRYBvpdEHX1kALBgCXVoJP/JimqJKkFWbZ5E/PdLgZCapQP09E3mDAsG0DA02nnodaSA20OnjVIPQ5XzrB854Kp/SmvhJ0UEIsq63Y31rXGbDgJ0AezppGsciw9f2p+QaZDVfoTjp/aLICV6gBLYxxpbOm447EPSw81QKdZH8DC3YLosqxpDvzypnNu//7ZaHv07Vtj6hpU2VNT337jPW82+6MOm6F05wkDBf2amCD94LKZd/1gnoJTOd8ivXfszzHJOzqgKqpa//fVjR+tOyABwuPgGBprpvQ+AWvPTFEgwIK/hKOCICjnzR1x9w/mjxqWgxrVgYopfsyc0WR7lqIA6HBTNOVrD/971d6X/rW1oSXockGAwQBcfJFSytAaj6jGjhYVlSkjc75/+cwLF4+Fs43JktDf0X0LwIOiJRD9dFMd4nOi9dfsJURX5EE5jnOm5aO1lmqLrU9Mjcv3qjRF+4KxDTub6tsiDp5Be5I01KHZfQO44jBRyIOkt+DEjhrknjIyy8bTsoz45iljd7jGTg59y6921B+uDSF5GWOzHRWkKcMzpo7J7keApZ0PcGRafJHPkPwR4OA5gJqQe/d7UV2EpKa5uXOm5HqcHDwTU+n4Oc4sgJXqAAuVJlDk2i3ldz+1MiJoKrw6mwehibISCsXe/sP1MycOlrEuR19asrgBvsIPH3x3XclRj9tm4ufDFwxHxKlj8lfcuzw/19M9BWtcyURQDImUNzaUVr32fun60kqgEA4Is5I6vqDfRGPQKZZoQwcqgNBKlMGY4VnXL5986aLx8CFx8gKxV6Fn7IUnxIk25H/DsYDDBP/kSFXbs69u/GzToZggO+0ci7gK+jOalaRgSDwDvH7EcFTMS3d/95JpN1wy2eO2I2JGFYFpg84uSao1TZFPN9fb7Tp3omYKZgaXBGX8MO+Msdk4WpqqZ1AvG8CjAWeRZchIVN1d3naoPiCJgEetaQmfoTfjIkhsGDWYItdFVNScdH7qiMyiXAdc9hJBmpL4SrCfgI831rV2RFlUsWTg06DzIMgLp+UNK/DKiTrafjH8Xsj7Kq/2r93VDN1SeEEROGkJeto/0pPXl2SlIMtx9sQ8nqcRyWqqbh0LYKU6wCLwenrmb18999YWzNukc7trAKsjFDtjUPqrv7smO8vd2wLP32Ya4eff3t72yAtrstIcJta5azkXl41dcfcFZ80cquCjp2vtXq0qi1AwJzelyMqqjeXw8XaXN8gqgL4mx6PaC+xN98MqAYiVUZEldKRCLDW0MP27l06/+NxxXhfCppIqkejc1t3Y1C2LEwLhvgHEJYaDDptKq95bVfb51or2QNRmY3iUM0Qpgr6PxCDBOdQOi0i9YxB/ympOpmvRrGE3XDxt9PAcApU6ySQSOYNzaHSM4HItK/et293oRbVoRvKDKH0JgDJ9VNa4YWkK6JtgTSpaMkOHyWjQcdDQGt1+sLWpPQaXFIt2Hi6M7KXxAVrKSZUUxMUwcpB74ogsB89ign3CrJpMFVd6CDH5oy214ajMMob2CDwHREm5fP6QNI+tv47xxODF41hw4naX+7YfaIV/wjMMLj/B260XZk2TCRo1yDVrfC4mYCH6OFLQfRsYAKuktPpqCLDSnCZ20cM1KiUAFj6c+/s9v/31ff7IT3793taymqx0h+5gMM4QAn9H5KrzJj5+53kQqmoN531vGsCqrGpbeNOL6Zjq06ywBybbVKJRJPx8+3fPknEVbTdPn0Q6DInxwUHu6Ih+vql85YZD2/dW+wMxnmd5eGwcT+Ngep0WAvpE4gNxfZyiqoIsx6KSnaVHDs1ZMGPolUsnFeZ5CZwIU1AFC8BU7X10xmpgFBFFUvFrZ/uu2lc/2L55Z21rIAT/zGbnOOYk29TMyNbxASvU+i7JgqwKArwS1aI879K5oy49d9yYEbnaAKLdjXtDDR4eiTplYuPuhrKKgMsgEzdu/2QAcdbUvCF5rhQ+gfrO4igLCywIMWVXRevh+nA0JsNrmo0TLRkOjRxjJU1gOqAKksJzVGG2c1SRpzDHBf9YRssG1wgYXjbJV0M0y/7o5yX1oqwyugEWZkuGWBAOxw2LiwHDkP26chLeKYrs0oA4VNOxs9wXDMpwviiNRpokTQ9lydA1UcG00Vnjh2UouJkpZZ2TgQGwtpZWX/WLN9I8dhPhMHxvSZZ/9ZNFEGAp+HhLNRCspWbgOi3dU3PVHW/Ai4u3MYSBsnR4jsDXfuinS65aOrEfWQ2x6huKwi38fy8cbfB7nLyp5ErAF4jNmTz4rw9f5nbzPWwwiVdnoWI15BNRsiR/vbdh9ebDX2wpr2sKCCI8GSmOo1mGorQaLeQ9mQNucIQRNVwjmAhxlQC/XIEefKbbcdbU4gsWjp4ypiAjzUnE6a9UGp1a+GTrc0VFoJ0ZFMqsoLJ6AMoONe3cX79y/cHSfXUxQSbhKLGUDdWAxwkIgUl1WiAxUvAh4EUlyUCCw0SAHLdjyoRBZ08efObU4jOGZBFx3Ws0MFR8eI0i4WSW58Ovahv9UTtHGdlDcFTg87vszMJp+Vlpjv8eltFTW/LCZnBQy9ch1jSGDlRBf0eCRwYLNx3cEioW2dK1mjTNZo3jRMIxKo4mB+U6RxV78zLs8OMlVOVIUSCRmTTJgdIAVnVjx5elTaSxRD68FGKymuHiLjtniILRVb+jC6A5hyTicO4ISV8faq2o7yBVkmbhSUBCqGqwZfIEg/gSfthZk3OH5HngCUBaAMvQI5LkppLKK+543Y276M36WE0N9JHbFl9/8ZTUFLEH+CajafL3L63/1Z8/H5Sfjksx9VtMlIYVZT7364tHD+tP2uikGMvjf179u7+tK8pNM/dhYhJ0eYl3n71h8thCffFzFCJBiBskT/FWX6ii2rdmS8XWPTVV9e0d4RhcPCxDQ8eXppCMPX18BoOKK0yfaN/8c7j/VCxqo6KwvyorMlzwDjs3OM87dXTh3KnF40bk5ee4GUxLiKKQSLqjn8rBTnhyHAtAhV+J7FY4LB6qalm7pWJvefOBypbmtqAAR4kmOYZmWQqpD5DH7eBvG6WTfReeFZVQUOBHlkQVqIrLbs/Ldg4tSp8zpXjh7GHZGR67DTelotiept5p2gVJJNYtvC5e+/SIKCsMY7TqWZZBXjq/YFq+28FbAKuzacGluB48AaJRqbw+XN0YDoSEqIQy/6wmj3ncavo2NwMkPzO+hBS0PGwMnebmB+Xai7JdGR5O+yTcQ2JaQP0Egx+8q9y3fV8rSRtKd8IfDUfl0cVpC6fnqyBV9OqTpaLw3eAwVjeFD1X7m/0iPI1ZEvtWia5jfGh0eplOH3FCuV2nLXHc7oCeCc9S580syPTaVcxMk1JNzJ1tYACsNl9w684aljOtpR8ZFmMfMyJ7cEG6rOBQcH+/6TcekNCyyyW7ahpaQg4bYzAYDNd9htcxeUwex9OJXvV+sIRWKFHf4C8pq3fYWXPBLTyRIxF55uTCnByPcZF5FAUhAG7cRMMFMcThqtbK2rbdBxr3VjTWN4c6IoIoSMgbxl+OipToRGKBiivOggQjBgo9AQ1QofATukIoCNQYO0+7HLbCbNeoobkTRuQOKkgbNTTL63VozwBxNsRzyAlMyWYZLdQKby0yqQoN1Mra9r2Hm8oON5VXt0FI2tIejgqyquC3R0gLhQi0KCChbT3Ml6Gp9KiaR6zVn+H6YxQKo0mWpdNc9twMd1G+d9wZ2ZNG5Q0ZlJmb5YrHHXHUqvd2sfaaKlBqmsLGqaNJXNnt4Oksjx1LRqXa8dPPlghloUsbt6qhog5fh9joi9W3hPxBGSEtVevQBxjmUyTWVNVIWCitewVvM60RGyXTKdJuo9NdfKaXz81w5KTzcOuhSCf6GEOSR10aXpxqe4fYERYNogEShXCIdBeb4eFTkJ8A3askyWCWrLZArKopXNcSDoRleEJqMInB5aJxHW7qOFZZdIYAPJ1w2ml0BMAfQqoSWLIovklQdJHIQSI5eXD+UtwxGQAAC85Ur0p1awxyqRASOPG1tXsDpavMff3+95bxmlPpXhaQUhXFuCuqUYETmqYQQgTHPi8UirX6Io1tHeXV7fWNgYa2DuhZ+vyhcEyG20oQFVFEYneSqrAUKqBnWcrGMzTOcmR6HR4357Lbc7NdhbmeIQUZ8MjIyHC6nHynr8YeN678QTdH6tFyHT9K8d/Ah+zsoUP06e+IHa31VTf6G1tDdY0Bf1Dwd4Q6wqiSQhQVQZDgehQlFVXJIxUjgkdkbxRDUk4nk+5xuZ1cXpYb+gZDC9MG56dnZTldNo7sVNeaqLMierudCr8mwG9nFh7CBfqpRiSWYqYV3aEBwqME72oI1v1hES4kX1AWBDmKlI8VBe42BYlF4mAp8m3gTDEM7eRpu41x2egMly3Dy9l5pHwYzxDI8U3V25sLF/KjVJl5K9SU461XLIlxNVwbjUm+kOgLiL6gEAjC7Q53PQo8KQgh45x/4iUwlkLJDcRyj7EXPDMZeGDSpMPGwMMTTiX81e1kIb502Xk19Qp7TrABAbAssyy1DJ3NaG+fGHaA9zw8QaIQNcgqPFZigoJ6KRSVo1FQi+cZhx0xbLEMhaT9ThaR1ei7UiTsb8SwoC8uvydPjPbAyywcESJR1O4XEyT4G3gICYgkFg4TwbC0w8ZxHLwESbuNczn4E388EazqfcIdy1LLtOA3XlCAilcfoXgwhOi4aSl+Z2tJa5ZBIVIIpXiOphK0nhjNEnG23oG/y1LcNGwRnyyU7FVjkgoBVjSG6tQlRZZlrZwSRZ5JjJYAScKNr9W4wlnjOcrGIkF1G0slHBsE2iBAU0hA62bW7yuzAJZllvXYOtE+q3EwRGnV3D3a74lQItqEceZqMlFuMNCP/njvvfY61LE3Ijv9t5ujhP/BXEXEcWTapwEMtaxHph6/brDMgJZe1v74m4sq3hRBxFt0E+vFGNmsZd205CFAEBpHn5rgGOrE9HxyO36e49UDWIQQfUz8oEzBvNOJr2EBLMsss8wyyyyzzDJzzQJYlllmmWWWWWaZZSabBbAss8wyyyyzzDLLTDYLYFlmmWWWWWaZZZaZbBbAsswyyyyzzDLLLDPZLIBlmWWWWWaZZZZZZrINDIBl0RxbZplllllmmWWa9T9fdjcsdQGWSiSJ5DR14AEwmpZZZplllllmWe+aRjib8sGX1AVYmCybVERx86aNhw7tZxg65cQCLbPMMssss8yyPjRVBjTNzJ03b8QZI1M8jpXaAAsNpVxxpLy5sYGiaMy7m9KjaZlllllmmWWW9ZqRWn5r5IhROXm5FsDSaSAuXw/olNSztMwyyyyzzDLL+sWQpqSqpKbcddJSF2Al5IZSXWzIMssss8wyyyzrS9OQS2rjqxQGWJZZZplllllmmWUD1CyAZZlllllmmWWWWWayWQDLMsss62xacr6zWYl6yyyzzLIemwWwLLPMss6mJlp4KVwFqeEtur+fyjJ9pmHllO60ssyy09VSF2DF/ehu8IhpzYbx9+nvx7bMsv60ztul5w3MKt5wSTYUkNhQWruJChQSh7L+WyJaJ5w9qd0QfqwrSCNgTMBkIsHYHH96oOD/MXMCtWVzbLD6eqDI4859oJ6eK7SbjJqpvUqNGV7jZHxmASZzT/FpTl2AhYePAO0tasBPUN/iQJOASk+nPZnwL6NjAwCmvx/bMsv6xbCbQSi+FhDwqyTBOF1UbgG8TfFV08UphPqd4bkF/yEIqeaIeHiv0tamBgKkLJKeNDo7i8nK5yZOJWlORqc3oP8LPBlAEmpMUOuqCIohVInKzadcXgCULgezv0yBAJigaTwxUvl+6Wi50tigRDooQJIeL51XwA0ewg4fSyCgrFKmTuD/Z+894KQomsfvyZtzuMARJIOgIIKgIEFAlHiACEjOOUgG4cgc4YiSMyggSBLMqICKJAkiSJB8XNqcw6S3e2Z3by+Ap+Lv7/t8nOejj3e3O9PTXV39reqqaqB7eb+Xz87i4fM5vEyF/6PkeQ7hAHZwNJeXzYVCQP5RlQYzGpGI9/V/5wJjyLkcnM362Kw5FMFVCkSfIL44J2DWv1RS/+rFwUmJsg4b77BD3FQqCUMCeF2IWf/WZMJ/MWChKM8yrk1LvXs+xNWaKJgXMFUQHMwoFVmqDFmrjrLN25hCjf4v8/t/11O4gLjjQFsJ2of7/4MNVMILzheGdq1f7Nu/ByEo6avNDO8t4ngGAAH6R4sNCz+Bsg9+9+z/IHDyGJf1iA2FgWoANwUwhZMkolBTNWuoew+TvtgIurU4Fsyzf61SeyoXWLlDVy7YxvdDCQXn9ximz5M2a4tGfXj/tks89wK0LPDzD57dW8K/XeUteSxkDjBOQMhRXCJFTUZJjedUfYZLq9V+utY/6KvgqWO2SSMxpZZHmcTdXxIa/dNypYCb43H+OWAy5MsdkFAcZfOybQum0dd+Aa+pbJ2qGTYeJan/tYUART2f7nG/vxTFyShjFVwKMRRVynCdSfJCXWWHdwidkQEqDvTI/20zYy5w5B/QrlDFcaxryxrvvm0oj8kaN9OOmsYrVCiUgn8pT//bAcu55D3XxjW4TpiuDC1Y2tGuhIskCn8GwxgKkRXK6WctldZtLO4Y/hu14H/X/9MLmrvQtsOYK+cYr4dzO6T1GhMG0/+ILgbUSNOORVPd29ZjJCl7vW3Csm0MeFuUewITcNGF2Xdgp23JbMTlQiVSaP+yLFDPYP3COAwlCDDR+HAYpQhl9z6age8iah3CcBFvyf/qhaKBi6dyu72BSVWcx21cuUHZuiv37/NgcZFj2aBadG5Z7lqeDh05lAQBEMyyUD2iPNSSgJKBhIQCqEximDxX0ak3EhdZ8XfbAADru6O5fTpiGjPHBUv/eJ3QGJ8OYEGpDjO3rrFOG+fzkTVqk0ml45sNXi+c9cg6YUDo0nnw4vK3ehmmp2ME+b+2U4ai7n2bbLOm4pQUAhYN8InJZyxxDccgZ/F0mExJ0Y6ZKn+jM5jayP/tUggEjcnO5LLu0XYbUfoZabUa0cF6Cq0QAcu5fK5n4yoOQxQt2xlmL0NVGiDn/9pq5P92wHKvmO3ashbTGiALK5WQroSzn8WAAqDvELcToWlEquA9Xlwt1y9cLWv0OsKDD/H/NlX43/X/9uKBvKA4Hw5mvlyJt1s5hks6cEL6Yv3/HcBiaWfGDM/OzQhOKVq+YVq0EcxuPmpQPqZP4Bf93x7JG94LkygxiZQL+cgKFann6hBlyiI4xt27F/z1In33NnT64STntstTOxtmrsQksv+Rfnt8f/rP/5jbpTkqVXIel/n9Lar2Pdh/frkCQ4YKNiMWBdhIKJVwJkjRp4u+K8AW7g9W29PTcJkabhXTIaJKVUndVwhzIk/TzP3boQtnmPsPID0LmKWfPEPZfRj6tHwMAEZPfpozqDuhNXFMqNQ3l5+SBwus1ziTcz+nfypz9RqvVJhXbFW81i52Z9FfwmRlWsb0CV08A15H1bWPbvoSwJf/a8IJAOvAVsf8NIySAn5G5XIUx/N7GKo2DvW7OV8Qk8vZQADhGd2491S9RqBPD6NL0kiOoR3L53g2LOfDIc3w8boJ84RddfTpxBRAwOIdqxZ4dqxBEVT2Wmv99MW4SsX9i/0p/37AmuXasg5VagiTUTdzMWEuwwWDkcHCMJQNh2784vtkX/jnswil4P0eqlp1w4I1xDOVebg5AiO3itVK/0yZeOheQ0oAdlxcbg/2Rx8o+snivs7FhbE+7ukRM6eE7/74Ror3+ReV2Y+4NXmhQY9vUQSwgq7Ml6shHA6+k7jjMFWz9v+NAuIK+/T/Tt9Fbgb38GLhNFD70M4l0z0fbAGAJW/ZyrxoEx/v8S22T4BO9Hty+7YLX7+FS2UcHVB26a7uPZJIKiU2kAe3yMsK/nTSuWEZl52DSiSs3aJftl7Vuuvj+62oNHJx/11Mn5S8N+K/gvz5rz+uocWAC4qG79xwr56HUDIu6NP0HCJ7oSEPI8RL8qi/rmBYFlAcj5Mk+H7w+i9s5n2eDhJlK5JVn8eKy/gBMoCgWPjSaevEYZzVimA4qlYqu/VRteuKJZQSY1c5jg3fu+U/ssdzcB/i84NnoFqNfv5Kef2myFPZRQKAdQIAVjdCa+bYpwBYnLAyQdHFMCb7Xl6/TnRmDq7XmBYsl73cMnb8HCvOaKfN+8E6+v4d0OXSeo0Uqe9gOFmscAo+bFSMAxcG5o/H6DEiWrw8l/jl/vx3o4CFojiqVGjHTZc8X58PhSLzACyFdJjOvhP49ivfp4cxSsIHg7wET9r+CVnlObSkQvuXhim+ZyC7Bx2Lpnv37ESklHrQCO3giQggv6e1UkAVxzlWpXu2rwE/yZsDwFoCAOvf7K38/wlgyVVEUpJ58x7SWDr+M+IAsw6rY/lM3yeHMFLGBj2awWM0wydDDxaPiKE2MQ3C85EYHFGpgJ/w/LERJzQv5inEKx0uqoOeKCZcJD8HJfDoh4U1nxd8aUj8V/nIJEMxOOHFlyhwY+EDHBKLExLahEffI/p1Hov3EaNxufTFKhe4VYTH7lDw3Yv5uPAUFEHy/R+c4AuJPpGFEYdxzMDFZXxGG/pkuRe0aCRXFEMKLpzid0syL8XgbuioweMMpeIyiThhN4zz2DKb1UIRAkhX4vZPBMBC4p9ckgdGX7K41j0mS4uPDKWY4RU3dmj+sArv/cebUBxcFXkBrDBeEFwMmvrIXwAs8FffN0esU0aiKIHQIUWXbvrxc1GCig4BFH1eaA9986plSBfW4QGPwUslJh/+SdiIYYpKr/CWPC8IGxp9KTgRULzI5/JXmxIu83zBBSru62j0J0T0fOTfUpAlYdhEYRHz7FAkOhGKnQusaNxwLGR2nhNElMeFz0YbEvtK5FbCBImLYOBLuK4UiJED/QTuw/u8nq3LfZ8cYJ12zutSd++vm5KO4kQx3AB+xXLOtenu9StRqRqlcO3ENGX77mhcmhXUpcJnA98dtc8Yz4cYcH9ZixbG9A28VIYXzyKR6Yzm/wYIHQtD74qO1ZMAK6rA8q/H9Qka/TAC96dBn7M8QRLh+7ctQ7uxWdkAHI0LVkhfaYlG+hZIFYaKYw09tVETC2rvwtviXOTuvPBOMfXOCf35BMyC2juqq4XsABQv/P6P0XIizIntKfJHUXkiUUEqgZDEA5ZablqySVa7QaEXFO7FO5fNcm9YjRuNTHamumtvw9z3I9HhRW5YzLtG+qmYuRgHmkCixC7BwTxnxSIuor5FcS4cdCxJ8+77EMFx9YBh2iGTIq9YzGQokBJY+A/F6v//AOspXoUBKyHBtP4DMrlC0d4EioC25+b07chlZXPBAFm5onnjfkJvFnQ6HMOIZHBAPQjLMICHoJf1+zCZElMo4xQBeKjglgdWZCiAhIIYKUUUcrgqI0IcYTFyGpM8PjIHWZr3+xCGwWQyRCrnRd8KA/NscBxHokDAR3W8oAQLJ/XwUc8/HnsEjK4VdQEW2RSIfB1oPYZHSfixoI/3eVBCgml00ZfiOUEB4cJU51iG93tRhuFlMkIiRwS1W6ypxwvaNcY6XCzxOxwEqhmXyhGZHI1mbuLR8YJtoEPgAxh4oEKNYdgTtjY4RHgjoeXwI+EA5w/CxyoV4gLPFxOkKcRdwyD1yK9ZoWlQ6fMIHLKAD5XIMblMVG1R7zSkRRTDxB5j/K7MhtVQTAK+kbjrS2nlarGSBGD2Yk/EEU7UL7DfhGFlWZQOAjsS1i+QKFEphUGlAz7DYkWc1jwvNjP6I8QimBwLlDbi83DgVlIZ3MERxfUxfMlH4nqx6Gi6ofUqUyAEiQmy51gy3VtywIIvwjtXzfdsWQsNg7JlTEvW4xWqYcIuVbTD0ah44/6vD+cN64lL5IzbZlq7Q926Gw8BC4s9A44pSohVHqAkgIkAHiJToiQlzMTCepOPAhMRR5mC77kAtMFRx5BYHKsAaxHMEWAWJfJRiuWg9UTA7/jcHDDxlWpcCncz+QiYIkLUP8KFA7wvAG8KlABJilMrfi7w0UmKRR/E87TA8DjcxYsLQBPwkeMxQZLDYTAoGE4iCtUT5D9Ge6LS4AHG+fwcG0RIKa5QgDY6tyxzLZ7DYxQYas7rUfcapJu+GCWKOmagC4f1uqzjBgZ/PI5RMqp+/cQ1H3HRYPDoKApzDYdeMYBizmULEJxAeDphz1eyWvUL7LhFBSPSA3AQPShOoTIZ4GnBExJZrQu81OMBS2AaFC1gcxXoEEFD8WhcEA08xDfyLXgxD+7mDe7K5mShWo1hyRpFnVdjE1bcM4BrPIqJ+eOQ98FUgkBU0GQVdV1k1vhQhualUkwqx1BxjIpJtuWjDRAYAkxTHhWS2cGqxHu98PZyBYqT4gsVN09Z4QvCX1iG9XnBlEAIKSaTi8IDaRCobgQvUcJjPGCp5Ib5q2T1m8ULQ6yqEWhMTpem9I2biEzBs4GU76/jMmXMxhBDAnDRMw2Uud+PEBQul4myIXQ8eF0ibnwFlQuXRVQ0HFGockU9xnMuB08zuEoNFFdE0sIB+6Ipvv37gIBpho/V9R0Tm+MwpFPQxCjUGNBiEV0GgI2hmAX9UBQoCYw9wAnx/nBHMH5P4j/AeopXyQFLzAuzpo32HtqPSyQcRyfs+ISqXgv8iXU5/cc+A9iBm83Shs0IpSZ49aLv4x3hm9c4h03WvL3h3ekMKygMQX9zTpv/+GeBH06w2Y/YcBCVSCSly0qeryd5qSH5TBX4IJ4tZPGw0QhTNueh/9jRwLkf2Lw8jmZxlYKqUFXWpIW0bkMerPoMK8AbECJgbzGBsyeZWzfAokVWqiSr37SQ3uSF0M7QD9/SD+6BCUhWrCqr/yoqLGZALrlQIHDqBJN5HygI2astiIRE1m7x7NroP/sjZ7OSyUmmjYeEuwjFK1AorMzt68HjnwcvnoXp9wyLK2TUM5UlDRrK6jbCdSaeR6JuNlEoUDYY8n95GHE5UJ1e+uprQF2Gblz1Hf0ofOMaZ7Ngah31bE3F6+3ImnWR6JRj7Xmej3eELp1jrRaYtFS+gvS1N+SNWiASOVpkG0Jc7aB283kCl04HTx4L3/qN9frAb3CDXvpcXUnDZpJnn4dGEqRPJNrhcDmh7/4WPP0jz3BE6TKyV5ohJBW+fNr36X769u+c044qNVSlymCspY1aCDsFUOWCb4UuXwie+Z4wmlmXzbl6EWA4cGdVz0FUUmmepjmfW9rkDbJCJezxc1VQYeBNYBgpc+NK4MzJ8G+/srY83h8EIofLVHiCiSpTXvJaG1n1WlFuzpcT0EeBH76jb10F2oWq10BSsw4Qb3CTwJeHQjevozSDqdRUtWcVnd+hylePLcx4/tOhQSz6SJjfr3u/PhT+7Sqbmw0NycQkyfMvKFt1IpJL2xZP8+zYiJYYsIAsOTJmej/aBSCFqllLv2gtYS7FM4xoDMRdYJIQjCPPPnUEYAh5s1aSBk2p8lVEmeQFT6RwP7hHQF8+E/jpBH39Kme1Qp+hVkWVrypr2Ub6/EtAdbJCD+d7gcA0d9n9J45xbicACOnLr5JlKhTa1ACfYayWwPdfI14vQlHSV5qSKWXFfSIYgmPJDRz/Cg0GsOQU8CeAU4GfT3r37wnfvYU4HIruvXW9RgIUhgOHwTi10C/nwRwP/3KZ8bhBZ0J5q/2StNnrZKWa8TFJABU5hzX41afAWOIYWvbam5KUMgJQ4rA9uVnBH77hfAFMq1G83gaVKMK5mf5924GYASHkCUJSrrz01RbShi0wlQZYdHzcQhELSwe/CN+5ETzzQ/DCj8yjLNB1uFwOXo2s+Xzgs0PBs2eIChUVrdriRhNRuYa0zitoMVuEcFxYe65lRB/6ykUeJxWt25rmreFESMlHhhjr4HRepmVAZ8kLL0mqPydt2hozJcY8WHzMceXz+k98ETpzgs7K4pwOMC6Y0Qxmh7xFW+mztWPZYfmNeTxggZkPpnbo/GmUYxCVTvF6W14ijTecBH2K0r9dCl08D3+p1shbtiUkUqCogz+fwVVaxpLt3rMV8XowqUzRtiNZoTowaYBgS2q9QD5bG34lFPSfPs49eACeR9SoIa3VIGIACZ3NRYgC6OcHYC0InvuJzctlGRqXUmTZCtJ6r0heakQkpHCFzDmgAwOBwJef8B4XIpdJGzYFn6FzHga+/iR44Ryb9RCIE5WYSNZ8UflmJyIpRch+QAotCggUtnPBH74L37jCWawsEwamKa7XS2rUkjRoQlavBUmCZ/CSOHALApZxwfuyl5oWCxbguc5d62xTxpJln2FzsxI/+kxW62XoFhU9akDowqHAqW+C331J37vDBXwArXCzSVr1eUmDxpJa9UTFJQa6CMoLqlwmO9P/9REosUkp8iatEIIInT7u/fJQ+OplNBxSDRqneO0N39EDCE2DdcT35SH6yhUg7tKGjWQNW8DUNABhKaUl9V9FJBKMF/yO0CkSDl67QJ/+PnT/NpeTDaYSxwr9YzDA/mnYjKz6PHggWnBQ/gOsp3aVHLDETF7nhsXOVUtxhZLxupJ2HKVeqAfENnjnRt6At9jMB1SduuY1e9jMO5ZxA+iHDzFCAuxCRbtOCSu2MwzQFnD3wvfdEe8Hm0OXfgamLS9u9MDaQDgmIfHSZTTDxoM1TJhInLBAoPntRJDAF/tdO9Yz165wIRpiN+hVHJpVmE4ja9RUN2E2bkhEeRp+USAk28wxvr17eAJXd+lumPM+UhSwfB7LxIHBLz7jKULVqYdp7krYJLjLB1DGYksb6fv8MyIp2bxmF1m+gmXCoMCJb+CkCIWwJGPpH26LviUox6GQZ9c636GPwnfuAE0EDA74LPBeEgrVqCU1nteOnCypVb9ArCtQLnZbdo829M2rZI2aiZv3MffvW6eNZH+/BfPKKAJOcpTDE5L0s5fCKQQA7tFt++xJgZPHga0GtDwm7KqgaoWsVTv9pHmoTBU/T2ILTPjqBdeGpaFzZ3mnHfQb4E7oKCFIREaRySmylm01IyYLwdR0foejqOeTD23TxoH5KX+zrWHeav83R51L5tDZOULCDPRTwX/LpMp3+mtHv4dCRGPB8AKoss6YRFUoC58N7CQUrnoAa3guDNQI/fCBed0uZWq3J8RjCfu/KJd5171xafDUSdqSh/iDQEQR0coCXUoSoGNwc6Jm5Dhlah+xGA0WbTb4V+7Eof7dm4C1bFywTNVruH3xVN8n+zmbHdrPoM+EzRyiSiXt8MnS5m15IT02hjlQpKAfAA+e/MK+OI29e4eHlh8L42nAzSUEEHjDjEWB4186318ElH9JAYsNO5fO9uzaBnQ9nlLKuGQDVfFZjmPwSLXRmFCwkKKASWnLRaUSTKXn8z06EcCCkda2POfKub5jn/MuN6A0nuUEiwDcDMPMRkXrjurew3BTMhfzeorwdPu6ZVRv+s7vuFKhm7tM9Xonvsh0CF65aBvdm8nOQjUq04LViqZvij4pML7BS2dzRvRA8vIkTVqYV20PnD5unz6WtVjBcHBuj2bwMMOUJRwALBznA17X2oW+I4c4KzCBaDFdBipxCYGXLqvu1lfVY2hsoYUxWDd+ze3bjnP5uKAvYfPHyiatxBgs2J6ff7C8O4DLzqGerZ74wREwQWzzpoQunEdg3iaGEBj8kEIqbdhYNykdSyyFgGkR28AX6A385Dn8gWfjavbRAw4KEi0GNKAUhSpVkL6Cfn3GelXzdnzUW1NcvgK0oFin3TKmd/D8WUwiperUS9ywL+qZjg/8E4P24MVk3SMSUzDB+xKb+LE9QSbzDpgsgW8+57w+IZ8UulrhjAcDmZig7j9c2aU/IqTplcCDBeMSvPu2OuZOBVxOVaxi3nkI05rjtQEUX57z7FzjWDQbPI6qXNm8/RCpMTk3LrUvSIP546BVoE9Aj4IeoGnA9BxYx5mQdtxUTb+xQoiIxZo2Jvj1l0CNq/oM0I2fCxUUH3GdAD4Ac8B/YLt33076t98AxcI3EnxcQOmjMilZuapu1BR5/WaM0KpYOBGTl5PTuy1z+zaWkJCwYTeu1VsnDw3+fFbI4MNgewSXuPTFurpZyyXlKscyTDnh63wo4Fqd7j34ETDy0TAjuDnFlF0MlRKEySxt/qZm+GRAkIKV8kcnJZQYsKAhd/Kr3L6pVGIZxm4xrdmsbNqeFyJVwCvTt6+6t6/1f/0F4GYIUpGIGKC2SMygVXbvrxkwGsFIjmcE5yrcbAUdGDz9TW6PVPBRaePm5k0f+w/sdCyewXr9YHQ5JqifsVjerEVO1zd5h5OXSFCCgP5EMACgo4B6BHcIBCRN3zDOW4Fp9XBcwPritLo3rYDaz2HjwzRPC/UBYHANBr8L+icxUdGlp6bvaKCXkJh98h9gPcXrz3iwOCAgjtXzXBtW4zIF43cl7jgKYBxWTbxzM2dwVzY7U9qgsX7iDNv0d0O/XEZJCcKHObdb0e7thJXbhBqLiHvfFmd6GlgVoAOTDuNqNapQAPMFkDUqkXI0i0owY/oaZfO2HCwCJO44RbSS/+hHlhljMVYIdELCOLBZpXLe4+T8AZSUcgGv7LUWpjV7hc0AFm5UhwL2OeO9Bz4Ckq3s2MU4exXPF4iBhoAV8FonDwl89TlYJ5Qd3jHOXgqlDHIbzjqs1pmjg8e+xlPKGBeu9X910L1tAyKRYQzN+n1kornUj7djIcDW94b4DnwshD2GEJWSLF8RVag4SzYNeAvGgDFEqRTz+zskVZ7LX9XA052OnJ7t6Ds3qDovqvsNdWTMoy9eQg06TK9HAwHO4wOdwwX8hMmYdPA40A7WCf39x77GSBJRK2BIhC8INBf4PeOyaPoP1U9eCGsgInz8HkT45i/A7GYyH8KtBzpEJpcGFAs3M+7cZG0OniKRQFDRpZtp7mrBm85GdBCKeo/sts+cwDO8sm07SYOG9vTZ7KNsVEqiSiW0l/1+nqQw0Et+r/7dqZqB43ihPJ196VzblOlUBaCvcVSjBdgMXdNuJ9D7YO6y9+3G7ds1b/V6wlwFg8J6nXn9O9MXL/JyCSBX0Al4UilMpeY5hst6xNhsCCmBXiuZTDczQ/F6e+jbiwMsy9SR3j2bgYo0pC8N37/nWbMMISiEJGEiDMNwwSAukQGDD1WrtJNmq9q8Hb+BywuROoFzJ2wThvIOF7A72aAPNxpIgxGsr0xODh8KS+rWI4yG4Lmf+XBI3vKNPwQs0fXr3LPRtXAWIpXyoZAytYv+vUXRrWlEDCIUt1aEsYuGGAmLd2RTHA4rBoHVbbdMHhb47hgmkfN0kKdwXG3kuDDvciI8jhEUR/tlDRoZMjZhap24xIrTB4iZZWx/+u4dVC4zzslQtuhQFLBCVy9bx/Zn8h7hCpVh/kpF41ZCOJAAWL+czx3Zi7dZ5a1TNX2G5U0YyN17wOEE0P2c06keNsI4ZYm4glmmDvbt34sqlKCvEBI0Twe3jEDzWBbDKY4J6d+bq+42mBVdjygevnU1t39H3uPjAz7Thr3KV1vwEa8MGrrwk2XCQDY3V/J8He2w0Y5li4IXzuNAaBUKMAtYuDeKY5SUczlkzZqZ1+8X5V/sdNihOOo5uN0xa4rYrWDQyWfK4zotnZfHPsoEHQikAgmHEj48Kqn2/BPXD9iPXChsm/Wu/9BHmEoH1IVm3BRVam8sglNcFDUi8BDx+yGFg4dYAd9Cl087Fkyjf/2VJwkkRKMyCa7WgAWS8biAKoPfx1Bl7wHaoZNxoFLiNMbjAAv8z7N/uyN9BhemqfIVzdsO4hpDvDknhBbwng/WODLmg99TFSonbv0YSI59Tbpz9hQwVWFRK5UaBXwMKNnv5YNBMF4cS+snzdQMmQjduk67bdYY/7fHAPoqe/TXj5sNBRVgFNzUg4DvWjnHuel9DCWExY7DNBqgD+G4B0MoJeOZEKrTmJZtkdZ5RYjIFrduccaSm9cvNXz3d7Jcee3497y7tvm//hKhSBzMfZmc9flQwIZg1vh8knp1jYs3kubkmHiAfzsWT/NsXYdKFRxDg8ZgWh2cAqEg53ZBtiMo3u+Wt+mYkLGFLzIWxVwlBiwYVfnt57kDOlHJZRmbxbxui6JxO1YwtoNXzwPtwd5/wJMkCvSeXAo7NhRkXC7QNrCyIMGgatBw7Zg0PhKUIoRVgME9dzynZwcg0ooO3dQ9+ub068QHQjDwhAkDrWWYuVjW5LXsDs0ALaGkDGhFVCaD7+T3cT4ffLeAX9airXHxOlxvhNsp9jznvIn+Lz+HDjw6CJZXIjkZ0+h5cDeblcvLRTAJ9CP4XIaFq1Ud3gHrLSYG+vwHWE/xejxgsXERrmh0hxixjOrh/+Ek9NmoFQlbD5HlKouAlTf0HdaSS9WsgZlMgW++RXmEfPZZyQsvkWXL4hWrSmu9DO7l//7zvKE9MUoJiBtLSdaOnCh95TVYYzHsc+/e7N23i/dCQYELwJJ10vpNoTcBjawrwZuXc7u+CePHOQ4rXVo3arKkQRMY5hXyuz5YB/MpGJ5zOzWjJ+hHTINp3sK+jH3+RAGwJMrUVOPMlcUAlt9nf29Y4KsveRJXtu9mnLkkH7CcVuvscSJgSeu/7D/2BW+1kBUrS15uTJYpSySaJc1SUYEqHAsmubesx7U6NhSUt2qrHTsVaEC4j8OywTPfOVfMZx5kIjRNVqpkXrsLTywdUXxC1eCc3h2YzHuo3oCBYch8qOjeR91rCG5IRMJh19bl3r0fglWT93kVqamY3uBcvpiqXl096F3Fq68jJBE48bnz/UWcxQ4mD1j+kw58RVWvg0ZeADqpuIe3wbjQ9+9hhATVKNRDRqvadEdJsAbBxFD32nTP3g/BsIJmaMZO1g2bkr+JCQDr0932WVMQnML0aoBTTHYO4FdVt35klecwkvL/9J1369rwnd9RHgNdZ1qyRt6wJZh/4Zu/0r+ewfRGxm53zJsBIBvMVe3wsWSZ0sCEQgIesk5TovQzT9giBI+2TB/h37cbBUsOgqi6dFP1HoHLlIISR9igP/jTt+5t65k7d0GXEs9WMy3eSJQqFyEkEbCmj/bt3go3ZZLMzI1biFwua9xM3a0fUfFZPuAO/Pite/NqLs/KhYOAk8zbPyFLl0ejwRNQ0q5ftk0YzD54CFZfVKtR9xqobNMFojzLhK5dcq1cED7/M6pRYxIJ6/XIW/yxByviQLpzPW9gF87txwiMAUDQsJGq/2hJpeqoRocJwRBxQfiPjYbmbBbbnHH+r77EFHJAU4rGzVUDhhMJZYAchu/edK3PCJz6HpeomLwsVacu+iVbYnHl0Md676b13YHM/Ttg3dKnLVa2aFc8YI0fyOXlAIw2zF2uaNQyHrAsY/pxHjdVuw5KSYInjoNVUPLc89Ja9fDSyWT1WlTVF4DkONYvdGXMx3UmLuiTNmmmHT6ZSCwL3o15+Ltz1YLgjz+iJMnTgYSPv5FUrsnxLLDZQgCwBnaB0VE+j2nDHmXD5vmAdQkA1lDO7sD0Wowiwzd/lzz7rLrvMEmDZmB1Ye7ddG1YGjz5PSaTsVaLdvo8Xe8RosuNg6hFhC/8aBnRiw/CYG48pZRufJq0NtwBBOuK/+tP7AtnAqYByz9Ro3rinmOo4Mt8/CBC0PV9vh9YHZHMGo6WNWupeqsPVe15VKnG4oPMoz1bTFgYtHmuWYe9zeZZUEKKq5WKHn3kLVJxg4kPBoI/fePZtS184zpcFP1e9aBhmlHTo46iPwKsQzsd6WlwUjxTIXHzfkxjKLAiCoGAnl3rnEsXgJ4lKlRM3LwPV+mDt68xv10E7WcePXBtWc+7vYhcouzaU1q1Bsye41miynNkuepg8nFOm23Ou/7j34K3Uvbsqx87ExrJvECWGO7ZtcE2cyKuM4BlnqpeQzN8gvSFBjAe12n17FzjO3wAGujAwEtKMq7cLqn0LBKNxGCslrx+HZnshyg0tmXMrTtEmbKq7n0krzYn9InsozuevVuhfga05/coUrsapqZjUjknoIz/2yO2CcNgeAbGS557QT1gpKRaLbhDh6Gh6xc9G98PnTkF2Iu1W7RTZ+n6jv7j8h8lBCxhslsXTPBuXIcnpzD23FJfnCHLVAK/ZKw5uZ2achYb4CqgIhT9hylbd8bkKtAV/u8+9e5YT9+9hxIkHw5oR45TDxgvWncRwDp/Iqd3Z0wilb78Kut2hi+cQ+UKslp1Sb1GZOlS0toNMGNC4NQxDJg0HOc/tDd49gJYD2WvtZS3bI3SNKBh3JREPV8fIyVcOOxYNM27czOq0sK6el3eAasbYU6CWhSOGRr6+XvH4pnsg0dAKnCtOvm7KzBAj2UFNfsfYD2967GAxeUDFgxoRWFEXvD0t5aJw5Aww7nd0saNzUu38TIFAUMcBMBygpWeAjqL8/vVw8bohkwEKwcSdZhzPldOj7bsvXtwtyDBZF65VVKpZiwBFfzbf+qYfd5ULs/Ch0OSOi8aFq0njEk8z4iPzhvRLXD8OCaVoEq5ee0H0movxCevOretdK5eirIcZjKaN+0lS1eEhns+YFHK1I5PACz/V18gELC6FwGssaHvjgNzGfaR1S5r3MQwbyVpKhX5uhBAHfz+a8u7/eEkZ2lF61TD7JWxhBlOiGMM375mnTCEuX+Po2l174FaaPkhogs3AljZD4GG4iy5qj4DDe9lxAQFvtempe51KxCchC0P+PAypc3LtlKVa8ZS8wNnT+SNHQBGhPf7NYOH60bNEOMAoH8r6LfNH+8/cBCVSFCDzjA9Xd7odU6Mn0Ui4RP29Yu8m9chDIeq5eY1H5LVa0e2FWKARVAozTEOi6Jzl4T09ZwQMSAa6aGch7YJg+hrvwIjVtWtt27iHCGnLCI0jN/9sH4lTKLgOTYJrKbPVBRfSojA5B/nqYcccPVCdu9U3h9EZBLtkNHageOiKTe84OeBEbDBaxctw3pxwNyXSHRzMpSwZo9oEIuANcq3exuRXIbzelCSUI+dpOk6CImrZxD49Wxur1TQNiY707Rpj7x5OxH4gKkMOs0xZ5xn/16Ay0CYDfNXyl9pHhMaGM3jslgHvk3/dg3T6VmPuySAJe7V4ijqWD7LtXoZkZAIDXeHBfyWqloVIDtV5TnqudpUSgVglcJYovx8oILzFOFdm5e7li2A+hpDtEPHaHqPjL2XkA1AW8YP9H1+BBaYtuUmbPlYEYUV6MsUAese9GAJgNX+sYCVA1PJDHNXFAGsvpzPDwnJ7+c5RjthuuqdoXFR8Ah773pO387ATAJWsrRRE9OyHRiOx5rHhLzWET1DZ88hDC1v9aYxYyscThQRAOstxBeAgLV+j7JR8wIerElDBFcixXtd1LPVDEu3SFLKx+YImJeWcX2C330HJEfyQu2ELUegyw8WYIARAs75k72H9gEcxEslGxeul1apEeMe0B7vVwetE4YCdgcLsHntdvlrHZ7kWBWHwOuxzR0XOHoQ1xo4luPsNkRKSmrWpio/S5avQNWoTZQqi6m1mEQm5OsUCO9DognCeWN6eQ/vJxOT2XAwcfV2Wf1mbLSLoNbyOvOGdg9fuQIoEHBD0q5PiUo1sZIDVhgAVvnELQeeCFgIUaESACxU2IMWQ5PC928DA4C15qEajXn5Junz9ZFYegTH4BhRLGDxMKMJZzPv5PZqz7l8QAKpqlXMaz7A9YnxeYPuAztcyxdw/jAf9snebGeYuQKTysSgAgGwOjC52ShOsW4XYdabN+yTVKwezdcT1ODGDPeGVQhQ78mljEs3SirXEBYUj33eJP+nh1CCkNSrb5q/FtUZkLgFheXC9nEDvEcOg89Slaok7PsaV+r+oFhMDLAQmEVomL9aVr8Jysc7mOGGHhjT0P3bOW+3gMEkNI2ZjaW+vCA+2jJ5kPeTA4RGC+w3/dzl6jc6x69xtCXLPn108OxpuKJqNMbFa6V1GyKiEysCWJ0IjZEDWtbvQ2QK7ehJyi59cDHjKtobQjtY27yJwmEShHbERG2f4Uj+NISPoq/8nN21JcrC5+inz9F0HxKVMT6SdAnU4KWfcgd3BaYH67In7j4qe6Ehy7LYf4D1dK8CgCVTEaVTErbvJ1SmQh8DwxP87lPXxhX09RvANOTZoH7ibEXX/sCwIHA8H7AIgs3LU3bsbFy4Aa45DCuUHIBj5jmyyz5zCgzWwRHdhBnqzn2iqUxIpDwCmIcfrHOuSIdh2QSim7FI8WZnRJiEgWsXLMN6wJgthlb1H6obMQ3uV/KROcijJGvNsU4aEj53DiEJ3YT3VF0Hwpv/fcCaNTZ08gQqlYGllCpfzrRsG/lMFWGjPZJLwvm9jrkTfZ8eRkmcrFDZuGgdWbaiGCUQf4q268N1rqXpCMMQVasYF28gy1TgRR9bDLDCNJacmLhxPw6wIGpmiV4HG/Q6PICZcThqmD5P2fptBjq1WCF+hQAdYgM8cWQ/ipPyN9qb09fEFtTAmZPWKSN4lwtuN/Qbqhs6Scz4E5NKYKQFTnDWXOvEweGLP4NJpxo4UjN0Ugz+RMBCCYoLBLBSiQnr9lEp5YSbs3zEnYm5dq5xLU8HCCVv+po+bSkeqysN6z7fz3qjLkapeDaUuO0IAIiS1MES1tRTtiWzuNu38LJlDBlbydLPCFnrKCamyEDchwl0Ob3epC//AhYh9dCxmoFjYZITjxUCLNbpULzZ2pC+QZASVtgsg58B1Jv1Tsvwlausx2FIW6DpMzoaKYyGf7+W16cDHwiBpULZ/i3jrBUMAtSdmI7OCwW7Mf/xz60jeqFKLR8Kylu8XqI6WOJE8zjyhr8TOnkc05lQlQwJA6vWD1ZKuDuj1ZAJpfCU0lStOrIXG0qqPV8oM06M+LYM68L8fhvQhqTeSwnrPhLqNIhhvyiYEWDahO/etAztyuZZwaSWNW1uXr5DcL5A4P4TgAVWO9VjAMsfADYuY8nVDBpumDA/GogNt/9BYwD/uVdnAAbG9Tr9vFVw8YBOaDgVWCG9BdYvmD6e9XqJ5FLm9buI0hUgqf8hYAEZBiOtkOpnLpY1flMIvGSFLDvoAvF/e8Q+YxzrCUjKlzNv2Y/rzGCiAUUUznpgnTSY/hUGAqu69xYMGxSJZM9AKeIDPuvonoHTp1AeU7zVxTRjOf8kwIqcI0k/umMZ1Tf8yyXSaOZxEqHDrN8HCxaQBKbR4aXLURWrUFWeldSpT1SsjhYdxMw7j1o3wOVq1mJR9RtgmLokmlMmJkhjUMAuncnr2Q5T6picB7oJ0zXDpqBR++HpAham0sMi0jBhlgj99otlZG/WbkPVCsO85bJXXs+fsNAdiBUPWMKC7dy8zL0qA+bYqhTamYsUjd9EgX2O8rF4A6B4HRmzPB9uhnFIeq1p/mqqbkNU8EIJgJUKw/5wknVZ9XMWqzv3E45xhFmkCBQmNHz/Ru7A7mxeLqbVQq9SgybgrowlxzZtOAwtxVB1v2FaoWYQMPZwqD45MGkxjAj+et65fB6m0Upq1ZW37kzozSUCrAVpKAvaqTSv2iatVqfoXA7fuWZfMC10/hwwdZjMu9pJafphU8CfQndAO7vwXjcfCsnbdgTGthA/ziDR2jEYnEdnLSP7IoEAH/Arew7QTZglfCbmwepE6ows6C+7DQ59v9FCnQx4B9B1QlEhOFicz21Nnxo4ehgqwP7DtEBvQzHi+EhkGhH++ZQtbQzn8oCZl3zsMkbJBJehiGhCLgLMsfDkje4dOvMj+K52wnva3iMj9ef+A6yneBUALJUWUyjk7Tvgcj3PhiNNx3CeDoVvXg/+fBrx+BFKwnnsMPB5xjJUreMBNABdJgKWywFzGRTSxC2HiQpVUSGRSQyaY33A8psY+PwTlCDJatVNi9bhSWUKyToME8nLzO3TibXkcoGgMrWLIW2pEJGHunasccOcZxRLSjIuXEdBRwsXl/UAAd+5co5z2UJgbKnf6W1IW4ZK5E8BsGaPDR0/gZAU+JVhUpqiY28h2CJa2gesx7+es00cyubkQUEfMlrbf2yhWjSI8GPo5tW8oT3AnEFlUt3sJYrm7QoA1qMHoIeV3fsZJswRE4BjPcLY8qzvjQ6f+RH8RNWta5q3BjUmoDA0UihFIQSuutYvcq1dAX4jadLEvOKDiG+MY52r5nk2vo/KlbjJaF63hyxdPuZLQOLcHs5NS12rl4L/oF6sb5z/Pm5KjAcsBCP4cEAzYJRm2CQust8UNclQ3P/9l7ZJI+CmQK0XjemriYSUfMDKfpDV6kUBsMLROlh/OD+FrCyWBaqcy87kcZyoXAMD8BEtVIbEbbjkvNs39M1XPODCHv11Y2cKNRUKeLCwxFK825Gw70tZlef5/BJNiKjo7IumedaugKM2aIRh4vxIWQOgXvdvt40bTCSX5TyOhL1fQEcpT2MFky04tyNvVK/Qz+fBmipvXiLAQqIFnNicB97ta3xHD7KWPCBXGCWFG5HC2RQIzXAMXJbIxESqYRPNO/2p8s+ysdpRKOo/+UVO37dIcxKwZEzL1yle71zoSBkWrqGIe8Vs9+b1qESGG3Wm93dIKj7LCyGJTwewAkEkGMRKJSds3g+GOz9wGK6UeWDBC579CVbAbtVWN30xJlOg+cXtxDyph7bRvQM//YipVeaM9dJWnUoEWE4XMOQUr7cxpGXAmizRY/Iic/DWVdv4QfTdu2SpZPOqrWTFmgCweIKgb1/Pe3cA9/A+QlH6STMVqT0LxSSBUXMun+3Zuha6QBo0NK/56AkiKvCcmJFDhu/ccK2Y7f/uazTMQBevVIIQEuEMcBphOZgSgaN4UoKi/dvqXkMxmUrABV70Ujg2ZriWLsRUajbsS9p5VFKzDhJJLkEiy5+QzZPb643gpYsYTuIpKclHforEcv0DgJU/YeMAyzhvheyVlvlfF/RhcYAFwUAAnWHhs+d5jJe/2hRQBabWIvAMKCQulh0N/HLGOro/AHRglqgHQn0iVpWIAFZONhIKEVUqJKzfj+mMBQp5CLMjp+eb4atXcIVSN22u8s0uUNqBcTh1GAAsmEnX5DX9gtUkJYvT70K+CGi504GoNRhBFVvoofAV82BhJCKTKJq3JkqVBmtcNKQeLIVhOvNe+PI5JisPGN6800pWqWLasA83w2Kzzt0bXEvmAJ2JKhSG9FXy+k3jqp8LCYZwBw7LGdo1dOYnngnjlSonrN9HGM0ia0Y8WDoz43WTKaWSD51ACGm0CA4MlYl4BGFultuWPtV/5DBCYGIdLJSPleHi4VuDSWKzstY8sLKQtaAzksiX5PzQH/vsdz17doJFWQ0GVCgH/x9gPeUrHrCg35uDVjVQEwUCQaDdjgo1XXg+5Fd27Kp7bxEgGKG2Bjxrgo4CFjAKFe276GZmYLBoDh97BH33lnXcAObOPR7nlG/30o2fDU2Z4kpt5YzqGfr+BMBtonwl06Z9wObgPU77rHd933wFGiF9talxNgA7feGjJ8Dyc/l06NvPJc/Vxp+tQ5iTMcCFT2eL8AS4Ofl8LdOCNThYs6PFtMQQS8+HG5wZc6CSVcj0szIUr7Zgve4Cay2YORTFeV2Wod3p23d5hlb3GaIdPU1MVIoA1sM7AFu1E2eqU3sU0omszWZLGxv8/jueQNW9BuhGz4ALFWxDvmno3rDMuS4DDA9V98XEDQeFml0I67RZBAjA5HJJ3XowtTPgxTix0JjwVXHfSqHyfXHQljYZCYfwRDPMbnv2hQKABZZFvd64aJ2k1kuFykBAjXD2pGXcYNbtBt0O4IwsXe5vAhb0dwiRlmi0kSz4ncfO2Wx8EKjmgFj5ENcb7Uvnhn44ybFhZae39dOWRIpDioD1ngBYGj1RKiHpyJkigcbQnePcstw+ewomUaje6qifu0EsfgY+mTu2h//To5hGh2o1pb++JERIFCymKpxTYU+f6t29DSWl8pYlBaxIWT8BDTiP0//NZ4GTXzJ373A2C+P2Qtc9mF8kCWYTF6ZZnxeTU/o5y1VvdI7Bn2P5TPeydDylLBfwlP7hBipXFSqXKsYJBb7/wv7eWM4XBKOlnzpbldoT7snGYrD+JmD5/Hw4pO49SDdmBixQwEfUtWBsnM8bN4i3WBGSAMKs6dSLi3PeiMUn2WDQd3Qvb8ul6r4K489UmhIBlt2JEIRu8hxVavf4oYwE79//3TppUPi364TJbFq6XvrcSzygHByjH/wO3/f2bYTCgYGu6dyfi5YHi5QyYhnbwmnePdsAx0jqv5K49iP+SSJaoGAvPC/p4b3AD8eCZ39kbt8AlIAEQ7yQ4opguDCIYc7jJqtX1c9YIq3VgINlAmAZspxhb4d+OgXWWqpatYR1ezG1Hi1SrReWANixypY2kSxVlnPZkz4/Q6U88+8ELPBN/4VT9knDOLsDmCuakRO1PYcW6UZOKAQDIKkNff03JBSkXmlkXroV2H75gJX1CBqZwFgaL3p04kZZ0JXZfdrSly6iEhIMpapzf+isCoftGTN8u3egCiW8Z/2XVT2HSCpURNVGVCIVK+3F11srGg9XzBUDLEoG9BAb8MMD4uJNZlTQTiQODW06LK3/im7KXKJ8VfgEj9sxf5Lvy6PgE+RztYzpa8jElEKhzGLVRefWFWAUUIWKD3oSd3xCPVevAGDpTfSjh/q5Gdrug4sXyMcAVvR1YYwVIhQ8i9UzhVrU7wZaFKxESDgozAGgOTDP7m2BL44Ay0DRoZNp5qrY7sd/gPXUrgIeLK0R4Rg+IAAWWrA3wXiQEtJkknfuruk3RsgzZsQzFhCYoCQAls0CvqUdPUXZYwiQKxzL98T4L/xknziYg7EUmGbMJHX3IcUczgWnIWqdN867bw+OU4iSMm09LClflcnJtE4ZGr58GUwq5Tt9DeNmC+0u0DyOi1TYiuRMCSWhnw5gfXscZoJ37KKfPB+m70Xz7GDaM0M7l832bF+HqXQ8iZGlUhC5EvrwCg8+tFyZe3ehzvW6le0662cshUtpFLDC93/H1UrdjHTla6lFAMtiBYD1w3GUwDSjpmp6DREaEOd75zj3+mXO9Rlg3lIv1kvcuB8R/kzfuZ47oDNv9yAyKaqSk+WegemNRRmAIHi3m3mUBRYblCL1YE1t/LpYUDsCWCxPlCtnXLKRhMciFRgyqBHOfG8ZP5D1eKVVq+oXrqPKVvx7gAUvVixoiCNMXlbo0pngqeP0b78yllzE52OFKnlguQe9jVJKuB/tcapSu+imZ2AEjsR7sPZsRyiZvEkz8+pdRaQFUohr01LbnGmYVKHslGqYv1FwTsAufZTakL13HzSCrF07afunIrQUHE24troyZrh2bi5pHaz4Rws52zweKRPKeBzs3d9D138JXzobvnWTzc7iXG6w8GASinG7UIRL2P0ZVa2WON65w98OHPsG02jAEphy7BdhASl8Oofg0fnVOm4gm5UFNK1q4HDt0EmwXiiKPA3A6se53UBOdNMWKFt3LvB0FPUd+8Q+Yxw8rFqpBCu0/JXmfAE3BicUICViMUmwchrD4gT+x4Blc8B7Llguf6WlcM8CLBJ6cMs6YVD4xg1CZwSrmuylhmJgEO+yWWaMDZ74BsEIRas39WkZiEQubmgK2gJnLDl5g7vAPF+GUXXvbZi6kC/pEiKU+4q2g817FLp1Hcy40OULzM3f4Cm8IZpQqBHBzsFLl0nYepBILgvXubA3p2d79jas5CJ9rYVh4frizpoE6yMWPP557oAuZEIpxmZJ2Lhb3kg4uOZfB1gwEML/6V7HnGlwGwsokJkLlS1SkaKAJdjoOWP7hE58Cz6Jly+fsHE/YUzIB6zMh0DENSPGaXuPKhyAKMys7D6t6UuXgZbWjpqk6jlMqG6Nhi+fA4YrHwpjMhnjtIOPkeXK4cmlieQUskwFolI1qlJl3JCEkBRawqOKYmcRSqSwBQGhrkdRFQAYOjFR0f4tdd8RwEhjeQ5HMTb3kXXqiPDF80A25K+1ME5fAuyHaPBW/JdR3/EjecP7E1odnfsoYcMeabM2WD5gdSbUWqAWEnYegUXk/wpgIfHRKazD6j/xVej8j/S9O2xeNutyoEG/EEoGIQyRKlCCFFalt4yzV/wHWE//KrhFqMPkElmT14BxDMuQxAo3cxym1pAVKpNVa0rKVYlPaxdeDo1lEQLTQTd9geLNTsKhKvkf8J34zD79XT4QBEpJO3G2plOPYtYkoXCzfeVs96Z1uEzB0oHEHUckNWrTmffBKs7cug7aA33Lg8c/piq6WCUyWim4QBbhXwes4LfHMRxV9BuqGz4lWvMG3h/uYYdCzoUTPXt24wYDMHRYm5ULBYs9bw1Ks0qJ4QTjsCleb2NetROVyZECgKU2zlosa9KmeMA6BQCL0I6bqn57UIHTaUTAEj1YBQErfPVSTt9UYHGjMinn9fBWG/cYAsAoEpHJMIYBvaGbu1TdsWc8YAHepio+Y1y4XiIEn8V/MR6wqKrVjAvX/l3AEkQCLOg4jvm//dS5ZRULmMPrhaLIMBzHwABMsWw3EEiNFlOoOLdDGQEsIuqEEjxYALBwUtE21bRkozAChawF1LFlqXPONFSikHdMNc/fKPo1wD+Zr9Xg3X7QY7KWLRJW7HocYP3po3Ji+5McIh4KwqGY6KuLFGQPB1i7lbl7y3dkn+/IAVQqBxLCWXNlb7QxZWwTxzurW0vm118BmhNlSyUdPFW0BIAo0uG70HPD3rvNo7zy7R768XNQIdfkaWwR9uOcTlSjNi5YLavfOK4eCNw29x7Y4Vw0g2cQTKszLV4vrV0PLrpYfHVHLvp/0A4SfguDqMJ/7MFyYGq1fsFKRf1mhQALShoErIHhGzcJvUE/f42ifiMhSlJo0q71joUzUUKKqGT6kRMVnfrEwo3BZV+W5t68GlfoGKc1cfdR+Quv/BFgxccrI/HTULTrkICftmSFfjnv+/xA8ORJQqkGaxid+VA76T390ClC5rwVBnRnPuLpIBBOfdoyDNayKTgKQs2t4NmTuT3aEyYz43TAcm7t3vnbgAWb+9QBC3zCu3e7IyMNjpZMDiw0OHwsX/RMMhQlLFNH+D47CL6Fm02mLYfJlNL5gPXoIZgOmrFTVd0HxbOC2DYkBlgSAFiTVe8MFeIyodfXs3OtY2EarH+m10EPeCiEMGFIXxSJyRV4cinJc3WU7btSNV/k4utvPe6KebAICiUJaf2XiYRkKHKx9wBiJZNjiSnSWvXIyjXy5yCMrrtrnTSEvv4b+FnRppN+ygJYXaLIkVxQbf56OqdrW0JjDGfdMy3fpmz/NhoPWAo1j9Lm7Ueoqs+jfwmwxO6GiQtXzrvWLAqeOy0U3WBgdhpDw8JssXgHlQYHWtTnUnZ4yzjzP8D6B67CWYTJycBgwk2lC5r8wjsgsVO3Ch5BFQdYCJhjMzOULVpzBevj+b4+aE+bCI+yQRHthDmazu8UtyYJhUzXpjvXrsDlSjboS9x2RFKrTvj+PaD0mTs3IKUMHaPt/26JfCFPCbBC3x3ncUw7bJS637gCQgz6LRy0z5vgPbAXV2nB18mKFWHEWGw2Fr4EMvO6qVr11GNm4lIptP9EwLr7O6FVA+NP3rRd8YD143EhG26qttugwlbp4wDrl59z+rTHCQmHoXiCkSwtnN5dXDdFlg0YZ4Coeg6SvdZBLBkvAhbP8KQAWNQzVZDHA5ZEACzybwIWL4awE77vv7BNGM76/BhF8QEfqtdSz9Uhy1cmEpKgj5BlMCnp3bubvnEdblhHAItE4rcIP9qOEKSidSfTkvWROxdsunPzUsdcCFiKjqmm+Rtjcp7ZoBLP8ZzbpXijlWnpzqcHWHx+zG8x9j2sqRH5gaFhNciM+WAKwOOK1Crjmg/ISjXgLkmnZjQwMwCnVyqfvO9EcbcSAOvebejBuiMAVsdOugnzYMGnwoC15EllGp4MWDqtMX21rG6jOA+WQDMfbXAsngujLvUGU8Zmac1aRQCruH4RgqhKAFhK/fyVigbNnwhYJn36GkW9V3hxnoORCvotQ7uGL12CxYeklKpNqvS113GNkXl03//Vp75jn6E8zlpyFB07m5btEM4MeXw7BQ0Oy/LBDSw2CltxRwDATogk53IBj3P5HM+H23GdnnO5iTIpyUfPYDCJTMiYy87imZCyQ1fdewsjcht3sQJghc+dyu3ZhtCZGI/TkDZf/Vb/vw1YsPnupx+DBQBrq2PxHIjKUoVx/vvyV5o8DrCsaSO9nxwEfY4bdKZtB2B5lDjAQjBUO3qKqsfgkgEWPENRPL3J9/Uh784NwSuXeH8IekhxAsMxBFpcsAAhHw4BntPOXqps2JLniz+UNv5ZEcDicVSjNGUAO+HlokKBRo/zwqNb5HARfPC7ZcJg5tbvQIwUbd/STZkHT7Yp4jmDPtcbv2R1ak7oDOEH90wrNis7dC8EWBzGmrcfllT5K4DFReBKCBWYO419lIVQJB/0A9yknn+erPkCYTajlBzOCJ/b/+1X4V8u80z4P8D6p64iZRqSTBt2UknlCwNW5J9IEA/2WMCS6WcuU7Z4sxAH+E8ft00ZybvdwKTTjk9Td+nDiclHBQQd6nH7kvfcO7bgEhmHswnbP5FUeY5+BABrMH3zN3BPZd+hupFTC8/AyEFOcInKp0ARsOZO9B4SAauzceby4gqN+u3vDQ98+Rn/RMBSDx6lHTiucOhlOGRPn+zd+yEmU5EpZWB5C1MiSzOPWU+EVDTh5Bqw9qPQBUbGAAvXqo0zF8qeImBdu5zTryMQOz5Mq97pBRO+wqFiWxX3XzzMisKEnM//J4AFExtx+u713AFdeJsd6AVwI1X3XpqB76ISmdBp0UcDipo33rd3D9DPyg5FAGt6FLDe/NOA9ahFTc7p5fx++SsvmzccLPa7ELAy0jw7N5UEsGBYGYaLJ07CIyZRDBM2LOI/EhVbmOQoBrw75k7wfrwLVaqBxBrem69sDaN6c/q3DZ4+i0llWIK+1GcXinqwwJKDoUToNgCpAWzmPThfeg3QjUkTWxYBrLt3UIVcn7awUKHRSA2wa1es4wdw2VmPKdMQA6xVsrqNC4mi9+gux5zpoPGYWm1csEpSrzEPs74RJFp3O/4APkTMaBA29ksQg1VywFqtqNcwAljCYfKhaz/n9O2EICR0bAQDYotFryEQNtAWWdMW+lnLcY3+Ced/i4fuIuIRP+EALGUJ8/iRgoCFRI+xj2SzZqc2ZO7dQ2UKzudM/u4yqU9kPI683u2Yh5lIKCBr1dowdw1GSYoAFjzbynfqG0ufjgTQJ3abadVmZfP2fwKwypdP3FwYsFjhEHrv7nXOjPlPD7Dg+aTegx8606fDMwSlUv3sxcqmbYo4AiOAlTtpUODrz2ExndIpCZv2E4kpfwewRFdwpOo+TbP2vOCv5+hfLtEP7rE52Yw9l7fboZaVSXmfH1HLzUKNU+gI57H8c6gLXYXqYKWvkdVrXPgzQvPE6rLRc3tgdAudlWmdPJS+chkgleKNdrppixC5HCsOsPxnjuX2605oDXT2fdOanfJWnbBCgIUCwDokqVrrLwCWCOj0zV/zBnRGbE5EpsBkhLxHX1W7d4A4xWtRcDlWL3SvXwYaL6yP/wHWP3D9maNyHvdyhQBrqbJFa6Qgi4DZmzdhIJ+dA2we5YDhgkCwaMETxcUwKsuUQb4vPoe1ABPM5s2HyOTSjDXXOm1E+Mxp6Hpt31E/dQG0yAsuUcJRrG7eacNUGkShhMstAk9RsM8d7z24DwJW587GGYUBC2aQe5228QMDP54Eps+fBCx4fLD7/YWuDSuA6YYbtKaVWyRVaj2u13ih1IVgznORQ0//IcASgtyZTKGqTU4e+LTsjTcT5q/ningS+Ih/RtivjxSaipzwi/0/ASzxUOT3F3g2vY9I5UAGNMPHanoMj7acFctjC6F6aM6EAaGvv+D5pwlY4MoWD3DFcaJUStKR4rbhhCB3R/o07+6tiET6B1mEAk9zQX/g9HfsjWvBC2fkrdqoOvbhnpDNJJifzo82u5bMRgDvcpxu8jxVx27gL9aZI73bt2IJSYB4Uk7dFgpqFDxMEIHnkYcunrJNGsbZHAjGa0dNVfccIu75RgDrzh1UKdfPXKxsXsCDxYqA9fMP1skjebDKKhV/FrD8p761TxnOef2ojDKkLZa36BD/mpHsU44DCyGsV6LRcvAgc7xEdbD+EmDB6XPvpm32hNDFCxAEVAoIu34fIuY2UxRZoaKifRdFhx4oJXlyjA48XSDk83/6MXv798CVs9p3Z0prNcD4olMq//PgD7ZZYz07N+PJKWAWl/ryZzylDMyi6Nc+/MtlLhyU1Hs5YQUM0C58QKrQct+hDyxjBxIp5VhbXtLHX0urv/DHgHVwJ9wsCwmFRrcdwNT6goAF3U2eLcudq6GuEAuNPpUgd9/JL+3Tx0CIIQjdxJnqjj2LC3KHmi9nYMfwxZ+5UFhSq5Zp9S5crft7gMUikWSjCOaiUUuFo4Ns5v3AxTO+/R+Gr/+GUTIO1nNP1c/IwEgZDLhE/8iDJQLW/Pdl9ZuWYCmEOgme/JE2GmZoYZi0/ivGOSswvbnoTEfhI3bY0sYTSh3jtCTsOCSr+yry9ABLzHRxrpztXDyHKFOR9ToMc5eo2/aI1hVjMV44hFpM8pg/1fvRNpQkle3/A6x/5vrnAQsKH5OTaZk0mL58hScQecs2humLUJkylpEnKioxWySnT1v6yhWogF6qb16+k1Cq2IDPnj7Zd/gQ+DP1wkumBaswU1LRLELPkY88W1cRCSmy11rJ23aFUYrBgH0+AKyPgT5RtGlvmrsGntUeN7dg2vyje3l9O7B5dgBMyvZvG2dmlBCwxFhpz/5tjvSZQvwBZZyzXNbkDXgIPIJh+RaS4PMDPZB1D9cZMJkKEWtQwYqZ2D8HWJzHaRnbP3jqJCZXSGu9YNp0AEGQQp0mZM6jXCCAuGxEYhlERC5gXwqxQU8XsMiatbE/kCgoJxxQUrPGBE6cgI6eWrVN6WtwUzJfINUZEUvLZPVoy1z/jaeDxWwR/kXAgkHyuZMG+A/sw4xm0BGlTl4FqpkveL4sXGv9XtvEwYHj36AU+WTAggej4SjnttkmDAS2O48RsoaNzdsPwyobxac1QX8XaIZbyE5FSQq8ueG9BarWXcCLez5YZ5syiihbnnU5Sn1xmij1TCGnCwtLYeHew3uc86bAnqIo49wMebM2HE/jALzu3hQyee/ycpkJANDr7QsCENzm8x/cYZ8/AxKslDLM+xOAJez0XQP3ZzMzgfhrRr6r7j2qgEEiOoxdTufSGWAtpypWUXYfRNWoU7Iswj8NWDAmxu2wzx4X+OQwplNLmjRXdXwHKITw7d9hWV0pTpStQFV9jkgoJYrHk1PMOOFMraxXq7JuH+90qgcOMc5dCwuPRVa1wl8VAcsybbhv74e4OYnz2pO+uUwaE2GV0clD/J8fgcfzJSUmbTmEgwZApcTnV84TENu2cIpnw2rcnMiFA6V/uIrJ1H+cRXhwO9RFNAMkxLxxN2FMjg6QUIcMyBUdss0a7zu0F5PJ4Dbi5o+fSgyWMO6D2IcwSl3Ze4Bu5PRi83ZZR15uv84ApHi/X9Y21ThrBfTe/VXAQiKJcAJOBfy8TF7oDGnxv0O3frUtmEJf+gVIN1WthjF9DWBWpPAOZgHNUNKjcgpMWmHfmAk5l83y7N6BYjhRvoJxyQZJ2Yp8cSmi1kXTvB9uQykKowjTzqPCae5/CbDEOliFYrAi3fUGfe48IlUQSebko2ci5nNBEYXlZkb3Dp0/hxLYf4D1T13/PGBBwedp2pkxw7PnAwAKeNlypoxNRNlKQj0nTAwuFncogKq1DunOud1AFar6DNG9O0P0ALv2bnYtmAnPdtVqDYvWSWs3iFUDjxx/Gwra54z37NsFJEPTf4hu8gJosNFh25I034ebMVJCNWqSsHInPC8YyZ+H4N29B7dbJ44gTSms363s0LXkgCWayOGrP1smDOZzLEBFqvv0145Kgy8iHjgQ+RhcnPhw0DK6F+tyk888o2jTWfpSM/EU1H8IsIR6ioxj1QLPplXARMbVWtP726gqzxX1KECnxfdfOZfOxhKTqZq1lW/1IUxJqFA26e8AFowzyL6X9Xo9CFg8nbTjE/zZWviTJUrocyYvyzp5WPDiz0C/KVunaqctxClp7LniEUAYSgTPnbSOGcixHOL3PDXAAq+KEp4DO21jBhJlygF71Pz+dnnT1nxUSmPfDd28kvtOG1ijgGWeXGgUwACP8oCkvbs3OhbOQCnBLTdmsqrbQDFTpMh3WFg8luccs8Z49n+EKdXAuDQuWy+v0wh8Pnjhx9xeHVCFhvd5dJPTND2GsVETRbwYMFs41p42ynfoY5SUk2VLmbcdQDVmMBNQlKQf3s0DAHTrJqz+PHWWKrUXwheYC8CqsUwYFPz2K0ypAvL2pwALyqrTZp0+MnjyJEKgskawHhKh1vL5YyeU2fz9V8vIfuFbtwiNUr98k1I4WuCpxmBFAAseFH3hB+u4IazNQZUrb9q0hzKX4qPrNibmMEYqTPyxomNFj9T04d7tm4nkcjztSdh5WFr9RV488rCgH4uPAtajNvW4rByYqyWTphy/imFwU9F9aKdt8ihcbwbAkbD9sLTeq2KhNTSqBlHxu6+/wFltnN8ne7mhefMhBImU/30MYAlOr68O2mdO5ANhHJ6TsYWo/FykBqzoqkbJ8L3fc3q2RQJ+oHqIZ56JAhYrhgCGr120jOzLOuyoWmlcsELWoEUJAYt12e2z3g18cwzMWeqFF00L1xGGBD7qW43EKqGY/8dj8HxPmgGzRjtphubtgaJj9a8BFgxnP/Nd6Kfv6ZvXieo19aOmwe5B4vUzzPTEEcy1dblr9TLwCuCVDYs2SCpUfdKI/yXAElcMIPaBz/baZkyEI0gS+hmL5K1SeTi4ER9bZHB5NqdX6/C161woIG3winnZdl6pwv88YFnTJweOHIEerEEjtYPGFwKsR+3qsZk5XCAob9UqYdmOwomZwsf8Z49b+neB+iTo+y8G65+6/g88WGIF5ODFn/JG9UXCYT4UUnTuZpw0nyMpRKiiJlYGZz1Ox8Kpvk+PQMVXKtm4eJ20Wm3Rd0rnPMzp34nLyQNWgrxVW8PsFShMb4bHrggsgwV+OGafMYZxuAm1Qr9wrbx+E/Hxng/XOzPmwsMNzImm1TvIZ6py4pokaLH/r73zjpOiSPt45548s7M7G1hBlKRHEFBQwqGeKCgKIiiKCigKIggoeck5I1lAPYJijqCengHUQ4KigJ4gAovkDRN2cujwVlXPzGYWdAj3fp7vXzDbM91d8fdUPfU8OK7p/XcoJX7GbJJ9bpzs+dy3CMm+JNJwnucn+zduoAWeRuJv8nxD+9tUeAydAAAiJUlEQVS11qwmwp7gUXXdUs/i2VQ4hk9gLVyja99RM1kukMAiiQjp6IG9rpEDpFNnUPHqO3ZKz5vF2hwkjUjpeqF0/Ihz0rDQzl10NGy4s0v6zBVIjRGl8le2CHHJKJ6CE7c0pzkDFfFnvfYx3/QGCkftr9a9VNEGcXcRqke8Y0uzurZt0mcso60Z2JWHwts68Wc+eqh48vDYvr20waT43KkTWLKCGuHx/IIBPVGhIStUaN7csfptHGZdTQSUwY0mUvBUz/C27VxGlhwoOXuqHPKxghSW6nU7p44IffEvWtDTHGt5aqi590AGtf8y11KJNET+za85JzzHiGYlGtTd1DZz1duUJoiDfmfeoPDnn9J6E5ubm7lyPZ9bj2yTSAwW8izL0IHP3i8ePYjRmeQSj23kuLQnRpBVW+xZhyZC55RnQ1u+QCVpuPOe9EkLKNFAYz90SnMWLtm4yj11FJueg/vj+QosUqr+j99yTh1Nq9hFOG3sdNSh8K1VUjxIQkgx94JJ/tfWoV/jW7bMXvuB1hguhMAi88eW4jFDKI+PTkuzj5qga387pTPg8HjEy1CJR/7U+rLWpbUUUlU00Lj5d+xw0ZM9lIIiJFaYbEfGrKViizZVbbuT7C6r53mWL+BsGbGTxyxPDLbnzaU1y0eKnryjpeIuwVmZWzbPWbtZ1Twy4ycfkRyjSl5a5H5+NmtNk4rOZL34hngLdmllyctWI7Bwj4vux/5z8unTFM/bRk+09OhHXHLwajlqcug5C5/pHfr0Ey47RwmFiJ+WJrAUssLExfIPFgzqrRQW0majfeZiQ/tO2sqx5lyGxGE1qXJwUQe+/NA9djjedVJl85NDbANGaWMgkxgAcYBZNI7t3kXLCtekWeZ8LdC0hO775wQWThv14iLP7Mm0KLDZtTIXrdG1aEvyCpAM4lS8MCk56po3IfDOG+g5xabNHXNXctm1Uy6wcPOmyPDl9xb06yrl56MpVWjcJGPZq7zdgQcW7POl4jBpaEp680X3/FnEwFZt46aZsJ1TNlXOuQmssN89Z4L/w3fQiGjp96Rt6EQ1PufEBfqphzvFftpHiTzf4Opab23VzDlFkYl/IIsLx+s58+idscP5nN0uez0gsC4UKRNYTz8sF1bj5E4sZdSGisYNDH74HmNJk4Me2+CRlj6Dcaxn0ofl08dKXnre/95btIC39izPjbORPGvktAj2zXIun+5b9jxjS5cDHtuwMba+QyhBp+24R37ZXTxpmHz4CGoW+ptvdSx/nUoYfOF9u3Bi8+Ji9InhrntsQ8dxJJMgvuOJfOeEZ0I7t7O2NIrhVXxUtbwPlpukyvm6uhUshehCTj526PTjPSi3B2/vpFntY6cbbr6TEuPPpnjd/s1v+JYvVGKyEg1bHu6XNgqH+i0byb1mgUXCNJyPwELWG55FPC8v9i7Bu7FUNCh2uDVt6Hiu3rXxrB04vvwvnoUTIzt20KxIW/WOJRuEZq2IDGL+usBCF5zscK3sDyENlDZmStoTpTHuE/lVyrdDAhrIvWvmelcuxQXIM1Y0mPbqX7rKgibjA3vcs8eHdu5gbVb0xorPY+rRK238gvMVWO6XF3kqCiw1nu/vn0t8SA3rTUosYu75kPWp0Wjm1r6veopdCyf73tjI2jNwCLGgv8ZchHFphnTAkQOFAx/EWWAFXg36jPf2Mj38OJdVm9HpGJ7H02A4jCRU8KvN7ufnYD9cjlN8XseLr5jadZLJKhpOovLt587xQ1R/VKUksXlL2/DxYrPWVML1JLJja9HoQYrXr0oSXyc3+/1vE2GWyPBLs751yz1LZuOOw/PWoWNMPR9hGZ7MoFLwi4+cYwfjhR2TEbdkgT9fgYVLLxI807eb9Nt+nP/BnpY29wX99W3j504Uyf/2evecSRQnqiXujLlLzd0flUmm0Qu0giUXnSnKezr6/Q6a16FWzdapw2ZfwZpMtMFAI02j01G8kTUbmLQM/sqrhXrX0FY7EblVO2NpQsH30Zvu6WPxHhOaNA2isfsDxq69hcwcSifi4KKqjN5CKjwd+Pht7ysv41DM4TBtFLPWb+Lr/41OvJT3lRWuCaO42rVlp9P8UB/rsPGcNZ5ETw4FQl9+4pw5Did9KfEabvmH4/m1is7AJjKEViOw8MKnjET8pOHhr7+gGZ6re2X66CkCEgfazwb9SI54VyxgbA6K53B+63pXl13Bwl8PB4oeuTt25BC6i/nRJ9OGT0y2q/gul8dZXEWyZ1U7llHwxH2R779HjRkVtW3CTFOXBxhe1MZ26chvrsVTw19/RQsGlVYypi80dOpB5gTiPRJPlUME1jPn7IOFhoKT+c4R/WMHDqL2wNatmzY0T9e6vRa8VLuv4i/xf/a+b/l8JRjGWyJ9Hrc9Ow3Z43SqBZbW0XFiWpr2vbPWmfcsl5EtO0/ru/Wyj53B2jPjxRj0+T9527tkropzMob0HTunT1tMm21klaGCwJIy128Sqw/ToGIFv9C3ehGqON11Le3TFwm5V5XuGVGUe9m0kvkzudpXy15XxszF5q4Plf2hWMEJ14xR4c/+RaejcYxXfSWGbj0zpy4luVfwo4DAShmawPIsmepbuwbnIszJdLzwChFYWriBmoPfxgXWYCKwdAb7lAWm2++uILDIThkXO3rwzIOdFX+A1ZkVOmq8rbPQqh1rtEjOwtDnH0X3/kRxguxyGrt1T5+5HMmC0jwbOGlMQUHvztIfx1kzan+U8c67hZY3sTq9dOKPwOZ3pPwjyD6gpGjWxk26627SUojgXY9I0DNrnO+d1xmLlYrF+OuaGzp344ym2B+HQls/j+7dx9TKEZu2iPz4g+J1mbo/Uk5glRQXTxkR+XoLznU1aKit/4hK7qg4aiRLs943XnJOfI61pONgB2a94dY7hBatWb1F9hVHtm0J7thOy7Lq9Qk33uR4/mUmIyeZUBkLrH7do0d/5ywW+5R5hlvvocp6zsYjuQ8Pb/saLwWPzLP1qkZgrV5Eq6zQunX2mne042hagStBb/EzfYLffM1lZCh+P9+ggf72LnzdenhIPnYk+OnHscO/o9ld8jrtE2db+zxTusyu+WBNIwKrXmWBFU8cQQTWQNnvFa9pnDF3BV9HE1iqQiOBwBaNeMz3zpt8do6q19v6PcVf3RDP5G6PUK+e0KRVhcIkbmkKzSJLen9Rvx5IJVA8S+l05vt6iS3bMHq9GokiRRj48J3ont1C06ZsdnZ033/VcNDYtWf6lEX4dEypwBoWeIvEwepyn2N+1QKr5J+LnNMnsDqjocd9jhnxa7Q1fMl52jV+aPjbrYzJpioxvuUNho53smabfOp4aNvX4V3baU4QrmkgFRYpxU5jpy6OeWtqCtOgENOS9X/6vnP0QBrZqyYTFQywtXL4uvVZh4M2WtRYRHE5kR0vHTmM81mjtlF0xvz40+kTF1DxUxEsaeExz4rZ3tVLWbNViUX5rBx957v5Bo0pKRI59Fv4X5tkZzG6VpWjjiUvG267JyFk48e4YifykaBX3G4cT4TnDJ276m5op4QD0V/3hj/9SC4sElrfgKYJNGlhH6zKTu7PPq64ywqsci722jJP4MvNhYMe5cxpMhJ5OZmGbr3QO6JJN7xnd+iT99HUovg9QosW2a99yrAipcZUmicC6wEqEFQCfsea103t4yoKC6w924tGDVKdLsZqsc9ebLypOoE1MB4Hi4RpkBP9K7J3V/HYwYrTTZPU7ziFDnZ3J+5m5Cg76lY49rrRqGvSwtx3oHjD3+mq1D9VumIt+V9Z4V40i+H1qOdT0TCbW1uo34DJcNCiiCvx1JnosSPyqVPYBzQUUmglbcQk86OD6ETsQOzO5SwsHPF45LttXFq6LEf0zVqKbW7mcq+UA97I999Ftn+DJ+BwEIukmUuE5m0SwyAJ0//NJ0RgORSpvMAi6VwDH73pGj8cx1OVJT47y3BPD+7KRrL7dGjHtug3W9AjiH9vJ/9xMnrsqNCoYfZLpT5Y8QNG4wfjNOdWK6MTTQ/1Ea69Dv1orOgM37SFvlEzxeNyTh8R2vIlDv/xSFxgab2GweLg24J+PWhOxJadXjTccZeuxQ00zqd+PPDZ5tj+XxidQS4qMD852D5ubqmQ1XIR9u8unTyBBRYST2cRWHv34aD8w8aYew/SrKnAh68WTxyJrAi8GW8yize20TW7nrGn46HP54rs+Da44zs6JlHhEH1FTvaaN/k6DZWzZ8uJ5yKcgtdgLUhgLTtngRX/uiJHC/p0DW//D5dZSwkFxFat9R06MpnZ6BmQnRz8ZgstKUrIz9evl75knVj3msQ2Pe5iWGA91pMzWFRadqz/QGzUvFotSNPBbZ8XD+uPbHX0b327Dro77uZMFiTKaR2vv+Wu6OEDRX27qsEQpdMzRqOxR2+xcXPGaJCCQenQgdCWz8K7dnK1rxCbNgl/vxuNRfpO3RxzVsqkcIhiVrGHyQYksBjDbXfZJ81nTWaqQte7nLjcBZZ7wQTv6mW0zszlZmetfZu/ogHJDVlDDJvEy9HRQ78V9O8pnzmJDIj02ctMnbtVjJ0djxPDhrZ+goY81eVBV+L8uyyaiPGwRUtoVlYon1d/1z2OOS9QFrvmZaXdHruy0Ex0938KRw2Uj59EZiiO1czg8RF/F3VyEogyc/pC0/2PyYqsBXUn+YxZxXm66IkHor/8TFtslBJTcWJNho5GVWTWcJRj/go5GHFPG0tHwsYH+zlmLi2zglVUnDck+OW/aY6zDn3W9lTl8BD4UpnkHvaumetZNBevpPMiXqbGgVhYSkImegz1IDXgE9u3cyxYx2fVUpMetag3ul2nH7oTyVMmzZIxY7EBB0GuILCKisYMDn/9OSXwtnGTbY8MriywSlbM8SydhwZf4aabsjd8wsQHTO1oORcrPo1z5nz3H9psx9mJ0DzB4SDyqhTFZY4fT04bMd46YJSWyyWZPMy36RVn3ggqJnMNG2QuXivUu7asX502YYe+21Iw9DHVW4IdSBe/LFzVkIrHYsVn5MP7dhb0v1/1BRiDEbvxiiLW4oWFaaPz7APGqBWjkCdECs34P3rTOWIghQZr9BVFZvQGSuComCR7ParPz9XKSV+wJvrfH0vmz1JlRehwS+aK11jtNBb5gcLRA/0b/4lq0NTtwcxl6+IVVb7FulfPcU8YR+l1pl69Muev007HUwmVECs4XjCkT2zPT0iXoxrEVi9upVE1EkMDpfnJIbpWNxZPek4pcBq73pe1ZH1NAiuehgxNSIGvPnbPmyAdPoKPT9OMoq2MaLM6SXWPpic1FGR0vKn3Y9YhE2l80lvL0qpdjKpQLp403LdxHYcsDbJ8QIssTq2LqlLB1cplpKeNmKi/91EqmccwnuYFf92/6XXnyIGUYGREQcVJkVm8hRiJKiGvcP2NjmkLPS8tCX20ibJaHXNXGf9xZ6nA2rOr8KnessfFpNszFr5owKerKh6jk8kebsnq+e55U/D6jSjioRq1NxzdQMJLmOEAV//q9KWvCg0aM4m1k+jvvxQ82hUnpg0GHBveN93cqVRg7d5WOPQxpaiYTbelL3jB2K5TFZHcj/5WOKyftH8/a3ekL3rJ2PZmBdkzLN4UC370umvJHLXQiYoFt3wtiaGq7Q/SxBsTfcLiNUVJYjLstrwZxjvuw8doK0Y/0xK9KVq4MhwQYUae4vHjlsmSZU/N85EmS2f4p2k5GOBzHNZRU01depFaUhPLt/ggArKpXDPHhbZ+wRjMKom5inQeejU0FONloWBAbNHcPn2x7poWZVqvrNBc+MvNyCTjbJmyEq793UEunl5dIbYBXjZ2Thrsf3UdY8sg3VnCP4tKHi+OBiz9Bph69cMW0cGDfJPGORs2Mcns7EQ+xo4dPt39ZjUQwmveyEY1iGj+jv5+EA3paY8PwS4TeUMCX/wb9RDLY0/ax8zSBBY5zof3mL3vrXNNHk1HFVrU45fiSFjgWAyrWyRtQwHLI/1tefNonY4uMwZKhQVnHukiHctHXQzvbOKUwxRTSWCdevC26A8/UXrePnK8ue9QWpFUhuxrr13mnjsJOzmJAkPsXZXj8NYv6g4xnI9ECYXYrCzHyg3I8Cahcs46oyHT66017ml5qJYYizlj0WpD247ns3KD9wGlo78Xjx0U2b2L0psZ0spojifJRmN4by4Y4BrUy3zhdeGqa8qcriACa8eXp3p3Y/RmVBVZr/9b1LKWVXkbzZIc3iew6T3Wno7elBY4JK2UwmKu8bVZ6zYha9+/aaNrxgTKF8CBKtA0JYqMXidHIlSJVwkGGZMxY9UG5dTp4smj0BBnaH9r1toP4j7KWqSYRTO8Ly5Fj6/r3DVj+hLWbEluEVyGXN4CS5JKNiwNvruREvRMZlb6tIV8Vl2SxrXmyLfk5ejo8XzXlOHYB0tntA0bb2z3j4qnSEizlsnChnT0UMnGVeGtX+HUOgqJC4BmMKOJq1vXdE8P072P4CP6arnzOZrkQY1VOpnv27AquOVzubgIh6Yl/pOs1SY2bmbuOygeegf1Ijy6svi0NkmVKBWddE8bGf5htxIN0jL2UEImGlMr1zZktPG2rt53X/VvWKHIkrFzd/uQvKTAUrxO17KZeAeNo40P9bU+MKBST9PmVVXbEYvu2+l95cXYj7tkt0slyRyxR4XRwF1Z19S5q+m+PozJUiH+quzxFI97SjpxlLGYrEPG6tt0pMsLLMntLFk6I/zDdzTPmx9/2nx370oCS/a++VLgtbWoHnXNmttnvEBrwVC045kKDouu+kp8720IITvy6FEljEsAzwYsz6Xb+BbXmx98UteyTcXNEZr2f7XJu3weKk+uTt200TOE2vXKr2DhqTGyd6d77njF6+fq108bNV3IvSp5jTbXRvZsL1m5IPLzHjTM0WQRXfH77BOm2vo9V0lgJRoKWQAPbv2Xb/Ui+cRxJehHGlr7HHVyXbsO5v5D9Q2b+v/9vnvxLBzrIic3fdZKFvvmx7dg3IumBD95DwlcXYdO6XlzKsliYqe+9RJ6MFrQGTt3sT03s0K8A3Qv2V/inDceZ4H0+9VojMSGFli7zdTzYeuA0eHvPvcsnqH4A/qbb7ePmV3TEJxo/yQkluJxBr/a7PvwXSX/MD4AhboAGRzwyTJOoNNs+hvbGXs9pru2BSlliSVhmzQ3DoXM8chM9r++xvfua3LBGSoUwpoDNUMOTVB23S23Wx8bzKGKqLgSE5+DsY/XZ+95Vy2UTp9RI2GKtEgkFHQ3tkubtIDVGdx41xjJcav1uQn6Vjdr2QuwwPptn3vGGLmkhLVZLCOm6q+7sTTTc3Iw0Y5iUnRo2+e+9ativ/5XCvhocmeK5djsLMPtXSwPPclm5+KDjWR4QX0/mn/QPWGw7A+osXD61KWGVu1LBdYvP7gWTFZdTtZss42aKDZvR5cXWDjP6Ymj7vl5SLOyaba0kdN017XG53ilqHvV3JLVS1lWYHJr2QY8w9etLxe7ZJ+bioRUKSKjcguEVZ9XLjwV+elHNMegqYite4Xj5Q/57NyqJrZSkUoRpyJUBeEfdsZOHKOCQfzAmsRiOaTaUUWIbTvYnhjGOmpRVIVTijKpbA5pPu/6FYG3NyquYqRCtIpgBT1tsxk73WUenIdkCkOVzZmBBVZo+1fuycNpUxp678x1mzlzabAr7TwNKm338pmBD95WfF5sEiDhxPGs1WK4t2f6sCmR/N/dM0ZGT58UGzZMn7acLQ3lQIYyZBTt3eGeNwmnyAwGtU4hnTmTMe8FW9+nZK/btXxWZPs2iqOMXe+39huKiyIR+SZ+YubAHt/6lZFd21WPh+RIxiG3OKuRbdDIcv+j+ju6IxNUIS5HicgKtOxCuu1p6dRx1EKsfQcZ7+1NVdilJQNC8ejHw/t/ZQXe3HegsesjZG8SJ0RCRY4M7xLU2A4ekFxOKhbVehP2cDcY6exs3fWtrf2f5bJz8SkWXAssdRbQuPfZ297Vi7GWMBntz04RW7Y9xxxfiUaCezIqK98HGwPvvS4dP4lTgBPNSIk6PitbuKmDbcBzbHpm+dckAuvnHcVjB+MFOZZOn71KqN+4ultrda1IYdfk4eGtW9VIUIlGaXLAWde8ZeaL77K2DPTjoX3fe1bMjv2yTwlGVDlGK9i3kjFbxUYNLUPH65u28n35kXfVfDUcZevUccxeyVjSNd8VNH/5Xn3B/94r6Bn17W+1PT2OgRWsP4fm2KnGQmosQsxhisahBM6vILEjbdhPUg9TJEosX2UgN5lE2+Focrj3+OHozz9I7iKc5cBg4uo1RCMjmvWJ065aZSeIZ7Qi3438/KPkKkBjDmuyCtc0RWKf0mL5IKOc0Q7w4jLXnDlYjsMeKnt3xvJ/V70eRRCE2lfrrr8J+wKjP8fCVDSIZwZOYHXG5Jo5drEKB1U1Rv4kMmjso6rvacRFA7/X4V/D+/ehSRRpR1Zv4a5qoGt+A8OJVToe4Q+DXprBp8Gwxc+UKzfSYpAFFmAoGb+IYMBuDeVPMmJTJoqeP0QECEvrzFX0SS0plRIN/7AjdvSgGg4xDM3Ys4XGzYQrG9Ja6JREjsX4L+OtsgjSo5rTJK0z0pUGJuLZGUP1Ti5hyDUVY76QHUc5tOOb2B8HqUgUGZ2s3iC0bCdcVb/y9JxEjRemGtn7fezIQdnrQQMpgyq6wbVi4+upeLwXSUFFR7PYN91gIcEb4km45YifikWwJxnP0byZrhSfG+sRKaxEAni85QVWNNJVJfVDPxc58mt0/39lVwEqMDYrV2jaQsiug4s9FlFjQTLbVlPmVSJj3ziFxZlrkKqK/fxj7OQfSolTicZwbAajic3IEes3YnOupLQQWqpcfhVZIbvSqK0IZM8rGN37Q+zYYTkQYNC4acsQ/oYzWZGWVn4NoHxjwD8UCUR2b4/8cYSJRZGWEq6uL17XRvOTVSJ+7PmOLtShBiky8QioNA6KHfFhB3Y86JpwH6/qrbF3EioU4i0e3bsz+vsBOYAzkHL2bH2L1mxOHTXuiawFGabJdp5KegGD7WydORncnGRtlNVQgGzqqZRopBihwnsRBzI0+ASR4MD2tUgeDFXcoV8L+t6jekOoWSBL3djmtrNUi+/Td/DOGqdTXIWOVz401hT6iGgREl9SikR+2RM7fkT2umgSIZSz2bmsK7hGjXiLQ4kHKqMqrNQSoYYXgPGJjaITob0/Kc4CnMxEp+Nr1eYbNRYyr1BIINYKBi42WpCxESlBMg6Xld7OVGrbWruNnsiP/rpXKTyFh0JHpvC35shAIkFYYrissM8Wy+gtFTNpaP43qoQsOin/oBwK0yKqSU534z/4uvVw00PjoULGQ14g7n1l613LJYsba/jgL9H9P8u+YhyfxmQTGlwjNLk+fkyS6LHybVpVw15t7qCwttDRVCUHTdROwl4G24sqxesZXkcnUobFF+7QKH7qSPS3A3LRcSQXcL80WNhadcQm13HmNIoYKomKOGteAbwlEUXTAck3rdKoydEcc37LNsS2pjnUxyV3cXjPdvnMKQUNR4KOza2LBxCbg/TQylFt0YQl4aLASwOocq0qHlyqa4dxExePUft/ih06qJQU407C6fnadcUb/s4IPF58wMveCq7NY0gxe/Fqsj2Tr38NTsKjTZeKpGgTN2oRunjfIa0IJ++iolGy7cShP9HnLjIvBZevwEo8YJk29Od82c7zF7SFCu26ZIC40gTS1RJP1KqWWZQgdkkV56WpMhfE0weU+aRsGqlqn/x8i4WmtFXUiu91VrfKGm7x1y8oo03V5Ltrz6bKicf8Mz8bP1hX/TUV7pv8kIovYJzNmiQu56U/Hy/M0uWo6m99Lk9e0zXaNidVfkcheVSH+Wv9Jb4oVOa/pTVSZhKqAbq0pSWL6BzTFSfLtux9K3aHiit/ZQu8wp/O9njJvkBRVLUeMNWW57ndtMIz03Rg+zdFfe9mLBkUT9fZfpj8KUYGgPjBOM2NEGcOJ7PUiY7NFLdP9hQ5Vr9q6HhvTTHbyt03eWkVhVkDsrbnmDx7mPhuxeBJ51BQcUg+Vi2IfZkLyW+SaFvsWTtsPGtTsl0lN5gZ7JJxLj0LHxkvOwYmi+UvjYE1XkPTyZI/j7G35htRNbfzaikNuVh2HDurc3MNw2mVT0tXekS11JiP2wIVpku8doCNHCaVc98l5bIXWJcArZ0lZhkc4YjUIsOcdaNXTaSM1fQSaq1KmV+pesJOJtrVAvqdk2PZX3qp5EE9NZGW4zJcWU2WJHV2ofOXURK9m6Xim5c43CtbU7GQqUIb4Zj4YHGOe9apfHIqUYNUCptNMjkOU8VfSsvqgr4YfTG6w6UBiaYITpZ8N5uWqUSCWa9+qG/SSknkaddscTWh3vGK+IlDp7rfRlGc6i3OWvuB2PbWcxVYZLmCVCWbPExwPnUXH8pkkt2VdIpkA/jT9VJ2omEqfXj27qNW+jotJ9rqub1VcsOQ0sKOEMOXubCtOX7fCh0n+S4X/uZVk0xKm6zK5CcXaByrMDmWLRaKrJtSZUbUy3NW+pOAwKpMcvbS/pdwE1bVs69gJRqr1j5ICJL4r9TYYkqTvl2wtlX2FmWf8zJEuYhPWFrX1WuLsz8hdR7fu5DPf+FvdNFe82Le66KiOWYVDuop5Z9gDAbaarU+NVTfqgMOm84L2KQnscGocFAuOhM5sNe7YqF08owSDvH1rsp86V0us9Y5u91UKMM/104SrpyJvMHaS1yKeqlwagE/w59qJfEvJb57ETx3Ko9ml7x5V5yqLnzNVnmLKnOk/X/r8iCwAAAALgZa4HX/u+s9cyYpUYnhONVbQufWEptcx2bn0iYDDr/p8SqnjkV+/00uPMnwFnyYwGqxjZ1muufBs3mwAQBw+QECCwAA4GKgnbGipJhv02slKxdIh/JpUSSHzyXsh80xlCLjc75aQFJ8QJMS8VmzZ3S3daEZ7nxOjQEAcOkBgQUAAHBxIEcFaHx2OHbscPirj0M7v5aOHVM8HjUcoCRy2lwQOaOZycrCR1PbdxSvb8ulOyplKQYA4H8AEFgAAAAXh0TMquR5ulhMVSRVVtRYUMFhwxhG0OMQoyxDvLKYMgevAAD4HwMEFgAAwCWhhvDdVDxI0qU6bgYAwF8CBBYAAAAAAECKAYEFAAAAAACQYkBgAQAAAAAApBgQWAAAAAAAACkGBBYAAAAAAECKAYEFAAAAAACQYkBgAQAAAAAApBgQWAAAAAAAACkGBBYAAAAAAECKAYEFAAAAAACQYkBgAQAAAAAApBgQWAAAAAAAACkGBBYAAAAAAECKAYEFAAAAAACQYkBgAQAAAAAApBgQWAAAAAAAACkGBBYAAAAAAECKAYEFAAAAAACQYkBgAQAAAAAApBgQWAAAAAAAACkGBBYAAAAAAECKAYEFAAAAAACQYkBgAQAAAAAApBgQWAAAAAAAACkGBBYAAAAAAECKAYEFAAAAAACQYkBgAQAAAAAApBgQWAAAAAAAACkGBBYAAAAAAECKAYEFAAAAAACQYkBgAQAAAAAApBgQWAAAAAAAACkGBBYAAAAAAECKAYEFAAAAAACQYkBgAQAAAAAApBgQWAAAAAAAACkGBBYAAAAAAECKAYEFAAAAAACQYkBgAQAAAAAApBgQWAAAAAAAACkGBBYAAAAAAECKAYEFAAAAAACQYv4PGYFQyQ9dOIkAAAAASUVORK5CYII="
-
-    # Style the boxes and images
-    box_css = """
-    <style>
-        .box {
-            border: 1px solid #ddd;
-            padding: 20px;
-            border-radius: 10px;
-            margin-bottom: 20px;
-            background-color: #f9f9f9;
-            text-align: center;
-        }
-        .box h3 {
-            margin-top: 0;
-        }
-        .box button {
-            background-color: #007acc;
-            color: white;
-            padding: 10px 20px;
-            border: none;
-            border-radius: 5px;
-            font-size: 16px;
-            cursor: pointer;
-        }
-        .box button:hover {
-            background-color: #005f99;
-        }
-        .image-container {
-            display: flex;
-            justify-content: center;
-            margin-bottom: 10px;
-        }
-        .image-container img {
-            width: 80px;
-            height: 80px;
-        }
-    </style>
-    """
-    st.markdown(box_css, unsafe_allow_html=True)
-
-    # Display the boxes with icons and buttons
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        st.markdown(f"""
-        <div class="box">
-            <div class="image-container">
-                <img src="data:image/png;base64,{general_services_image}" />
-            </div>
-            <h3>NYS General Services</h3>
-            """, unsafe_allow_html=True)
-        if st.button("NYS General Services"):
-            navigate_to('page2')
-
-        st.markdown(f"""
-        <div class="box">
-            <div class="image-container">
-                <img src="data:image/png;base64,{passport_opportunities_image}" />
-            </div>
-            <h3>PASSPort Opportunities</h3>
-            """, unsafe_allow_html=True)
-        if st.button("PASSPort Opportunities"):
-            navigate_to('page7')
-
-    with col2:
-        st.markdown(f"""
-        <div class="box">
-            <div class="image-container">
-                <img src="data:image/png;base64,{nys_dot_designation_image}" />
-            </div>
-            <h3>NYS DOT Designation</h3>
-            """, unsafe_allow_html=True)
-        if st.button("NYS DOT Designation"):
-            navigate_to('page4')
-
-        st.markdown(f"""
-        <div class="box">
-            <div class="image-container">
-                <img src="data:image/png;base64,{nys_dot_detailed_ads_image}" />
-            </div>
-            <h3>NYS DOT Detailed Ads</h3>
-            """, unsafe_allow_html=True)
-        if st.button("NYS DOT Detailed Ads"):
-            navigate_to('page3')
-
-    with col3:
-        st.markdown(f"""
-        <div class="box">
-            <div class="image-container">
-                <img src="data:image/png;base64,{port_authority_professional_services_image}" />
-            </div>
-            <h3>Port Authority Prof. Services</h3>
-            """, unsafe_allow_html=True)
-        if st.button("Port Authority Professional Services"):
-            navigate_to('page6')
-
-        st.markdown(f"""
-        <div class="box">
-            <div class="image-container">
-                <img src="data:image/png;base64,{port_authority_construction_image}" />
-            </div>
-            <h3>Port Authority Construction</h3>
-            """, unsafe_allow_html=True)
-        if st.button("Port Authority Construction"):
-            navigate_to('page5')
+    # Style the boxes and images. Streamlit clears anything a rerun does not emit again, so the
+    # (small) stylesheet goes out each run; style-only HTML lands in the event container, taking no space
+    st.html(f"<style>{dashboard_css()}</style>")
+
+    # Display the boxes with icons and buttons; the icons are plain URLs the browser caches
+    for column, boxes in zip(st.columns(len(SOURCE_BOXES)), SOURCE_BOXES):
+        with column:
+            for title, label, page, icon in boxes:
+                st.markdown(f"""
+                <div class="box">
+                    <div class="image-container">
+                        <img src="{static_url(icon)}" />
+                    </div>
+                    <h3>{title}</h3>
+                    """, unsafe_allow_html=True)
+                if st.button(label):
+                    navigate_to(page)
+
+    # Scrape every source concurrently from the homepage
+    st.markdown("### Or scrape everything at once:")
+    show_scrape_all()
+
+    show_search()
+    show_new_opportunities()
+
+# Homepage "Scrape all" action: run the sweep and show per-source timing plus every table.
+# Lives here, not in scrape_all, so the sweep itself runs without Streamlit (scrape_cli).
+# The session keeps only the timing rows; tables are read from the shared snapshot store.
+def show_scrape_all():
+    import asyncio
+    import time
+    import pandas as pd
+    import scrape_all
+    import snapshot_view
+    import snapshots
+
+    if st.button("Scrape All Sources"):
+        progress = st.progress(0.0, text="Fetching all sources...")
+
+        def on_result(result, done):
+            progress.progress(done / len(sources.SOURCES), text=f"{result['Source']} done ({done}/{len(sources.SOURCES)})")
+
+        start = time.perf_counter()
+        results = asyncio.run(scrape_all.scrape_all_sources(on_result))
+        st.session_state['scrape_all_results'] = [{k: v for k, v in result.items() if k != 'tables'} for result in results]
+        st.session_state['scrape_all_wall_time'] = time.perf_counter() - start
+        progress.empty()
+
+    if 'scrape_all_results' in st.session_state:
+        results = st.session_state['scrape_all_results']
+        wall_time = st.session_state['scrape_all_wall_time']
+        sequential_time = sum(result['Fetch (s)'] + result['Parse (s)'] for result in results)
+
+        st.markdown(f"**Scraped {len(results)} sources in {wall_time:.1f} s** "
+                    f"(one at a time would have taken about {sequential_time:.1f} s)")
+        timing = pd.DataFrame([{k: v for k, v in result.items() if k not in ('source', 'version')} for result in results])
+        st.dataframe(timing, hide_index=True)
+
+        for result in results:
+            snapshot = snapshots.load(result['source']) if result['version'] else None
+            if snapshot is None:
+                continue
+            with st.expander(f"{result['Source']} ({result['Rows']} rows)"):
+                if snapshot['version'] != result['version']:
+                    st.caption("Refreshed since this sweep; showing the latest snapshot.")
+                # One memoized page at a time, like the source pages
+                for table_name, df in snapshot['tables']:
+                    st.markdown(f"#### {table_name}")
+                    snapshot_view.paged_table(snapshot, f"scrape_all:{table_name}", (), lambda df=df: df)
+
+# One search box over every source's stored opportunities, ranked by the full-text index
+def show_search():
+    import datetime
+    import html
+    import pandas as pd
+    import records
+    import store
+
+    st.markdown("### Search all sources")
+    query = st.text_input(
+        "Search all sources",
+        key='search_all_query',
+        label_visibility='collapsed',
+        placeholder='bridge paint*   "design services"   asbestos OR abatement',
+    )
+    if not query.strip():
+        return
+
+    results = store.search_opportunities(query)
+    if results.empty:
+        st.info("No stored opportunities match. Scrape a source to add its rows to the index.")
+        return
+
+    source_names = sources.NAMES
+    rows = []
+    for _, result in results.iterrows():
+        link = records.first_url(result['data'])
+        title = html.escape(result['title'])
+        if link:
+            title = f'<a href="{html.escape(link)}" target="_blank">{title}</a>'
+        # Indexed text is plain, so escape it and keep only the snippet's highlight tags
+        snippet = html.escape(result['snippet']).replace('&lt;mark&gt;', '<mark>').replace('&lt;/mark&gt;', '</mark>')
+        rows.append({
+            'Source': source_names.get(result['source'], result['source']),
+            'Table': result['table_name'],
+            'Title': title,
+            'Match': snippet,
+            'First seen': datetime.datetime.fromtimestamp(result['first_seen']).strftime('%Y-%m-%d %H:%M'),
+        })
+    st.caption(f"{len(rows)} best matches")
+    st.markdown(pd.DataFrame(rows).to_html(escape=False, index=False), unsafe_allow_html=True)
+
+# Rows first seen in the last 24 hours, answered from the opportunity store without scraping.
+# Each source shows its newest rows only (one table page); its own page has the rest.
+def show_new_opportunities():
+    import time
+    import pandas as pd
+    import records
+    import snapshot_view
+    import store
+
+    new_rows = store.new_since(time.time() - 24 * 60 * 60)
+    st.markdown(f"### New in the last 24 hours ({len(new_rows)})")
+    source_names = sources.NAMES
+    for source, group in new_rows.groupby('source', sort=False):
+        with st.expander(f"{source_names.get(source, source)} ({len(group)} new)"):
+            shown = group.head(snapshot_view.PAGE_SIZE)
+            df = pd.DataFrame([{'Table': table_name, **data} for table_name, data in zip(shown['table_name'], shown['data'])])
+            st.markdown(records.display_html(df), unsafe_allow_html=True)
+            if len(group) > len(shown):
+                st.caption(f"Newest {len(shown)} of {len(group)} new rows")
+                st.button(f"See all on the {source_names.get(source, source)} page", key=f"new:{source}",
+                          on_click=navigate_to, args=(source,))
+
+# Sidebar counter of ScraperAPI credits spent on renders and saved by the render cache,
+# plus this month's spend against the budget when one is set
+def show_scraperapi_usage():
+    import ratelimit
+    import scraperapi
+    counters = scraperapi.usage()
+    st.sidebar.markdown("### ScraperAPI credits")
+    st.sidebar.metric("Spent", counters['credits_spent'], help=f"{counters['calls']} renders")
+    st.sidebar.metric("Saved by cache", counters['credits_saved'], help=f"{counters['hits']} cache hits")
+    if ratelimit.SCRAPERAPI_MONTHLY_CREDITS:
+        spent = sum(ratelimit.monthly_credits().values())
+        st.sidebar.metric("This month", f"{spent} / {ratelimit.SCRAPERAPI_MONTHLY_CREDITS}",
+                          help="Credits reserved or spent since the 1st (UTC), across every process")
+
+# Collapsible sidebar panel of this process's per-stage timings and cache hit rates;
+# rendered after the page so that run's filter and render stages are included
+def show_metrics_panel():
+    import metrics
+    import snapshots
+    stage_rows, cache_rows = metrics.summary()
+    with st.sidebar.expander("Stage timings"):
+        if not stage_rows:
+            st.caption("Nothing measured yet.")
+            return
+        held, held_bytes = snapshots.store_usage()
+        st.caption(f"Shared snapshot store: {held_bytes / 2 ** 20:.1f} of "
+                   f"{snapshots.STORE_MAX_BYTES / 2 ** 20:.0f} MB (sources held: {held})")
+        st.dataframe(stage_rows, hide_index=True)
+        if cache_rows:
+            st.dataframe(cache_rows, hide_index=True)
+        st.download_button("Prometheus metrics", metrics.prometheus_text(), file_name="scraper.prom", mime="text/plain")
+    # Keep the textfile export current for stages this process ran outside a refresh (filter, render)
+    metrics.export_prometheus()
 
 # Main function
 def main():
@@ -137,28 +226,15 @@ def main():
         st.session_state['page'] = 'main'
 
     page = st.session_state['page']
+    show_scraperapi_usage()
 
-    # Check current page and navigate accordingly
+    # Check current page and navigate accordingly; a source page's module is imported on first visit
     if page == 'main':
         show_homepage()
-    elif page == 'page2':
-        import page2
-        page2.show_page()
-    elif page == 'page3':
-        import page3
-        page3.show_page()
-    elif page == 'page4':
-        import page4
-        page4.show_page()
-    elif page == 'page5':
-        import page5
-        page5.show_page()
-    elif page == 'page6':
-        import page6
-        page6.show_page()
-    elif page == 'page7':
-        import page7
-        page7.show_page()
+    elif page in sources.NAMES:
+        sources.load(page).show_page()
+
+    show_metrics_panel()
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,213 @@
+import collections
+import contextlib
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import re
+import sys
+import threading
+import time
+
+# Hot-path stage timings: fetch, parse, frame (DataFrame build), filter and render, with bytes,
+# rows and cache hits/misses. Each stage is attributed to the source being scraped or shown,
+# aggregated in memory for the sidebar panel, appended to a JSON-lines log and exported as a
+# Prometheus text file so latency can be trended across restarts.
+METRICS_DIR = os.path.join(os.environ.get('SCRAPER_CACHE_DIR', '.cache'), 'metrics')
+# One JSON object per stage; set SCRAPER_METRICS_LOG to '' to turn the log off
+METRICS_LOG = os.environ.get('SCRAPER_METRICS_LOG', os.path.join(METRICS_DIR, 'stages.jsonl'))
+# The log is rotated to <log>.1 past this size
+METRICS_LOG_MAX_BYTES = 10 * 2 ** 20
+# Processes (dashboard, scheduler) write separate Prometheus files, labelled with their name
+PROCESS = (os.environ.get('SCRAPER_METRICS_PROCESS')
+           or re.sub(r'[^\w.]', '', os.path.splitext(os.path.basename(sys.argv[0]))[0]).strip('.')
+           or 'python')
+
+# 'throttle' is time spent waiting on the rate limiter before a fetch (included in that fetch)
+STAGES = ('throttle', 'fetch', 'parse', 'frame', 'filter', 'render')
+RECENT_SIZE = 200
+
+# Source the current thread / task is working on; asyncio tasks and to_thread calls inherit it
+_source = contextvars.ContextVar('metrics_source', default=None)
+
+_lock = threading.Lock()
+_totals = {}  # (source, stage) -> aggregate counters
+_cache = collections.Counter()  # (source, cache, 'hit' | 'miss') -> count
+_recent = collections.deque(maxlen=RECENT_SIZE)
+# Bumped on every stage and cache miss, so a process that is only serving cached pages (every
+# rerun counts snapshot / html hits) does not rewrite its export; hit counts ride along with the next change
+_generation = 0
+_exported = {}  # export path -> generation written
+
+
+# Attribute every stage inside the block to `source`
+@contextlib.contextmanager
+def source_context(source):
+    token = _source.set(source)
+    try:
+        yield
+    finally:
+        _source.reset(token)
+
+
+def current_source():
+    return _source.get()
+
+
+def _new_totals():
+    return {'calls': 0, 'seconds': 0.0, 'max_seconds': 0.0, 'last_seconds': 0.0, 'bytes': 0, 'rows': 0, 'errors': 0}
+
+
+# Time the block as one `name` stage. The yielded dict takes extra fields (bytes, rows, ...)
+# before the block ends; an exception escaping the block is counted as an error.
+@contextlib.contextmanager
+def stage(name, source=None, **fields):
+    record = {'source': source or current_source() or 'unknown', 'stage': name, **fields}
+    start = time.perf_counter()
+    try:
+        yield record
+    except BaseException:
+        record['error'] = True
+        raise
+    finally:
+        record['seconds'] = time.perf_counter() - start
+        observe(record)
+
+
+def observe(record):
+    global _generation
+    record.setdefault('at', time.time())
+    with _lock:
+        _generation += 1
+        totals = _totals.setdefault((record['source'], record['stage']), _new_totals())
+        totals['calls'] += 1
+        totals['seconds'] += record['seconds']
+        totals['max_seconds'] = max(totals['max_seconds'], record['seconds'])
+        totals['last_seconds'] = record['seconds']
+        totals['bytes'] += record.get('bytes') or 0
+        totals['rows'] += record.get('rows') or 0
+        totals['errors'] += bool(record.get('error'))
+        _recent.append(record)
+    _log(record)
+
+
+# Count a cache lookup: `cache` is 'http' (conditional GET), 'scraperapi' (render TTL), 'memo' (parse),
+# 'html' / 'filter' (dashboard), 'snapshot' (shared snapshot store) or 'flight' (a hit joined work already running)
+def cache_result(cache, hit, source=None):
+    global _generation
+    key = (source or current_source() or 'unknown', cache, 'hit' if hit else 'miss')
+    with _lock:
+        if not hit:
+            _generation += 1
+        _cache[key] += 1
+
+
+# The stage log's own logger: the handler keeps the file open and rotates it, under its own lock
+# rather than the aggregates' (so writing a line never holds up other threads' counters)
+_log_setup_lock = threading.Lock()
+_stage_log = None
+
+
+def _stage_logger():
+    global _stage_log
+    with _log_setup_lock:
+        if _stage_log is None:
+            logger = logging.getLogger('scraper.metrics.stages')
+            logger.propagate = False
+            logger.setLevel(logging.INFO)
+            try:
+                os.makedirs(os.path.dirname(METRICS_LOG) or '.', exist_ok=True)
+                handler = logging.handlers.RotatingFileHandler(METRICS_LOG, maxBytes=METRICS_LOG_MAX_BYTES,
+                                                               backupCount=1, delay=True)
+            except OSError:
+                handler = logging.NullHandler()  # Metrics must never break a scrape
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            logger.addHandler(handler)
+            _stage_log = logger
+    return _stage_log
+
+
+def _log(record):
+    if METRICS_LOG:
+        _stage_logger().info(json.dumps(record, default=str))
+
+
+# Per (source, stage) aggregates plus cache hit/miss counts, as plain rows for a table
+def summary():
+    with _lock:
+        totals = {key: dict(value) for key, value in _totals.items()}
+        cache = dict(_cache)
+    rows = []
+    for (source, stage_name), value in sorted(totals.items(), key=lambda item: (item[0][0], _stage_order(item[0][1]))):
+        rows.append({
+            'Source': source,
+            'Stage': stage_name,
+            'Calls': value['calls'],
+            'Last (ms)': round(value['last_seconds'] * 1000, 1),
+            'Avg (ms)': round(value['seconds'] / value['calls'] * 1000, 1),
+            'Max (ms)': round(value['max_seconds'] * 1000, 1),
+            'KB': round(value['bytes'] / 1024, 1),
+            'Rows': value['rows'],
+            'Errors': value['errors'],
+        })
+    cache_rows = [{'Source': source, 'Cache': cache_name, 'Result': result, 'Count': count}
+                  for (source, cache_name, result), count in sorted(cache.items())]
+    return rows, cache_rows
+
+
+def recent():
+    with _lock:
+        return list(_recent)
+
+
+def _stage_order(stage_name):
+    return STAGES.index(stage_name) if stage_name in STAGES else len(STAGES)
+
+
+def _labels(**labels):
+    return '{' + ','.join(f'{key}="{value}"' for key, value in labels.items()) + '}'
+
+
+# This process's aggregates in the Prometheus text exposition format
+def prometheus_text():
+    with _lock:
+        totals = {key: dict(value) for key, value in _totals.items()}
+        cache = dict(_cache)
+    series = [
+        ('scraper_stage_calls_total', 'counter', 'Stage executions.', 'calls'),
+        ('scraper_stage_seconds_total', 'counter', 'Wall time spent in the stage (parse includes frame).', 'seconds'),
+        ('scraper_stage_last_seconds', 'gauge', 'Duration of the most recent execution.', 'last_seconds'),
+        ('scraper_stage_max_seconds', 'gauge', 'Slowest execution since the process started.', 'max_seconds'),
+        ('scraper_stage_bytes_total', 'counter', 'Bytes transferred (fetch) or read (parse).', 'bytes'),
+        ('scraper_stage_rows_total', 'counter', 'Rows produced by the stage.', 'rows'),
+        ('scraper_stage_errors_total', 'counter', 'Executions that raised.', 'errors'),
+    ]
+    lines = []
+    for metric, kind, help_text, field in series:
+        lines += [f'# HELP {metric} {help_text}', f'# TYPE {metric} {kind}']
+        for (source, stage_name), value in sorted(totals.items()):
+            lines.append(f'{metric}{_labels(process=PROCESS, source=source, stage=stage_name)} {value[field]}')
+    lines += ['# HELP scraper_cache_requests_total Cache lookups by result.', '# TYPE scraper_cache_requests_total counter']
+    for (source, cache_name, result), count in sorted(cache.items()):
+        lines.append(f'scraper_cache_requests_total{_labels(process=PROCESS, source=source, cache=cache_name, result=result)} {count}')
+    return '\n'.join(lines) + '\n'
+
+
+# Write <METRICS_DIR>/<process>.prom atomically (for a node_exporter textfile collector or a scrape job);
+# skipped when nothing was observed since the last export
+def export_prometheus(path=None):
+    path = path or os.path.join(METRICS_DIR, f'{PROCESS}.prom')
+    generation = _generation
+    if _exported.get(path) == generation:
+        return path
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(prometheus_text())
+        os.replace(tmp_path, path)
+        _exported[path] = generation
+    except OSError:
+        pass
+    return path
@@ -1,67 +1,105 @@
-import streamlit as st
-import requests
 import pandas as pd
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 
+import http_cache
+import metrics
+import parsing
+import records
+import store
+
+URL = 'https://online2.ogs.ny.gov/dnc/contractorConsultant/esb/esbConsultantOpsIndex.asp'
+BASE_URL = 'https://online2.ogs.ny.gov/dnc/contractorConsultant/esb/'
+
+REFRESH_INTERVAL = 30 * 60
+
+# Every opportunity table on the OGS page shares these attributes
+TABLE_ATTRS = {'bgcolor': '#FFFFFF', 'cellspacing': '0', 'border': '1', 'cellpadding': '0', 'width': '100%'}
+
+# Only those tables are built into the soup
+TABLE_STRAINER = SoupStrainer('table', attrs=TABLE_ATTRS)
+TABLE_CSS = 'table[bgcolor="#FFFFFF"][cellspacing="0"][border="1"][cellpadding="0"][width="100%"]'
+
+TABLE_NAMES = [
+    'Current Opportunities',
+    'Submission Under Review',
+    'Short-Listed',
+    'Selected - Award Pending',
+]
+
+def extract_table_data(table, title, base_url):
+    if table is None:
+        return pd.DataFrame([["No data found"]], columns=[title])
+
+    rows = table.find_all('tr')
+    if len(rows) > 2:
+        header = [th.get_text(strip=True) for th in rows[1].find_all('td')]
+        data = []
+        for row in rows[2:]:
+            cols = row.find_all('td')
+            if len(cols) == len(header):
+                row_data = [col.get_text(strip=True) for col in cols]
+                link_tag = cols[0].find('a')
+                if link_tag:
+                    row_data[0] = records.Link(row_data[0], base_url + link_tag['href'])  # Make the first column clickable
+                data.append(row_data)
+        if data:
+            with metrics.stage('frame', rows=len(data)):
+                return records.frame(data, header, dates=['Date'])
+    return pd.DataFrame([["No submissions at this time."]], columns=[title])
+
+# Parse the OGS page into its four named tables, yielding each as soon as it is built (no Streamlit calls)
+def iter_nys_general_services(html_content):
+    soup = parsing.make_soup(html_content, TABLE_STRAINER, TABLE_CSS)
+
+    table = soup.find('table', TABLE_ATTRS)
+    for table_name in TABLE_NAMES:
+        yield table_name, extract_table_data(table, table_name, BASE_URL)
+        if table is not None:
+            table = table.find_next('table', TABLE_ATTRS)
+
+def parse_nys_general_services(html_content):
+    return list(iter_nys_general_services(html_content))
+
+@parsing.memoize_by_content(TABLE_CSS)
+def parse_tables(html_content):
+    return parse_nys_general_services(html_content)
+
+# Opportunity store identity: the project link, which stays the same as a project moves between tables
+def row_key(table_name, row):
+    if list(row.index) == [table_name]:
+        return None  # "No data found" / "No submissions at this time." placeholder
+    return records.first_url(row, row.index[:1]) or store.content_key(row)
+
+def show_tables(snapshot):
+    import streamlit as st
+    import snapshot_view
+
+    for table_name, df in snapshot['tables']:
+        st.markdown(f"### {table_name}")
+        if not df.empty:
+            # One page at a time, as HTML with escape=False to keep the links clickable
+            snapshot_view.paged_table(snapshot, table_name, None, lambda: df)
+        else:
+            st.write("No data available.")
+
+# Scraping function for NYS General Services (no Streamlit calls; raises httpx.HTTPError)
 def scrape_nys_general_services():
-    url = 'https://online2.ogs.ny.gov/dnc/contractorConsultant/esb/esbConsultantOpsIndex.asp'
-    base_url = 'https://online2.ogs.ny.gov/dnc/contractorConsultant/esb/'
-
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        html_content = response.content
-        soup = BeautifulSoup(html_content, 'html.parser')
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching the webpage: {e}")
-        return
-
-    def extract_table_data(table, title, base_url):
-        if table is None:
-            return pd.DataFrame([["No data found"]], columns=[title])
-        
-        rows = table.find_all('tr')
-        if len(rows) > 2:
-            header = [th.get_text(strip=True) for th in rows[1].find_all('td')]
-            data = []
-            for row in rows[2:]:
-                cols = row.find_all('td')
-                if len(cols) == len(header):
-                    row_data = [col.get_text(strip=True) for col in cols]
-                    link_tag = cols[0].find('a')
-                    if link_tag:
-                        link_url = base_url + link_tag['href']
-                        row_data[0] = f'<a href="{link_url}" target="_blank">{row_data[0]}</a>'  # Make the first column clickable
-                    data.append(row_data)
-            if data:
-                return pd.DataFrame(data, columns=header)
-        return pd.DataFrame([["No submissions at this time."]], columns=[title])
-
-    tables = []
-    current_opportunities_table = soup.find('table', {'bgcolor': '#FFFFFF', 'cellspacing': '0', 'border': '1', 'cellpadding': '0', 'width': '100%'})
-    tables.append(('Current Opportunities', extract_table_data(current_opportunities_table, 'Current Opportunities', base_url)))
-
-    submission_under_review_table = current_opportunities_table.find_next('table', {'bgcolor': '#FFFFFF', 'cellspacing': '0', 'border': '1', 'cellpadding': '0', 'width': '100%'})
-    tables.append(('Submission Under Review', extract_table_data(submission_under_review_table, 'Submission Under Review', base_url)))
-
-    short_listed_table = submission_under_review_table.find_next('table', {'bgcolor': '#FFFFFF', 'cellspacing': '0', 'border': '1', 'cellpadding': '0', 'width': '100%'})
-    tables.append(('Short-Listed', extract_table_data(short_listed_table, 'Short-Listed', base_url)))
-
-    selected_award_pending_table = short_listed_table.find_next('table', {'bgcolor': '#FFFFFF', 'cellspacing': '0', 'border': '1', 'cellpadding': '0', 'width': '100%'})
-    tables.append(('Selected - Award Pending', extract_table_data(selected_award_pending_table, 'Selected - Award Pending', base_url)))
-
-    # Display tables in Streamlit
-    if tables:
-        for table_name, df in tables:
-            st.markdown(f"### {table_name}")
-            if not df.empty:
-                # Convert the DataFrame to HTML with escape=False to allow rendering of clickable links
-                st.markdown(df.to_html(escape=False, index=False), unsafe_allow_html=True)  # Render as raw HTML
-            else:
-                st.write("No data available.")
+    # Conditional GET: an unchanged page comes back as the previously parsed tables
+    return http_cache.get_parsed(URL, parse_tables)
+
+# Common fetch entry point used by the scheduler and background refreshes
+def fetch_tables():
+    return scrape_nys_general_services()
+
+# Streaming fetch for background refreshes: each table as it is parsed, so the page can show it early
+def stream_tables():
+    return http_cache.iter_parsed(URL, parse_tables, iter_nys_general_services)
 
 # Function to show the page
 def show_page():
+    import streamlit as st
+    import snapshot_view
+
     # Embedded hyperlink in the title
     title_html = """
     <h2><a href='https://online2.ogs.ny.gov/dnc/contractorConsultant/esb/esbConsultantOpsIndex.asp' 
@@ -69,8 +107,9 @@ def show_page():
     """
     st.markdown(title_html, unsafe_allow_html=True)
 
-    if st.button("Scrape NYS General Services"):
-        scrape_nys_general_services()
+    snapshot = snapshot_view.latest_snapshot('page2', "Scrape NYS General Services")
+    if snapshot:
+        show_tables(snapshot)
     
     if st.button("Back to Home"):
         st.session_state['page'] = 'main'
@@ -1,21 +1,43 @@
-import streamlit as st
-import requests
-import pandas as pd
-from bs4 import BeautifulSoup
-from datetime import datetime
+from bs4 import Comment, SoupStrainer, Tag
 
+import http_cache
+import metrics
+import parsing
+import records
+import store
 
-# Scraping function for NYS DOT Detailed Ads
-def scrape_nys_dot_detail_ads():
-    url = 'https://www.dot.ny.gov/doing-business/opportunities/eng-detailad'
-    try:
-        response = requests.get(url)
-        response.raise_for_status()  # Ensure the request was successful
-        html_content = response.content
-        soup = BeautifulSoup(html_content, 'html.parser')
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching the webpage: {e}")
-        return
+URL = 'https://www.dot.ny.gov/doing-business/opportunities/eng-detailad'
+
+REFRESH_INTERVAL = 30 * 60
+
+# Column the cross-source search index treats as the row's title
+TITLE_COLUMN = 'Description'
+
+# Ads listed more than this many days ago are skipped while parsing (0: keep all);
+# override with SCRAPER_PAGE3_WINDOW_DAYS
+DATE_WINDOW_DAYS = parsing.window_days('page3', 0)
+
+# Only the listing table is built into the soup
+TABLE_STRAINER = SoupStrainer('table', id='rg151682')
+TABLE_CSS = 'table#rg151682'
+
+
+# Description of an ad: the cell's text up to its list of documents, read straight off
+# the parsed nodes, nothing is re-serialized
+def cell_description(info_td):
+    parts = []
+    for node in info_td.children:
+        if isinstance(node, Tag):
+            if node.name == 'ul':
+                break
+            parts.append(node.get_text())
+        elif not isinstance(node, Comment):
+            parts.append(node)
+    return ''.join(parts).replace('\n', '').strip()
+
+# Parse the NYS DOT Detailed Ads page into a DataFrame (no Streamlit calls)
+def parse_nys_dot_detail_ads(html_content):
+    soup = parsing.make_soup(html_content, TABLE_STRAINER, TABLE_CSS)
 
     # Initialize lists to store scraped data
     dates = []
@@ -26,57 +48,66 @@ def scrape_nys_dot_detail_ads():
     main_table = soup.find('table', {'id': 'rg151682'})
     inner_tables = main_table.find_all('table', class_='bcbanregion1')
 
-    for inner_table in inner_tables:
-        rows = inner_table.find_all('tr')
-        for row in rows:
-            date_td = row.find('td', class_='bcgroup')
-            info_td = row.find('td', class_='bcbanregion2')
+    # Every listing row, in page order (not necessarily by date)
+    window = parsing.DateWindow(parsing.window_start(DATE_WINDOW_DAYS))
+    rows = (row for inner_table in inner_tables for row in inner_table.find_all('tr'))
+    for row in rows:
+        date_td = row.find('td', class_='bcgroup')
+        info_td = row.find('td', class_='bcbanregion2')
+        
+        if date_td and info_td:
+            date = date_td.get_text(strip=True)
+            listed = parsing.listing_date(date)
+            # Rows outside the window are dropped before any description work
+            if not window.admits(listed):
+                continue
+            # Change the date format to yyyy/mm/dd (unexpected formats are kept as they are)
+            if listed is not None:
+                date = listed.strftime('%Y/%m/%d')
+
+            # Extract the description and link
+            description = cell_description(info_td)
+
+            # Extract link
+            link_tag = info_td.find('a', target='_blank')
+            if link_tag:
+                link_href = link_tag['href']
+                full_link = 'https://www.dot.ny.gov' + link_href
+                link = records.Link(link_tag.get_text(strip=True), full_link)
+            else:
+                link = None
             
-            if date_td and info_td:
-                date = date_td.get_text(strip=True)
-                # Change the date format to yyyy/mm/dd
-                try:
-                    date_obj = datetime.strptime(date, '%m/%d/%Y')  # Adjust the format if needed
-                    date = date_obj.strftime('%Y/%m/%d')
-                except ValueError:
-                    pass  # Handle unexpected date formats
-                
-                # Extract the description and link
-                description_html = str(info_td)
-                description_start = description_html.find('&nbsp;') + 6
-                description_end = description_html.find('<ul>')
-                if description_end == -1:
-                    description_end = description_html.find('</td>')
-                description = description_html[description_start:description_end].strip()
-                description = description.replace('lass="bcbanregion2">', '').replace('\n', '').strip()
-                
-                # Extract link
-                link_tag = info_td.find('a', target='_blank')
-                if link_tag:
-                    link_href = link_tag['href']
-                    full_link = 'https://www.dot.ny.gov' + link_href
-                    link_text = link_tag.get_text(strip=True)
-                    link = f'<a href="{full_link}" target="_blank">{link_text}</a>'
-                else:
-                    link = None
-                
-                # Append data to lists
-                dates.append(date)
-                descriptions.append(description)
-                links.append(link)
+            # Append data to lists
+            dates.append(date)
+            descriptions.append(description)
+            links.append(link)
 
     # Create a DataFrame
-    df = pd.DataFrame({
-        'Date': dates,
-        'Description': descriptions,
-        'Link': links
-    })
+    with metrics.stage('frame', rows=len(dates)):
+        return records.frame(list(zip(dates, descriptions, links)), ['Date', 'Description', 'Link'], dates=['Date'])
+
+@parsing.memoize_by_content(TABLE_CSS, variant=lambda: parsing.window_start(DATE_WINDOW_DAYS))
+def parse_tables(html_content):
+    return [('NYS DOT Detailed Ads', parse_nys_dot_detail_ads(html_content))]
+
+# Opportunity store identity: the ad date plus a hash of its description
+def row_key(table_name, row):
+    return f"{row['Date']}|{store.text_key(row['Description'])}"
 
-    # Display the DataFrame in Streamlit with clickable links
-    st.markdown(df.to_html(escape=False, index=False), unsafe_allow_html=True)
+# Common fetch entry point used by the scheduler and background refreshes
+def fetch_tables():
+    # Conditional GET: an unchanged page comes back as the previously parsed table
+    return http_cache.get_parsed(URL, parse_tables)
+
+# Scraping function for NYS DOT Detailed Ads (no Streamlit calls; raises httpx.HTTPError)
+def scrape_nys_dot_detail_ads():
+    return fetch_tables()[0][1]
 
 # Function to show the page
 def show_page():
+    import streamlit as st
+    import snapshot_view
+
     # Embedded hyperlink in the title
     title_html = """
     <h2><a href='https://www.dot.ny.gov/doing-business/opportunities/eng-detailad' 
@@ -85,8 +116,11 @@ def show_page():
     st.markdown(title_html, unsafe_allow_html=True)
 
     # Scrape the data when the button is clicked
-    if st.button("Scrape NYS DOT Detailed Ads"):
-        scrape_nys_dot_detail_ads()
+    snapshot = snapshot_view.latest_snapshot('page3', "Scrape NYS DOT Detailed Ads")
+    if snapshot and snapshot['tables']:
+        df = snapshot['tables'][0][1]
+        # Display the DataFrame in Streamlit with clickable links, one page at a time
+        snapshot_view.paged_table(snapshot, 'table', None, lambda: df)
 
     # Back to Home button
     if st.button("Back to Home"):
@@ -1,21 +1,44 @@
-import streamlit as st
-import requests
 import pandas as pd
-from bs4 import BeautifulSoup
-from datetime import datetime
+from bs4 import Comment, SoupStrainer, Tag
 
+import http_cache
+import metrics
+import parsing
+import store
 
-# Scraping function for NYS DOT Designation
-def scrape_nys_dot_designation():
-    url = 'https://www.dot.ny.gov/doing-business/opportunities/eng-designation'
-    try:
-        response = requests.get(url)
-        response.raise_for_status()  # Ensure the request was successful
-        html_content = response.content
-        soup = BeautifulSoup(html_content, 'html.parser')
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching the webpage: {e}")
-        return
+URL = 'https://www.dot.ny.gov/doing-business/opportunities/eng-designation'
+
+REFRESH_INTERVAL = 30 * 60
+
+# Column the cross-source search index treats as the row's title
+TITLE_COLUMN = 'Description'
+
+# Designations older than this many days are skipped while parsing (0: keep all);
+# override with SCRAPER_PAGE4_WINDOW_DAYS
+DATE_WINDOW_DAYS = parsing.window_days('page4', 365)
+
+# Only the listing table is built into the soup
+TABLE_STRAINER = SoupStrainer('table', id='rg151694')
+TABLE_CSS = 'table#rg151694'
+
+
+# Text nodes under `node`, skipping <strong> (the designated firm's name)
+def _description_strings(node):
+    for child in node.children:
+        if isinstance(child, Tag):
+            if child.name != 'strong':
+                yield from _description_strings(child)
+        elif not isinstance(child, Comment):
+            yield child
+
+# Designation text of a cell: its stripped text pieces without the firm name, read straight
+# off the parsed nodes instead of re-parsing the serialized cell
+def cell_description(info_td):
+    return ''.join(text.strip() for text in _description_strings(info_td))
+
+# Parse the NYS DOT Designation page into a DataFrame (no Streamlit calls)
+def parse_nys_dot_designation(html_content):
+    soup = parsing.make_soup(html_content, TABLE_STRAINER, TABLE_CSS)
 
     # Initialize lists to store scraped data
     dates = []
@@ -25,46 +48,56 @@ def scrape_nys_dot_designation():
     main_table = soup.find('table', {'id': 'rg151694'})
     inner_tables = main_table.find_all('table', class_='bcbanregion1')
 
-    for inner_table in inner_tables:
-        rows = inner_table.find_all('tr')
-        for row in rows:
-            date_td = row.find('td', class_='bcgroup', valign='top')
-            info_td = row.find('td', class_='bcbanregion2')
-            
-            if date_td and info_td:
-                date = date_td.get_text(strip=True)
-                
-                if '2024' in date:
-                    description_html = str(info_td)
-                    description_start = description_html.find('<br>') + 4
-                    description_end = description_html.find('</td>')
-                    description = description_html[description_start:description_end].strip()
-                    
-                    soup_desc = BeautifulSoup(description, 'html.parser')
-                    for strong_tag in soup_desc.find_all('strong'):
-                        strong_tag.decompose()  # Remove <strong> tags
-                    
-                    description = soup_desc.get_text(strip=True)
-                    description = description.replace('class="bcbanregion2">', '').strip()
-                    
-                    dates.append(date)
-                    descriptions.append(description)
+    # Every listing row, in page order (not necessarily by date)
+    window = parsing.DateWindow(parsing.window_start(DATE_WINDOW_DAYS))
+    rows = (row for inner_table in inner_tables for row in inner_table.find_all('tr'))
+    for row in rows:
+        date_td = row.find('td', class_='bcgroup', valign='top')
+        info_td = row.find('td', class_='bcbanregion2')
+        
+        if date_td and info_td:
+            date = date_td.get_text(strip=True)
+            # Rows outside the window are dropped before any description work
+            if not window.admits(parsing.listing_date(date)):
+                continue
+
+            description = cell_description(info_td)
+            dates.append(date)
+            descriptions.append(description)
 
     # Create a DataFrame
-    df = pd.DataFrame({
-        'Date': dates,
-        'Description': descriptions
-    })
+    with metrics.stage('frame', rows=len(dates)):
+        df = pd.DataFrame({
+            'Date': pd.to_datetime(dates, format='%m/%d/%Y', errors='coerce'),
+            'Description': descriptions
+        })
+
+        # Sort the DataFrame by date
+        df.sort_values(by='Date', ascending=False, inplace=True)
+    return df
+
+@parsing.memoize_by_content(TABLE_CSS, variant=lambda: parsing.window_start(DATE_WINDOW_DAYS))
+def parse_tables(html_content):
+    return [('NYS DOT Designation', parse_nys_dot_designation(html_content))]
 
-    # Sort the DataFrame by date
-    df['Date'] = pd.to_datetime(df['Date'])
-    df.sort_values(by='Date', ascending=False, inplace=True)
+# Opportunity store identity: the ad date plus a hash of its description
+def row_key(table_name, row):
+    return f"{row['Date']}|{store.text_key(row['Description'])}"
 
-    # Display the DataFrame in Streamlit
-    st.markdown(df.to_html(escape=False, index=False), unsafe_allow_html=True)
+# Common fetch entry point used by the scheduler and background refreshes
+def fetch_tables():
+    # Conditional GET: an unchanged page comes back as the previously parsed table
+    return http_cache.get_parsed(URL, parse_tables)
+
+# Scraping function for NYS DOT Designation (no Streamlit calls; raises httpx.HTTPError)
+def scrape_nys_dot_designation():
+    return fetch_tables()[0][1]
 
 # Function to show the page
 def show_page():
+    import streamlit as st
+    import snapshot_view
+
     # Embedded hyperlink in the title
     title_html = """
     <h2><a href='https://www.dot.ny.gov/doing-business/opportunities/eng-designation' 
@@ -72,8 +105,11 @@ def show_page():
     """
     st.markdown(title_html, unsafe_allow_html=True)
 
-    if st.button("Scrape NYS DOT Designation"):
-        scrape_nys_dot_designation()
+    snapshot = snapshot_view.latest_snapshot('page4', "Scrape NYS DOT Designation")
+    if snapshot and snapshot['tables']:
+        df = snapshot['tables'][0][1]
+        # Display the DataFrame in Streamlit, one page at a time
+        snapshot_view.paged_table(snapshot, 'table', None, lambda: df)
     
     if st.button("Back to Home"):
         st.session_state['page'] = 'main'
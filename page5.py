@@ -1,107 +1,129 @@
-import streamlit as st
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from urllib.parse import urljoin
 
-API_KEY = st.secrets["SCRAPER_API_KEY"]
+import metrics
+import parsing
+import records
+import scraperapi
+import search
+import store
+
+USES_SCRAPERAPI = True
+
+URL = 'https://panynj.gov/port-authority/en/business-opportunities/solicitations-advertisements/Construction.html'
+
+REFRESH_INTERVAL = 60 * 60
+
+TABLE_NAMES = [
+    "Solicitations/Advertisements",
+    "Catalog of Upcoming Procurements at John F. Kennedy (JFK) International Airport",
+    "RTQ (Request to Qualify)",
+    "VVP (Verification and Validation Process)",
+    "Others"
+]
+
+# Only the table containers are built into the rendered page's soup
+CONTAINER_STRAINER = SoupStrainer('div', attrs={'class': 'Text med black'})
+CONTAINER_CSS = 'div.Text.med.black'
+
+# Parse the rendered Port Authority Construction page into its named tables, yielding each as soon
+# as it is built (no Streamlit calls)
+def iter_table_port_authority(html_content):
+    soup = parsing.make_soup(html_content, CONTAINER_STRAINER, CONTAINER_CSS)
+
+    # Locate all table elements
+    table_containers = soup.find_all('div', {'class': 'Text med black'})
+
+    table_counter = 0
+
+    for container in table_containers:
+        tables = container.find_all('table')
+        for table in tables:
+            if table is None or table_counter >= len(TABLE_NAMES):
+                continue
+
+            headers = ['Full Description']
+            for th in table.find_all('th'):
+                headers.append(th.get_text(strip=True))
+
+            rows = []
+            base_url = 'https://panynj.gov'
+            for tr in table.find_all('tr')[1:]:  # Skip the header row
+                cells = []
+                full_description = ''
+                for idx, td in enumerate(tr.find_all('td')):
+                    if td.find('a'):
+                        texts, hrefs = [], []
+                        for a in td.find_all('a'):
+                            href = a['href']
+                            if not href.startswith('http'):
+                                href = urljoin(base_url, href)
+                            texts.append(a.get_text(strip=True))
+                            hrefs.append(href)
+                        cells.append(records.links(texts, hrefs))
+                    else:
+                        cells.append(td.get_text(strip=True))
+
+                    if idx == 2:
+                        first_paragraph = td.find('p')
+                        if first_paragraph and first_paragraph.contents:
+                            full_description = str(first_paragraph.contents[0]).strip()
+
+                cells.insert(0, full_description)  # Insert the full description at the beginning
+                rows.append(cells)
+
+            with metrics.stage('frame', rows=len(rows)):
+                df = records.frame(rows, headers, dates=['Due Date'])
+            yield TABLE_NAMES[table_counter], df
+            table_counter += 1
+
+def parse_table_port_authority(html_content):
+    return list(iter_table_port_authority(html_content))
+
+@parsing.memoize_by_content(CONTAINER_CSS)
+def parse_tables(html_content):
+    return parse_table_port_authority(html_content)
+
+# Opportunity store identity: the solicitation's document link, else the row's content
+def row_key(table_name, row):
+    return records.first_url(row) or store.content_key(row)
 
 # Scraping function for Port Authority Construction Opportunities using ScraperAPI
+# (no Streamlit calls; raises httpx.HTTPError)
 def fetch_table_port_authority():
-    url = 'https://panynj.gov/port-authority/en/business-opportunities/solicitations-advertisements/Construction.html'
-    api_url = f'http://api.scraperapi.com?api_key={API_KEY}&url={url}&render=true'
-    
-    response = requests.get(api_url)
-    
-    if response.status_code == 200:
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Locate all table elements
-        table_containers = soup.find_all('div', {'class': 'Text med black'})
-
-        table_names = [
-            "Solicitations/Advertisements",
-            "Catalog of Upcoming Procurements at John F. Kennedy (JFK) International Airport",
-            "RTQ (Request to Qualify)",
-            "VVP (Verification and Validation Process)",
-            "Others"
-        ]
-
-        all_tables = []
-        table_counter = 0
-
-        for container in table_containers:
-            tables = container.find_all('table')
-            for table in tables:
-                if table is None or table_counter >= len(table_names):
-                    continue
-
-                headers = ['Full Description']
-                for th in table.find_all('th'):
-                    headers.append(th.get_text(strip=True))
-
-                rows = []
-                base_url = 'https://panynj.gov'
-                for tr in table.find_all('tr')[1:]:  # Skip the header row
-                    cells = []
-                    full_description = ''
-                    for idx, td in enumerate(tr.find_all('td')):
-                        cell_content = []
-                        if td.find('a'):
-                            for a in td.find_all('a'):
-                                href = a['href']
-                                if not href.startswith('http'):
-                                    href = urljoin(base_url, href)
-                                cell_content.append(f'<a href="{href}" target="_blank">{a.get_text(strip=True)}</a>')
-                            cells.append("<br>".join(cell_content))
-                        else:
-                            cells.append(td.get_text(strip=True))
-
-                        if idx == 2:
-                            first_paragraph = td.find('p')
-                            if first_paragraph and first_paragraph.contents:
-                                full_description = str(first_paragraph.contents[0]).strip()
-
-                    cells.insert(0, full_description)  # Insert the full description at the beginning
-                    rows.append(cells)
-
-                df = pd.DataFrame(rows, columns=headers)
-                all_tables.append((table_names[table_counter], df))
-                table_counter += 1
-
-        return all_tables
-    else:
-        st.error(f"Failed to scrape the page. Status code: {response.status_code}")
-        return []
+    # Rendered pages are cached for scraperapi.CACHE_TTL, so repeat clicks cost no credits
+    html_content = scraperapi.fetch(URL)
+    # Through the content-hash memo, so an unchanged render is not parsed again
+    return parse_tables(html_content)
+
+# Common fetch entry point used by the scheduler and background refreshes
+def fetch_tables():
+    return fetch_table_port_authority()
+
+# Streaming fetch for background refreshes: each table as it is parsed, so the page can show it early
+def stream_tables():
+    return parsing.stream(parse_tables, iter_table_port_authority, scraperapi.fetch(URL))
 
 # Function to show the page in Streamlit
 def show_page():
+    import streamlit as st
+    import snapshot_view
+
     title_html = """
     <h2><a href='https://panynj.gov/port-authority/en/business-opportunities/solicitations-advertisements/Construction.html' 
     target='_blank'>Port Authority Construction Opportunities</a></h2>
     """
     st.markdown(title_html, unsafe_allow_html=True)
 
-    if st.button("Scrape Port Authority Construction Opportunities"):
-        all_tables = fetch_table_port_authority()
-        st.session_state["scraped_tables"] = all_tables
-        st.success("Scraping completed! Start typing to filter the tables.")
-
-    if "scraped_tables" in st.session_state:
-        all_tables = st.session_state["scraped_tables"]
+    snapshot = snapshot_view.latest_snapshot('page5', "Scrape Port Authority Construction Opportunities")
 
+    if snapshot is not None:
         # Text input for keyword filter (Dynamic filtering)
-        filter_keyword = st.text_input("Filter for relevant keywords:", "")
+        filter_keyword, match_all = snapshot_view.keyword_filter("Filter for relevant keywords:")
 
-        for table_name, df in all_tables:
+        for (table_name, df), search_column in zip(snapshot['tables'], snapshot['search']):
             st.markdown(f"### {table_name}")
 
-            # Apply the filter as the user types
-            if filter_keyword:
-                df_filtered = df[df.apply(lambda row: row.astype(str).str.contains(filter_keyword, case=False).any(), axis=1)]
-            else:
-                df_filtered = df
-
             # Custom CSS for table styling
             st.markdown("""
                 <style>
@@ -137,9 +159,10 @@ def show_page():
                 </style>
             """, unsafe_allow_html=True)
 
-            # Display the filtered table dynamically
-            table_html = df_filtered.to_html(index=False, escape=False, classes='styled-table')
-            st.markdown(table_html, unsafe_allow_html=True)
+            # Display the filtered table one page at a time; reruns with the same keyword reuse the HTML
+            snapshot_view.paged_table(snapshot, table_name, (filter_keyword, match_all),
+                                      lambda: search.filter_rows(df, search_column, filter_keyword, match_all),
+                                      classes='styled-table')
 
     if st.button("Back to Home"):
         st.session_state['page'] = 'main'
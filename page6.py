@@ -1,60 +1,82 @@
-import streamlit as st
-import requests
-import pandas as pd
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from urllib.parse import urljoin
 
-# Retrieve the ScraperAPI Key from Streamlit secrets
-API_KEY = st.secrets["SCRAPER_API_KEY"]
+import metrics
+import parsing
+import records
+import scraperapi
+import search
+import store
+
+USES_SCRAPERAPI = True
+
+URL = 'https://panynj.gov/port-authority/en/business-opportunities/solicitations-advertisements/professional-services.html'
+
+REFRESH_INTERVAL = 60 * 60
+
+# Only tables are built into the rendered page's soup
+TABLE_STRAINER = SoupStrainer('table')
+TABLE_CSS = 'table'
+
+# Parse the rendered Professional Services page into a DataFrame (no Streamlit calls)
+def parse_port_authority_professional_services(html_content):
+    soup = parsing.make_soup(html_content, TABLE_STRAINER, TABLE_CSS)
+
+    # Find the first table in the webpage
+    table = soup.find('table')
+    if not table:
+        return None
+
+    # Ensure all links are absolute by converting relative URLs
+    for a in table.find_all('a', href=True):
+        a['href'] = urljoin(URL, a['href'])
+
+    # Extract table headers and rows for DataFrame
+    headers = [th.get_text(strip=True) for th in table.find_all('th')]
+    rows = []
+    for tr in table.find_all('tr')[1:]:
+        cells = [
+            td.get_text(strip=True) if not td.find('a') 
+            else records.Link(td.get_text(strip=True), td.find("a")["href"])
+            for td in tr.find_all('td')
+        ]
+        rows.append(cells)
+
+    # Create DataFrame
+    with metrics.stage('frame', rows=len(rows)):
+        return records.frame(rows, headers, dates=['Due Date'])
+
+@parsing.memoize_by_content(TABLE_CSS)
+def parse_tables(html_content):
+    df = parse_port_authority_professional_services(html_content)
+    if df is None:
+        return []
+    return [('Port Authority Professional Services', df)]
+
+# Opportunity store identity: the solicitation's document link, else the row's content
+def row_key(table_name, row):
+    return records.first_url(row) or store.content_key(row)
 
 # Scraping function for Port Authority Professional Services using ScraperAPI (Synchronous)
+# (no Streamlit calls; raises httpx.HTTPError, or ValueError when the page has no table)
 def scrape_port_authority_professional_services():
-    url = 'https://panynj.gov/port-authority/en/business-opportunities/solicitations-advertisements/professional-services.html'
-    
-    # Use ScraperAPI to get the fully rendered HTML of the page
-    api_url = f'http://api.scraperapi.com?api_key={API_KEY}&url={url}&render=true'
-    
-    try:
-        response = requests.get(api_url)
-        
-        if response.status_code == 200:
-            html_content = response.text
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Find the first table in the webpage
-            table = soup.find('table')
-            if not table:
-                st.error("No table found on the page.")
-                return None
-
-            # Ensure all links are absolute by converting relative URLs
-            for a in table.find_all('a', href=True):
-                a['href'] = urljoin(url, a['href'])
-
-            # Extract table headers and rows for DataFrame
-            headers = [th.get_text(strip=True) for th in table.find_all('th')]
-            rows = []
-            for tr in table.find_all('tr')[1:]:
-                cells = [
-                    td.get_text(strip=True) if not td.find('a') 
-                    else f'<a href="{td.find("a")["href"]}" target="_blank">{td.get_text(strip=True)}</a>'
-                    for td in tr.find_all('td')
-                ]
-                rows.append(cells)
-
-            # Create DataFrame
-            df = pd.DataFrame(rows, columns=headers)
-            return df
-        else:
-            st.error(f"Failed to scrape the page. Status code: {response.status_code}")
-            return None
-
-    except Exception as e:
-        st.error(f"An error occurred: {e}")
-        return None
+    # Use ScraperAPI (through its TTL cache) to get the fully rendered HTML of the page
+    html_content = scraperapi.fetch(URL)
+    # Through the content-hash memo, so an unchanged render is not parsed again
+    tables = parse_tables(html_content)
+    if not tables:
+        raise ValueError("No table found on the page.")
+    return tables[0][1]
+
+# Common fetch entry point used by the scheduler and background refreshes
+def fetch_tables():
+    return [('Port Authority Professional Services', scrape_port_authority_professional_services())]
 
 # Function to show the page in Streamlit
 def show_page():
+    import streamlit as st
+    import snapshot_view
+
     # Embedded hyperlink in the title
     title_html = """
     <h2><a href='https://panynj.gov/port-authority/en/business-opportunities/solicitations-advertisements/professional-services.html' 
@@ -62,25 +84,14 @@ def show_page():
     """
     st.markdown(title_html, unsafe_allow_html=True)
 
-    # Scrape the data when the button is clicked
-    if st.button("Scrape Port Authority Professional Services"):
-        df = scrape_port_authority_professional_services()  # Synchronous scraping call
-        if df is not None:
-            st.session_state["scraped_table"] = df  # Store the scraped table in session state
-            st.success("Scraping completed! Now you can filter the table.")
+    snapshot = snapshot_view.latest_snapshot('page6', "Scrape Port Authority Professional Services")
 
-    # Check if data is available in session state
-    if "scraped_table" in st.session_state:
-        df = st.session_state["scraped_table"]
+    if snapshot and snapshot['tables']:
+        df = snapshot['tables'][0][1]
+        search_column = snapshot['search'][0]
 
         # Text input for keyword filter
-        filter_keyword = st.text_input("Filter for relevant keywords:", "")
-
-        # Filter the DataFrame based on the keyword input
-        if filter_keyword:
-            df_filtered = df[df.apply(lambda row: row.astype(str).str.contains(filter_keyword, case=False).any(), axis=1)]
-        else:
-            df_filtered = df
+        filter_keyword, match_all = snapshot_view.keyword_filter("Filter for relevant keywords:")
 
         # Add CSS to make the table full-width and aligned to the left
         st.markdown("""
@@ -116,8 +127,11 @@ def show_page():
             </style>
         """, unsafe_allow_html=True)
 
-        # Display the filtered table in Streamlit with full-width and aligned left
-        st.markdown(df_filtered.to_html(escape=False, index=False, classes='full-width-table'), unsafe_allow_html=True)
+        # Display the filtered table in Streamlit with full-width and aligned left, one page at a time;
+        # reruns with the same keyword reuse the HTML
+        snapshot_view.paged_table(snapshot, 'table', (filter_keyword, match_all),
+                                  lambda: search.filter_rows(df, search_column, filter_keyword, match_all),
+                                  classes='full-width-table')
 
     # Back to Home button
     if st.button("Back to Home"):
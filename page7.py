@@ -1,45 +1,121 @@
-import streamlit as st
-import pandas as pd
-from bs4 import BeautifulSoup
-import requests
+import asyncio
+import logging
+from bs4 import SoupStrainer
 
-# Retrieve the ScraperAPI Key from Streamlit secrets
-API_KEY = st.secrets["SCRAPER_API_KEY"]
+import fetcher
+import metrics
+import parsing
+import records
+import scraperapi
+import search
 
-# Scraping function using ScraperAPI for PASSPort Construction Opportunities
-def fetch_passport_data_scraperapi(max_pages=6):
-    url = 'https://passport.cityofnewyork.us/page.aspx/en/rfp/request_browse_public'
-    api_url = f'http://api.scraperapi.com?api_key={API_KEY}&url={url}&render=true'
+USES_SCRAPERAPI = True
 
-    all_data = []
+URL = 'https://passport.cityofnewyork.us/page.aspx/en/rfp/request_browse_public'
+
+REFRESH_INTERVAL = 60 * 60
+
+# Assumed, not confirmed against a live multi-page grid: later pages are requested with their
+# index as this query argument (page 1 is the bare URL). PASSPort may page through postbacks
+# instead; then page 2 repeats page 1 and the scrape is reported as partial (see afetch_passport_pages).
+PAGE_PARAM = 'page'
+MAX_PAGES = 6
+# Pages rendered at once after page 2; bounds the renders wasted past the last page
+PAGE_CONCURRENCY = 3
+
+log = logging.getLogger('page7')
+
+# Column the cross-source search index treats as the row's title
+TITLE_COLUMN = 'Procurement Name'
+
+# Few distinct values: stored as categoricals
+CATEGORY_COLUMNS = ['Agency', 'RFx Status', 'Industry', 'Main Commodity']
+DATE_COLUMNS = ['Release Date (Your Local Time)', 'Due Date (Your Local Time)']
+
+# Only the results grid is built into the rendered page's soup
+GRID_STRAINER = SoupStrainer('table', class_='iv-grid-view')
+GRID_CSS = 'table.iv-grid-view'
+
+
+def page_url(page_number):
+    if page_number == 1:
+        return URL
+    return f'{URL}?{PAGE_PARAM}={page_number}'
+
+# Parse one rendered grid page into (titles, page_data, row_ids)
+@parsing.memoize_by_content(GRID_CSS)
+def parse_page(html_content):
+    soup = parsing.make_soup(html_content, GRID_STRAINER, GRID_CSS)
+    return parse_table(soup)
+
+# Page through the grid concurrently, de-duplicating rows on data-id.
+# Stops at the first page that adds no new rows (past the end, or a repeated page).
+# Pages 1 and 2 are rendered alone: if the grid ignores PAGE_PARAM, page 2 repeats page 1
+# and the scrape ends there instead of paying for a whole window of repeated pages. That
+# repeat is reported in `errors`, as the rows past page 1 were never read.
+async def afetch_passport_pages(client, max_pages=MAX_PAGES, concurrency=PAGE_CONCURRENCY):
     titles = None
+    rows = {}  # data-id -> row cells, in first-seen order
+    errors = []
 
     page_number = 1
     while page_number <= max_pages:
-        response = requests.get(api_url)
-        if response.status_code != 200:
-            st.error(f"Failed to fetch page {page_number}.")
-            break
-        html_content = response.text
+        # Page 1 alone first (a single-page grid costs one render), then page 2 alone as a probe
+        window = 1 if page_number <= 2 else concurrency
+        batch = list(range(page_number, min(page_number + window, max_pages + 1)))
+        pages = await asyncio.gather(
+            *(scraperapi.afetch(client, page_url(n)) for n in batch),
+            return_exceptions=True,
+        )
 
-        # Parse the HTML content using BeautifulSoup
-        soup = BeautifulSoup(html_content, 'html.parser')
-        page_titles, page_data = parse_table(soup)
+        for n, html_content in zip(batch, pages):
+            if isinstance(html_content, Exception):
+                errors.append(f"Failed to fetch page {n}: {html_content}")
+                return titles, rows, errors
 
-        if page_data:
+            page_titles, page_data, row_ids = await asyncio.to_thread(parse_page, html_content)
+            new_rows = [(row_id, row) for row_id, row in zip(row_ids or [], page_data or []) if row_id not in rows]
+            if not new_rows:
+                if n == 2 and row_ids and set(row_ids) == set(rows):
+                    errors.append(f"Page 2 repeated page 1 (the grid may not take '{PAGE_PARAM}' as its "
+                                  f"page index), so only page 1 was read")
+                return titles, rows, errors
             if not titles:
                 titles = page_titles
-            all_data.extend(page_data)
-            page_number += 1
-        else:
-            break
+            rows.update(new_rows)
 
-    # Convert data to a pandas DataFrame
-    if titles and all_data:
-        df = pd.DataFrame(all_data, columns=titles)
+        page_number += len(batch)
+    return titles, rows, errors
+
+# Turn de-duplicated rows into the PASSPort DataFrame. A failure past page 1 keeps the pages
+# already read; the error is logged and travels with the table (df.attrs['errors']) into its snapshot.
+def build_dataframe(titles, rows, errors):
+    if errors and not rows:
+        raise RuntimeError(errors[0])
+    if titles and rows:
+        with metrics.stage('frame', rows=len(rows)):
+            df = records.frame(list(rows.values()), titles, index=list(rows),
+                               categories=CATEGORY_COLUMNS, dates=DATE_COLUMNS)
+        for error in errors:
+            log.warning('partial PASSPort scrape (%d rows kept): %s', len(rows), error)
+        df.attrs['errors'] = errors
         return df
     return None
 
+# Scraping function using ScraperAPI for PASSPort Construction Opportunities (no Streamlit calls)
+def fetch_passport_data_scraperapi(max_pages=MAX_PAGES):
+    async def run():
+        async with fetcher.async_client() as client:
+            return await afetch_passport_pages(client, max_pages)
+
+    # Convert data to a pandas DataFrame
+    return build_dataframe(*asyncio.run(run()))
+
+# Common fetch entry point used by the scheduler and background refreshes
+def fetch_tables():
+    df = fetch_passport_data_scraperapi()
+    return [] if df is None else [('PASSPort Opportunities', df)]
+
 # HTML parser function using BeautifulSoup
 def parse_table(soup):
     table = soup.find("table", class_="iv-grid-view")
@@ -49,6 +125,7 @@ def parse_table(soup):
         titles = [header.text.strip() for header in headers]
         rows = table.find_all('tr', {'data-id': True})  # Get rows with data-id attribute
         page_data = []
+        row_ids = []
         for row in rows:
             data = row.find_all('td')
             row_data = []
@@ -57,17 +134,78 @@ def parse_table(soup):
                 if i == 3 and 'onclick' in str(td):
                     link = td.find('button')['onclick'].split("'")[1]
                     full_link = f"https://passport.cityofnewyork.us{link}"
-                    # Embed the link in the Procurement Name text as a clickable link
-                    row_data.append(f'<a href="{full_link}" target="_blank">{td.text.strip()}</a>')
+                    # Keep the link with the Procurement Name text
+                    row_data.append(records.Link(td.text.strip(), full_link))
                 else:
                     row_data.append(td.text.strip().replace('Edit', '').strip())
             page_data.append(row_data)
-        return titles, page_data
+            row_ids.append(row['data-id'])
+        return titles, page_data, row_ids
     else:
-        return None, None
+        return None, None, None
+
+# Common parser entry point for a single grid page
+def parse_tables(html_content):
+    titles, page_data, row_ids = parse_page(html_content)
+    if not titles or not page_data:
+        return []
+    with metrics.stage('frame', rows=len(page_data)):
+        return [('PASSPort Opportunities', records.frame(page_data, titles, index=row_ids,
+                                                        categories=CATEGORY_COLUMNS, dates=DATE_COLUMNS))]
+
+# Opportunity store identity: the grid row's data-id, kept as the DataFrame index
+def row_key(table_name, row):
+    return row.name
+
+# Paginated fetch used by the "Scrape all" mode
+async def afetch_tables(client):
+    df = build_dataframe(*await afetch_passport_pages(client))
+    return [] if df is None else [('PASSPort Opportunities', df)]
+
+# Columns hidden from the table
+COLUMNS_TO_DROP = ["EPIN", "Release Date (Your Local Time)", "Remaining time", "Main Commodity"]
+
+# Industries kept in the table
+INDUSTRIES_TO_KEEP = [
+    'Construction', 
+    'Professional Services', 
+    'Professional Services - Construction Related', 
+    'Professional Services - Architecture/Engineering', 
+    'Standard Services', 
+    'Standard Services - Construction Related'
+]
+
+# Apply the fixed and user-selected filters
+def filtered_rows(scraped_data, search_column, selected_industry, keyword_filter, match_all):
+    # Remove unwanted columns
+    filtered_data = scraped_data.drop(columns=COLUMNS_TO_DROP, errors='ignore')
+    
+    # Filter by 'RFx Status' containing 'Released'
+    if 'RFx Status' in filtered_data.columns:
+        filtered_data = filtered_data[filtered_data['RFx Status'].str.contains('Released', case=False)]
+    
+    # Filter to keep only specified industries
+    if 'Industry' in filtered_data.columns:
+        filtered_data = filtered_data[filtered_data['Industry'].isin(INDUSTRIES_TO_KEEP)]
+
+    # Apply Industry filter if selected
+    if selected_industry != "All" and 'Industry' in filtered_data:
+        filtered_data = filtered_data[filtered_data['Industry'] == selected_industry]
+    
+    # Apply keyword search filter (case-insensitive, against the precomputed search column)
+    if keyword_filter:
+        keyword_mask = search.matches(search_column, keyword_filter, match_all)
+        filtered_data = filtered_data[keyword_mask.loc[filtered_data.index].to_numpy()]
+    
+    # Add serial numbers after filtering to avoid gaps
+    filtered_data.insert(0, 'Serial Number', range(1, len(filtered_data) + 1))
+    return filtered_data
 
 # Function to show the page in Streamlit
 def show_page():
+    import streamlit as st
+    import snapshot_view
+
     # Embed the website link in the title
     st.markdown(
         """
@@ -80,60 +218,21 @@ def show_page():
         unsafe_allow_html=True
     )
 
-    # Initialize session state for persistent data
-    if 'scraped_data' not in st.session_state:
-        st.session_state.scraped_data = None
-
-    # Button to trigger scraping
-    if st.button("Scrape NYC PASSPort"):
-        st.session_state.scraped_data = fetch_passport_data_scraperapi()
-        if st.session_state.scraped_data is not None:
-            st.success("Data scraped successfully!")
+    snapshot = snapshot_view.latest_snapshot('page7', "Scrape NYC PASSPort")
+    scraped_data = snapshot['tables'][0][1] if snapshot and snapshot['tables'] else None
 
     # If data is scraped, display filters and the table
-    if st.session_state.scraped_data is not None:
-        # Remove unwanted columns
-        columns_to_drop = ["EPIN", "Release Date (Your Local Time)", "Remaining time", "Main Commodity"]
-        filtered_data = st.session_state.scraped_data.drop(columns=columns_to_drop, errors='ignore')
-        
-        # Filter by 'RFx Status' containing 'Released'
-        if 'RFx Status' in filtered_data.columns:
-            filtered_data = filtered_data[filtered_data['RFx Status'].str.contains('Released', case=False)]
-        
-        # Filter to keep only specified industries
-        industries_to_keep = [
-            'Construction', 
-            'Professional Services', 
-            'Professional Services - Construction Related', 
-            'Professional Services - Architecture/Engineering', 
-            'Standard Services', 
-            'Standard Services - Construction Related'
-        ]
-        
-        if 'Industry' in filtered_data.columns:
-            filtered_data = filtered_data[filtered_data['Industry'].isin(industries_to_keep)]
-        
+    if scraped_data is not None:
         # Industry dropdown filter
         selected_industry = st.selectbox(
             "Filter by Industry",
-            options=["All"] + industries_to_keep,
+            options=["All"] + INDUSTRIES_TO_KEEP,
             index=0
         )
 
         # Keyword text filter
-        keyword_filter = st.text_input("Search by Keyword", "")
-
-        # Apply Industry filter if selected
-        if selected_industry != "All" and 'Industry' in filtered_data:
-            filtered_data = filtered_data[filtered_data['Industry'] == selected_industry]
-        
-        # Apply keyword search filter (case-insensitive)
-        if keyword_filter:
-            filtered_data = filtered_data[filtered_data.apply(lambda row: row.astype(str).str.contains(keyword_filter, case=False).any(), axis=1)]
-        
-        # Add serial numbers after filtering to avoid gaps
-        filtered_data.insert(0, 'Serial Number', range(1, len(filtered_data) + 1))
-        
+        keyword_filter, match_all = snapshot_view.keyword_filter("Search by Keyword")
+
         # Add CSS to style the table
         st.markdown("""
             <style>
@@ -168,8 +267,13 @@ def show_page():
             </style>
         """, unsafe_allow_html=True)
 
-        # Display the dataframe in wide mode, with serial numbers and clickable links
-        st.markdown(filtered_data.to_html(escape=False, index=False, classes='full-width-table'), unsafe_allow_html=True)
+        # Display the dataframe in wide mode, with serial numbers and clickable links, one page at a time;
+        # reruns with the same filters reuse the HTML
+        search_column = snapshot['search'][0]
+        snapshot_view.paged_table(
+            snapshot, 'table', (selected_industry, keyword_filter, match_all),
+            lambda: filtered_rows(scraped_data, search_column, selected_industry, keyword_filter, match_all),
+            classes='full-width-table')
 
         # Add "Back to Home" button
         if st.button("Back to Home"):
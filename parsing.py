@@ -0,0 +1,206 @@
+import collections
+import contextlib
+import datetime
+import functools
+import hashlib
+import importlib.util
+import os
+import threading
+import time
+from bs4 import BeautifulSoup
+
+import metrics
+
+# Pluggable HTML parser layer. Every scraper builds its soup here from only the
+# subtree it needs: a SoupStrainer for BeautifulSoup backends, or a CSS selector
+# that selectolax uses to cut the target fragment out before BeautifulSoup sees it.
+BACKENDS = ('selectolax', 'lxml', 'html.parser')
+
+
+def available(backend):
+    if backend == 'html.parser':
+        return True
+    return importlib.util.find_spec(backend) is not None
+
+
+# Fastest installed backend, unless SCRAPER_PARSER pins one
+def default_backend():
+    requested = os.environ.get('SCRAPER_PARSER')
+    if requested in BACKENDS and available(requested):
+        return requested
+    return next(backend for backend in BACKENDS if available(backend))
+
+
+BACKEND = default_backend()
+STRAIN = True
+
+
+# Temporarily switch backend and/or subtree straining (used by the timing comparison)
+@contextlib.contextmanager
+def use_backend(backend, strain=True):
+    global BACKEND, STRAIN
+    previous = BACKEND, STRAIN
+    BACKEND, STRAIN = backend, strain
+    try:
+        yield
+    finally:
+        BACKEND, STRAIN = previous
+
+
+# BeautifulSoup backend used for the fragment selectolax hands over
+def _tree_builder():
+    return 'lxml' if available('lxml') else 'html.parser'
+
+
+# Outer HTML of the top-most nodes matching `css` (nested matches are already inside their parent)
+def _select_fragment(html_content, css):
+    from selectolax.lexbor import LexborHTMLParser
+
+    nodes = LexborHTMLParser(html_content).css(css)
+    matched = {node.mem_id for node in nodes}
+    fragments = []
+    for node in nodes:
+        parent = node.parent
+        while parent is not None and parent.mem_id not in matched:
+            parent = parent.parent
+        if parent is None:
+            fragments.append(node.html)
+    return ''.join(fragments)
+
+
+# Parse `html_content`, keeping only what `parse_only` / `css` describe when straining is on
+def make_soup(html_content, parse_only=None, css=None):
+    if not STRAIN:
+        parse_only = css = None
+
+    builder = BACKEND
+    if BACKEND == 'selectolax':
+        builder = _tree_builder()
+        if css:
+            html_content = _select_fragment(html_content, css)
+    return BeautifulSoup(html_content, builder, parse_only=parse_only)
+
+
+# Parsed results by content hash, so an unchanged page is never parsed twice in a process
+MEMO_SIZE = 32
+_memo = collections.OrderedDict()
+_memo_lock = threading.Lock()
+
+
+# Hash of the region a parser reads: the selected fragment when selectolax can cut it out
+# cheaply (rendered pages carry tokens that change on every request), else the whole body
+def content_digest(html_content, css=None):
+    if css and available('selectolax'):
+        html_content = _select_fragment(html_content, css)
+    if isinstance(html_content, str):
+        html_content = html_content.encode('utf-8', 'surrogatepass')
+    return hashlib.sha256(html_content).hexdigest()
+
+
+# Decorator for parse functions: skip parsing entirely when the content hash was seen before.
+# Every page module's parse_tables(html) (page7's parse_page) is wrapped in it, so a page that
+# comes back unchanged is not parsed again.
+# Callers share the returned objects, so they must not modify them in place.
+# The wrapper's lookup(html) / remember(html, result) give streaming parsers (see stream) the same memo.
+# `variant()`, when given, names anything else the result depends on (a date window); it is part of
+# the memo key and, as wrapper.variant, of the HTTP cache key.
+def memoize_by_content(css=None, variant=None):
+    def decorator(parse):
+        def key_for(html_content):
+            key = (parse.__module__, parse.__qualname__, content_digest(html_content, css))
+            return key + (variant(),) if variant else key
+
+        def lookup(html_content, key=None):
+            key = key or key_for(html_content)
+            with _memo_lock:
+                hit = key in _memo
+                if hit:
+                    _memo.move_to_end(key)
+                    result = _memo[key]
+            metrics.cache_result('memo', hit)
+            return result if hit else None
+
+        def remember(html_content, result, key=None):
+            key = key or key_for(html_content)
+            with _memo_lock:
+                _memo[key] = result
+                while len(_memo) > MEMO_SIZE:
+                    _memo.popitem(last=False)
+
+        @functools.wraps(parse)
+        def wrapper(html_content):
+            key = key_for(html_content)
+            result = lookup(html_content, key)
+            if result is not None:
+                return result
+            # Rows are counted by the 'frame' stages the parser runs inside this one
+            with metrics.stage('parse', bytes=len(html_content), backend=BACKEND):
+                result = parse(html_content)
+            remember(html_content, result, key)
+            return result
+
+        wrapper.lookup = lookup
+        wrapper.remember = remember
+        wrapper.variant = variant
+        return wrapper
+    return decorator
+
+
+# Dated listings (the DOT pages) keep the last N days of rows: N comes from
+# SCRAPER_<SOURCE>_WINDOW_DAYS (e.g. SCRAPER_PAGE4_WINDOW_DAYS=180), else the page's default; 0 keeps every row
+def window_days(source, default):
+    return int(os.environ.get(f'SCRAPER_{source.upper()}_WINDOW_DAYS', default))
+
+
+# First day of a window of `days` days ending today, or None when the window is off
+def window_start(days, today=None):
+    if not days:
+        return None
+    return (today or datetime.date.today()) - datetime.timedelta(days=days)
+
+
+# Date filter applied while parsing: rows outside the window are skipped before any cell work.
+# Every row is still looked at, since the DOT pages do not list their ads in date order.
+class DateWindow:
+    def __init__(self, start):
+        self.start = start
+
+    def admits(self, listed):
+        return self.start is None or listed is None or listed >= self.start
+
+
+# Date of a DOT listing row ('mm/dd/yyyy'), or None for anything else
+def listing_date(text):
+    try:
+        return datetime.datetime.strptime(text, '%m/%d/%Y').date()
+    except ValueError:
+        return None
+
+
+# Yield a memoized multi-table parser's (name, df) tables one at a time: straight from the memo
+# when this content was parsed before, else from `iter_parse` as each table is built (and the
+# whole list is memoized once the last one is out), so a page can show the first table early.
+def stream(memoized, iter_parse, html_content):
+    cached = memoized.lookup(html_content)
+    if cached is not None:
+        yield from cached
+        return
+    tables = []
+    seconds = 0.0
+    start = time.perf_counter()
+    for table in iter_parse(html_content):
+        seconds += time.perf_counter() - start
+        tables.append(table)
+        yield table
+        start = time.perf_counter()
+    seconds += time.perf_counter() - start
+    # Only the time spent parsing counts, not the time the consumer held each table
+    metrics.observe({'source': metrics.current_source() or 'unknown', 'stage': 'parse', 'seconds': seconds,
+                     'bytes': len(html_content), 'backend': BACKEND, 'streamed': True})
+    memoized.remember(html_content, tables)
+
+
+# Forget every memoized parse (benchmarks, so each run really parses)
+def clear_memo():
+    with _memo_lock:
+        _memo.clear()
@@ -0,0 +1,251 @@
+import asyncio
+import contextlib
+import datetime
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import metrics
+
+# Request governor shared by every process on the machine (dashboard sessions, scheduler,
+# batch CLI) through one SQLite file. Each upstream gets a token bucket (requests per second)
+# and a cap on requests in flight: every state host on its own, ScraperAPI per API key, which
+# also has a monthly credit budget. A 429 halves that upstream's rate and each success wins a
+# little back, so the rate settles just under where the upstream starts throttling.
+DB_PATH = os.environ.get('SCRAPER_RATELIMIT_DB',
+                         os.path.join(os.environ.get('SCRAPER_CACHE_DIR', '.cache'), 'ratelimit.sqlite'))
+
+# State sites (OGS, DOT, Port Authority, PASSPort) when fetched directly
+HOST_RATE = float(os.environ.get('SCRAPER_HOST_RATE', '2'))
+HOST_BURST = float(os.environ.get('SCRAPER_HOST_BURST', '4'))
+HOST_CONCURRENCY = int(os.environ.get('SCRAPER_HOST_CONCURRENCY', '4'))
+
+# ScraperAPI, per API key: keep the concurrency at the plan's thread limit
+SCRAPERAPI_RATE = float(os.environ.get('SCRAPERAPI_RATE', '5'))
+SCRAPERAPI_BURST = float(os.environ.get('SCRAPERAPI_BURST', '5'))
+SCRAPERAPI_CONCURRENCY = int(os.environ.get('SCRAPERAPI_CONCURRENCY', '5'))
+# Credits one key may spend per calendar month (UTC); 0 means no budget
+SCRAPERAPI_MONTHLY_CREDITS = int(os.environ.get('SCRAPERAPI_MONTHLY_CREDITS', '0'))
+# ScraperAPI bills only these responses; any other outcome gets its reserved credits back
+BILLED_STATUSES = {200, 404}
+
+# Adaptive rate: halve on a 429, add this fraction of the ceiling back per success, never below the floor
+RATE_FLOOR = 0.1
+RATE_RECOVERY = 0.05
+
+# A slot whose holder died is reclaimed after this long (longer than any render timeout)
+LEASE_SECONDS = 300
+# How often a caller waiting for a free slot looks again
+POLL_SECONDS = 0.1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name    TEXT PRIMARY KEY,
+    tokens  REAL NOT NULL,
+    rate    REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS leases (
+    id      INTEGER PRIMARY KEY,
+    name    TEXT NOT NULL,
+    expires REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS leases_name ON leases (name);
+CREATE TABLE IF NOT EXISTS credits (
+    name  TEXT NOT NULL,
+    month TEXT NOT NULL,
+    spent INTEGER NOT NULL,
+    PRIMARY KEY (name, month)
+);
+CREATE TABLE IF NOT EXISTS counters (
+    name  TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+_local = threading.local()
+
+
+class BudgetExceeded(RuntimeError):
+    pass
+
+
+# One connection per thread; IMMEDIATE transactions serialize the read-modify-writes across processes
+def connect():
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        directory = os.path.dirname(DB_PATH)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(DB_PATH, timeout=30, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(SCHEMA)
+        _local.conn = conn
+    return conn
+
+
+@contextlib.contextmanager
+def _transaction():
+    conn = connect()
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        yield conn
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+    conn.execute('COMMIT')
+
+
+# Limits for one request: (bucket name, rate, burst, concurrency, monthly credits, credits it costs).
+# Bucket names never contain the API key itself, only a short hash of it.
+def limits_for(url):
+    parts = urlsplit(url)
+    host = parts.hostname or ''
+    if not host.endswith('scraperapi.com'):
+        return host, HOST_RATE, HOST_BURST, HOST_CONCURRENCY, 0, 0
+    query = parse_qs(parts.query)
+    api_key = query.get('api_key', [''])[0]
+    name = 'scraperapi:' + hashlib.sha256(api_key.encode()).hexdigest()[:12]
+    import scraperapi
+    cost = scraperapi.credits_for(query.get('render', [''])[0] == 'true')
+    return name, SCRAPERAPI_RATE, SCRAPERAPI_BURST, SCRAPERAPI_CONCURRENCY, SCRAPERAPI_MONTHLY_CREDITS, cost
+
+
+def current_month():
+    return datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m')
+
+
+# Reserve `cost` credits of this month's budget, or raise BudgetExceeded
+def _reserve_credits(conn, name, budget, cost):
+    month = current_month()
+    row = conn.execute('SELECT spent FROM credits WHERE name = ? AND month = ?', (name, month)).fetchone()
+    spent = row[0] if row else 0
+    if budget and spent + cost > budget:
+        raise BudgetExceeded(f'ScraperAPI monthly budget of {budget} credits reached ({spent} spent in {month})')
+    conn.execute('INSERT INTO credits (name, month, spent) VALUES (?, ?, ?) '
+                 'ON CONFLICT (name, month) DO UPDATE SET spent = spent + excluded.spent', (name, month, cost))
+    return month
+
+
+# One attempt at a slot plus a token: (lease id, 0) on success, (None, seconds to wait) otherwise
+def _try_acquire(name, rate, burst, concurrency):
+    now = time.time()
+    with _transaction() as conn:
+        conn.execute('DELETE FROM leases WHERE expires < ?', (now,))
+        in_flight = conn.execute('SELECT COUNT(*) FROM leases WHERE name = ?', (name,)).fetchone()[0]
+        if in_flight >= concurrency:
+            return None, POLL_SECONDS
+        row = conn.execute('SELECT tokens, rate, updated FROM buckets WHERE name = ?', (name,)).fetchone()
+        tokens, current_rate, updated = row if row else (burst, rate, now)
+        current_rate = min(current_rate, rate)  # A lowered setting applies at once
+        tokens = min(burst, tokens + (now - updated) * current_rate)
+        if tokens < 1:
+            conn.execute('INSERT OR REPLACE INTO buckets (name, tokens, rate, updated) VALUES (?, ?, ?, ?)',
+                         (name, tokens, current_rate, now))
+            return None, (1 - tokens) / current_rate
+        conn.execute('INSERT OR REPLACE INTO buckets (name, tokens, rate, updated) VALUES (?, ?, ?, ?)',
+                     (name, tokens - 1, current_rate, now))
+        lease = conn.execute('INSERT INTO leases (name, expires) VALUES (?, ?)', (name, now + LEASE_SECONDS)).lastrowid
+    return lease, 0
+
+
+# Free the slot, refund unbilled credits and adapt the rate to how the upstream answered
+def _release(permit):
+    name, rate = permit['name'], permit['rate']
+    status = permit.get('status')
+    with _transaction() as conn:
+        conn.execute('DELETE FROM leases WHERE id = ?', (permit['lease'],))
+        if permit['cost'] and status not in BILLED_STATUSES:
+            conn.execute('UPDATE credits SET spent = MAX(spent - ?, 0) WHERE name = ? AND month = ?',
+                         (permit['cost'], name, permit['month']))
+        if status == 429:
+            conn.execute('UPDATE buckets SET rate = MAX(rate / 2, ?) WHERE name = ?', (RATE_FLOOR, name))
+        elif status is not None and status < 400:
+            conn.execute('UPDATE buckets SET rate = MIN(rate + ?, ?) WHERE name = ?', (rate * RATE_RECOVERY, rate, name))
+
+
+def _granted(limits, month, lease, waited):
+    name, rate, _, _, _, cost = limits
+    if waited:
+        metrics.observe({'source': metrics.current_source() or 'unknown', 'stage': 'throttle',
+                         'seconds': waited, 'upstream': name.split(':')[0]})
+    return {'name': name, 'rate': rate, 'cost': cost, 'month': month, 'lease': lease, 'status': None}
+
+
+# Reserve the request's credits up front, so concurrent renders cannot overrun the budget together
+def _reserve(limits):
+    name, _, _, _, budget, cost = limits
+    if not cost:
+        return None
+    with _transaction() as conn:
+        return _reserve_credits(conn, name, budget, cost)
+
+
+# Block until `url` may be requested. Set permit['status'] = response.status_code on the yielded
+# permit so the slot is released with the right outcome (no status: nothing billed, rate unchanged).
+# Raises BudgetExceeded before anything is sent when a ScraperAPI key is out of credits.
+@contextlib.contextmanager
+def permit(url):
+    limits = limits_for(url)
+    month = _reserve(limits)
+    lease, waited = None, 0.0
+    try:
+        while lease is None:
+            lease, wait = _try_acquire(*limits[:4])
+            time.sleep(wait)
+            waited += wait
+    finally:
+        if lease is None:  # Interrupted while waiting: give the credits back
+            _release(_granted(limits, month, None, 0))
+    granted = _granted(limits, month, lease, waited)
+    try:
+        yield granted
+    finally:
+        _release(granted)
+
+
+# Async counterpart of permit(): waits with asyncio.sleep so other requests keep going, and runs
+# the SQLite transactions (which can block on other processes' locks) on worker threads
+@contextlib.asynccontextmanager
+async def apermit(url):
+    limits = limits_for(url)
+    month = await asyncio.to_thread(_reserve, limits)
+    lease, waited = None, 0.0
+    try:
+        while lease is None:
+            lease, wait = await asyncio.to_thread(_try_acquire, *limits[:4])
+            if wait:
+                await asyncio.sleep(wait)
+            waited += wait
+    finally:
+        if lease is None:
+            await asyncio.to_thread(_release, _granted(limits, month, None, 0))
+    granted = _granted(limits, month, lease, waited)
+    try:
+        yield granted
+    finally:
+        await asyncio.to_thread(_release, granted)
+
+
+# Add to named running totals (ScraperAPI calls, cache hits, credits) in one transaction,
+# so processes counting at the same time never lose each other's updates
+def add_counts(counts):
+    with _transaction() as conn:
+        conn.executemany('INSERT INTO counters (name, value) VALUES (?, ?) '
+                         'ON CONFLICT (name) DO UPDATE SET value = value + excluded.value', list(counts.items()))
+
+
+# Current totals of the named counters (0 for any never counted)
+def counts(names):
+    rows = connect().execute(f"SELECT name, value FROM counters WHERE name IN ({','.join('?' * len(names))})",
+                             list(names)).fetchall()
+    return {name: 0 for name in names} | dict(rows)
+
+
+# Credits reserved and spent this month per ScraperAPI key bucket, for the dashboard
+def monthly_credits():
+    rows = connect().execute('SELECT name, spent FROM credits WHERE month = ?', (current_month(),)).fetchall()
+    return dict(rows)
@@ -0,0 +1,117 @@
+import collections
+import html
+import pandas as pd
+
+# Typed table schema shared by every source. A linked cell is stored as two plain columns: its
+# text in `<name>` and its target in `<name> URL` (missing when the cell has no link; several links
+# in one cell are newline-separated in both). Low-cardinality columns are categoricals and dates
+# are datetime64. Anchor markup exists only in display_html(), so snapshots, the opportunity
+# store and exports hold plain values.
+URL_SUFFIX = ' URL'
+
+# Bumped whenever the shape of parsed tables or their saved search columns changes, so caches of
+# older tables are not reused
+SCHEMA = 5
+
+# A linked cell as a page parser builds it
+Link = collections.namedtuple('Link', 'text url')
+
+
+def url_column(column):
+    return f'{column}{URL_SUFFIX}'
+
+
+def is_url_column(columns, column):
+    return isinstance(column, str) and column.endswith(URL_SUFFIX) and column[:-len(URL_SUFFIX)] in columns
+
+
+# Columns shown to people: everything but the URL halves of linked columns (of a DataFrame, or of a row)
+def display_columns(df):
+    columns = df.columns if isinstance(df, pd.DataFrame) else df.index
+    return [column for column in columns if not is_url_column(columns, column)]
+
+
+# Link of the cells of one <td>'s anchors: their texts and hrefs, newline-separated
+def links(texts, hrefs):
+    return Link('\n'.join(texts), '\n'.join(hrefs))
+
+
+# DataFrame from parsed rows whose cells may be Link: each column holding a Link gains a URL
+# column right after it. `categories` and `dates` name columns to store as category / datetime64.
+def frame(rows, columns, index=None, categories=(), dates=()):
+    df = pd.DataFrame(rows, columns=columns, index=index)
+    linked = [position for position in range(len(df.columns))
+              if df.iloc[:, position].map(lambda cell: isinstance(cell, Link)).any()]
+    for position in reversed(linked):
+        cells = df.iloc[:, position]
+        column = df.columns[position]
+        df.isetitem(position, cells.map(lambda cell: cell.text if isinstance(cell, Link) else cell))
+        df.insert(position + 1, url_column(column), cells.map(lambda cell: cell.url if isinstance(cell, Link) else None))
+    return compact(df, categories, dates)
+
+
+# Convert the named columns in place of object/str storage: categories always, dates only when
+# every non-empty value parses (a column with stray text stays text rather than lose it)
+def compact(df, categories=(), dates=()):
+    for column in categories:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    for column in dates:
+        if column in df.columns and not pd.api.types.is_datetime64_any_dtype(df[column]):
+            values = df[column].replace('', None)
+            parsed = pd.to_datetime(values, errors='coerce', format='mixed')
+            if parsed.notna().sum() == values.notna().sum():
+                df[column] = parsed
+    return df
+
+
+# First link target among the row's linked columns (optionally only `columns`), or None.
+# Works on a DataFrame row or a stored row's dict.
+def first_url(row, columns=None):
+    keys = list(row.keys())
+    for column in keys if columns is None else columns:
+        url = row.get(url_column(column)) if url_column(column) in keys else None
+        if isinstance(url, str) and url:
+            return url.split('\n')[0]
+    return None
+
+
+def _text(value):
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ''
+    return html.escape(str(value), quote=False)
+
+
+def _anchors(text, url):
+    if not isinstance(url, str) or not url:
+        return _text(text)
+    texts = str(text).split('\n')
+    return '<br>'.join(f'<a href="{html.escape(href)}" target="_blank">{_text(label)}</a>'
+                       for label, href in zip(texts, url.split('\n')))
+
+
+def _dates(column):
+    with_time = (column.dropna() != column.dropna().dt.normalize()).any()
+    return column.dt.strftime('%Y-%m-%d %H:%M' if with_time else '%Y-%m-%d').fillna('')
+
+
+# The display version of `df`: links as anchors, text escaped, dates formatted, URL columns
+# folded into their links. Only called on the rows actually shown.
+def display_frame(df):
+    names = display_columns(df)
+    cells = []
+    for column in names:
+        values = df[column]
+        if url_column(column) in df.columns:
+            cells.append([_anchors(text, url) for text, url in zip(values, df[url_column(column)])])
+        elif pd.api.types.is_datetime64_any_dtype(values):
+            cells.append(_dates(values).tolist())
+        else:
+            cells.append([_text(value) for value in values])
+    shown = pd.DataFrame(dict(enumerate(cells)), index=df.index)
+    shown.columns = names
+    return shown
+
+
+def display_html(df, classes=None):
+    return display_frame(df).to_html(escape=False, index=False, classes=classes)
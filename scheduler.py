@@ -0,0 +1,60 @@
+# Background pre-scraper: re-runs each source's fetch on its REFRESH_INTERVAL and
+# writes snapshots the dashboard renders instantly.
+#
+#   python scheduler.py                  # run forever
+#   python scheduler.py --once page7     # refresh the due sources once and exit
+import argparse
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import fetcher
+import snapshots
+import sources
+
+# How often to look for sources whose snapshot has gone stale
+POLL_SECONDS = 60
+
+log = logging.getLogger('scheduler')
+
+
+def due_sources(sources):
+    return [source for source in sources if snapshots.is_stale(source, snapshots.load(source))]
+
+
+def refresh_source(source):
+    start = time.perf_counter()
+    try:
+        snapshot = snapshots.refresh(source)
+    except Exception:
+        log.exception('%s: refresh failed', source)
+        return
+    rows = sum(len(df) for _, df in snapshot['tables'])
+    log.info('%s: %d rows in %.1f s', source, rows, time.perf_counter() - start)
+
+
+# Refresh every due source in parallel; returns the sources that were refreshed
+def run_once(sources, pool):
+    due = due_sources(sources)
+    list(pool.map(refresh_source, due))
+    return due
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Pre-scrape sources into snapshots.')
+    sources.add_argument(arg_parser)
+    arg_parser.add_argument('--once', action='store_true', help='refresh due sources once and exit')
+    args = arg_parser.parse_args()
+    args.sources = sources.selected(arg_parser, args.sources)
+
+    fetcher.configure_logging()
+    with ThreadPoolExecutor(max_workers=len(args.sources)) as pool:
+        while True:
+            run_once(args.sources, pool)
+            if args.once:
+                break
+            time.sleep(POLL_SECONDS)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+import fetcher
+import http_cache
+import metrics
+import scraperapi
+import singleflight
+import snapshots
+import sources
+from sources import SOURCES
+
+
+# Fetch and parse one source; parsing runs off the event loop so other fetches keep streaming in.
+# Each source runs as its own task, so its stage metrics are attributed to it alone.
+async def scrape_source(client, module_name, name):
+    with metrics.source_context(module_name):
+        return await _scrape_source(client, module_name, name)
+
+
+async def _scrape_source(client, module_name, name):
+    # Filled in by _fetch_and_save; left as is when this sweep joins a scrape already in progress
+    timing = {'status': 'OK (joined a running scrape)'}
+    snapshot = None
+    start = time.perf_counter()
+    try:
+        # Another session's sweep or a page refresh of this source is joined, not repeated
+        snapshot = await singleflight.ado(snapshots.refresh_key(module_name),
+                                          lambda: _fetch_and_save(client, module_name, timing))
+    except Exception as e:
+        timing['status'] = f'Error: {e}'
+
+    tables = snapshot['tables'] if snapshot else []
+    return {
+        'Source': name,
+        'Status': timing['status'],
+        'Fetch (s)': round(timing.get('fetch', time.perf_counter() - start), 2),
+        'Parse (s)': round(timing.get('parse', 0.0), 2),
+        'Rows': sum(len(df) for _, df in tables),
+        'source': module_name,
+        'version': snapshot['version'] if snapshot else None,
+        'tables': tables,
+    }
+
+
+async def _fetch_and_save(client, module_name, timing):
+    module = sources.load(module_name)
+    timing['status'] = 'OK'
+    start = time.perf_counter()
+    if hasattr(module, 'afetch_tables'):
+        # Sources with their own (paginated) fetch strategy parse as they go
+        tables = await module.afetch_tables(client)
+        timing['fetch'] = time.perf_counter() - start
+        start = time.perf_counter()
+    elif getattr(module, 'USES_SCRAPERAPI', False):
+        # ScraperAPI sources share the render TTL cache with the single-page buttons
+        html_content = await scraperapi.afetch(client, module.URL)
+        timing['fetch'] = time.perf_counter() - start
+        start = time.perf_counter()
+        tables = await asyncio.to_thread(module.parse_tables, html_content)
+    else:
+        # Direct state sites go through the conditional-GET cache, like the single-page buttons
+        entry = http_cache.load_entry(module.URL, module.parse_tables)
+        response = await fetcher.aget(client, module.URL, headers=http_cache.conditional_headers(entry))
+        timing['fetch'] = time.perf_counter() - start
+        if response.status_code == 304 and entry is not None:
+            timing['status'] = 'OK (not modified)'
+        start = time.perf_counter()
+        tables = await asyncio.to_thread(http_cache.resolve, module.URL, module.parse_tables, response, entry)
+    timing['parse'] = time.perf_counter() - start
+    # A successful sweep doubles as a fresh snapshot for every page; saving (pickle, search columns,
+    # opportunity store upsert) also runs off the event loop
+    snapshot = await asyncio.to_thread(snapshots.save, module_name, tables)
+    if snapshot['errors']:
+        timing['status'] = f"Partial: {snapshot['errors'][0]}"
+    return snapshot
+
+
+# Fan out to every source (or just `module_names`) at once and collect each result as soon as it completes
+async def scrape_all_sources(on_result=None, module_names=None):
+    results = []
+    selected = [(module_name, name) for module_name, name in SOURCES if module_names is None or module_name in module_names]
+    async with fetcher.async_client() as client:
+        tasks = [asyncio.create_task(scrape_source(client, module_name, name)) for module_name, name in selected]
+        for finished in asyncio.as_completed(tasks):
+            result = await finished
+            results.append(result)
+            if on_result:
+                on_result(result, len(results))
+    metrics.export_prometheus()
+    return results
@@ -0,0 +1,116 @@
+# Headless batch scrape for cron jobs and worker containers: runs any subset of sources in
+# parallel without a Streamlit session and writes every table as CSV, JSON and/or Parquet.
+# It goes through the same fetch/parse code and caches as the dashboard and saves the same
+# snapshots (and opportunity store rows), so the web process only ever renders them.
+#
+#   python scrape_cli.py                                   # every source, CSV into ./exports
+#   python scrape_cli.py page3 page4 --format json --format parquet --out /data/exports
+#   python scrape_cli.py --plain                           # link text only, without the "<column> URL" columns
+import argparse
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+import re
+import sys
+import time
+
+import fetcher
+import records
+import scrape_all
+import snapshots
+import sources
+
+FORMATS = ('csv', 'json', 'parquet')
+
+log = logging.getLogger('scrape_cli')
+
+
+def slug(text):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or 'table'
+
+
+# Parquet needs pyarrow or fastparquet, which the dashboard itself does not
+def parquet_available():
+    return any(importlib.util.find_spec(engine) for engine in ('pyarrow', 'fastparquet'))
+
+
+# Only the columns the dashboard shows, for consumers that do not want the link targets
+def plain(df):
+    return df[records.display_columns(df)]
+
+
+def write_table(df, path_stem, formats):
+    paths = []
+    for file_format in formats:
+        path = f'{path_stem}.{file_format}'
+        if file_format == 'csv':
+            df.to_csv(path, index=False)
+        elif file_format == 'json':
+            df.to_json(path, orient='records', force_ascii=False, indent=2, date_format='iso')
+        else:
+            df.to_parquet(path, index=False)
+        paths.append(path)
+    return paths
+
+
+# Write each table of a result as <out>/<source>/<table>.<format>; returns the paths written
+def write_result(result, module_name, out_dir, formats, plain_text):
+    source_dir = os.path.join(out_dir, module_name)
+    os.makedirs(source_dir, exist_ok=True)
+    paths = []
+    for table_name, df in result['tables']:
+        if plain_text:
+            df = plain(df)
+        df = snapshots.export_frame(df)
+        paths += write_table(df, os.path.join(source_dir, slug(table_name)), formats)
+    return paths
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Scrape sources without Streamlit and export their tables.')
+    sources.add_argument(arg_parser)
+    arg_parser.add_argument('--format', action='append', choices=FORMATS, help='output format (repeatable; default csv)')
+    arg_parser.add_argument('--out', default='exports', help='output directory (default: ./exports)')
+    arg_parser.add_argument('--plain', action='store_true', help='leave out the link target columns')
+    args = arg_parser.parse_args()
+    module_names = sources.selected(arg_parser, args.sources)
+    formats = args.format or ['csv']
+    if 'parquet' in formats and not parquet_available():
+        arg_parser.error('parquet output needs pyarrow or fastparquet (pip install pyarrow)')
+
+    fetcher.configure_logging()
+
+    module_by_name = {name: module_name for module_name, name in sources.SOURCES}
+    manifest = []
+
+    def on_result(result, done):
+        module_name = module_by_name[result['Source']]
+        paths = write_result(result, module_name, args.out, formats, args.plain) if result['tables'] else []
+        log.info('%s: %s, %d rows, fetch %.1f s, parse %.1f s', module_name, result['Status'],
+                 result['Rows'], result['Fetch (s)'], result['Parse (s)'])
+        manifest.append({
+            'source': module_name,
+            'name': result['Source'],
+            'status': result['Status'],
+            'rows': result['Rows'],
+            'fetch_seconds': result['Fetch (s)'],
+            'parse_seconds': result['Parse (s)'],
+            'files': paths,
+        })
+
+    start = time.perf_counter()
+    asyncio.run(scrape_all.scrape_all_sources(on_result, module_names))
+    os.makedirs(args.out, exist_ok=True)
+    with open(os.path.join(args.out, 'manifest.json'), 'w') as f:
+        json.dump({'finished_at': time.time(), 'seconds': round(time.perf_counter() - start, 2), 'sources': manifest}, f, indent=2)
+
+    failed = [entry['source'] for entry in manifest if entry['status'].startswith('Error')]
+    if failed:
+        log.error('failed: %s', ', '.join(failed))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
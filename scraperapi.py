@@ -0,0 +1,127 @@
+import hashlib
+import os
+import pickle
+import threading
+import time
+from urllib.parse import urlencode
+
+import fetcher
+import metrics
+import ratelimit
+import singleflight
+
+# On-disk TTL cache in front of ScraperAPI, keyed on (target URL, render flag).
+# Every render costs credits and 10-60 s, so sessions within the TTL share one render.
+API_ENDPOINT = 'http://api.scraperapi.com'
+CACHE_DIR = os.path.join(os.environ.get('SCRAPER_CACHE_DIR', '.cache'), 'scraperapi')
+CACHE_TTL = float(os.environ.get('SCRAPERAPI_CACHE_TTL', '3600'))
+
+# ScraperAPI bills 1 credit per plain request and 10 per JavaScript-rendered request
+CREDITS_PLAIN = 1
+CREDITS_RENDER = 10
+
+# Usage counters, kept in the rate limiter's SQLite file so every process adds to the same totals
+USAGE_COUNTERS = ('calls', 'hits', 'credits_spent', 'credits_saved')
+
+
+# ScraperAPI key, looked up only when a render is actually requested: SCRAPER_API_KEY from the
+# environment (scheduler, scripts) or else Streamlit secrets. A missing key fails that fetch, not the import.
+def configured_key():
+    key = os.environ.get('SCRAPER_API_KEY')
+    if key:
+        return key
+    try:
+        import streamlit as st  # Not installed in headless worker containers
+        return st.secrets['SCRAPER_API_KEY']
+    except (ImportError, KeyError, FileNotFoundError):
+        raise RuntimeError('No ScraperAPI key: set SCRAPER_API_KEY in the environment or .streamlit/secrets.toml') from None
+
+
+def api_url(api_key, url, render=True):
+    params = {'api_key': api_key, 'url': url}
+    if render:
+        params['render'] = 'true'
+    return f'{API_ENDPOINT}?{urlencode(params)}'
+
+
+def credits_for(render):
+    return CREDITS_RENDER if render else CREDITS_PLAIN
+
+
+def _entry_path(url, render):
+    key = f'{url}|render={bool(render)}'
+    return os.path.join(CACHE_DIR, hashlib.sha256(key.encode()).hexdigest() + '.pickle')
+
+
+def _write_atomic(path, data):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+# Credits spent on real renders and saved by cache hits, across every process
+def usage():
+    return ratelimit.counts(USAGE_COUNTERS)
+
+
+def _record(hit, render):
+    if hit:
+        ratelimit.add_counts({'hits': 1, 'credits_saved': credits_for(render)})
+    else:
+        ratelimit.add_counts({'calls': 1, 'credits_spent': credits_for(render)})
+
+
+# Cached body for (url, render) if it is younger than the TTL; counts the credits it saved
+def lookup(url, render=True, ttl=None):
+    ttl = CACHE_TTL if ttl is None else ttl
+    try:
+        with open(_entry_path(url, render), 'rb') as f:
+            entry = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    if time.time() - entry['fetched_at'] > ttl:
+        return None
+    _record(True, render)
+    return entry['body']
+
+
+# Remember a freshly rendered body and count the credits it cost
+def store(url, render, body):
+    entry = {'fetched_at': time.time(), 'body': body}
+    _write_atomic(_entry_path(url, render), pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+    _record(False, render)
+
+
+# Blocking fetch through the cache; raises httpx.HTTPError on failure. The key defaults to configured_key().
+# Concurrent misses for the same page (any session, thread or sweep) share one render and its credits.
+def fetch(url, api_key=None, render=True, ttl=None):
+    body = lookup(url, render, ttl)
+    metrics.cache_result('scraperapi', body is not None)
+    if body is not None:
+        return body
+    return singleflight.do(('scraperapi', url, bool(render)), lambda: _render(url, api_key, render))
+
+
+def _render(url, api_key, render):
+    response = fetcher.get(api_url(api_key or configured_key(), url, render), timeout=fetcher.RENDER_TIMEOUT)
+    response.raise_for_status()
+    store(url, render, response.text)
+    return response.text
+
+
+# Async counterpart of fetch() for the concurrent sweep
+async def afetch(client, url, api_key=None, render=True, ttl=None):
+    body = lookup(url, render, ttl)
+    metrics.cache_result('scraperapi', body is not None)
+    if body is not None:
+        return body
+    return await singleflight.ado(('scraperapi', url, bool(render)), lambda: _arender(client, url, api_key, render))
+
+
+async def _arender(client, url, api_key, render):
+    response = await fetcher.aget(client, api_url(api_key or configured_key(), url, render), timeout=fetcher.RENDER_TIMEOUT)
+    response.raise_for_status()
+    store(url, render, response.text)
+    return response.text
@@ -0,0 +1,79 @@
+import html
+import re
+import pandas as pd
+
+import records
+
+# Keyword filtering on a precomputed search column: one lowercased, markup-free string
+# per row, built once per scrape, matched with vectorized string operations.
+TAG = re.compile(r'<[^>]+>')
+# A term is either a "quoted phrase" or a single word
+TERM = re.compile(r'"([^"]+)"|(\S+)')
+# Tokens the full-text index can match; FTS5 syntax characters never are
+WORD = re.compile(r'\w+')
+
+
+# Lowercased, markup-stripped text of every shown cell in each row (link targets excluded), aligned with df's index
+def build_search_column(df):
+    names = records.display_columns(df)
+    if df.empty or not names:
+        return pd.Series('', index=df.index, dtype='string')
+    # Missing cells (blank dates, unlinked text) count as empty; one would otherwise blank the whole row
+    columns = [df[column].astype('string').fillna('') for column in names]
+    text = columns[0].str.cat(columns[1:], sep=' ') if len(columns) > 1 else columns[0]
+    text = text.str.replace(TAG, ' ', regex=True).str.lower()
+    return text.astype('string')
+
+
+# Cell value as plain text for the full-text index: markup stripped, whitespace collapsed, dates as dates
+def plain_text(value):
+    if value is None or (pd.api.types.is_scalar(value) and pd.isna(value)):
+        return ''
+    if isinstance(value, pd.Timestamp):
+        return value.strftime('%Y-%m-%d' if value == value.normalize() else '%Y-%m-%d %H:%M')
+    return ' '.join(html.unescape(TAG.sub(' ', str(value))).split())
+
+
+# User query as an FTS5 MATCH expression: quoted phrases stay phrases, a trailing * on a
+# word is a prefix search, OR between terms is kept; everything else is quoted so that
+# punctuation in a query ("I-87", "D26:1") cannot be read as FTS5 syntax
+def fts_query(query):
+    parts = []
+    for phrase, word in TERM.findall(query):
+        if phrase:
+            words = WORD.findall(phrase)
+            if words:
+                parts.append('"' + ' '.join(words) + '"')
+        elif word == 'OR':
+            if parts and parts[-1] != 'OR':
+                parts.append('OR')
+        else:
+            words = WORD.findall(word)
+            if not words:
+                continue
+            prefix = '*' if word.endswith('*') else ''
+            parts.append('"' + ' '.join(words) + '"' + prefix)
+    while parts and parts[-1] == 'OR':
+        parts.pop()
+    return ' '.join(parts)
+
+
+def parse_terms(query):
+    return [(phrase or word).lower() for phrase, word in TERM.findall(query)]
+
+
+# Rows of `df` whose search column matches `query` (all rows for an empty query)
+def filter_rows(df, search_column, query, match_all=True):
+    return df[matches(search_column, query, match_all).to_numpy()]
+
+
+# Boolean mask of rows matching every term (match_all) or any term; all rows for an empty query
+def matches(search_column, query, match_all=True):
+    terms = parse_terms(query)
+    if not terms:
+        return pd.Series(True, index=search_column.index)
+    mask = search_column.str.contains(terms[0], regex=False)
+    for term in terms[1:]:
+        term_mask = search_column.str.contains(term, regex=False)
+        mask = mask & term_mask if match_all else mask | term_mask
+    return mask.fillna(False).astype(bool)
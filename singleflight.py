@@ -0,0 +1,69 @@
+import asyncio
+import concurrent.futures
+import threading
+
+import metrics
+
+# Process-wide request coalescing ("single flight"). While work for a key is running, callers
+# with the same key from any thread, session or event loop wait for it and share its result
+# (or its exception) instead of starting the same scrape again. The entry is dropped the moment
+# the work finishes, so later callers are served by what it wrote (snapshot, render cache)
+# or start a fresh flight.
+_lock = threading.Lock()
+_flights = {}  # key -> concurrent.futures.Future of the running work
+
+
+# (future, True) for the caller that has to do the work, (future, False) for one that joins it
+def _join(key):
+    with _lock:
+        future = _flights.get(key)
+        if future is None:
+            future = _flights[key] = concurrent.futures.Future()
+            leader = True
+        else:
+            leader = False
+    # A joined flight is a hit: the work it would have repeated was shared
+    metrics.cache_result('flight', not leader)
+    return future, leader
+
+
+def _land(key, future, result=None, error=None):
+    with _lock:
+        _flights.pop(key, None)
+    if error is None:
+        future.set_result(result)
+    else:
+        future.set_exception(error)
+
+
+# fn() run once for every concurrent caller with `key`
+def do(key, fn):
+    future, leader = _join(key)
+    if not leader:
+        return future.result()
+    try:
+        result = fn()
+    except BaseException as e:
+        _land(key, future, error=e)
+        raise
+    _land(key, future, result)
+    return result
+
+
+# Async counterpart of do(): `make_coroutine()` is awaited once for every concurrent caller,
+# sync or async, with `key`
+async def ado(key, make_coroutine):
+    future, leader = _join(key)
+    if not leader:
+        return await asyncio.wrap_future(future)
+    try:
+        result = await make_coroutine()
+    except BaseException as e:
+        _land(key, future, error=e)
+        raise
+    _land(key, future, result)
+    return result
+
+
+def in_flight(key):
+    return key in _flights
@@ -0,0 +1,201 @@
+import collections
+import datetime
+import importlib
+import threading
+import pandas as pd
+import streamlit as st
+
+import metrics
+import records
+import search
+import snapshots
+
+# Rendered table HTML shared by every session, keyed on snapshot content version
+HTML_CACHE_SIZE = 64
+_html_cache = collections.OrderedDict()
+# Filtered frames and sort orders behind paged tables; larger than HTML, so fewer are kept
+FRAME_CACHE_SIZE = 16
+_frame_cache = collections.OrderedDict()
+_cache_lock = threading.Lock()
+
+# Rows per page of a paged table; only this many rows are turned into HTML per rerun
+PAGE_SIZE = 50
+
+
+def _format_age(seconds):
+    minutes = int(seconds // 60)
+    if minutes < 1:
+        return "just now"
+    if minutes < 60:
+        return f"{minutes} min ago"
+    return f"{minutes // 60} h {minutes % 60} min ago"
+
+
+# Tables a first scrape has parsed so far, with a progress bar and placeholders for the rest.
+# Only a preview (the first page of each table): sorting and paging come with the saved snapshot.
+def _show_partial(source, partial):
+    tables, expected = partial
+    if expected:
+        st.progress(min(len(tables) / expected, 1.0), text=f"{len(tables)} of {expected} tables loaded")
+    for table_name, df in tables:
+        st.markdown(f"### {table_name}")
+        if df.empty:
+            st.write("No data available.")
+        else:
+            st.markdown(records.display_html(df.head(PAGE_SIZE)), unsafe_allow_html=True)
+            if len(df) > PAGE_SIZE:
+                st.caption(f"First {PAGE_SIZE} of {len(df)} rows")
+    for table_name in getattr(importlib.import_module(source), 'TABLE_NAMES', ())[len(tables):]:
+        st.markdown(f"### {table_name}")
+        st.caption(f"Loading {table_name}...")
+
+
+# Re-check a running background refresh every couple of seconds and rerun the page once it lands.
+# During a first scrape, tables from streaming sources are shown as they are parsed.
+@st.fragment(run_every=2)
+def _watch_refresh(source, taken_at):
+    if snapshots.is_refreshing(source):
+        st.caption("Refreshing in the background...")
+        partial = snapshots.partial_tables(source) if taken_at is None else None
+        if partial is not None:
+            _show_partial(source, partial)
+        return
+    snapshot = snapshots.load(source)
+    if snapshot is not None and snapshot['taken_at'] != taken_at:
+        st.rerun()
+    error = snapshots.last_error(source)
+    if error is not None:
+        st.error(f"Error fetching the webpage: {error}")
+
+
+# Latest snapshot for `source`, announced with an "as of" line.
+# Never waits on the network: stale or missing snapshots are refreshed on a background thread.
+def latest_snapshot(source, refresh_label):
+    snapshot = snapshots.load(source)
+
+    if st.button(refresh_label) or snapshots.needs_refresh(source, snapshot):
+        snapshots.refresh_in_background(source)
+
+    error = snapshots.last_error(source)
+    if error is not None and not snapshots.is_refreshing(source):
+        st.error(f"Error fetching the webpage: {error}")
+
+    if snapshot is None:
+        if snapshots.is_refreshing(source):
+            st.info("First scrape in progress, the table will appear here when it is ready.")
+    else:
+        taken_at = datetime.datetime.fromtimestamp(snapshot['taken_at'])
+        st.caption(f"As of {taken_at:%Y-%m-%d %H:%M} ({_format_age(snapshots.age(snapshot))})")
+        for partial_error in snapshot.get('errors', ()):
+            st.error(f"{partial_error}. Showing the rows read before it.")
+
+    if snapshots.is_refreshing(source):
+        _watch_refresh(source, snapshot['taken_at'] if snapshot else None)
+
+    return snapshot
+
+
+# Keyword box plus an all/any terms switch; returns (query, match_all)
+def keyword_filter(label):
+    query = st.text_input(label, "", help='Separate terms with spaces; use "quotes" for a phrase.')
+    mode = st.radio("Match", ["All terms", "Any term"], horizontal=True, label_visibility="collapsed")
+    return query, mode == "All terms"
+
+
+def _memoized(cache, size, snapshot, key, build, cache_name=None):
+    full_key = (snapshot['source'], snapshot.get('version', snapshot['taken_at']), key)
+    with _cache_lock:
+        hit = full_key in cache
+        if hit:
+            cache.move_to_end(full_key)
+            value = cache[full_key]
+    if cache_name:
+        metrics.cache_result(cache_name, hit, snapshot['source'])
+    if hit:
+        return value
+    value = build()
+    with _cache_lock:
+        cache[full_key] = value
+        while len(cache) > size:
+            cache.popitem(last=False)
+    return value
+
+
+# HTML from `build()` memoized on the snapshot's content version plus `key` (table name, filters...).
+# An unchanged page keeps its version across refreshes, so its HTML is generated once.
+def cached_html(snapshot, key, build):
+    return _memoized(_html_cache, HTML_CACHE_SIZE, snapshot, key, build, 'html')
+
+
+# Sort key for a column: its own values for datetimes, else numbers or dates when every cell parses as one, else text
+def _sort_key(column):
+    if pd.api.types.is_datetime64_any_dtype(column):
+        return column
+    text = column.astype(object).map(search.plain_text)
+    numbers = pd.to_numeric(text, errors='coerce')
+    if numbers.notna().all():
+        return numbers
+    dates = pd.to_datetime(text, errors='coerce', format='mixed')
+    if dates.notna().all():
+        return dates
+    return text.str.lower()
+
+
+# Row positions of `rows` in display order
+def sort_order(rows, sort_column, descending):
+    if sort_column not in rows.columns:
+        order = list(range(len(rows)))
+        return order[::-1] if descending else order
+    keys = _sort_key(rows[sort_column]).reset_index(drop=True)
+    return keys.sort_values(ascending=not descending, kind='stable').index.tolist()
+
+
+# One page of a filtered table, with server-side sorting and paging. `build_rows()` returns the
+# filtered DataFrame for `filters`; it, the sort order and each page's HTML are memoized per
+# (snapshot, filters, sort, page), so a rerun renders at most PAGE_SIZE rows whatever the table size
+# (links are turned into anchors for those rows only, see records.display_html).
+# `name` identifies the table's widgets and must not change with the filters.
+def paged_table(snapshot, name, filters, build_rows, classes=None, page_size=PAGE_SIZE):
+    source = snapshot['source']
+
+    def filtered():
+        with metrics.stage('filter', source) as record:
+            result = build_rows()
+            record['rows'] = len(result)
+        return result
+
+    def page_html():
+        with metrics.stage('render', source, rows=end - start) as record:
+            html = records.display_html(rows.iloc[order[start:end]], classes)
+            record['bytes'] = len(html)
+        return html
+
+    rows = _memoized(_frame_cache, FRAME_CACHE_SIZE, snapshot, ('rows', name, filters), filtered, 'filter')
+    if rows.empty:
+        st.write("No matching rows.")
+        return
+
+    widget_key = f"{snapshot['source']}:{name}"
+    page_key = f"{widget_key}:page"
+    # A new filter starts again from the first page
+    if st.session_state.get(f"{widget_key}:filters") != filters:
+        st.session_state[f"{widget_key}:filters"] = filters
+        st.session_state[page_key] = 1
+
+    sort_col, order_col, page_col = st.columns([2, 1, 1])
+    sort_column = sort_col.selectbox("Sort by", ["Page order"] + records.display_columns(rows), key=f"{widget_key}:sort")
+    descending = order_col.radio("Order", ["Ascending", "Descending"], horizontal=True,
+                                 key=f"{widget_key}:order") == "Descending"
+    order = _memoized(_frame_cache, FRAME_CACHE_SIZE, snapshot, ('order', name, filters, sort_column, descending),
+                      lambda: sort_order(rows, sort_column, descending))
+
+    pages = (len(order) + page_size - 1) // page_size
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    page = page_col.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=page_key)
+
+    start = (page - 1) * page_size
+    end = min(start + page_size, len(order))
+    table_html = cached_html(snapshot, ('page', name, filters, sort_column, descending, page, page_size), page_html)
+    st.caption(f"Rows {start + 1}-{end} of {len(order)}")
+    st.markdown(table_html, unsafe_allow_html=True)
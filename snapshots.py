@@ -0,0 +1,245 @@
+import collections
+import hashlib
+import importlib
+import os
+import pickle
+import threading
+import time
+import pandas as pd
+
+import metrics
+import records
+import search
+import singleflight
+import store
+
+# Latest scrape result per source, kept on disk so the dashboard can render it
+# instantly. Written by the scheduler process, the Scrape All sweep and the
+# dashboard's own background refreshes.
+SNAPSHOT_DIR = os.path.join(os.environ.get('SCRAPER_CACHE_DIR', '.cache'), 'snapshots')
+
+# After a failed refresh, wait this long before refreshing a stale snapshot automatically again
+RETRY_AFTER_ERROR = 300
+
+_lock = threading.Lock()
+_refreshing = set()
+_errors = {}
+# Tables parsed so far by a running streaming refresh: source -> (tables, expected table count or None)
+_partial = {}
+
+# Loaded snapshots shared by every session of the process, least recently used first:
+# source -> (file mtime, snapshot, approximate bytes). Only the latest version of a source is
+# kept, and sources are evicted past this many bytes (SCRAPER_SNAPSHOT_STORE_MB).
+STORE_MAX_BYTES = int(float(os.environ.get('SCRAPER_SNAPSHOT_STORE_MB', '256')) * 2 ** 20)
+_loaded = collections.OrderedDict()
+
+
+def _path(source):
+    return os.path.join(SNAPSHOT_DIR, f'{source}.pickle')
+
+
+# Modification time of a source's snapshot file (ns), or None if it has never been saved
+def modified_at(source):
+    try:
+        return os.stat(_path(source)).st_mtime_ns
+    except OSError:
+        return None
+
+
+# Latest snapshot, or None when there is none (or only one saved under an older table schema,
+# which then counts as stale and is re-scraped). Served from the process-wide store while the
+# file is unchanged, so every session shares one copy: treat the returned snapshot as read-only.
+def load(source):
+    modified = modified_at(source)
+    if modified is None:
+        return None
+    with _lock:
+        entry = _loaded.get(source)
+        hit = entry is not None and entry[0] == modified
+        if hit:
+            _loaded.move_to_end(source)
+    metrics.cache_result('snapshot', hit, source)
+    if hit:
+        return entry[1]
+    # Sessions that miss together unpickle the file once
+    snapshot = singleflight.do(('load', source, modified), lambda: _read(source))
+    if snapshot is not None:
+        _keep(source, modified, snapshot)
+    return snapshot
+
+
+def _read(source):
+    try:
+        with open(_path(source), 'rb') as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    return snapshot if snapshot.get('schema') == records.SCHEMA else None
+
+
+# Approximate memory held by a snapshot's tables and search columns
+def _size(snapshot):
+    tables = sum(int(df.memory_usage(deep=True).sum()) for _, df in snapshot['tables'])
+    return tables + sum(column.memory_usage(deep=True) for column in snapshot['search'])
+
+
+# Remember `snapshot` as the latest of `source` (file version `modified`), evicting the least
+# recently used sources past STORE_MAX_BYTES; the newest entry is kept even when it alone is larger
+def _keep(source, modified, snapshot):
+    size = _size(snapshot)
+    with _lock:
+        current = _loaded.get(source)
+        if current is not None and current[0] > modified:
+            return  # A newer version landed meanwhile
+        _loaded[source] = (modified, snapshot, size)
+        _loaded.move_to_end(source)
+        while len(_loaded) > 1 and sum(entry[2] for entry in _loaded.values()) > STORE_MAX_BYTES:
+            _loaded.popitem(last=False)
+
+
+# (sources held, bytes held) by the shared snapshot store, for the dashboard
+def store_usage():
+    with _lock:
+        return len(_loaded), sum(entry[2] for entry in _loaded.values())
+
+
+# Content hash of the parsed tables: unchanged data keeps its version across refreshes,
+# so HTML rendered for it stays valid
+def tables_version(tables):
+    digest = hashlib.sha256()
+    for table_name, df in tables:
+        digest.update(table_name.encode())
+        digest.update(','.join(map(str, df.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+def save(source, tables, taken_at=None):
+    snapshot = {
+        'source': source,
+        'schema': records.SCHEMA,
+        'taken_at': taken_at or time.time(),
+        'version': tables_version(tables),
+        'tables': tables,
+        # Pages that failed in a scrape that still returned rows (see page7.build_dataframe)
+        'errors': [error for _, df in tables for error in df.attrs.get('errors', ())],
+        # Keyword filters match against these instead of re-stringifying every cell per rerun
+        'search': [search_column(source, df) for _, df in tables],
+    }
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    path = _path(source)
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    modified = os.stat(tmp_path).st_mtime_ns  # The rename keeps it
+    os.replace(tmp_path, path)  # Readers always see a complete snapshot
+    _keep(source, modified, snapshot)  # This process's sessions need not read it back
+
+    # Every snapshot also lands in the persistent opportunity store
+    store.upsert(source, tables, snapshot['taken_at'])
+    return snapshot
+
+
+# Search column of one of `source`'s tables: only the columns its page shows (a page module's
+# COLUMNS_TO_DROP are never on screen, so a keyword must not match them)
+def search_column(source, df):
+    hidden = getattr(importlib.import_module(source), 'COLUMNS_TO_DROP', ())
+    return search.build_search_column(df.drop(columns=hidden, errors='ignore'))
+
+
+# A table as exported outside the dashboard: row identities kept in the index (PASSPort's
+# data-ids) become an 'id' column, a plain positional index is dropped
+def export_frame(df):
+    if pd.api.types.is_integer_dtype(df.index):
+        return df.reset_index(drop=True)
+    return df.rename_axis('id').reset_index()
+
+
+# How often a source should be re-scraped, from its page module's REFRESH_INTERVAL
+def refresh_interval(source):
+    return importlib.import_module(source).REFRESH_INTERVAL
+
+
+def age(snapshot):
+    return time.time() - snapshot['taken_at']
+
+
+def is_stale(source, snapshot):
+    return snapshot is None or age(snapshot) >= refresh_interval(source)
+
+
+# Stale and not just failed (so a down upstream is not hammered on every rerun)
+def needs_refresh(source, snapshot):
+    if not is_stale(source, snapshot):
+        return False
+    failure = _errors.get(source)
+    return failure is None or time.time() - failure[1] >= RETRY_AFTER_ERROR
+
+
+# Blocking scrape + save; raises whatever the source's fetch raises. A scrape of `source` already
+# running in this process (another session's refresh, the Scrape All sweep, the scheduler) is
+# joined and its snapshot shared instead of scraping again.
+def refresh(source):
+    return singleflight.do(refresh_key(source), lambda: _refresh(source))
+
+
+# Single-flight key shared by every path that scrapes a source into its snapshot
+def refresh_key(source):
+    return ('refresh', source)
+
+
+# Sources with stream_tables() publish each table through partial_tables() as soon as it is parsed
+def _refresh(source):
+    module = importlib.import_module(source)
+    with metrics.source_context(source):
+        try:
+            if not hasattr(module, 'stream_tables'):
+                return save(source, module.fetch_tables())
+            tables = []
+            _partial[source] = (tables, len(getattr(module, 'TABLE_NAMES', ())) or None)
+            for table in module.stream_tables():
+                tables.append(table)
+            return save(source, tables)
+        finally:
+            _partial.pop(source, None)
+            metrics.export_prometheus()
+
+
+# (tables parsed so far, expected count or None) while a streaming refresh of `source` runs, else None
+def partial_tables(source):
+    partial = _partial.get(source)
+    if partial is None:
+        return None
+    tables, expected = partial
+    return list(tables), expected
+
+
+def _refresh_worker(source):
+    try:
+        refresh(source)
+        _errors.pop(source, None)
+    except Exception as e:
+        _errors[source] = (e, time.time())
+    finally:
+        with _lock:
+            _refreshing.discard(source)
+
+
+# Start a refresh on a daemon thread unless one is already running for this source
+def refresh_in_background(source):
+    with _lock:
+        if source in _refreshing:
+            return False
+        _refreshing.add(source)
+    threading.Thread(target=_refresh_worker, args=(source,), name=f'refresh-{source}', daemon=True).start()
+    return True
+
+
+def is_refreshing(source):
+    return source in _refreshing
+
+
+# Error from the most recent failed background refresh, cleared by the next success
+def last_error(source):
+    failure = _errors.get(source)
+    return failure[0] if failure else None
@@ -0,0 +1,44 @@
+import importlib
+
+# Source registry: (page module, display name) for every source the dashboard can scrape.
+# Plain data, so the dashboard, the scrape-all sweep and the scheduler can list sources
+# without importing a page module (pandas, bs4, its fetch stack); a module loads on first use.
+#
+# Besides fetch_tables() and show_page(), a page module sets
+#   REFRESH_INTERVAL  seconds between background re-scrapes (scheduler and stale snapshots);
+#                     ScraperAPI sources use the render cache TTL, so a re-scrape renders anew
+#   USES_SCRAPERAPI   True when the page is rendered through ScraperAPI (the key is looked up
+#                     on the first render, not at import)
+# and show_page() calls snapshot_view.latest_snapshot(), which renders the saved snapshot at
+# once and refreshes a stale one in the background. show_page() imports Streamlit itself, so
+# scrapes (scheduler, CLI) run where it is not installed.
+SOURCES = [
+    ('page2', 'NYS General Services'),
+    ('page3', 'NYS DOT Detailed Ads'),
+    ('page4', 'NYS DOT Designation'),
+    ('page5', 'Port Authority Construction'),
+    ('page6', 'Port Authority Professional Services'),
+    ('page7', 'PASSPort Opportunities'),
+]
+
+NAMES = dict(SOURCES)
+
+
+# Page module of a registered source, imported the first time it is needed
+def load(module_name):
+    if module_name not in NAMES:
+        raise KeyError(f'unknown source: {module_name}')
+    return importlib.import_module(module_name)
+
+
+# Positional SOURCE arguments of the command-line tools
+def add_argument(arg_parser):
+    arg_parser.add_argument('sources', nargs='*', metavar='SOURCE', help=f"any of {', '.join(NAMES)} (default: all)")
+
+
+# Sources named on the command line, every source when none is; an unknown name is a usage error
+def selected(arg_parser, names):
+    unknown = set(names) - set(NAMES)
+    if unknown:
+        arg_parser.error(f"unknown sources: {', '.join(sorted(unknown))}")
+    return names or list(NAMES)
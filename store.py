@@ -0,0 +1,184 @@
+import hashlib
+import importlib
+import json
+import os
+import sqlite3
+import time
+import pandas as pd
+import records
+import search
+
+# Persistent opportunity store. Every saved snapshot is upserted here, keyed on a
+# stable per-source row identity (each page module's row_key), with the time the
+# row was first and last seen, so "what is new" needs no re-scrape.
+DB_PATH = os.environ.get('SCRAPER_DB', os.path.join('data', 'opportunities.db'))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS opportunities (
+    source      TEXT NOT NULL,
+    row_key     TEXT NOT NULL,
+    table_name  TEXT NOT NULL,
+    data        TEXT NOT NULL,
+    title       TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    first_seen  REAL NOT NULL,
+    last_seen   REAL NOT NULL,
+    PRIMARY KEY (source, row_key)
+);
+CREATE INDEX IF NOT EXISTS opportunities_first_seen ON opportunities (first_seen);
+CREATE INDEX IF NOT EXISTS opportunities_source_last_seen ON opportunities (source, last_seen);
+"""
+
+# Full-text index over every source's titles and descriptions. It indexes the
+# opportunities table itself (external content) and the triggers keep it in step
+# with each upsert; a re-scrape that leaves a row's text unchanged touches nothing.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS opportunities_fts USING fts5(
+    title, description,
+    content='opportunities', content_rowid='rowid',
+    tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS opportunities_fts_insert AFTER INSERT ON opportunities BEGIN
+    INSERT INTO opportunities_fts (rowid, title, description) VALUES (new.rowid, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS opportunities_fts_delete AFTER DELETE ON opportunities BEGIN
+    INSERT INTO opportunities_fts (opportunities_fts, rowid, title, description)
+    VALUES ('delete', old.rowid, old.title, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS opportunities_fts_update AFTER UPDATE OF title, description ON opportunities
+WHEN old.title IS NOT new.title OR old.description IS NOT new.description BEGIN
+    INSERT INTO opportunities_fts (opportunities_fts, rowid, title, description)
+    VALUES ('delete', old.rowid, old.title, old.description);
+    INSERT INTO opportunities_fts (rowid, title, description) VALUES (new.rowid, new.title, new.description);
+END;
+"""
+
+# Title matches outrank description matches
+TITLE_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+# A row seen again keeps its first_seen; its table (e.g. a move to "Short-Listed") and data follow the page
+UPSERT = """
+INSERT INTO opportunities (source, row_key, table_name, data, title, description, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (source, row_key) DO UPDATE SET
+    table_name = excluded.table_name,
+    data = excluded.data,
+    title = excluded.title,
+    description = excluded.description,
+    last_seen = excluded.last_seen
+"""
+
+
+# WAL lets the dashboard read while the scheduler process writes
+def connect():
+    directory = os.path.dirname(DB_PATH)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.executescript(SCHEMA)
+    conn.executescript(FTS_SCHEMA)
+    return conn
+
+
+# Short stable hash of text, for row identities built from descriptions
+def text_key(*parts):
+    return hashlib.sha1('|'.join(str(part) for part in parts).encode()).hexdigest()[:16]
+
+
+# Fallback identity: the whole row's shown content
+def content_key(row):
+    return text_key(*row[records.display_columns(row)].tolist())
+
+
+# Indexed text of a row: the module's TITLE_COLUMN (else the first column) and the other cells, markup stripped
+def row_text(row, title_column=None):
+    if title_column not in row.index:
+        title_column = row.index[0]
+    title = search.plain_text(row[title_column])
+    description = ' '.join(search.plain_text(value) for column, value in row.items()
+                           if column != title_column and not records.is_url_column(row.index, column))
+    return title, description.strip()
+
+
+# Upsert every row of a source's tables; returns the number of rows written
+def upsert(source, tables, seen_at=None):
+    module = importlib.import_module(source)
+    title_column = getattr(module, 'TITLE_COLUMN', None)
+    seen_at = seen_at or time.time()
+
+    upserts = []
+    for table_name, df in tables:
+        for _, row in df.iterrows():
+            key = module.row_key(table_name, row)
+            if key is None:
+                continue  # Placeholder rows such as "No submissions at this time."
+            data = row_json(row)
+            title, description = row_text(row, title_column)
+            upserts.append((source, key, table_name, data, title, description, seen_at, seen_at))
+
+    conn = connect()
+    try:
+        with conn:
+            conn.executemany(UPSERT, upserts)
+    finally:
+        conn.close()
+    return len(upserts)
+
+
+# A row as stored JSON: missing cells (NaN, NaT, None) become null, timestamps their text
+def row_json(row):
+    data = {column: None if pd.api.types.is_scalar(value) and pd.isna(value) else value
+            for column, value in row.items()}
+    return json.dumps(data, default=str, allow_nan=False)
+
+
+
+
+# Rows first seen at or after `since` (epoch seconds), newest first
+def new_since(since, source=None):
+    query = 'SELECT source, table_name, row_key, data, first_seen, last_seen FROM opportunities WHERE first_seen >= ?'
+    params = [since]
+    if source:
+        query += ' AND source = ?'
+        params.append(source)
+    query += ' ORDER BY first_seen DESC'
+
+    conn = connect()
+    try:
+        rows = conn.execute(query, params).fetchall()
+    finally:
+        conn.close()
+    df = pd.DataFrame(rows, columns=['source', 'table_name', 'row_key', 'data', 'first_seen', 'last_seen'])
+    df['data'] = df['data'].map(json.loads)
+    return df
+
+
+# Ranked full-text search across every source: best BM25 match first, with a highlighted snippet
+def search_opportunities(query, limit=50):
+    match = search.fts_query(query)
+    columns = ['source', 'table_name', 'title', 'snippet', 'score', 'data', 'first_seen', 'last_seen']
+    if not match:
+        return pd.DataFrame(columns=columns)
+
+    conn = connect()
+    try:
+        rows = conn.execute(
+            f"""
+            SELECT o.source, o.table_name, o.title,
+                   snippet(opportunities_fts, 1, '<mark>', '</mark>', ' … ', 16),
+                   bm25(opportunities_fts, {TITLE_WEIGHT}, {DESCRIPTION_WEIGHT}) AS score,
+                   o.data, o.first_seen, o.last_seen
+            FROM opportunities_fts JOIN opportunities AS o ON o.rowid = opportunities_fts.rowid
+            WHERE opportunities_fts MATCH ?
+            ORDER BY score
+            LIMIT ?
+            """,
+            (match, limit),
+        ).fetchall()
+    finally:
+        conn.close()
+    df = pd.DataFrame(rows, columns=columns)
+    df['data'] = df['data'].map(json.loads)
+    return df
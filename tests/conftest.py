@@ -0,0 +1,18 @@
+import os
+import sys
+import tempfile
+
+# The app is a flat set of top-level modules; make them importable from the tests
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# Caches, snapshots, metrics and the opportunity store of a test run never touch the working ones
+_STATE_DIR = tempfile.mkdtemp(prefix='scraper-tests-')
+os.environ.setdefault('SCRAPER_CACHE_DIR', _STATE_DIR)
+os.environ.setdefault('SCRAPER_DB', os.path.join(_STATE_DIR, 'opportunities.db'))
+
+FIXTURE_DIR = os.path.join(ROOT, 'benchmarks', 'fixtures')
+
+
+def fixture_html(source):
+    with open(os.path.join(FIXTURE_DIR, f'{source}.html'), 'rb') as f:
+        return f.read()
@@ -0,0 +1,67 @@
+import gzip
+import http.client
+import json
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+import api_server
+import page3
+import snapshots
+from conftest import fixture_html
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshots, 'SNAPSHOT_DIR', str(tmp_path))
+    snapshots.save('page3', [('NYS DOT Detailed Ads', page3.parse_nys_dot_detail_ads(fixture_html('page3')))])
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), api_server.Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd.server_address
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def get(address, path, **headers):
+    connection = http.client.HTTPConnection(*address, timeout=10)
+    connection.request('GET', path, headers=headers)
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response, body
+
+
+def test_unchanged_snapshot_answers_304(server):
+    response, body = get(server, '/sources/page3')
+    assert response.status == 200
+    assert len(json.loads(body)['tables'][0]['rows']) == 25
+
+    etag = response.getheader('ETag')
+    response, body = get(server, '/sources/page3', **{'If-None-Match': etag})
+    assert (response.status, body) == (304, b'')
+    response, _ = get(server, '/sources/page3', **{'If-None-Match': 'W/' + etag})
+    assert response.status == 304
+
+
+# The gzipped body is its own representation, with its own ETag
+def test_gzip_for_clients_that_accept_it(server):
+    plain, plain_body = get(server, '/sources/page3')
+    response, body = get(server, '/sources/page3', **{'Accept-Encoding': 'gzip'})
+    assert response.getheader('Content-Encoding') == 'gzip'
+    assert gzip.decompress(body) == plain_body
+    etag = response.getheader('ETag')
+    assert etag != plain.getheader('ETag') and etag.endswith('-gzip"')
+
+    response, _ = get(server, '/sources/page3', **{'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert response.status == 304
+    response, _ = get(server, '/sources/page3', **{'Accept-Encoding': 'gzip;q=0'})
+    assert response.getheader('Content-Encoding') is None
+
+
+@pytest.mark.parametrize('since', ['yesterday', 'nan', 'inf'])
+def test_bad_since_is_a_400(server, since):
+    for path in (f'/opportunities?since={since}', f'/sources/page3?since={since}'):
+        response, body = get(server, path)
+        assert response.status == 400
+        assert 'since' in json.loads(body)['error']
@@ -0,0 +1,13 @@
+import subprocess
+import sys
+
+from conftest import ROOT
+
+
+# The batch CLI, the scheduler and every source's fetch path must run where Streamlit is not installed
+def test_scrape_path_does_not_import_streamlit():
+    code = ('import sys, scrape_cli, scheduler, sources\n'
+            'for source in sources.NAMES:\n'
+            '    sources.load(source)\n'
+            'assert "streamlit" not in sys.modules, "streamlit was imported"\n')
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True)
@@ -0,0 +1,50 @@
+from urllib.parse import urlsplit
+
+import httpx
+import pytest
+
+import fetcher
+import http_cache
+import page3
+from conftest import fixture_html
+
+ETAG = '"v1"'
+parses = []
+
+
+def parse_ads(html_content):
+    parses.append(len(html_content))
+    return [('NYS DOT Detailed Ads', page3.parse_nys_dot_detail_ads(html_content))]
+
+
+# The DOT page as a server honouring If-None-Match would serve it
+def serve(request):
+    if request.headers.get('If-None-Match') == ETAG:
+        return httpx.Response(304)
+    return httpx.Response(200, content=fixture_html('page3'), headers={'ETag': ETAG})
+
+
+@pytest.fixture(autouse=True)
+def mock_upstream(tmp_path, monkeypatch):
+    parses.clear()
+    monkeypatch.setattr(http_cache, 'CACHE_DIR', str(tmp_path))
+    client = httpx.Client(transport=httpx.MockTransport(serve))
+    monkeypatch.setitem(fetcher._clients, urlsplit(page3.URL).netloc, client)
+
+
+# A 304 answers with the tables parsed from the 200 before it, without parsing again
+def test_not_modified_returns_cached_tables_unparsed():
+    first = http_cache.get_parsed(page3.URL, parse_ads)
+    assert len(parses) == 1
+
+    second = http_cache.get_parsed(page3.URL, parse_ads)
+    assert len(parses) == 1
+    assert [name for name, _ in second] == ['NYS DOT Detailed Ads']
+    assert second[0][1].equals(first[0][1])
+
+
+def test_not_modified_streams_cached_tables():
+    http_cache.get_parsed(page3.URL, parse_ads)
+    streamed = list(http_cache.iter_parsed(page3.URL, parse_ads, None))
+    assert len(parses) == 1
+    assert len(streamed[0][1]) == 25
@@ -0,0 +1,31 @@
+import json
+
+import metrics
+
+
+def test_stages_are_logged_as_json_lines(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics, 'METRICS_LOG', str(tmp_path / 'stages.jsonl'))
+    monkeypatch.setattr(metrics, '_stage_log', None)
+    with metrics.stage('parse', 'page3', bytes=10):
+        pass
+    for handler in metrics._stage_log.handlers:
+        handler.flush()
+    lines = (tmp_path / 'stages.jsonl').read_text().splitlines()
+    assert json.loads(lines[-1])['stage'] == 'parse'
+    for handler in metrics._stage_log.handlers:
+        handler.close()
+    metrics._stage_log.handlers.clear()
+
+
+# Cache hits alone (a rerun served from memory) leave the Prometheus export as it was
+def test_export_skips_generations_with_only_cache_hits(tmp_path):
+    path = str(tmp_path / 'test.prom')
+    metrics.cache_result('snapshot', False, 'page3')
+    metrics.export_prometheus(path)
+    written = (tmp_path / 'test.prom').stat().st_mtime_ns
+    metrics.cache_result('snapshot', True, 'page3')
+    assert metrics.export_prometheus(path) == path
+    assert (tmp_path / 'test.prom').stat().st_mtime_ns == written
+    metrics.cache_result('snapshot', False, 'page3')
+    metrics.export_prometheus(path)
+    assert 'result="hit"' in (tmp_path / 'test.prom').read_text()
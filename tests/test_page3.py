@@ -0,0 +1,9 @@
+import page3
+from conftest import fixture_html
+
+
+# Descriptions are plain text: entities decoded and inline tags dropped, documents list excluded
+def test_description_is_plain_text():
+    df = page3.parse_nys_dot_detail_ads(fixture_html('page3'))
+    assert 'D264418 Bridge & culvert repairs urgent, I-87' in df['Description'].tolist()
+    assert not df['Description'].str.contains('<|&amp;|Notice to Bidders').any()
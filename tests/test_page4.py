@@ -0,0 +1,22 @@
+import datetime
+
+import page4
+from conftest import fixture_html
+
+
+def days_since(day):
+    return (datetime.date.today() - day).days
+
+
+# The fixture lists its ads out of date order, with in-window ads after a run of old ones
+def test_date_window_keeps_rows_after_older_ones(monkeypatch):
+    monkeypatch.setattr(page4, 'DATE_WINDOW_DAYS', days_since(datetime.date(2025, 7, 1)))
+    df = page4.parse_nys_dot_designation(fixture_html('page4'))
+    assert df['Date'].dt.strftime('%Y-%m-%d').tolist() == ['2025-12-09', '2025-08-18', '2025-08-08', '2025-07-28']
+
+
+def test_date_window_off_keeps_every_row(monkeypatch):
+    monkeypatch.setattr(page4, 'DATE_WINDOW_DAYS', 0)
+    df = page4.parse_nys_dot_designation(fixture_html('page4'))
+    assert len(df) == 24
+    assert df['Date'].is_monotonic_decreasing
@@ -0,0 +1,61 @@
+import asyncio
+
+import page7
+import scraperapi
+
+
+def grid(*row_ids):
+    rows = ''.join(f'<tr data-id="{row_id}"><td>EPIN{row_id}</td><td>Agency</td><td>Released</td>'
+                   f'<td>Procurement {row_id}</td></tr>' for row_id in row_ids)
+    return (f'<html><body><table class="iv-grid-view"><tr><th>EPIN</th><th>Agency</th><th>RFx Status</th>'
+            f'<th>Procurement Name</th></tr>{rows}</table></body></html>')
+
+
+def scrape(monkeypatch, render):
+    rendered = []
+
+    async def afetch(client, url):
+        rendered.append(url)
+        return render(url)
+
+    monkeypatch.setattr(scraperapi, 'afetch', afetch)
+    df = page7.build_dataframe(*asyncio.run(page7.afetch_passport_pages(None)))
+    return df, rendered
+
+
+# A grid that ignores the page argument repeats page 1: the page 2 probe ends the scrape,
+# and the table is flagged as partial
+def test_ignored_page_argument_costs_two_renders(monkeypatch):
+    df, rendered = scrape(monkeypatch, lambda url: grid(1, 2))
+    assert rendered == [page7.URL, page7.page_url(2)]
+    assert list(df.index) == ['1', '2']
+    assert len(df.attrs['errors']) == 1 and 'Page 2 repeated page 1' in df.attrs['errors'][0]
+
+
+# A single-page grid: page 2 comes back empty, which is the end of the grid, not an error
+def test_empty_page_two_ends_cleanly(monkeypatch):
+    df, rendered = scrape(monkeypatch, lambda url: grid(1, 2) if url == page7.URL else grid())
+    assert rendered == [page7.URL, page7.page_url(2)]
+    assert list(df.index) == ['1', '2']
+    assert df.attrs['errors'] == []
+
+
+# Pages that honour the argument are read concurrently until one adds nothing new
+def test_pages_are_read_until_one_adds_no_rows(monkeypatch):
+    pages = {page7.URL: grid(1, 2), page7.page_url(2): grid(3, 4), page7.page_url(3): grid(5)}
+    df, rendered = scrape(monkeypatch, lambda url: pages.get(url, grid()))
+    assert list(df.index) == ['1', '2', '3', '4', '5']
+    assert rendered == [page7.URL] + [page7.page_url(n) for n in (2, 3, 4, 5)]
+    assert df.attrs['errors'] == []
+
+
+def test_failed_page_keeps_rows_and_reports_error(monkeypatch, caplog):
+    def render(url):
+        if url == page7.page_url(3):
+            raise RuntimeError('render timed out')
+        return grid(3, 4) if url == page7.page_url(2) else grid(1, 2)
+
+    df, _ = scrape(monkeypatch, render)
+    assert list(df.index) == ['1', '2', '3', '4']
+    assert df.attrs['errors'] == ['Failed to fetch page 3: render timed out']
+    assert 'partial PASSPort scrape' in caplog.text
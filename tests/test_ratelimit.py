@@ -0,0 +1,85 @@
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+import ratelimit
+import scraperapi
+from conftest import ROOT
+
+URL = 'https://api.scraperapi.com/?api_key=test-key&render=true&url=https%3A%2F%2Fexample.com'
+ACQUIRE = ('import ratelimit\n'
+           'for _ in range(10):\n'
+           '    with ratelimit.permit({url!r}) as permit:\n'
+           '        permit["status"] = 200\n')
+
+
+@pytest.fixture(autouse=True)
+def fresh_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(ratelimit, 'DB_PATH', str(tmp_path / 'ratelimit.sqlite'))
+    monkeypatch.setattr(ratelimit._local, 'conn', None, raising=False)
+    monkeypatch.setattr(ratelimit, 'SCRAPERAPI_BURST', 1000)
+    monkeypatch.setattr(ratelimit, 'SCRAPERAPI_RATE', 1000)
+
+
+def spent():
+    return sum(ratelimit.monthly_credits().values())
+
+
+def leases():
+    return ratelimit.connect().execute('SELECT COUNT(*) FROM leases').fetchone()[0]
+
+
+def test_budget_stops_requests_before_they_are_sent(monkeypatch):
+    monkeypatch.setattr(ratelimit, 'SCRAPERAPI_MONTHLY_CREDITS', 2 * scraperapi.CREDITS_RENDER)
+    for _ in range(2):
+        with ratelimit.permit(URL) as permit:
+            permit['status'] = 200
+    with pytest.raises(ratelimit.BudgetExceeded):
+        with ratelimit.permit(URL):
+            pass
+    assert spent() == 2 * scraperapi.CREDITS_RENDER
+    assert leases() == 0
+
+
+# Only billed answers keep their credits, so a failed request does not eat into the budget
+def test_unbilled_response_refunds_credits():
+    with ratelimit.permit(URL) as permit:
+        permit['status'] = 500
+    assert spent() == 0
+
+
+# Every process reserves credits from the same file without losing another's reservations
+def test_credits_add_up_across_processes():
+    env = dict(os.environ, SCRAPER_RATELIMIT_DB=ratelimit.DB_PATH, SCRAPERAPI_RATE='1000', SCRAPERAPI_BURST='1000')
+    code = ACQUIRE.format(url=URL)
+    workers = [subprocess.Popen([sys.executable, '-c', code], cwd=ROOT, env=env) for _ in range(4)]
+    assert all(worker.wait() == 0 for worker in workers)
+    assert spent() == 4 * 10 * scraperapi.CREDITS_RENDER
+    assert leases() == 0
+
+
+# A request cancelled while it waits for a slot frees nothing it did not hold and returns its credits
+def test_cancelled_wait_returns_credits(monkeypatch):
+    monkeypatch.setattr(ratelimit, 'SCRAPERAPI_CONCURRENCY', 1)
+
+    async def wait_for_slot():
+        async with ratelimit.apermit(URL):
+            pass
+
+    async def scenario():
+        with ratelimit.permit(URL) as held:
+            held['status'] = 200
+            waiter = asyncio.create_task(wait_for_slot())
+            await asyncio.sleep(5 * ratelimit.POLL_SECONDS)
+            assert not waiter.done()
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            assert leases() == 1
+
+    asyncio.run(scenario())
+    assert spent() == scraperapi.CREDITS_RENDER
+    assert leases() == 0
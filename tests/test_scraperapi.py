@@ -0,0 +1,73 @@
+import json
+import os
+import subprocess
+import sys
+from urllib.parse import urlsplit
+
+import httpx
+import pytest
+
+import fetcher
+import scraperapi
+from conftest import ROOT
+
+RECORD = 'import scraperapi\nfor _ in range(50):\n    scraperapi._record(True, True)\n'
+PAGE = 'https://www.passport.cityofnewyork.us/page7'
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(scraperapi, 'CACHE_DIR', str(tmp_path))
+
+
+# fn()'s result and how it moved the usage counters
+def counted(fn):
+    before = scraperapi.usage()
+    result = fn()
+    return result, {name: value - before[name] for name, value in scraperapi.usage().items()}
+
+
+def test_cached_render_is_served_within_ttl(cache_dir):
+    assert scraperapi.lookup(PAGE) is None
+    _, spent = counted(lambda: scraperapi.store(PAGE, True, '<html>1</html>'))
+    assert spent == {'calls': 1, 'hits': 0, 'credits_spent': scraperapi.CREDITS_RENDER, 'credits_saved': 0}
+
+    body, saved = counted(lambda: scraperapi.lookup(PAGE))
+    assert body == '<html>1</html>'
+    assert saved == {'calls': 0, 'hits': 1, 'credits_spent': 0, 'credits_saved': scraperapi.CREDITS_RENDER}
+    # Plain and rendered fetches of a page are cached apart
+    assert scraperapi.lookup(PAGE, render=False) is None
+
+
+def test_expired_render_is_fetched_again(cache_dir, monkeypatch):
+    scraperapi.store(PAGE, True, '<html>1</html>')
+    fetched_at = scraperapi.time.time()
+    monkeypatch.setattr(scraperapi.time, 'time', lambda: fetched_at + scraperapi.CACHE_TTL + 1)
+    assert scraperapi.lookup(PAGE) is None
+    assert scraperapi.lookup(PAGE, ttl=scraperapi.CACHE_TTL * 2) == '<html>1</html>'
+
+
+# Only the first fetch reaches ScraperAPI; the second is answered from the cache
+def test_fetch_renders_once_within_ttl(cache_dir, monkeypatch):
+    requests = []
+
+    def render(request):
+        requests.append(request.url.params['url'])
+        return httpx.Response(200, text='<html>rendered</html>')
+
+    client = httpx.Client(transport=httpx.MockTransport(render))
+    monkeypatch.setitem(fetcher._clients, urlsplit(scraperapi.API_ENDPOINT).netloc, client)
+    assert [scraperapi.fetch(PAGE, api_key='test-key') for _ in range(2)] == ['<html>rendered</html>'] * 2
+    assert requests == [PAGE]
+
+
+# Dashboard, scheduler and CLI processes count into the same totals without losing updates
+def test_usage_counters_add_up_across_processes(tmp_path):
+    env = dict(os.environ, SCRAPER_CACHE_DIR=str(tmp_path), SCRAPER_RATELIMIT_DB=str(tmp_path / 'ratelimit.sqlite'))
+
+    workers = [subprocess.Popen([sys.executable, '-c', RECORD], cwd=ROOT, env=env) for _ in range(4)]
+    assert all(worker.wait() == 0 for worker in workers)
+
+    totals = subprocess.run([sys.executable, '-c', 'import json, scraperapi; print(json.dumps(scraperapi.usage()))'],
+                            cwd=ROOT, env=env, check=True, capture_output=True, text=True).stdout
+    assert json.loads(totals) == {'calls': 0, 'hits': 200, 'credits_spent': 0, 'credits_saved': 2000}
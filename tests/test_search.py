@@ -0,0 +1,55 @@
+import pytest
+
+import page7
+import records
+import search
+import snapshots
+from conftest import fixture_html
+
+
+def passport_rows():
+    return records.frame(
+        [['Bridge rehab', 'Released', 'Construction', ''],
+         ['Bridge painting', 'Released', 'Construction', '12/01/2025']],
+        ['Procurement Name', 'RFx Status', 'Industry', 'Due Date (Your Local Time)'],
+        categories=page7.CATEGORY_COLUMNS, dates=page7.DATE_COLUMNS)
+
+
+# A blank due date is stored as NaT; the rest of its row must still be searchable
+def test_search_column_ignores_missing_cells():
+    df = passport_rows()
+    assert df['Due Date (Your Local Time)'].isna().iloc[0]
+    assert search.build_search_column(df).tolist() == [
+        'bridge rehab released construction ',
+        'bridge painting released construction 2025-12-01',
+    ]
+
+
+def test_keyword_filter_keeps_row_with_missing_cell():
+    df = passport_rows()
+    rows = page7.filtered_rows(df, search.build_search_column(df), 'All', 'bridge', True)
+    assert rows['Procurement Name'].tolist() == ['Bridge rehab', 'Bridge painting']
+
+
+# EPIN is one of the columns the PASSPort page hides; searching for one must not match its row
+def test_passport_search_ignores_hidden_columns():
+    df = page7.parse_tables(fixture_html('page7'))[0][1]
+    epin = df['EPIN'].iloc[0]
+    search_column = snapshots.search_column('page7', df)
+    assert page7.filtered_rows(df, search_column, 'All', epin, True).empty
+
+
+@pytest.mark.parametrize('query, match', [
+    ('bridge', '"bridge"'),
+    ('"bridge rehab"', '"bridge rehab"'),
+    ('bri*', '"bri"*'),
+    ('bridge OR culvert', '"bridge" OR "culvert"'),
+    ('OR bridge OR', '"bridge"'),
+    # FTS5 operators and punctuation are searched as plain words
+    ('I-87', '"I 87"'),
+    ('D26:1', '"D26 1"'),
+    ('NOT bridge', '"NOT" "bridge"'),
+    ('( - )', ''),
+])
+def test_fts_query(query, match):
+    assert search.fts_query(query) == match
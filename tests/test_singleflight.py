@@ -0,0 +1,82 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import singleflight
+
+CALLERS = 8
+
+
+# Runs `fn` under `key` from every caller at once; the leader holds until all the others joined
+def run_together(key, fn, monkeypatch):
+    calls = []
+    joined = threading.Semaphore(0)
+    release = threading.Event()
+    monkeypatch.setattr(singleflight.metrics, 'cache_result', lambda kind, hit, *args: hit and joined.release())
+
+    def work():
+        calls.append(1)
+        release.wait(5)
+        return fn()
+
+    with ThreadPoolExecutor(CALLERS) as pool:
+        leader = pool.submit(singleflight.do, key, work)
+        while not singleflight.in_flight(key):
+            pass
+        joiners = [pool.submit(singleflight.do, key, work) for _ in range(CALLERS - 1)]
+        for _ in joiners:
+            assert joined.acquire(timeout=5)
+        release.set()
+        futures = [leader] + joiners
+        results = [future.exception() or future.result() for future in futures]
+    return calls, results
+
+
+def test_concurrent_callers_share_one_run(monkeypatch):
+    calls, results = run_together('shared', lambda: object(), monkeypatch)
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert not singleflight.in_flight('shared')
+
+
+def test_error_reaches_every_caller(monkeypatch):
+    def fail():
+        raise ValueError('upstream down')
+
+    calls, results = run_together('failing', fail, monkeypatch)
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) and result is results[0] for result in results)
+    # The failed flight is gone, so the next caller tries again
+    assert singleflight.do('failing', lambda: 'recovered') == 'recovered'
+
+
+def test_async_callers_join_one_coroutine():
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 'page'
+
+    async def scenario():
+        return await asyncio.gather(*(singleflight.ado('async', work) for _ in range(CALLERS)))
+
+    assert asyncio.run(scenario()) == ['page'] * CALLERS
+    assert len(calls) == 1
+
+
+def test_async_error_reaches_joiners():
+    async def fail():
+        await asyncio.sleep(0.05)
+        raise ValueError('upstream down')
+
+    async def scenario():
+        return await asyncio.gather(*(singleflight.ado('async-failing', fail) for _ in range(3)),
+                                    return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, ValueError) for result in results)
+    with pytest.raises(ValueError):
+        asyncio.run(singleflight.ado('async-failing', fail))
@@ -0,0 +1,56 @@
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+import records
+import snapshot_view
+from conftest import ROOT
+
+
+def bids():
+    return records.frame([['Bridge', '1,200', '03/01/2025'], ['culvert', '950', '01/15/2025'], ['Arch', '15', '12/01/2024']],
+                         ['Name', 'Amount', 'Due Date'], dates=['Due Date'])
+
+
+def test_sort_order_by_column_type():
+    df = bids()
+    assert snapshot_view.sort_order(df, 'Name', False) == [2, 0, 1]  # Text ignores case
+    assert snapshot_view.sort_order(df, 'Amount', False) == [0, 2, 1]  # '1,200' is not a number, so text
+    assert snapshot_view.sort_order(df.assign(Amount=['1200', '950', '15']), 'Amount', False) == [2, 1, 0]
+    assert snapshot_view.sort_order(df, 'Due Date', True) == [0, 1, 2]
+    assert snapshot_view.sort_order(df, 'Page order', True) == [2, 1, 0]
+
+
+def test_sort_order_parses_text_dates():
+    df = pd.DataFrame({'Posted': ['03/01/2025', '01/15/2025', '12/01/2024']})
+    assert snapshot_view.sort_order(df, 'Posted', False) == [2, 1, 0]
+
+
+# 120 rows, 50 per page: only the current page is rendered, sorted across every row
+def paged_app(root):
+    import sys
+    sys.path.insert(0, root)
+    import records
+    import snapshot_view
+
+    df = records.frame([[f'Bid {i:03d}', str(i)] for i in range(120)], ['Name', 'Amount'])
+    snapshot = {'source': 'test', 'version': 'v1', 'taken_at': 0, 'tables': [('Bids', df)]}
+    snapshot_view.paged_table(snapshot, 'bids', None, lambda: df)
+
+
+def shown_rows(app):
+    return [markdown.value for markdown in app.markdown if '<table' in markdown.value][0].count('<tr') - 1
+
+
+def test_paged_table_pages_and_sorts():
+    app = AppTest.from_function(paged_app, args=(ROOT,)).run()
+    assert app.caption[0].value == 'Rows 1-50 of 120'
+    assert shown_rows(app) == 50
+
+    app.number_input[0].set_value(3).run()
+    assert app.caption[0].value == 'Rows 101-120 of 120'
+    assert shown_rows(app) == 20
+
+    app.selectbox[0].select('Amount').run()
+    app.radio[0].set_value('Descending').run()  # Still page 3: rows 101-120 of the new order
+    page = [markdown.value for markdown in app.markdown if '<table' in markdown.value][0]
+    assert 'Bid 019' in page and 'Bid 000' in page and 'Bid 020' not in page
@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+import api_server
+import records
+import store
+
+
+def ads():
+    return records.frame([['10/15/2025', 'Bridge rehabilitation in Albany', None],
+                          ['09/01/2025', 'Culvert replacement', records.Link('Ad PDF', 'https://www.dot.ny.gov/ad.pdf')]],
+                         ['Date', 'Description', 'Link'], dates=['Date'])
+
+
+# An ad without a link has missing Link cells; they must be stored and served as null, not NaN
+def test_missing_cells_are_stored_as_null(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, 'DB_PATH', str(tmp_path / 'opportunities.db'))
+    store.upsert('page3', [('NYS DOT Detailed Ads', ads())], seen_at=100.0)
+    data = next(data for data in store.new_since(0, 'page3')['data'] if data['Description'].startswith('Bridge'))
+    assert data['Link'] is None and data['Link URL'] is None
+    json.loads(api_server.encode(api_server.new_rows_payload(0, 'page3')))
+
+
+@pytest.mark.parametrize('value', ['nan', 'inf', '-Infinity'])
+def test_since_must_be_finite(value):
+    with pytest.raises(api_server.BadRequest):
+        api_server.parse_since(value)
+
+
+# Queries with FTS5 punctuation reach SQLite as plain words instead of failing as syntax
+@pytest.mark.parametrize('query', ['bridge-rehabilitation', 'albany:', '"culvert', '(bridge'])
+def test_search_accepts_punctuation(tmp_path, monkeypatch, query):
+    monkeypatch.setattr(store, 'DB_PATH', str(tmp_path / 'opportunities.db'))
+    store.upsert('page3', [('NYS DOT Detailed Ads', ads())], seen_at=100.0)
+    assert len(store.search_opportunities(query)) == 1